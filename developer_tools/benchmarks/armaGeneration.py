@@ -0,0 +1,95 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the generation of the synthetic histories of the TSA ARMA, comparing the
+  statsmodels state space simulation (one ARIMA model built per history), the native simulator
+  of "generate" (one history per call) and "generateMany" (all the histories at once).
+  Usage:
+    python developer_tools/benchmarks/armaGeneration.py [--histories 200] [--length 8760] [--P 2] [--Q 3]
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)))
+from ravenframework.utils import randomUtils
+from ravenframework.TSA import ARMA
+
+def makeParams(arma, P, Q):
+  """
+    Builds the (trained) parameters of a stable ARMA(P, Q)
+    @ In, arma, ARMA, the ARMA algorithm
+    @ In, P, int, the AR order
+    @ In, Q, int, the MA order
+    @ Out, params, dict, the trained parameters as from "characterize"
+  """
+  armaData = {'lags': (P, 0, Q),
+              'const': 0.5,
+              'ar': 0.8 * 0.5**np.arange(P) / max(1, P),
+              'ma': 0.3 * 0.5**np.arange(Q),
+              'var': 1.2}
+  transition, stateIntercept, stateCov, selection = arma._buildStateSpaceMatrices(armaData)
+  initMean, initCov = arma._solveStateDistribution(transition, stateIntercept, stateCov, selection)
+  armaData['initials'] = {'mean': initMean, 'cov': initCov}
+  return {'signal': {'arma': armaData}}
+
+def simulateStatsmodels(arma, params, pivot):
+  """
+    Generates one history with the statsmodels simulation (as "generate" did before the native simulator)
+    @ In, arma, ARMA, the ARMA algorithm
+    @ In, params, dict, the trained parameters
+    @ In, pivot, np.array, the pivot values
+    @ Out, new, np.array, the history
+  """
+  import statsmodels.tsa.arima.model
+  armaData = params['signal']['arma']
+  msrShocks, stateShocks, initialState = arma._generateNoise(armaData, len(pivot))
+  model = statsmodels.tsa.arima.model.ARIMA(np.zeros(len(pivot)), order=armaData['lags'], trend='c')
+  modelParams = np.r_[armaData['const'], armaData['ar'], armaData['ma'], armaData['var']]
+  return model.simulate(modelParams, len(pivot), measurement_shocks=msrShocks,
+                        state_shocks=stateShocks, initial_state=initialState)
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='ARMA generation benchmark')
+  parser.add_argument('--histories', type=int, default=200, help='number of histories')
+  parser.add_argument('--length', type=int, default=8760, help='length of the histories')
+  parser.add_argument('--P', type=int, default=2, help='AR order')
+  parser.add_argument('--Q', type=int, default=3, help='MA order')
+  args = parser.parse_args()
+  arma = ARMA()
+  params = makeParams(arma, args.P, args.Q)
+  pivot = np.arange(args.length, dtype=float)
+  settings = {'gaussianize': False}
+  print(f'{args.histories} histories of {args.length} values, ARMA({args.P}, {args.Q})')
+  randomUtils.randomSeed(42)
+  start = time.time()
+  for _ in range(args.histories):
+    simulateStatsmodels(arma, params, pivot)
+  reference = time.time() - start
+  print(f'  statsmodels simulate : {reference:8.3f} s, {args.histories/reference:10.1f} histories/s')
+  randomUtils.randomSeed(42)
+  start = time.time()
+  for _ in range(args.histories):
+    arma.generate(params, pivot, settings)
+  elapsed = time.time() - start
+  print(f'  native generate      : {elapsed:8.3f} s, {args.histories/elapsed:10.1f} histories/s '
+        f'(x{reference/elapsed:.1f})')
+  randomUtils.randomSeed(42)
+  start = time.time()
+  arma.generateMany(params, pivot, settings, args.histories)
+  elapsed = time.time() - start
+  print(f'  native generateMany  : {elapsed:8.3f} s, {args.histories/elapsed:10.1f} histories/s '
+        f'(x{reference/elapsed:.1f})')
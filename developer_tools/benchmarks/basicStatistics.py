@@ -0,0 +1,110 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the BasicStatistics PostProcessor.
+  Computes moments, extrema, median, percentiles, covariance, pearson and sensitivity of random
+  (optionally weighted) samples, with and without the streaming mode, reporting the time, the peak of
+  memory allocated by the computation (in addition to the samples) and the largest relative difference
+  of the moments and matrices between the two modes.
+  Usage:
+    python developer_tools/benchmarks/basicStatistics.py [--sizes 100000 1000000] [--vars 10] [--weighted]
+"""
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+import numpy as np
+import xarray as xr
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+sys.path.append(frameworkDir)
+
+def createPostProcessor(variables, streaming, pbPresent):
+  """
+    Creates a BasicStatistics PostProcessor, as after reading its input
+    @ In, variables, list(str), the variables
+    @ In, streaming, bool, True for the streaming mode
+    @ In, pbPresent, bool, True if the samples are weighted
+    @ Out, pp, BasicStatistics, the PostProcessor
+  """
+  from ravenframework import MessageHandler
+  from ravenframework.Models.PostProcessors.BasicStatistics import BasicStatistics
+  pp = BasicStatistics()
+  pp.messageHandler = MessageHandler.MessageHandler()
+  pp.messageHandler.initialize({'verbosity':'quiet'})
+  pp.toDo = {}
+  for metric in ['expectedValue', 'variance', 'sigma', 'skewness', 'kurtosis', 'minimum', 'maximum']:
+    pp.toDo[metric] = [{'targets':set(variables), 'prefix':metric}]
+  pp.toDo['median'] = [{'targets':set(variables), 'prefix':'median', 'interpolation':'linear'}]
+  pp.toDo['percentile'] = [{'targets':set(variables), 'prefix':'percentile', 'percent':{0.05, 0.95},
+                            'strPercent':{'5', '95'}, 'interpolation':'linear'}]
+  for metric in ['covariance', 'pearson', 'sensitivity']:
+    pp.toDo[metric] = [{'targets':set(variables[len(variables)//2:]), 'features':set(variables[:len(variables)//2]), 'prefix':metric}]
+  pp.parameters = {'targets':list(variables)}
+  pp.sampleTag = 'RAVEN_sample_ID'
+  pp.dynamic = False
+  pp.outputDataset = False
+  pp.pbPresent = pbPresent
+  pp.streaming = streaming
+  return pp
+
+def createSamples(size, nVars, weighted):
+  """
+    Creates random correlated samples
+    @ In, size, int, number of samples
+    @ In, nVars, int, number of variables
+    @ In, weighted, bool, if True probability weights are created
+    @ Out, dataset, xarray.Dataset, the samples
+    @ Out, weights, xarray.Dataset, the probability weights (None if not weighted)
+  """
+  rng = np.random.default_rng(42)
+  features = rng.normal(size=(size, nVars // 2))
+  targets = features @ rng.random((nVars // 2, nVars - nVars // 2)) + rng.lognormal(size=(size, nVars - nVars // 2))
+  values = np.concatenate([features, targets], axis=1)
+  dataset = xr.Dataset(dict((f'x{i}', ('RAVEN_sample_ID', values[:, i])) for i in range(nVars)),
+                       coords={'RAVEN_sample_ID':np.arange(size)})
+  weights = None
+  if weighted:
+    pb = rng.random(size)
+    weights = xr.Dataset({'ProbabilityWeight':('RAVEN_sample_ID', pb / pb.sum())})
+    for var in dataset.data_vars:
+      weights[var] = weights['ProbabilityWeight']
+  return dataset, weights
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='BasicStatistics benchmark')
+  parser.add_argument('--sizes', type=int, nargs='+', default=[100000, 1000000], help='number of samples')
+  parser.add_argument('--vars', type=int, default=10, help='number of variables')
+  parser.add_argument('--weighted', action='store_true', help='use probability weights')
+  args = parser.parse_args()
+  for size in args.sizes:
+    dataset, weights = createSamples(size, args.vars, args.weighted)
+    variables = list(dataset.data_vars)
+    results = {}
+    for streaming in [False, True]:
+      pp = createPostProcessor(variables, streaming, args.weighted)
+      pp.realizationWeight = weights[['ProbabilityWeight']] if args.weighted else None
+      tracemalloc.start()
+      start = time.time()
+      results[streaming] = pp._runLocal((dataset, weights))
+      elapsed = time.time() - start
+      peak = tracemalloc.get_traced_memory()[1]
+      tracemalloc.stop()
+      mode = 'streaming' if streaming else 'full     '
+      print(f'{size:8d} samples, {args.vars} variables, {mode}: {elapsed:7.2f} s, peak memory {peak/1e6:8.1f} MB')
+    exact = [key for key in results[False] if not key.startswith(('median', 'percentile'))]
+    diff = max(np.max(np.abs(np.asarray(results[True][key]) - np.asarray(results[False][key])) /
+                      np.maximum(np.abs(np.asarray(results[False][key])), 1e-300)) for key in exact)
+    print(f'{"":8s} largest relative difference of moments and matrices: {diff:.1e}')
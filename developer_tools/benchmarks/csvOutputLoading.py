@@ -0,0 +1,105 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the collection of the CSV outputs of the Code model.
+  For transient-like CSV files (a time column and many float columns) of increasing number of rows,
+  reports the time to load the file with each CsvLoader utility, with and without the projection on a
+  few requested columns, the largest relative difference with respect to the values loaded by pandas (the
+  float parsers differ in the last digit), and the time of the (now skipped) rewrite of the loaded data.
+  Usage:
+    python developer_tools/benchmarks/csvOutputLoading.py [--rows 1000 10000 100000] [--columns 200] [--requested 10]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+sys.path.append(frameworkDir)
+
+def writeCsv(fileName, rows, columns):
+  """
+    Writes a transient-like CSV file
+    @ In, fileName, str, the file name
+    @ In, rows, int, number of rows
+    @ In, columns, int, number of columns (in addition to time)
+    @ Out, names, list(str), names of the columns
+  """
+  rng = np.random.default_rng(42)
+  names = ['time'] + [f'var_{i}' for i in range(columns)]
+  data = np.column_stack([np.linspace(0., 1000., rows), rng.normal(size=(rows, columns)) * 1e3])
+  pd.DataFrame(data, columns=names).to_csv(fileName, index=False)
+  return names
+
+def load(fileName, utility, columns):
+  """
+    Loads a CSV file as the Code model does, and converts it in a realization
+    @ In, fileName, str, the file name
+    @ In, utility, str, the CsvLoader utility
+    @ In, columns, set, the columns to load (None for all)
+    @ Out, elapsed, float, time (s)
+    @ Out, rlz, dict, the realization
+  """
+  from ravenframework import MessageHandler
+  from ravenframework import CsvLoader
+  loader = CsvLoader.CsvLoader()
+  loader.messageHandler = MessageHandler.MessageHandler()
+  loader.messageHandler.initialize({'verbosity':'silent'})
+  start = time.time()
+  rlz = loader.toRealization(loader.loadCsvFile(fileName, nullOK=False, utility=utility, columns=columns))
+  return time.time() - start, rlz
+
+def relativeDifference(values, expected):
+  """
+    Computes the largest relative difference between two arrays
+    @ In, values, np.ndarray, the values
+    @ In, expected, np.ndarray, the expected values
+    @ Out, difference, float, the largest relative difference
+  """
+  return np.max(np.abs(values - expected) / np.maximum(np.abs(expected), 1e-300))
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Code CSV output loading benchmark')
+  parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000], help='number of rows')
+  parser.add_argument('--columns', type=int, default=200, help='number of columns')
+  parser.add_argument('--requested', type=int, default=10, help='number of columns requested by the DataObject')
+  args = parser.parse_args()
+  try:
+    import pyarrow.csv
+    print('pyarrow available')
+  except ImportError:
+    print('pyarrow not available, the "pyarrow" utility falls back to pandas')
+  with tempfile.TemporaryDirectory() as workDir:
+    for rows in args.rows:
+      fileName = os.path.join(workDir, f'out_{rows}.csv')
+      names = writeCsv(fileName, rows, args.columns)
+      requested = set(names[:args.requested + 1])
+      size = os.path.getsize(fileName) / 1e6
+      print(f'{rows:7d} rows x {args.columns + 1} columns ({size:.1f} MB), {len(requested)} columns requested:')
+      reference = None
+      for utility in ['pandas', 'numpy', 'pyarrow']:
+        allTime, rlz = load(fileName, utility, None)
+        projTime, projRlz = load(fileName, utility, requested)
+        if reference is None:
+          reference = rlz
+        assert set(projRlz) == requested
+        difference = max(relativeDifference(rlz[name], reference[name]) for name in names)
+        difference = max([difference] + [relativeDifference(projRlz[name], reference[name]) for name in requested])
+        print(f'  {utility:8s}: all columns {allTime:7.3f} s, projection {projTime:7.3f} s, max rel diff {difference:.1e}')
+      start = time.time()
+      pd.DataFrame.from_dict(reference).to_csv(path_or_buf=os.path.join(workDir, 'rewrite.csv'), index=False)
+      print(f'  rewrite of the loaded data (skipped): {time.time() - start:7.3f} s')
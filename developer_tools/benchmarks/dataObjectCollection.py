@@ -0,0 +1,94 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the data collection in the DataObjects.
+  Adds realizations one at a time to a PointSet and to HistorySets (with aligned time values, or with
+  histories of different lengths), then collapses them into the xr.Dataset, reporting the time of the two phases.
+  Usage:
+    python developer_tools/benchmarks/dataObjectCollection.py [--sizes 10000 100000] [--vars 10] [--length 50]
+"""
+import os
+import sys
+import time
+import argparse
+import xml.etree.ElementTree as ET
+import numpy as np
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+sys.path.append(frameworkDir)
+
+def createDataObject(kind, nVars):
+  """
+    Creates an empty data object
+    @ In, kind, str, PointSet or HistorySet
+    @ In, nVars, int, number of input and of output variables
+    @ Out, data, DataObject, the data object
+  """
+  from ravenframework import DataObjects, MessageHandler
+  mh = MessageHandler.MessageHandler()
+  mh.initialize({'verbosity':'quiet'})
+  data = getattr(DataObjects, kind)()
+  xml = ET.Element(kind, {'name':'collect'})
+  ET.SubElement(xml, 'Input').text = ','.join(f'x{i}' for i in range(nVars))
+  ET.SubElement(xml, 'Output').text = ','.join(f'y{i}' for i in range(nVars))
+  if kind == 'HistorySet':
+    options = ET.SubElement(xml, 'options')
+    ET.SubElement(options, 'pivotParameter').text = 'time'
+  data._readMoreXML(xml)
+  data.messageHandler = mh
+  return data
+
+def realizations(kind, size, nVars, length, aligned):
+  """
+    Creates the realizations to collect
+    @ In, kind, str, PointSet or HistorySet
+    @ In, size, int, number of realizations
+    @ In, nVars, int, number of input and of output variables
+    @ In, length, int, number of time values for the histories
+    @ In, aligned, bool, if True all the histories share the same time values, otherwise they have different lengths
+    @ Out, rlzs, list(dict), realizations
+  """
+  rng = np.random.default_rng(42)
+  rlzs = []
+  for _ in range(size):
+    rlz = dict((f'x{i}', np.atleast_1d(rng.random())) for i in range(nVars))
+    if kind == 'PointSet':
+      rlz.update(dict((f'y{i}', np.atleast_1d(rng.random())) for i in range(nVars)))
+    else:
+      num = length if aligned else rng.integers(length // 2, length + 1)
+      rlz['time'] = np.arange(num, dtype=float)
+      rlz.update(dict((f'y{i}', rng.random(num)) for i in range(nVars)))
+    rlzs.append(rlz)
+  return rlzs
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='DataObject collection benchmark')
+  parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000], help='number of realizations')
+  parser.add_argument('--vars', type=int, default=10, help='number of input and of output variables')
+  parser.add_argument('--length', type=int, default=50, help='number of time values for the histories')
+  args = parser.parse_args()
+  cases = [('PointSet', True), ('HistorySet', True), ('HistorySet', False)]
+  for size in args.sizes:
+    for kind, aligned in cases:
+      rlzs = realizations(kind, size, args.vars, args.length, aligned)
+      data = createDataObject(kind, args.vars)
+      start = time.time()
+      for rlz in rlzs:
+        data.addRealization(rlz)
+      collect = time.time() - start
+      start = time.time()
+      data.asDataset()
+      collapse = time.time() - start
+      label = kind if kind == 'PointSet' else f'{kind} ({"aligned" if aligned else "not aligned"})'
+      print(f'{size:7d} realizations, {label:27s}: addRealization {collect:8.2f} s, asDataset {collapse:8.2f} s')
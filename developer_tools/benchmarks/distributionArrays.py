@@ -0,0 +1,115 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the evaluation of the 1D distributions at arrays of coordinates.
+  For each type of 1D distribution, reports the time of ppfArray, cdfArray and pdfArray at
+  the requested number of points, the time per point of the element-wise evaluation (ppf, cdf and
+  pdf called one coordinate at a time, measured on a subset of the points) and the largest
+  relative difference between the two.
+  Usage:
+    python developer_tools/benchmarks/distributionArrays.py [--points 1000000] [--loopPoints 10000]
+"""
+import os
+import sys
+import time
+import argparse
+import xml.etree.ElementTree as ET
+import numpy as np
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+sys.path.append(frameworkDir)
+
+distributionsXml = """
+<Distributions>
+  <Uniform name="Uniform"><lowerBound>-1.0</lowerBound><upperBound>2.0</upperBound></Uniform>
+  <Normal name="Normal"><mean>1.0</mean><sigma>0.5</sigma></Normal>
+  <Normal name="TruncatedNormal"><mean>1.0</mean><sigma>0.5</sigma><lowerBound>0.5</lowerBound><upperBound>2.0</upperBound></Normal>
+  <Gamma name="Gamma"><low>0.0</low><alpha>2.0</alpha><beta>1.5</beta></Gamma>
+  <Beta name="Beta"><low>0.0</low><high>1.0</high><alpha>2.0</alpha><beta>5.0</beta></Beta>
+  <Triangular name="Triangular"><apex>1.0</apex><min>0.0</min><max>4.0</max></Triangular>
+  <Poisson name="Poisson"><mu>4.0</mu></Poisson>
+  <Binomial name="Binomial"><n>10</n><p>0.25</p></Binomial>
+  <Bernoulli name="Bernoulli"><p>0.4</p></Bernoulli>
+  <Geometric name="Geometric"><p>0.25</p></Geometric>
+  <Logistic name="Logistic"><location>4.0</location><scale>1.0</scale></Logistic>
+  <Laplace name="Laplace"><location>0.0</location><scale>2.0</scale></Laplace>
+  <Exponential name="Exponential"><lambda>2.0</lambda></Exponential>
+  <LogNormal name="LogNormal"><mean>0.5</mean><sigma>0.3</sigma></LogNormal>
+  <Weibull name="Weibull"><k>1.5</k><lambda>2.0</lambda></Weibull>
+  <LogUniform name="LogUniform"><lowerBound>1.0</lowerBound><upperBound>3.0</upperBound><base>natural</base></LogUniform>
+  <Categorical name="Categorical">
+    <state outcome="1">0.1</state><state outcome="2">0.2</state><state outcome="3">0.15</state>
+    <state outcome="5">0.4</state><state outcome="6">0.15</state>
+  </Categorical>
+  <UniformDiscrete name="UniformDiscrete"><lowerBound>3</lowerBound><upperBound>12</upperBound><strategy>withReplacement</strategy></UniformDiscrete>
+</Distributions>
+"""
+
+def createDistributions():
+  """
+    Creates and initializes one distribution of each 1D type
+    @ In, None
+    @ Out, distributions, dict, {name: distribution}
+  """
+  from ravenframework import MessageHandler
+  from ravenframework import Distributions
+  messageHandler = MessageHandler.MessageHandler()
+  messageHandler.initialize({'verbosity':'silent'})
+  distributions = {}
+  for node in ET.fromstring(distributionsXml):
+    distribution = Distributions.factory.returnInstance(node.tag)
+    distribution.setMessageHandler(messageHandler)
+    paramInput = distribution.getInputSpecification()()
+    paramInput.parseNode(node)
+    distribution._handleInput(paramInput)
+    distribution.initializeDistribution()
+    distributions[node.attrib['name']] = distribution
+  return distributions
+
+def relativeDifference(values, expected):
+  """
+    Computes the largest relative difference between two arrays
+    @ In, values, np.ndarray, the values
+    @ In, expected, np.ndarray, the expected values
+    @ Out, difference, float, the largest relative difference
+  """
+  values = np.asarray(values, dtype=float)
+  expected = np.asarray(expected, dtype=float)
+  return np.max(np.abs(values - expected) / np.maximum(np.abs(expected), 1e-300))
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='1D distributions array evaluation benchmark')
+  parser.add_argument('--points', type=int, default=1000000, help='number of points of the array evaluations')
+  parser.add_argument('--loopPoints', type=int, default=10000, help='number of points of the element-wise evaluations')
+  args = parser.parse_args()
+  rng = np.random.default_rng(42)
+  cdfs = rng.uniform(1e-6, 1. - 1e-6, args.points)
+  print(f'{"":16s} {"array (s), " + str(args.points) + " points":>32s} {"element-wise (us/point)":>27s} {"max rel diff":>12s}')
+  print(f'{"distribution":16s} {"ppf":>10s} {"cdf":>10s} {"pdf":>10s} {"ppf":>8s} {"cdf":>8s} {"pdf":>8s} {"":>12s}')
+  for name, distribution in createDistributions().items():
+    arrayTimes, loopTimes, difference = [], [], 0.
+    points = {'ppf':cdfs}
+    for method in ['ppf', 'cdf', 'pdf']:
+      start = time.time()
+      values = getattr(distribution, method + 'Array')(points[method])
+      arrayTimes.append(time.time() - start)
+      if method == 'ppf':
+        points['cdf'] = points['pdf'] = values
+      subset = points[method][:args.loopPoints]
+      start = time.time()
+      loopValues = [getattr(distribution, method)(point) for point in subset]
+      loopTimes.append((time.time() - start) / len(subset) * 1e6)
+      difference = max(difference, relativeDifference(values[:args.loopPoints], loopValues))
+    print(f'{name:16s} {arrayTimes[0]:10.3f} {arrayTimes[1]:10.3f} {arrayTimes[2]:10.3f} '
+          f'{loopTimes[0]:8.1f} {loopTimes[1]:8.1f} {loopTimes[2]:8.1f} {difference:12.1e}')
@@ -0,0 +1,115 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the DTW metric on hourly histories of a year (8760 time steps): the previous
+  implementation (python loop over the full matrix of the local distances, timed on a shorter prefix and
+  extrapolated quadratically), the anti-diagonal one without and with Sakoe-Chiba windows, and the
+  matrix of the distances between several histories as used by the DataMining temporal clustering
+  (number of processes, cutoff). Checks the anti-diagonal distance against the loop on the prefix.
+  Usage:
+    python developer_tools/benchmarks/dtwDistance.py [--length 8760] [--prefix 1000] [--radii 168 24] [--histories 12] [--workers 1 2]
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+import scipy.spatial.distance as spatialDistance
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)))
+from ravenframework.Metrics.metrics.DTW import dtwDistance, dtwDistanceMatrix
+
+def previousDistance(x, y, localDistance):
+  """
+    Computes the DTW distance as before, looping over the full matrix of the local distances
+    @ In, x, np.array, first history, shape (numDimensions, numTimeSteps)
+    @ In, y, np.array, second history, shape (numDimensions, numTimeSteps)
+    @ In, localDistance, str, the local distance
+    @ Out, value, float, the DTW distance
+  """
+  r, c = x.shape[1], y.shape[1]
+  D0 = np.zeros((r + 1, c + 1))
+  D0[0, 1:] = np.inf
+  D0[1:, 0] = np.inf
+  D0[1:, 1:] = spatialDistance.cdist(x.T, y.T, metric=localDistance)
+  for i in range(r):
+    for j in range(c):
+      D0[i+1, j+1] += min(D0[i, j], D0[i, j+1], D0[i+1, j])
+  return D0[-1, -1]
+
+def history(rng, length):
+  """
+    Generates a history of two variables with a daily cycle, randomly shifted, and a random walk
+    @ In, rng, np.random.Generator, the random number generator
+    @ In, length, int, the number of (hourly) time steps
+    @ Out, history, np.array, the history, shape (2, length)
+  """
+  hours = np.arange(length) + rng.integers(0, 6)
+  daily = np.sin(2. * np.pi * hours / 24.)
+  return np.vstack((daily + 0.1 * rng.normal(size=length).cumsum() / np.sqrt(length),
+                    np.cos(2. * np.pi * hours / 24.) + 0.3 * rng.normal(size=length)))
+
+def timeIt(function, *args, **kwargs):
+  """
+    Times a function
+    @ In, function, callable, the function
+    @ In, args, list, its arguments
+    @ In, kwargs, dict, its keyword arguments
+    @ Out, (result, elapsed), tuple, the return of the function and the time it took
+  """
+  start = time.time()
+  result = function(*args, **kwargs)
+  return result, time.time() - start
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='DTW benchmark')
+  parser.add_argument('--length', type=int, default=8760, help='number of time steps of the histories')
+  parser.add_argument('--prefix', type=int, default=1000, help='number of time steps the previous implementation is timed on')
+  parser.add_argument('--radii', type=int, nargs='+', default=[168, 24], help='radii of the Sakoe-Chiba windows')
+  parser.add_argument('--histories', type=int, default=12, help='number of histories of the distance matrix')
+  parser.add_argument('--workers', type=int, nargs='+', default=[1, 2], help='numbers of processes computing the distance matrix')
+  args = parser.parse_args()
+  rng = np.random.default_rng(42)
+  histories = [history(rng, args.length) for _ in range(args.histories)]
+  x, y = histories[0], histories[1]
+  print(f'two variables, {args.length} time steps, {os.cpu_count()} CPUs')
+  prefix = min(args.prefix, args.length)
+  loop, elapsed = timeIt(previousDistance, x[:, :prefix], y[:, :prefix], 'euclidean')
+  diagonal = dtwDistance(x[:, :prefix], y[:, :prefix], 'euclidean')
+  extrapolated = elapsed * (args.length / prefix)**2
+  print(f'  previous loop: {elapsed:7.2f} s on {prefix} steps, {extrapolated:7.1f} s extrapolated '
+        f'({"identical" if np.isclose(loop, diagonal, rtol=1e-12) else "DIFFERENT"} distance on {prefix} steps)')
+  full, elapsed = timeIt(dtwDistance, x, y, 'euclidean')
+  print(f'  anti-diagonal: {elapsed:7.2f} s, x{extrapolated/elapsed:.0f}, distance {full:.6g}')
+  for radius in args.radii:
+    banded, elapsed = timeIt(dtwDistance, x, y, 'euclidean', 'sakoeChiba', radius)
+    print(f'  Sakoe-Chiba {radius:4d}: {elapsed:7.2f} s, x{extrapolated/elapsed:.0f}, distance {banded:.6g} ({banded/full-1.:+.2%})')
+  # distance matrices, in the narrowest window
+  radius = min(args.radii)
+  pairs = args.histories * (args.histories - 1) // 2
+  print(f'{args.histories}x{args.histories} distance matrix, Sakoe-Chiba {radius} ({pairs} pairs, {args.histories**2} evaluations before)')
+  reference = None
+  for workers in args.workers:
+    matrix, elapsed = timeIt(dtwDistanceMatrix, histories, 'euclidean', 'sakoeChiba', radius, workers=workers)
+    if reference is None:
+      reference = (matrix, elapsed)
+    print(f'  {workers:3d} workers: {elapsed:7.2f} s, speedup x{reference[1]/elapsed:.2f}, '
+          f'{"identical" if np.array_equal(matrix, reference[0]) else "DIFFERENT"} matrix')
+  # only the distances below the median (e.g. neighbors within a radius) needed exactly
+  cutoff = np.median(reference[0][np.triu_indices(args.histories, k=1)])
+  matrix, elapsed = timeIt(dtwDistanceMatrix, histories, 'euclidean', 'sakoeChiba', radius, cutoff=cutoff)
+  below = reference[0] <= cutoff
+  exact = np.array_equal(matrix[below], reference[0][below]) and np.all(matrix[~below] > cutoff)
+  print(f'  cutoff at the median: {elapsed:7.2f} s, speedup x{reference[1]/elapsed:.2f}, '
+        f'{"exact" if exact else "WRONG"} distances below the cutoff, bounds above it')
@@ -0,0 +1,80 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the persistent evaluation cache of the models.
+  Reports the cost per evaluation of storing the evaluations (with and without eviction), of opening
+  the cache, and of looking the samples up (hits and misses), i.e. the overhead added to each model
+  evaluation, to be compared with the cost of the evaluations the cache allows to skip.
+  Usage:
+    python developer_tools/benchmarks/evaluationCache.py [--entries 10000] [--variables 10] [--outputs 20] [--historyLength 100]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import numpy as np
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+sys.path.append(frameworkDir)
+
+from ravenframework.utils.evaluationCache import EvaluationCache
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Evaluation cache benchmark')
+  parser.add_argument('--entries', type=int, default=10000, help='number of evaluations')
+  parser.add_argument('--variables', type=int, default=10, help='number of sampled variables')
+  parser.add_argument('--outputs', type=int, default=20, help='number of output variables')
+  parser.add_argument('--historyLength', type=int, default=100, help='length of the outputs')
+  args = parser.parse_args()
+  rng = np.random.default_rng(42)
+  samples = [dict((f'x{v}', value) for v, value in enumerate(rng.random(args.variables))) for _ in range(args.entries)]
+  outputs = dict((f'y{o}', rng.random(args.historyLength)) for o in range(args.outputs))
+  signature = ['ExternalModel', b'source of the model']
+  with tempfile.TemporaryDirectory() as cacheDir:
+    cache = EvaluationCache(cacheDir, signature, tolerance=1e-10)
+    start = time.time()
+    keys = [cache.key(sample) for sample in samples]
+    keyTime = time.time() - start
+    start = time.time()
+    for key in keys:
+      cache.put(key, outputs)
+    putTime = time.time() - start
+    size = cache._size / 1e6
+    start = time.time()
+    cache = EvaluationCache(cacheDir, signature, tolerance=1e-10)
+    openTime = time.time() - start
+    start = time.time()
+    for key in keys:
+      cache.get(key)
+    hitTime = time.time() - start
+    misses = [cache.key(dict((var, value + 1.) for var, value in sample.items())) for sample in samples]
+    start = time.time()
+    for key in misses:
+      cache.get(key)
+    missTime = time.time() - start
+    start = time.time()
+    limited = EvaluationCache(cacheDir, signature, tolerance=1e-10, maxEntries=args.entries // 2)
+    for key in misses:
+      limited.put(key, outputs)
+    evictTime = time.time() - start
+  perEntry = lambda elapsed: elapsed / args.entries * 1e6
+  print(f'{args.entries} evaluations, {args.variables} sampled variables, {args.outputs} outputs of length {args.historyLength} '
+        f'({size:.1f} MB)')
+  print(f'  key               : {perEntry(keyTime):8.1f} us/evaluation')
+  print(f'  store             : {perEntry(putTime):8.1f} us/evaluation')
+  print(f'  store and evict   : {perEntry(evictTime):8.1f} us/evaluation ({limited.stats["evicted"]} evicted)')
+  print(f'  open              : {openTime:8.3f} s ({args.entries} entries)')
+  print(f'  hit               : {perEntry(hitTime):8.1f} us/evaluation')
+  print(f'  miss              : {perEntry(missTime):8.1f} us/evaluation')
@@ -0,0 +1,100 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the input writing of the GenericCode interface.
+  Creates a templated input deck (with $RAVEN-var$ wildcards, some with formats and defaults) and
+  writes new inputs from it as done by the Code model for each sample (copy of the original file,
+  then GenericCode.createNewInput), parsing the deck for each sample or reusing the parsed template.
+  The new inputs are all written to the same file, to keep the disk usage bounded.
+  Usage:
+    python developer_tools/benchmarks/genericInputWriting.py [--samples 10000] [--size 5] [--vars 200]
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import numpy as np
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+sys.path.append(frameworkDir)
+
+def createDeck(fileName, sizeMB, nVars):
+  """
+    Writes a templated input deck
+    @ In, fileName, str, path of the deck
+    @ In, sizeMB, float, approximate size of the deck (MB)
+    @ In, nVars, int, number of variables (wildcards)
+    @ Out, None
+  """
+  filler = '  card {:8d} 1.0 2.0 3.0 4.0 5.0 6.0 7.0 8.0 9.0 ! fixed data\n'
+  lines = int(sizeMB * 1e6 / len(filler.format(0)))
+  wildcards = ['$RAVEN-x{}$', '$RAVEN-x{}|10.4f$', '$RAVEN-x{}:1.0$', '$RAVEN-x{}|12$']
+  every = max(lines // nVars, 1)
+  with open(fileName, 'w') as deck:
+    for i in range(lines):
+      if i % every == 0 and i // every < nVars:
+        v = i // every
+        deck.write('  param' + str(v) + ' = ' + wildcards[v % len(wildcards)].format(v) + '\n')
+      else:
+        deck.write(filler.format(i))
+
+def writeInputs(workDir, samples, nVars, reuse):
+  """
+    Writes new inputs with the GenericCode interface
+    @ In, workDir, str, working directory (with the deck in it)
+    @ In, samples, int, number of inputs to write
+    @ In, nVars, int, number of variables
+    @ In, reuse, bool, if True the parsed template is reused
+    @ Out, rate, float, inputs/s
+    @ Out, content, str, the last input written
+  """
+  from ravenframework import Files
+  from ravenframework.CodeInterfaceClasses.Generic.GenericCodeInterface import GenericCode
+  code = GenericCode()
+  code.addInputExtension(['inp'])
+  code.reuseParser = reuse
+  original = Files.File()
+  original.setAbsFile(os.path.join(workDir, 'deck.inp'))
+  sampleDir = os.path.join(workDir, 'sample')
+  os.makedirs(sampleDir, exist_ok=True)
+  rng = np.random.default_rng(42)
+  start = time.time()
+  for _ in range(samples):
+    new = Files.File()
+    new.setAbsFile(os.path.join(sampleDir, 'deck.inp'))
+    shutil.copy(original.getAbsFile(), sampleDir)
+    values = rng.random(nVars)
+    sampled = dict((f'x{v}', values[v]) for v in range(nVars) if v % 4 != 2)
+    code.createNewInput([new], [original], 'MonteCarlo', SampledVars=sampled, additionalEdits={})
+  rate = samples / (time.time() - start)
+  with open(os.path.join(sampleDir, 'deck.inp')) as newInput:
+    content = newInput.read()
+  return rate, content
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='GenericCode input writing benchmark')
+  parser.add_argument('--samples', type=int, default=10000, help='number of inputs to write')
+  parser.add_argument('--size', type=float, default=5, help='size of the templated deck (MB)')
+  parser.add_argument('--vars', type=int, default=200, help='number of variables in the deck')
+  args = parser.parse_args()
+  with tempfile.TemporaryDirectory() as workDir:
+    createDeck(os.path.join(workDir, 'deck.inp'), args.size, args.vars)
+    parseRate, parseContent = writeInputs(workDir, args.samples, args.vars, False)
+    reuseRate, reuseContent = writeInputs(workDir, args.samples, args.vars, True)
+    identical = 'identical' if parseContent == reuseContent else 'DIFFERENT'
+    print(f'{args.samples} inputs from a {args.size} MB deck with {args.vars} variables: '
+          f'parse each sample {parseRate:8.1f} inputs/s, reuse template {reuseRate:8.1f} inputs/s '
+          f'(x{reuseRate / parseRate:.1f}), inputs {identical}')
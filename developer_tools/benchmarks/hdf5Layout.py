@@ -0,0 +1,70 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the layouts of the HDF5 databases.
+  Reports the time to add the (Monte Carlo) realizations one by one, as done by a MultiRun,
+  the time to load them all back, as done by an IOStep, and the size of the file, for the
+  "groups" (one group per realization) and "columnar" layouts.
+  Usage:
+    python developer_tools/benchmarks/hdf5Layout.py [--realizations 10000] [--scalars 10] [--histories 5] [--historyLength 100] [--bufferSize 1000]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import numpy as np
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+sys.path.append(frameworkDir)
+
+from ravenframework.h5py_interface_creator import hdf5Database
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='HDF5 database layout benchmark')
+  parser.add_argument('--realizations', type=int, default=10000, help='number of realizations')
+  parser.add_argument('--scalars', type=int, default=10, help='number of scalar variables')
+  parser.add_argument('--histories', type=int, default=5, help='number of time-dependent variables')
+  parser.add_argument('--historyLength', type=int, default=100, help='length of the histories')
+  parser.add_argument('--bufferSize', type=int, default=1000, help='buffer of the columnar layout')
+  args = parser.parse_args()
+  rng = np.random.default_rng(42)
+  rlzs = []
+  for r in range(args.realizations):
+    rlz = dict((f'x{v}', np.atleast_1d(value)) for v, value in enumerate(rng.random(args.scalars)))
+    rlz.update(dict((f'y{v}', rng.random(args.historyLength)) for v in range(args.histories)))
+    rlz['prefix'] = np.atleast_1d(str(r))
+    rlzs.append(rlz)
+  print(f'{args.realizations} realizations, {args.scalars} scalars, {args.histories} histories of length {args.historyLength}')
+  with tempfile.TemporaryDirectory() as directory:
+    for layout in ['groups', 'columnar']:
+      database = hdf5Database(layout, directory, f'{layout}.h5', False, layout=layout, bufferSize=args.bufferSize)
+      database.verbosity = 'quiet'
+      start = time.time()
+      for rlz in rlzs:
+        database.addGroup(rlz)
+      database.closeDatabaseW()
+      writeTime = time.time() - start
+      start = time.time()
+      database = hdf5Database(layout, directory, f'{layout}.h5', True)
+      database.verbosity = 'quiet'
+      names = database.retrieveAllHistoryNames()
+      names.sort()
+      loaded = database._getRealizationsByName(names)
+      database.closeDatabaseW()
+      loadTime = time.time() - start
+      assert len(loaded) == args.realizations
+      size = os.path.getsize(os.path.join(directory, f'{layout}.h5')) / 1e6
+      print(f'  {layout:9s}: write {writeTime:7.2f} s ({args.realizations/writeTime:8.0f} realizations/s), '
+            f'load {loadTime:7.2f} s ({args.realizations/loadTime:8.0f} realizations/s), {size:7.1f} MB')
@@ -0,0 +1,130 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the HistorySetSync post-processor on many long histories, with aligned (same time
+  points) and unaligned pivots, for the grid and all synchronization methods: the previous implementation
+  (point by point re-sampling of each history and variable, timed on a subset of the histories and
+  extrapolated linearly) and the batched one, with one or more threads. Checks that the re-sampled
+  histories are identical.
+  Usage:
+    python developer_tools/benchmarks/historySetSync.py [--histories 1000] [--steps 10000] [--variables 4] [--subset 20] [--workers 1 2]
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)))
+from ravenframework.Models.PostProcessors.HistorySetSync import HistorySetSync
+
+def previousResampleHist(extension, variable, oldTime, newTime):
+  """
+    Re-samples a history as before, one new time point at a time
+    @ In, extension, str, zeroed or extended
+    @ In, variable, np.array, array containing the sampled values of the dependent variable
+    @ In, oldTime, np.array, array containing the sampled values of the temporal variable
+    @ In, newTime, np.array, array containing the sampled values of the new temporal variable
+    @ Out, newVar, np.array, the re-sampled values
+  """
+  newVar = np.zeros(newTime.size)
+  pos = 0
+  for newT in newTime:
+    if newT < oldTime[0]:
+      newVar[pos] = variable[0] if extension == 'extended' else 0.0
+    elif newT > oldTime[-1]:
+      newVar[pos] = variable[-1] if extension == 'extended' else 0.0
+    else:
+      index = np.searchsorted(oldTime, newT)
+      newVar[pos] = variable[index-1] + (variable[index]-variable[index-1])/(oldTime[index]-oldTime[index-1])*(newT-oldTime[index-1])
+    pos = pos + 1
+  return newVar
+
+def previousSync(pp, data, outVars, histories):
+  """
+    Synchronizes the first histories as before (new time grid, then loop over histories and variables)
+    @ In, pp, HistorySetSync, the post-processor (settings)
+    @ In, data, dict, the histories
+    @ In, outVars, list(str), the variables to re-sample
+    @ In, histories, int, number of histories to re-sample
+    @ Out, resampled, dict, the re-sampled histories of each variable
+  """
+  if pp.syncMethod == 'grid':
+    newTime = np.linspace(min(h[0] for h in data['time']), max(h[-1] for h in data['time']), pp.numberOfSamples)
+  else:
+    times = []
+    for hist in data['time']:
+      times.extend(hist)
+    times = list(set(times))
+    times.sort()
+    newTime = np.array(times)
+  resampled = {var: [] for var in outVars}
+  for rlz in range(histories):
+    for var in outVars:
+      resampled[var].append(previousResampleHist(pp.extension, data[var][rlz], data['time'][rlz], newTime))
+  return resampled
+
+def makeData(rng, histories, steps, variables, aligned):
+  """
+    Generates the histories
+    @ In, rng, np.random.Generator, the random number generator
+    @ In, histories, int, the number of histories
+    @ In, steps, int, the number of time points of each history
+    @ In, variables, int, the number of dependent variables
+    @ In, aligned, bool, True if the histories share the time points
+    @ Out, (inputDic, outVars), tuple, the data in the format of the post-processor input and the variables
+  """
+  outVars = [f'v{v}' for v in range(variables)]
+  data = {'time': np.zeros(histories, dtype=object)}
+  for var in outVars:
+    data[var] = np.zeros(histories, dtype=object)
+  for rlz in range(histories):
+    if aligned:
+      data['time'][rlz] = np.linspace(0., 1., steps)
+    else:
+      data['time'][rlz] = np.sort(rng.uniform(0., 1., steps))
+    for var in outVars:
+      data[var][rlz] = rng.normal(size=steps).cumsum()
+  inputDic = {'data': data, 'outVars': outVars, 'inpVars': [], 'metaKeys': [], 'numberRealizations': histories, 'dims': {}}
+  return inputDic, outVars
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='HistorySetSync benchmark')
+  parser.add_argument('--histories', type=int, default=1000, help='number of histories')
+  parser.add_argument('--steps', type=int, default=10000, help='number of time points of each history')
+  parser.add_argument('--variables', type=int, default=4, help='number of re-sampled variables')
+  parser.add_argument('--subset', type=int, default=20, help='number of histories the previous implementation is timed on')
+  parser.add_argument('--workers', type=int, nargs='+', default=[1, 2], help='numbers of threads')
+  args = parser.parse_args()
+  rng = np.random.default_rng(42)
+  print(f'{args.histories} histories of {args.steps} time points, {args.variables} variables, {os.cpu_count()} CPUs')
+  for aligned in (True, False):
+    inputDic, outVars = makeData(rng, args.histories, args.steps, args.variables, aligned)
+    for syncMethod in ('grid', 'all'):
+      if syncMethod == 'all' and not aligned:
+        # the union of the time points of unaligned histories is too large to synchronize on
+        continue
+      pp = HistorySetSync()
+      pp.setParams(args.steps, 'time', 'extended', syncMethod)
+      start = time.time()
+      previous = previousSync(pp, inputDic['data'], outVars, args.subset)
+      extrapolated = (time.time() - start) * args.histories / args.subset
+      print(f'  {"aligned" if aligned else "unaligned"} {syncMethod}: previous {extrapolated:7.1f} s (extrapolated from {args.subset} histories)')
+      for workers in args.workers:
+        pp.workers = workers
+        start = time.time()
+        output = pp.run({'Data': [(None, None, inputDic)]})
+        elapsed = time.time() - start
+        same = all(np.array_equal(output['data'][var][rlz], previous[var][rlz]) for var in outVars for rlz in range(args.subset))
+        print(f'    {workers} threads: {elapsed:7.2f} s, x{extrapolated/elapsed:.0f}, {"identical" if same else "DIFFERENT"} histories')
@@ -0,0 +1,123 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the JobHandler scheduling overhead.
+  1) runs a MultiRun of many trivial ExternalModel jobs and reports the throughput (jobs/s);
+  2) runs a MultiRun with a single job that sleeps and reports the CPU used by RAVEN
+     while it is just waiting for the job (idle CPU).
+  Usage:
+    python developer_tools/benchmarks/jobHandlerThroughput.py [--jobs 10000] [--batch 1] [--idle 5]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+sys.path.append(frameworkDir)
+
+modelTemplate = """
+import time
+def run(self, inputs):
+  time.sleep({sleep})
+  self.y = self.x
+"""
+
+workflowTemplate = """
+<Simulation verbosity="quiet">
+  <RunInfo>
+    <WorkingDir>.</WorkingDir>
+    <Sequence>sample</Sequence>
+    <batchSize>{batch}</batchSize>
+  </RunInfo>
+  <Steps>
+    <MultiRun name="sample">
+      <Input class="DataObjects" type="PointSet">placeholder</Input>
+      <Model class="Models" type="ExternalModel">model</Model>
+      <Sampler class="Samplers" type="MonteCarlo">mc</Sampler>
+      <Output class="DataObjects" type="PointSet">results</Output>
+    </MultiRun>
+  </Steps>
+  <Models>
+    <ExternalModel ModuleToLoad="{module}" name="model" subType="">
+      <inputs>x</inputs>
+      <outputs>y</outputs>
+    </ExternalModel>
+  </Models>
+  <Samplers>
+    <MonteCarlo name="mc">
+      <samplerInit>
+        <limit>{jobs}</limit>
+        <initialSeed>42</initialSeed>
+      </samplerInit>
+      <variable name="x">
+        <distribution>dist</distribution>
+      </variable>
+    </MonteCarlo>
+  </Samplers>
+  <Distributions>
+    <Uniform name="dist">
+      <lowerBound>0</lowerBound>
+      <upperBound>1</upperBound>
+    </Uniform>
+  </Distributions>
+  <DataObjects>
+    <PointSet name="placeholder"/>
+    <PointSet name="results">
+      <Input>x</Input>
+      <Output>y</Output>
+    </PointSet>
+  </DataObjects>
+</Simulation>
+"""
+
+def runWorkflow(workDir, name, jobs, batch, sleep):
+  """
+    Writes and runs a MultiRun workflow
+    @ In, workDir, str, directory where to write the workflow
+    @ In, name, str, name of the workflow
+    @ In, jobs, int, number of samples
+    @ In, batch, int, batch size (number of parallel jobs)
+    @ In, sleep, float, time spent by each job (s)
+    @ Out, wall, float, wall time of the run (s)
+    @ Out, cpu, float, CPU time of the run (s), summed over all the threads
+  """
+  from ravenframework import Raven
+  module = os.path.join(workDir, f'{name}.py')
+  with open(module, 'w') as modFile:
+    modFile.write(modelTemplate.format(sleep=sleep))
+  xml = os.path.join(workDir, f'{name}.xml')
+  with open(xml, 'w') as xmlFile:
+    xmlFile.write(workflowTemplate.format(module=module, jobs=jobs, batch=batch))
+  raven = Raven()
+  raven.loadWorkflowFromFile(xml)
+  startWall, startCpu = time.time(), time.process_time()
+  returnCode = raven.runWorkflow()
+  wall, cpu = time.time() - startWall, time.process_time() - startCpu
+  if returnCode != 0:
+    raise RuntimeError(f'Workflow "{name}" failed!')
+  return wall, cpu
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='JobHandler throughput and idle CPU benchmark')
+  parser.add_argument('--jobs', type=int, default=10000, help='number of trivial jobs')
+  parser.add_argument('--batch', type=int, default=1, help='batch size')
+  parser.add_argument('--idle', type=float, default=5.0, help='duration of the idle job (s)')
+  args = parser.parse_args()
+  with tempfile.TemporaryDirectory() as workDir:
+    wall, cpu = runWorkflow(workDir, 'throughput', args.jobs, args.batch, 0.0)
+    print(f'throughput: {args.jobs} jobs in {wall:.2f} s -> {args.jobs / wall:.1f} jobs/s (CPU {cpu:.2f} s)')
+    wall, cpu = runWorkflow(workDir, 'idle', 1, 1, args.idle)
+    print(f'idle: one {args.idle} s job in {wall:.2f} s -> CPU {cpu:.2f} s ({100 * cpu / wall:.1f}% of a core)')
@@ -0,0 +1,129 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the limit surface detection of the LimitSurface post-processor (gradient
+  pre-screening and search of the sign changes on the evaluation grid, i.e. the per-iteration cost of
+  the LimitSurfaceSearch sampler besides the ROM) as a function of the grid size and dimensionality,
+  compared with the previous implementation (looping over the candidate nodes and their neighbours).
+  Checks that the negative and positive limit surface points are identical. It also reports the
+  fraction of the grid the ROM is re-evaluated on with an evaluationBand of 1 node.
+  Usage:
+    python developer_tools/benchmarks/limitSurfaceBoundary.py [--dimensions 2 3 4 5 6] [--nodes 100000 1000000]
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)))
+from ravenframework.Models.PostProcessors.LimitSurface import LimitSurface
+
+def previousSearch(testMatrix, sign):
+  """
+    Searches the limit surface points as before, looping over the candidates of the gradient pre-screening
+    @ In, testMatrix, np.ndarray, the goal function values on the grid
+    @ In, sign, int, the sign that should be tested (-1 or +1)
+    @ Out, listSurfPoint, list, the list of limit surface coordinates
+  """
+  nVar = testMatrix.ndim
+  if nVar > 1:
+    toBeTested = np.squeeze(np.dstack(np.nonzero(np.sum(np.abs(np.gradient(testMatrix)), axis = 0))))
+  else:
+    toBeTested = np.atleast_2d(np.squeeze(np.dstack(np.nonzero(np.abs(np.gradient(testMatrix)))))).T
+  listSurfPoint = []
+  gridShape = testMatrix.shape
+  myIdList = np.zeros(nVar,dtype=int)
+  for coordinate in np.rollaxis(toBeTested, 0):
+    myIdList[:] = coordinate
+    if testMatrix[tuple(coordinate)] * sign > 0:
+      for iVar in range(nVar):
+        if coordinate[iVar] + 1 < gridShape[iVar]:
+          myIdList[iVar] += 1
+          if testMatrix[tuple(myIdList)] * sign <= 0:
+            listSurfPoint.append(coordinate.copy())
+            break
+          myIdList[iVar] -= 1
+          if coordinate[iVar] > 0:
+            myIdList[iVar] -= 1
+            if testMatrix[tuple(myIdList)] * sign <= 0:
+              listSurfPoint.append(coordinate.copy())
+              break
+            myIdList[iVar] += 1
+  return listSurfPoint
+
+def currentSearch(pp, testMatrix, sign):
+  """
+    Searches the limit surface points with the LimitSurface post-processor
+    @ In, pp, LimitSurface, the post-processor
+    @ In, testMatrix, np.ndarray, the goal function values on the grid
+    @ In, sign, int, the sign that should be tested (-1 or +1)
+    @ Out, listSurfPoint, list, the list of limit surface coordinates
+  """
+  pp.testMatrix['grid'] = testMatrix
+  if testMatrix.ndim > 1:
+    candidates = np.sum(np.abs(np.gradient(testMatrix)), axis = 0) != 0
+  else:
+    candidates = np.abs(np.gradient(testMatrix)) != 0
+  return list(np.argwhere(pp.__localLimitStateSearch__(candidates, sign, 'grid')))
+
+def goalFunction(shape):
+  """
+    Evaluates a goal function (+1 outside, -1 inside a sphere crossing the domain) on a grid
+    @ In, shape, tuple, the shape of the grid
+    @ Out, testMatrix, np.ndarray, the goal function values
+  """
+  axes = np.meshgrid(*[np.linspace(0., 1., n) for n in shape], indexing='ij', sparse=True)
+  radius = sum((axis - 0.3)**2 for axis in axes)
+  return np.where(radius > 0.5**2, 1., -1.)
+
+def timeIt(function, *args):
+  """
+    Times a function
+    @ In, function, callable, the function
+    @ In, args, list, its arguments
+    @ Out, (result, elapsed), tuple, the return of the function and the time it took
+  """
+  start = time.time()
+  result = function(*args)
+  return result, time.time() - start
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Limit surface detection benchmark')
+  parser.add_argument('--dimensions', type=int, nargs='+', default=[2, 3, 4, 5, 6], help='grid dimensionalities')
+  parser.add_argument('--nodes', type=int, nargs='+', default=[100000, 1000000], help='approximate numbers of grid nodes')
+  args = parser.parse_args()
+  pp = LimitSurface()
+  pp.evaluationBand = 1
+  print(f'{"dims":>4s} {"shape":>22s} {"nodes":>8s} {"surface":>8s} | {"before":>9s} {"after":>8s} {"speedup":>8s} | {"band":>5s} | identical')
+  for nodes in args.nodes:
+    for dims in args.dimensions:
+      shape = (int(round(nodes**(1. / dims))), ) * dims
+      testMatrix = goalFunction(shape)
+      before, after = [], []
+      elapsedBefore = elapsedAfter = 0.
+      for sign in (-1, 1):
+        points, elapsed = timeIt(previousSearch, testMatrix, sign)
+        before.extend(points)
+        elapsedBefore += elapsed
+        points, elapsed = timeIt(currentSearch, pp, testMatrix, sign)
+        after.extend(points)
+        elapsedAfter += elapsed
+      same = len(before) == len(after) and all(np.array_equal(b, a) for b, a in zip(before, after))
+      surface = np.zeros(shape, dtype=bool)
+      surface[tuple(np.asarray(after).T)] = True
+      pp.surfaceNodes['grid'] = surface
+      band = np.count_nonzero(pp.__evaluationMask__('grid', shape)) / testMatrix.size
+      print(f'{dims:4d} {str(shape):>22s} {testMatrix.size:8d} {len(after):8d} | {elapsedBefore:7.3f} s {elapsedAfter:6.3f} s '
+            f'{elapsedBefore/elapsedAfter:7.1f}x | {band:5.1%} | {same}')
@@ -0,0 +1,126 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the Monte Carlo integration of the LimitSurfaceIntegral post-processor on a
+  rare event (the corner x0 + x1 > 1.8 of the unit square, probability 0.02), as a function of the
+  tolerance: time, peak memory (tracemalloc), number of samples and estimate of the previous
+  implementation (all the samples drawn and evaluated at once) and of the chunked one, with plain
+  Monte Carlo, LHS, Sobol and importance sampling (stopping at 95% confidence).
+  Usage:
+    python developer_tools/benchmarks/limitSurfaceIntegral.py [--tolerances 0.01 0.003 0.001] [--chunkSize 16384]
+"""
+import os
+import sys
+import math
+import time
+import argparse
+import tracemalloc
+import numpy as np
+from scipy import spatial
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)))
+from ravenframework import MessageHandler
+from ravenframework.SupervisedLearning import factory as romFactory
+from ravenframework.Models.PostProcessors.LimitSurfaceIntegral import LimitSurfaceIntegral
+
+def buildIntegral(sampling, chunkSize, confidence):
+  """
+    Builds the post-processor, with the classifier trained on the points around the limit surface
+    @ In, sampling, str, the point set
+    @ In, chunkSize, int, the number of samples evaluated at once
+    @ In, confidence, float, the confidence level (None for no early stopping)
+    @ Out, pp, LimitSurfaceIntegral, the post-processor
+  """
+  messageHandler = MessageHandler.MessageHandler()
+  messageHandler.initialize({'verbosity': 'quiet', 'callerLength': 10, 'tagLength': 10, 'suppressErrs': False})
+  pp = LimitSurfaceIntegral()
+  pp.messageHandler = messageHandler
+  pp.target = 'goal'
+  pp.variableDist = {'x0': None, 'x1': None}
+  pp.lowerUpperDict = {'x0': {'lowerBound': 0., 'upperBound': 1.}, 'x1': {'lowerBound': 0., 'upperBound': 1.}}
+  pp.sampling, pp.chunkSize, pp.confidence = sampling, chunkSize, confidence
+  # points on both sides of the limit surface x0 + x1 = 1.8
+  t = np.linspace(0.8, 1., 41)
+  x0 = np.concatenate((t - 0.01, t + 0.01))
+  x1 = np.concatenate((1.8 - t - 0.01, 1.8 - t + 0.01))
+  pp.matrixDict = {'x0': x0, 'x1': x1, 'goal': np.concatenate((np.zeros(len(t)), np.ones(len(t))))}
+  pp.functionS = romFactory.returnInstance('KNeighborsClassifier')
+  pp.functionS.initializeFromDict({'Features': ['x0', 'x1'], 'Target': ['goal']})
+  pp.functionS.initializeModel({})
+  pp.functionS.train(pp.matrixDict)
+  if sampling == 'importance':
+    centers = np.column_stack((x0, x1))
+    pp.importanceCenters = centers
+    pp.importanceTree = spatial.cKDTree(centers)
+  # count the evaluated samples
+  evaluate = pp.functionS.evaluate
+  def countingEvaluate(request):
+    """
+      Evaluates the classifier, counting the samples
+      @ In, request, dict, the samples
+      @ Out, evaluation, dict, the classifier evaluation
+    """
+    pp.evaluatedSamples += len(request['x0'])
+    return evaluate(request)
+  pp.evaluatedSamples = 0
+  pp.functionS.evaluate = countingEvaluate
+  return pp
+
+def previousIntegral(pp):
+  """
+    Integrates as before, drawing and evaluating all the samples at once
+    @ In, pp, LimitSurfaceIntegral, the post-processor
+    @ Out, (pb, None, nSamples), tuple, the probability and the number of samples
+  """
+  nSamples = int(math.ceil(1.0 / pp.tolerance**2))
+  randomMatrix = np.random.rand(nSamples, 2)
+  pb = np.mean(pp.functionS.evaluate({'x0': randomMatrix[:, 0], 'x1': randomMatrix[:, 1]})['goal'])
+  return pb, None, nSamples
+
+def measure(function, *args):
+  """
+    Measures the time and the peak memory of a function
+    @ In, function, callable, the function
+    @ In, args, list, its arguments
+    @ Out, (result, elapsed, peak), tuple, the return of the function, the time it took and its peak memory (MB)
+  """
+  tracemalloc.start()
+  start = time.time()
+  result = function(*args)
+  elapsed = time.time() - start
+  peak = tracemalloc.get_traced_memory()[1] / 1e6
+  tracemalloc.stop()
+  return result, elapsed, peak
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='LimitSurfaceIntegral benchmark')
+  parser.add_argument('--tolerances', type=float, nargs='+', default=[0.01, 0.003, 0.001], help='integration tolerances')
+  parser.add_argument('--chunkSize', type=int, default=16384, help='number of samples evaluated at once (power of 2)')
+  args = parser.parse_args()
+  print(f'exact probability 0.02, chunks of {args.chunkSize} samples')
+  print(f'{"tolerance":>9s} {"method":>22s} | {"samples":>8s} {"time":>8s} {"peak MB":>8s} | {"estimate":>8s} {"95% half width":>14s}')
+  for tolerance in args.tolerances:
+    methods = [('previous (at once)', None, None), ('chunked montecarlo', 'montecarlo', None)]
+    methods += [(f'{sampling}, early stop', sampling, 0.95) for sampling in ['montecarlo', 'lhs', 'sobol', 'importance']]
+    for label, sampling, confidence in methods:
+      np.random.seed(20021986)
+      pp = buildIntegral(sampling or 'montecarlo', args.chunkSize, confidence)
+      pp.tolerance = tolerance
+      if sampling is None:
+        (pb, halfWidth, nSamples), elapsed, peak = measure(previousIntegral, pp)
+      else:
+        (pb, _, halfWidth), elapsed, peak = measure(pp._integrateMonteCarlo)
+        nSamples = pp.evaluatedSamples
+      halfWidth = '' if halfWidth is None else f'{halfWidth:.2e}'
+      print(f'{tolerance:9.0e} {label:>22s} | {nSamples:8d} {elapsed:6.2f} s {peak:8.1f} | {pb:8.5f} {halfWidth:>14s}')
@@ -0,0 +1,96 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the submission of the model evaluations to the dask workers, sending the model
+  (here, an object carrying a large state, as a trained ROM) with each job, or shipping it once
+  (scattered to the workers) and sending only a reference with each job, as done by the JobHandler.
+  Reports the bytes serialized and the submission time per job, and the throughput.
+  Usage:
+    python developer_tools/benchmarks/modelShipping.py [--jobs 200] [--stateSize 1000000] [--workers 1]
+"""
+import time
+import pickle
+import argparse
+import numpy as np
+from dask.distributed import Client, LocalCluster, wait
+
+class HeavyModel:
+  """
+    Model with a large state (e.g. the training data of a ROM)
+  """
+  def __init__(self, size):
+    """
+      Constructor
+      @ In, size, int, number of floats of the state
+      @ Out, None
+    """
+    self.state = np.random.default_rng(42).random(size)
+
+  def evaluate(self, x):
+    """
+      Evaluates the model
+      @ In, x, float, the input
+      @ Out, evaluate, float, the output
+    """
+    return x * self.state[0]
+
+def evaluate(model, kwargs):
+  """
+    Remote function (as evaluateSample)
+    @ In, model, HeavyModel, the model
+    @ In, kwargs, dict, the sampled variables
+    @ Out, evaluate, float, the output
+  """
+  return model.evaluate(kwargs['x'])
+
+def submit(client, model, jobs):
+  """
+    Submits the jobs and waits for them
+    @ In, client, Client, the dask client
+    @ In, model, object, the model or its reference
+    @ In, jobs, int, the number of jobs
+    @ Out, (submitTime, totalTime), tuple(float), the total submission time and the total time
+  """
+  start = time.time()
+  submitTime = 0.
+  futures = []
+  for i in range(jobs):
+    submitStart = time.time()
+    futures.append(client.submit(evaluate, model, {'x':float(i)}, pure=False, retries=0))
+    submitTime += time.time() - submitStart
+  wait(futures)
+  return submitTime, time.time() - start
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Model shipping benchmark')
+  parser.add_argument('--jobs', type=int, default=200, help='number of jobs')
+  parser.add_argument('--stateSize', type=int, default=1000000, help='number of floats of the model state')
+  parser.add_argument('--workers', type=int, default=1, help='number of dask workers')
+  args = parser.parse_args()
+  model = HeavyModel(args.stateSize)
+  with LocalCluster(n_workers=args.workers, threads_per_worker=1, processes=True) as cluster, Client(cluster) as client:
+    # warm up the workers
+    client.submit(evaluate, HeavyModel(1), {'x':0.}).result()
+    perJobBytes = len(pickle.dumps((model, {'x':0.})))
+    submitTime, totalTime = submit(client, model, args.jobs)
+    print(f'{args.jobs} jobs, model of {perJobBytes/1e6:.1f} MB, {args.workers} workers')
+    print(f'  sent with each job : {perJobBytes/1e3:10.1f} kB/job, {submitTime/args.jobs*1e3:7.2f} ms/job submission, '
+          f'{args.jobs/totalTime:8.1f} jobs/s')
+    start = time.time()
+    shipment = client.scatter(model, broadcast=True, hash=False)
+    shipTime = time.time() - start
+    perJobBytes = len(pickle.dumps({'x':0.}))
+    submitTime, totalTime = submit(client, shipment, args.jobs)
+    print(f'  shipped once       : {perJobBytes/1e3:10.1f} kB/job, {submitTime/args.jobs*1e3:7.2f} ms/job submission, '
+          f'{args.jobs/(totalTime + shipTime):8.1f} jobs/s (shipping {shipTime:.2f} s)')
@@ -0,0 +1,143 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the MonteCarlo sampler generation rate.
+  For 1, 10 and 100 sampled variables, reports the samples/s obtained by the MonteCarlo sampler
+  drawing one sample at a time and in blocks (samplerInit/blockSize), and checks that the two
+  modes produce identical samples.
+  Usage:
+    python developer_tools/benchmarks/monteCarloBlockDraw.py [--samples 10000] [--block 1000]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+sys.path.append(frameworkDir)
+
+# a mix of distributions, cycled over the variables
+distributionsXml = """
+    <Normal name="normal">
+      <mean>1.0</mean>
+      <sigma>0.5</sigma>
+    </Normal>
+    <Uniform name="uniform">
+      <lowerBound>-1.0</lowerBound>
+      <upperBound>2.0</upperBound>
+    </Uniform>
+    <Exponential name="exponential">
+      <lambda>2.0</lambda>
+    </Exponential>
+    <Beta name="beta">
+      <alpha>2.0</alpha>
+      <beta>5.0</beta>
+    </Beta>
+    <Triangular name="triangular">
+      <apex>1.0</apex>
+      <min>0.0</min>
+      <max>4.0</max>
+    </Triangular>
+"""
+distributionNames = ['normal', 'uniform', 'exponential', 'beta', 'triangular']
+
+workflowTemplate = """
+<Simulation verbosity="silent">
+  <RunInfo>
+    <WorkingDir>.</WorkingDir>
+    <Sequence>sample</Sequence>
+  </RunInfo>
+  <Steps>
+    <MultiRun name="sample">
+      <Input class="DataObjects" type="PointSet">placeholder</Input>
+      <Model class="Models" type="Dummy">model</Model>
+      <Sampler class="Samplers" type="MonteCarlo">mc</Sampler>
+      <Output class="DataObjects" type="PointSet">results</Output>
+    </MultiRun>
+  </Steps>
+  <Models>
+    <Dummy name="model" subType=""/>
+  </Models>
+  <Samplers>
+    <MonteCarlo name="mc">
+      <samplerInit>
+        <limit>{samples}</limit>
+        <initialSeed>42</initialSeed>
+      </samplerInit>
+{variables}
+    </MonteCarlo>
+  </Samplers>
+  <Distributions>{distributions}</Distributions>
+  <DataObjects>
+    <PointSet name="placeholder"/>
+    <PointSet name="results">
+      <Input>{inputs}</Input>
+      <Output>OutputPlaceHolder</Output>
+    </PointSet>
+  </DataObjects>
+</Simulation>
+"""
+
+def loadSampler(workDir, nVars, samples):
+  """
+    Writes and loads a MonteCarlo workflow, and returns its (assembled) sampler
+    @ In, workDir, str, directory where to write the workflow
+    @ In, nVars, int, number of sampled variables
+    @ In, samples, int, number of samples
+    @ Out, sampler, MonteCarlo, the sampler
+  """
+  from ravenframework import Raven
+  names = [f'x{i}' for i in range(nVars)]
+  variables = '\n'.join(f'      <variable name="{name}"><distribution>{distributionNames[i % len(distributionNames)]}</distribution></variable>'
+                        for i, name in enumerate(names))
+  xml = os.path.join(workDir, f'mc_{nVars}.xml')
+  with open(xml, 'w') as xmlFile:
+    xmlFile.write(workflowTemplate.format(samples=samples, variables=variables, distributions=distributionsXml, inputs=','.join(names)))
+  raven = Raven()
+  raven.loadWorkflowFromFile(xml)
+  stepInputDict, _ = raven._simulation.initiateStep('sample')
+  return stepInputDict['Sampler']
+
+def sample(sampler, blockSize):
+  """
+    Generates all the samples of the sampler
+    @ In, sampler, MonteCarlo, the sampler
+    @ In, blockSize, int, block size (0 for one sample at a time)
+    @ Out, rate, float, samples/s
+    @ Out, values, list, the sampled values
+  """
+  sampler.blockSize = blockSize
+  sampler.initialize()
+  values = []
+  start = time.time()
+  while sampler.amIreadyToProvideAnInput():
+    sampler.generateInput(None, [])
+    values.append((dict(sampler.values), sampler.inputInfo['PointProbability']))
+  rate = len(values) / (time.time() - start)
+  return rate, values
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='MonteCarlo block-draw benchmark')
+  parser.add_argument('--samples', type=int, default=10000, help='number of samples')
+  parser.add_argument('--block', type=int, default=1000, help='block size')
+  args = parser.parse_args()
+  with tempfile.TemporaryDirectory() as workDir:
+    for nVars in [1, 10, 100]:
+      mc = loadSampler(workDir, nVars, args.samples)
+      serialRate, serialValues = sample(mc, 0)
+      blockRate, blockValues = sample(mc, args.block)
+      identical = 'identical' if serialValues == blockValues else 'DIFFERENT'
+      print(f'{nVars:4d} variables: serial {serialRate:10.1f} samples/s, block {blockRate:10.1f} samples/s '
+            f'(x{blockRate / serialRate:.1f}), samples {identical}')
@@ -0,0 +1,66 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the NetCDF database fed with realizations, as done by a MultiRun.
+  Reports the time to add the realizations when they are written one by one (bufferSize 1)
+  and in batches, and the time of each block of realizations, to show how it grows with the size
+  of the database.
+  Usage:
+    python developer_tools/benchmarks/netcdfStreaming.py [--realizations 2000] [--historyLength 50] [--bufferSize 100]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import numpy as np
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+sys.path.append(frameworkDir)
+
+from ravenframework.Databases.NetCDF import NetCDF
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='NetCDF database streaming benchmark')
+  parser.add_argument('--realizations', type=int, default=2000, help='number of realizations')
+  parser.add_argument('--historyLength', type=int, default=50, help='length of the time-dependent output')
+  parser.add_argument('--bufferSize', type=int, default=100, help='buffer of the database')
+  args = parser.parse_args()
+  rng = np.random.default_rng(42)
+  time_ = np.linspace(0., 1., args.historyLength)
+  blocks = 4
+  print(f'{args.realizations} realizations with a history of length {args.historyLength}')
+  with tempfile.TemporaryDirectory() as directory:
+    for bufferSize in [1, args.bufferSize]:
+      database = NetCDF()
+      database.name = f'buffer{bufferSize}'
+      database.databaseDir = directory
+      database.filename = f'buffer{bufferSize}.nc'
+      database._bufferSize = bufferSize
+      blockTimes = []
+      start = time.time()
+      for r in range(args.realizations):
+        x = rng.random(2)
+        rlz = {'x': np.atleast_1d(x[0]), 'y': np.atleast_1d(x[1]), 'time': time_, 'z': x[0] * np.exp(x[1] * time_),
+               '_indexMap': [{'z': ['time']}]}
+        database.addRealization(rlz)
+        if (r + 1) % (args.realizations // blocks) == 0:
+          blockTimes.append(time.time() - start)
+          start = time.time()
+      start = time.time()
+      database.flush()
+      blockTimes[-1] += time.time() - start
+      blocksText = ', '.join(f'{t:6.2f}' for t in blockTimes)
+      print(f'  bufferSize {bufferSize:4d}: total {sum(blockTimes):7.2f} s '
+            f'({args.realizations/sum(blockTimes):7.0f} realizations/s), per quarter of the run [{blocksText}] s')
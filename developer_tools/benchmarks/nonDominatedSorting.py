@@ -0,0 +1,100 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the non-dominated sorting (frontUtils.rankNonDominatedFrontiers) and of the
+  crowding distance (frontUtils.crowdingDistance) of a population, compared with the previous
+  implementations (omitting the frontiers one by one, and looping over the individuals).
+  Checks that the ranks and the distances are identical (the population having no duplicates).
+  Usage:
+    python developer_tools/benchmarks/nonDominatedSorting.py [--sizes 100 1000 3000 10000] [--objectives 3]
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)))
+from ravenframework.utils import frontUtils
+
+def previousRank(data):
+  """
+    Ranks the non dominated fronts as before, omitting the first front from the data recursively
+    @ In, data, np.array, data matrix (nPoints, nObjectives)
+    @ Out, nonDominatedRank, list, the ranking of the front passing through each point
+  """
+  nonDominatedRank = np.zeros(data.shape[0], dtype=int)
+  rank = 0
+  indicesDominated = list(np.arange(data.shape[0]))
+  rawData = data
+  while np.shape(data)[0] > 0:
+    rank += 1
+    indicesNonDominated = list(frontUtils.nonDominatedFrontier(data, False))
+    if rank > 1:
+      for i in range(len(indicesNonDominated)):
+        indicesNonDominated[i] = indicesDominated[indicesNonDominated[i]]
+    indicesDominated = list(set(indicesDominated) - set(indicesNonDominated))
+    data = rawData[indicesDominated]
+    nonDominatedRank[indicesNonDominated] = rank
+  return list(nonDominatedRank)
+
+def previousCrowdingDistance(rank, popSize, objectives):
+  """
+    Calculates the crowding distance for each front as before, looping over the individuals
+    @ In, rank, np.array, array which contains the front ID for each element of the population
+    @ In, popSize, int, size of population
+    @ In, objectives, np.array, matrix contains objective values for each element of the population
+    @ Out, crowdDist, np.array, array of crowding distances
+  """
+  crowdDist = np.zeros(popSize)
+  fronts = np.unique(rank)
+  fronts = fronts[fronts != np.inf]
+  for f in range(len(fronts)):
+    front = np.where(np.asarray(rank) == f + 1)[0]
+    fMax = np.max(objectives[front, :], axis=0)
+    fMin = np.min(objectives[front, :], axis=0)
+    for obj in range(np.shape(objectives)[1]):
+      sortedRank = np.argsort(objectives[front, obj])
+      crowdDist[front[sortedRank[0]]] = crowdDist[front[sortedRank[-1]]] = np.inf
+      for i in range(1, len(front) - 1):
+        crowdDist[front[sortedRank[i]]] = crowdDist[front[sortedRank[i]]] + (objectives[front[sortedRank[i+1]], obj] - objectives[front[sortedRank[i-1]], obj]) / (fMax[obj] - fMin[obj])
+  return crowdDist
+
+def timeIt(function, *args):
+  """
+    Times a function
+    @ In, function, callable, the function
+    @ In, args, list, its arguments
+    @ Out, (result, elapsed), tuple, the return of the function and the time it took
+  """
+  start = time.time()
+  result = function(*args)
+  return result, time.time() - start
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Non-dominated sorting benchmark')
+  parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 3000, 10000], help='population sizes')
+  parser.add_argument('--objectives', type=int, default=3, help='number of objectives')
+  args = parser.parse_args()
+  rng = np.random.default_rng(42)
+  print(f'{args.objectives} objectives')
+  print(f'{"population":>10s} {"fronts":>6s} | {"rank before":>11s} {"after":>8s} | {"crowding before":>15s} {"after":>8s} | identical')
+  for size in args.sizes:
+    objectives = rng.random((size, args.objectives))
+    before, rankBefore = timeIt(previousRank, objectives)
+    after, rankAfter = timeIt(frontUtils.rankNonDominatedFrontiers, objectives)
+    distBefore, crowdBefore = timeIt(previousCrowdingDistance, before, size, objectives)
+    distAfter, crowdAfter = timeIt(frontUtils.crowdingDistance, after, size, objectives)
+    same = before == after and np.array_equal(distBefore, distAfter)
+    print(f'{size:10d} {max(after):6d} | {rankBefore:9.3f} s {rankAfter:6.3f} s | {crowdBefore:13.3f} s {crowdAfter:6.3f} s | {same}')
@@ -0,0 +1,143 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of a HistorySet collecting many long histories, kept in memory (the previous
+  behavior) and stored on disk in NetCDF chunks: time, peak memory (tracemalloc) and memory retained
+  by the DataObject when adding the realizations, when writing the CSV files and when computing the
+  statistics of the scalar inputs with BasicStatistics. Checks that the CSV files and the statistics
+  are identical.
+  Usage:
+    python developer_tools/benchmarks/outOfCoreHistorySet.py [--histories 1000] [--steps 2000] [--chunkSize 200]
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import filecmp
+import tempfile
+import tracemalloc
+import xml.etree.ElementTree as ET
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)))
+from ravenframework import MessageHandler
+from ravenframework import DataObjects
+from ravenframework.Models.PostProcessors.BasicStatistics import BasicStatistics
+
+messageHandler = MessageHandler.MessageHandler()
+messageHandler.initialize({'verbosity': 'quiet', 'callerLength': 10, 'tagLength': 10, 'suppressErrs': False})
+
+def createHistorySet(storage, chunkSize, directory):
+  """
+    Creates the HistorySet, as after reading its input
+    @ In, storage, str, memory or netCDF
+    @ In, chunkSize, int, the number of realizations of each chunk on disk
+    @ In, directory, str, the directory of the chunks
+    @ Out, data, HistorySet, the data object
+  """
+  xml = ET.fromstring(f'<HistorySet name="histories"><Input>a,b,c</Input><Output>x,y</Output>'
+                      f'<options><pivotParameter>time</pivotParameter></options>'
+                      f'<storage chunkSize="{chunkSize}" directory="{directory}">{storage}</storage></HistorySet>')
+  data = DataObjects.HistorySet()
+  data.messageHandler = messageHandler
+  data._readMoreXML(xml)
+  return data
+
+def addHistories(data, histories, steps):
+  """
+    Adds the realizations, generated on the fly as a code would, then collapses the data object
+    @ In, data, HistorySet, the data object
+    @ In, histories, int, the number of histories
+    @ In, steps, int, the number of time points of each history
+    @ Out, None
+  """
+  rng = np.random.default_rng(42)
+  time = np.linspace(0., 1., steps)
+  for _ in range(histories):
+    a, b = rng.random(2)
+    c = rng.lognormal()
+    x = a * np.sin(2. * np.pi * time) + 0.1 * c * rng.normal(size=steps).cumsum()
+    y = b * time + rng.normal(size=steps)
+    data.addRealization({'a': np.array([a]), 'b': np.array([b]), 'c': np.array([c]), 'x': x, 'y': y, 'time': time})
+  data.asDataset()
+
+def computeStatistics(data):
+  """
+    Computes moments and percentiles of the scalar inputs with BasicStatistics
+    @ In, data, HistorySet, the data object
+    @ Out, results, dict, the statistics
+  """
+  pp = BasicStatistics()
+  pp.messageHandler = messageHandler
+  variables = ['a', 'b', 'c']
+  pp.toDo = {}
+  for metric in ['expectedValue', 'sigma', 'minimum', 'maximum']:
+    pp.toDo[metric] = [{'targets': set(variables), 'prefix': metric}]
+  pp.toDo['percentile'] = [{'targets': set(variables), 'prefix': 'percentile', 'percent': {0.05, 0.95},
+                            'strPercent': {'5', '95'}, 'interpolation': 'linear'}]
+  pp.parameters = {'targets': variables}
+  pp.sampleTag = 'RAVEN_sample_ID'
+  pp.dynamic = False
+  pp.outputDataset = False
+  pp.pbPresent = False
+  pp.realizationWeight = None
+  return pp._runLocal((data.asDataset()[variables], None))
+
+def measure(function, *args):
+  """
+    Measures the time, the peak memory and the memory still allocated after a function
+    @ In, function, callable, the function
+    @ In, args, list, its arguments
+    @ Out, (result, elapsed, peak, retained), tuple, the return of the function, the time it took, its
+      peak memory and the memory still allocated after it (MB)
+  """
+  tracemalloc.start()
+  start = time.time()
+  result = function(*args)
+  elapsed = time.time() - start
+  retained, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  return result, elapsed, peak / 1e6, retained / 1e6
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='out-of-core HistorySet benchmark')
+  parser.add_argument('--histories', type=int, default=1000, help='number of histories')
+  parser.add_argument('--steps', type=int, default=2000, help='number of time points of each history')
+  parser.add_argument('--chunkSize', type=int, default=200, help='number of realizations of each chunk on disk')
+  args = parser.parse_args()
+  size = args.histories * args.steps * 2 * 8 / 1e6
+  print(f'{args.histories} histories of {args.steps} time points, two histories each ({size:.0f} MB of values), '
+        f'chunks of {args.chunkSize} realizations on disk')
+  print(f'{"storage":>8s} {"step":>10s} | {"time":>8s} {"peak MB":>8s} {"retained MB":>11s}')
+  workDir = tempfile.mkdtemp()
+  results = {}
+  for storage in ['memory', 'netCDF']:
+    data = createHistorySet(storage, args.chunkSize, os.path.join(workDir, 'chunks'))
+    _, elapsed, peak, retained = measure(addHistories, data, args.histories, args.steps)
+    print(f'{storage:>8s} {"collect":>10s} | {elapsed:6.2f} s {peak:8.1f} {retained:11.1f}')
+    csvDir = os.path.join(workDir, storage)
+    os.makedirs(csvDir)
+    _, elapsed, peak, _ = measure(data.write, os.path.join(csvDir, 'histories'), 'CSV')
+    print(f'{storage:>8s} {"write CSV":>10s} | {elapsed:6.2f} s {peak:8.1f}')
+    results[storage], elapsed, peak, _ = measure(computeStatistics, data)
+    print(f'{storage:>8s} {"statistics":>10s} | {elapsed:6.2f} s {peak:8.1f}')
+    data.reset()
+  csvFiles = sorted(os.listdir(os.path.join(workDir, 'memory')))
+  _, mismatch, errors = filecmp.cmpfiles(os.path.join(workDir, 'memory'), os.path.join(workDir, 'netCDF'), csvFiles, shallow=False)
+  print(f'{len(csvFiles)} CSV files, {"identical" if not mismatch and not errors else "DIFFERENT"}')
+  statistics = {storage: {key: np.asarray(value, dtype=float) for key, value in results[storage].items()} for storage in results}
+  same = all(np.allclose(statistics['memory'][key], statistics['netCDF'][key], rtol=1e-12, atol=0.) for key in statistics['memory'])
+  print(f'statistics {"identical" if same else "DIFFERENT"}')
+  shutil.rmtree(workDir)
@@ -0,0 +1,110 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Scaling benchmark of the parallel methods of the internal models.
+  Samples a CPU-bound, pure-Python ExternalModel with MonteCarlo, with the "shared" (threads) and the
+  "process" (pool of local processes) parallelMethod, for an increasing number of workers (batchSize),
+  and reports the throughput of the sampling step (estimated by subtracting the time of a run with a
+  single, trivial, sample) and the speedup with respect to a single worker.
+  Usage:
+    python developer_tools/benchmarks/processPool.py [--samples 200] [--workers 1 2 4 8] [--work 200000]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+
+model = """
+def run(self, Input):
+  # pure-Python (GIL-bound) work
+  x = float(Input['x'])
+  total = 0.
+  for i in range({work}):
+    total += (x * i) % 7.
+  self.y = total
+"""
+
+template = """<Simulation verbosity="quiet">
+  <RunInfo>
+    <WorkingDir>{workDir}</WorkingDir>
+    <Sequence>sample</Sequence>
+    <batchSize>{workers}</batchSize>
+    <parallelMethod>{method}</parallelMethod>
+  </RunInfo>
+  <Distributions>
+    <Uniform name="unif"><lowerBound>0</lowerBound><upperBound>1</upperBound></Uniform>
+  </Distributions>
+  <Samplers>
+    <MonteCarlo name="mc">
+      <samplerInit><limit>{samples}</limit><initialSeed>42</initialSeed></samplerInit>
+      <variable name="x"><distribution>unif</distribution></variable>
+    </MonteCarlo>
+  </Samplers>
+  <Models>
+    <ExternalModel ModuleToLoad="{model}" name="model" subType=""><inputs>x</inputs><outputs>y</outputs></ExternalModel>
+  </Models>
+  <Steps>
+    <MultiRun name="sample">
+      <Input class="DataObjects" type="PointSet">placeholder</Input>
+      <Model class="Models" type="ExternalModel">model</Model>
+      <Sampler class="Samplers" type="MonteCarlo">mc</Sampler>
+      <Output class="DataObjects" type="PointSet">samples</Output>
+    </MultiRun>
+  </Steps>
+  <DataObjects>
+    <PointSet name="placeholder"><Input>x</Input><Output>OutputPlaceHolder</Output></PointSet>
+    <PointSet name="samples"><Input>x</Input><Output>y</Output></PointSet>
+  </DataObjects>
+</Simulation>
+"""
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Process pool scaling benchmark')
+  parser.add_argument('--samples', type=int, default=200, help='number of MonteCarlo samples')
+  parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help='numbers of workers (batchSize)')
+  parser.add_argument('--work', type=int, default=200000, help='number of Python loop iterations per evaluation')
+  args = parser.parse_args()
+  env = dict(os.environ, PYTHONPATH=frameworkDir, RAVEN_IGNORE_VERSIONS='1')
+  print(f'{args.samples} evaluations of a pure-Python model ({args.work} iterations), {os.cpu_count()} CPUs')
+  with tempfile.TemporaryDirectory() as workDir:
+    with open(os.path.join(workDir, 'cpuBound.py'), 'w') as moduleFile:
+      moduleFile.write(model.format(work=args.work))
+    def run(method, workers, samples):
+      """
+        Runs the sampling
+        @ In, method, str, the parallelMethod
+        @ In, workers, int, the batchSize
+        @ In, samples, int, the number of samples
+        @ Out, elapsed, float, time of the run (s)
+      """
+      name = f'{method}_{workers}_{samples}'
+      inputFile = os.path.join(workDir, f'{name}.xml')
+      with open(inputFile, 'w') as xml:
+        xml.write(template.format(workDir=os.path.join(workDir, name), workers=workers, method=method,
+                                  samples=samples, model=os.path.join(workDir, 'cpuBound')))
+      start = time.time()
+      subprocess.run([sys.executable, '-m', 'ravenframework.Driver', inputFile], env=env, cwd=workDir,
+                     capture_output=True, check=True)
+      return time.time() - start
+    for method in ['shared', 'process']:
+      reference = None
+      for workers in args.workers:
+        overhead = run(method, workers, 1)
+        elapsed = max(run(method, workers, args.samples) - overhead, 1e-6)
+        reference = reference or elapsed
+        print(f'  {method:8s} {workers:3d} workers: {args.samples / elapsed:8.1f} evaluations/s, speedup {reference / elapsed:5.2f}')
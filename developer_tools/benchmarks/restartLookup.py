@@ -0,0 +1,95 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the restart lookup (DataSet.realization(matchDict=...)).
+  Fills a PointSet with random realizations (in the finalized data or in the collector) and
+  reports the time per lookup for points that are found and points that are not found,
+  as done by the samplers for each new sample when restarting.
+  Usage:
+    python developer_tools/benchmarks/restartLookup.py [--sizes 1000 10000 200000] [--vars 5] [--lookups 200]
+"""
+import os
+import sys
+import time
+import argparse
+import xml.etree.ElementTree as ET
+import numpy as np
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+sys.path.append(frameworkDir)
+
+def createPointSet(nVars, values, collapse):
+  """
+    Creates and fills a PointSet
+    @ In, nVars, int, number of input variables
+    @ In, values, np.ndarray, (samples, nVars + 1) values of the inputs and the output
+    @ In, collapse, bool, if True the realizations are moved from the collector to the data
+    @ Out, data, PointSet, the data object
+  """
+  from ravenframework import DataObjects, MessageHandler
+  mh = MessageHandler.MessageHandler()
+  mh.initialize({'verbosity':'quiet'})
+  data = DataObjects.PointSet()
+  xml = ET.Element('PointSet', {'name':'restart'})
+  ET.SubElement(xml, 'Input').text = ','.join(f'x{i}' for i in range(nVars))
+  ET.SubElement(xml, 'Output').text = 'y'
+  data._readMoreXML(xml)
+  data.messageHandler = mh
+  names = [f'x{i}' for i in range(nVars)] + ['y']
+  for row in values:
+    data.addRealization(dict((name, np.atleast_1d(val)) for name, val in zip(names, row)))
+  if collapse:
+    data.asDataset()
+  return data
+
+def lookup(data, nVars, points):
+  """
+    Looks up the points in the data object
+    @ In, data, PointSet, the data object
+    @ In, nVars, int, number of input variables
+    @ In, points, np.ndarray, (lookups, nVars) points to find
+    @ Out, perLookup, float, time per lookup (s)
+    @ Out, found, int, number of points found
+  """
+  found = 0
+  start = time.time()
+  for point in points:
+    _, rlz = data.realization(matchDict=dict((f'x{i}', val) for i, val in enumerate(point)), tol=1e-15)
+    found += rlz is not None
+  perLookup = (time.time() - start) / len(points)
+  return perLookup, found
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Restart lookup benchmark')
+  parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 200000], help='number of stored realizations')
+  parser.add_argument('--vars', type=int, default=5, help='number of input variables')
+  parser.add_argument('--lookups', type=int, default=200, help='number of lookups')
+  args = parser.parse_args()
+  rng = np.random.default_rng(42)
+  for size in args.sizes:
+    values = rng.random((size, args.vars + 1))
+    existing = values[rng.integers(0, size, args.lookups), :args.vars]
+    new = rng.random((args.lookups, args.vars))
+    for collapse in [True, False]:
+      data = createPointSet(args.vars, values, collapse)
+      where = 'data' if collapse else 'collector'
+      # the first lookup includes building the index
+      start = time.time()
+      lookup(data, args.vars, existing[:1])
+      first = time.time() - start
+      hit, nHit = lookup(data, args.vars, existing)
+      miss, nMiss = lookup(data, args.vars, new)
+      print(f'{size:8d} realizations in {where:9s}: first lookup {first*1e3:9.2f} ms, '
+            f'found {hit*1e3:8.3f} ms/lookup ({nHit}/{len(existing)}), '
+            f'not found {miss*1e3:8.3f} ms/lookup ({nMiss}/{len(new)})')
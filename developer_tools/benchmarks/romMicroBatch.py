@@ -0,0 +1,115 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmark of the micro-batched evaluation of a ROM in a MultiRun step.
+  Trains a ROM on a grid of an analytic model, then samples it with MonteCarlo for each requested
+  "microBatch" and reports the time of the whole workflow (the training is the same for all of them)
+  and the throughput of the sampling step, estimated by subtracting the time of the same workflow without it.
+  Usage:
+    python developer_tools/benchmarks/romMicroBatch.py [--samples 2000] [--microBatch 1 10 100] [--rom NDinvDistWeight]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+modelPath = os.path.join(frameworkDir, 'tests', 'framework', 'AnalyticModels', 'parabolas')
+
+template = """<Simulation verbosity="quiet">
+  <RunInfo>
+    <WorkingDir>{workDir}</WorkingDir>
+    <Sequence>{sequence}</Sequence>
+    <batchSize>1</batchSize>
+  </RunInfo>
+  <Distributions>
+    <Uniform name="unif"><lowerBound>-1</lowerBound><upperBound>1</upperBound></Uniform>
+  </Distributions>
+  <Samplers>
+    <Grid name="grid">
+      <variable name="x"><distribution>unif</distribution><grid construction="equal" steps="9" type="value">-1 1</grid></variable>
+      <variable name="y"><distribution>unif</distribution><grid construction="equal" steps="9" type="value">-1 1</grid></variable>
+    </Grid>
+    <MonteCarlo name="mc">
+      <samplerInit><limit>{samples}</limit><initialSeed>42</initialSeed></samplerInit>
+      <variable name="x"><distribution>unif</distribution></variable>
+      <variable name="y"><distribution>unif</distribution></variable>
+    </MonteCarlo>
+  </Samplers>
+  <Models>
+    <ExternalModel ModuleToLoad="{model}" name="model" subType=""><variables>x, y, ans</variables></ExternalModel>
+    <ROM name="rom" subType="{rom}"><Features>x, y</Features><Target>ans</Target>{romOptions}</ROM>
+  </Models>
+  <Steps>
+    <MultiRun name="sample">
+      <Input class="DataObjects" type="PointSet">placeholder</Input>
+      <Model class="Models" type="ExternalModel">model</Model>
+      <Sampler class="Samplers" type="Grid">grid</Sampler>
+      <Output class="DataObjects" type="PointSet">trainingData</Output>
+    </MultiRun>
+    <RomTrainer name="train">
+      <Input class="DataObjects" type="PointSet">trainingData</Input>
+      <Output class="Models" type="ROM">rom</Output>
+    </RomTrainer>
+    <MultiRun name="resample" microBatch="{microBatch}">
+      <Input class="DataObjects" type="PointSet">placeholder</Input>
+      <Model class="Models" type="ROM">rom</Model>
+      <Sampler class="Samplers" type="MonteCarlo">mc</Sampler>
+      <Output class="DataObjects" type="PointSet">samples</Output>
+    </MultiRun>
+  </Steps>
+  <DataObjects>
+    <PointSet name="placeholder"><Input>x, y</Input><Output>OutputPlaceHolder</Output></PointSet>
+    <PointSet name="trainingData"><Input>x, y</Input><Output>ans</Output></PointSet>
+    <PointSet name="samples"><Input>x, y</Input><Output>ans</Output></PointSet>
+  </DataObjects>
+</Simulation>
+"""
+
+romOptions = {'NDinvDistWeight':'<p>3</p>',
+              'LinearRegression':'',
+              'GaussianProcessRegressor':''}
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='ROM micro-batch benchmark')
+  parser.add_argument('--samples', type=int, default=2000, help='number of MonteCarlo samples of the ROM')
+  parser.add_argument('--microBatch', type=int, nargs='+', default=[1, 10, 100], help='micro-batch sizes')
+  parser.add_argument('--rom', default='NDinvDistWeight', choices=list(romOptions), help='ROM subType')
+  args = parser.parse_args()
+  env = dict(os.environ, PYTHONPATH=frameworkDir, RAVEN_IGNORE_VERSIONS='1')
+  print(f'{args.samples} MonteCarlo samples of a {args.rom} ROM')
+  with tempfile.TemporaryDirectory() as workDir:
+    def run(name, sequence, microBatch):
+      """
+        Runs the workflow
+        @ In, name, str, name of the run
+        @ In, sequence, str, the steps to run
+        @ In, microBatch, int, the micro-batch of the sampling of the ROM
+        @ Out, elapsed, float, time of the workflow (s)
+      """
+      inputFile = os.path.join(workDir, f'{name}.xml')
+      with open(inputFile, 'w') as xml:
+        xml.write(template.format(workDir=os.path.join(workDir, name), sequence=sequence, samples=args.samples,
+                                  model=modelPath, rom=args.rom, romOptions=romOptions[args.rom], microBatch=microBatch))
+      start = time.time()
+      subprocess.run([sys.executable, '-m', 'ravenframework.Driver', inputFile], env=env, cwd=workDir,
+                     capture_output=True, check=True)
+      return time.time() - start
+    training = run('training', 'sample, train', 1)
+    print(f'  training only      : workflow {training:7.2f} s')
+    for microBatch in args.microBatch:
+      elapsed = run(f'microBatch_{microBatch}', 'sample, train, resample', microBatch)
+      print(f'  microBatch {microBatch:4d}    : workflow {elapsed:7.2f} s, sampling {args.samples / max(elapsed - training, 1e-6):8.0f} samples/s')
@@ -0,0 +1,98 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Microbenchmark of the training of a segmented SyntheticHistory ROM (Fourier and ARMA) on an hourly
+  year (8760 values) of a few signals, as a function of the number of processes training the segment
+  ROMs (Segment "trainingWorkers"). Checks that the trained ARMA coefficients do not depend on it.
+  Usage:
+    python developer_tools/benchmarks/segmentTraining.py [--segments 52] [--signals 2] [--workers 1 2 4]
+"""
+import io
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)))
+from ravenframework import MessageHandler
+from ravenframework.utils import TreeStructure as TS
+from ravenframework.Models.ROM import ROM
+
+def buildROM(signals, segments, workers):
+  """
+    Builds the segmented SyntheticHistory ROM
+    @ In, signals, list(str), the names of the signals
+    @ In, segments, int, the number of segments
+    @ In, workers, int, the number of processes training the segment ROMs
+    @ Out, rom, ROM, the (untrained) ROM
+  """
+  targets = ', '.join(signals)
+  xml = f"""<ROM name="synth" subType="SyntheticHistory">
+    <Target>{targets}, pivot</Target>
+    <Features>scaling</Features>
+    <pivotParameter>pivot</pivotParameter>
+    <fourier target="{targets}"><periods>24, 12</periods></fourier>
+    <arma target="{targets}" seed="42"><P>2</P><Q>1</Q></arma>
+    <Segment grouping="segment" trainingWorkers="{workers}">
+      <subspace divisions="{segments}">pivot</subspace>
+    </Segment>
+  </ROM>"""
+  messageHandler = MessageHandler.MessageHandler()
+  messageHandler.initialize({'verbosity': 'quiet', 'callerLength': 10, 'tagLength': 10, 'suppressErrs': False})
+  rom = ROM()
+  rom.messageHandler = messageHandler
+  rom._readMoreXML(TS.parse(io.StringIO(xml), dType='xml').getroot())
+  return rom
+
+def armaCoefficients(rom):
+  """
+    Collects the trained ARMA coefficients of the segment ROMs
+    @ In, rom, ROM, the trained ROM
+    @ Out, coeffs, np.array, the AR and MA coefficients of each segment and signal
+  """
+  coeffs = []
+  for segment in rom.supervisedContainer[0]._roms:
+    for algo, params in segment._tsaTrainedParams.items():
+      if type(algo).__name__ == 'ARMA':
+        for target in sorted(params):
+          coeffs.append(np.r_[params[target]['arma']['ar'], params[target]['arma']['ma']])
+  return np.array(coeffs)
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Segment training benchmark')
+  parser.add_argument('--segments', type=int, default=52, help='number of segments')
+  parser.add_argument('--signals', type=int, default=2, help='number of signals')
+  parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help='numbers of training processes')
+  args = parser.parse_args()
+  length = 8760
+  pivot = np.arange(length, dtype=float)
+  rng = np.random.default_rng(42)
+  signals = [f'signal{s}' for s in range(args.signals)]
+  data = {'scaling': [np.ones(length)], 'pivot': [pivot]}
+  for s, signal in enumerate(signals):
+    data[signal] = [np.sin(2. * np.pi * pivot / 24. + s) + 0.5 * np.cos(2. * np.pi * pivot / 12.) + rng.normal(size=length)]
+  print(f'{length}x{args.signals} signals in {args.segments} segments, {os.cpu_count()} CPUs')
+  reference = None
+  for workers in args.workers:
+    rom = buildROM(signals, args.segments, workers)
+    start = time.time()
+    rom.train(data)
+    elapsed = time.time() - start
+    coeffs = armaCoefficients(rom)
+    if reference is None:
+      reference = (elapsed, coeffs)
+    same = np.array_equal(coeffs, reference[1])
+    print(f'  {workers:3d} workers: {elapsed:8.2f} s, speedup x{reference[0]/elapsed:.2f}, '
+          f'ARMA coefficients {"identical" if same else "DIFFERENT"}')
@@ -1307,6 +1307,13 @@ user need to specify following information for \xmlNode{Segment}:
         segmentation without clustering. If clustering, then an additional node needs to be included in the
         \xmlNode{Segment} node, as described below.
         \default{segment}
+      \item \xmlAttr{trainingWorkers}, \xmlDesc{integer, optional field} number of local processes
+        training the segment ROMs concurrently. If greater than 1, the ROMs of the segments are trained
+        on a pool of processes. Serial or not, the global random number generator is seeded before
+        the training of each segment, with a seed drawn once from the global generator (hence depending
+        on the seed of the simulation) plus the index of the segment, so that the trained ROMs do not
+        depend on the number of processes.
+        \default{1}
     \end{itemize}
 
     This node takes the following subnodes:
@@ -232,6 +232,18 @@ class CodeInterfaceBase(BaseInterface):
     """
     self.addInputExtension(['i','inp','in'])
 
+  def getModifiedInputFiles(self, oriInputFiles):
+    """
+      This method returns the input files that the code interface modifies (rewrites) in createNewInput.
+      Only these files need to be copied for each new input, while the others can be linked
+      to the original ones (see the "inputStaging" option of the Code model).
+      This method should be overwritten by the interfaces that do not modify all the input files.
+      @ In, oriInputFiles, list, list of the original input files
+      @ Out, modifiedFiles, list, list of the original input files that get modified
+    """
+    modifiedFiles = list(oriInputFiles)
+    return modifiedFiles
+
   def initialize(self, runInfo, oriInputFiles):
     """
       Method to initialize the run of a new step
@@ -42,6 +42,9 @@ class GenericCode(CodeInterfaceBase):
     self.execPostfix      = ''       # executioner command postfix (e.g. -zcvf)
     self.caseName         = None     # base label for outgoing files, should default to inputFileName
     self.fixedOutFileName = None     # CSV output filename of the run code (in case it is hardcoded in the driven code)
+    self.reuseParser      = True     # if True, the input files are parsed once (per step) and reused for all the samples
+    self._parser          = None     # parsed (templated) input files
+    self._parserKey       = None     # identifies the original input files the parser was created for
 
   def _readMoreXML(self,xmlNode):
     """
@@ -174,7 +177,43 @@ class GenericCode(CodeInterfaceBase):
     for inputFile in origInputFiles:
       if inputFile.getExt() in self.getInputExtension():
         origfiles.append(inputFile)
-    parser = GenericParser.GenericParser(infiles)
+    parser = self._getParser(infiles, origfiles)
     parser.modifyInternalDictionary(**Kwargs)
     parser.writeNewInput(infiles,origfiles)
     return currentInputFiles
+
+  def getModifiedInputFiles(self, oriInputFiles):
+    """
+      This method returns the input files that the code interface modifies (rewrites) in createNewInput,
+      i.e. the files with one of the input extensions.
+      @ In, oriInputFiles, list, list of the original input files
+      @ Out, modifiedFiles, list, list of the original input files that get modified
+    """
+    modifiedFiles = [inputFile for inputFile in oriInputFiles if inputFile.getExt() in self.getInputExtension()]
+    return modifiedFiles
+
+  def _getParser(self, infiles, origfiles):
+    """
+      Provides the parser of the input files. Unless the original input files changed (e.g., a new step
+      copied them again), the parser created for the previous sample is reused, since the new input
+      files are copies of the original ones. A shallow copy is returned, since the templates are shared
+      but the segments of each new input are not.
+      @ In, infiles, list, list of the new input files to be modified
+      @ In, origfiles, list, list of the corresponding original input files
+      @ Out, parser, GenericParser.GenericParser, the parser
+    """
+    if not self.reuseParser:
+      return GenericParser.GenericParser(infiles)
+    key = []
+    for inputFile in origfiles:
+      try:
+        stat = os.stat(inputFile.getAbsFile())
+      except OSError:
+        # let the parser report the problem
+        return GenericParser.GenericParser(infiles)
+      key.append((inputFile.getAbsFile(), stat.st_mtime_ns, stat.st_size))
+    key = tuple(key)
+    if self._parser is None or key != self._parserKey:
+      self._parser = GenericParser.GenericParser(infiles)
+      self._parserKey = key
+    return copy.copy(self._parser)
@@ -132,6 +132,42 @@ class GenericParser():
         else:
           seg+=line
       self.segments[infileName].append(seg)
+    self._compile()
+
+  def _compile(self):
+    """
+      Compiles the parsed input files into templates, such that writing a new input only requires
+      filling the placeholder slots and joining the segments.
+      @ In, None
+      @ Out, None
+    """
+    self._template = {}   # _template[inputFile], immutable segments as parsed
+    self._slots = {}      # _slots[inputFile], list of (place, var) for each placeholder in the segments
+    self._formatters = {} # _formatters[(var, inputFile)], function to convert a value to text, or None to leave the placeholder as is
+    for inputFile, segments in self.segments.items():
+      self._template[inputFile] = tuple(segments)
+      self._slots[inputFile] = sorted((place, var) for var, files in self.varPlaces.items() for place in files.get(inputFile, []))
+      for _, var in self._slots[inputFile]:
+        self._formatters[(var, inputFile)] = self._compileFormatter(var, inputFile)
+
+  def _compileFormatter(self, var, inputFile):
+    """
+      Creates the function converting values of "var" into text for the input file "inputFile".
+      @ In, var, string, the variable name
+      @ In, inputFile, string, the input file name
+      @ Out, formatter, function or None, formatter(value) -> string, None if the variable has a format
+        for other input files only (the placeholder is not replaced)
+    """
+    if var not in self.formats:
+      return _reprIfFloat
+    if inputFile not in self.formats[var]:
+      return None
+    varFormat, cast = self.formats[var][inputFile]
+    if any(formVal in varFormat for formVal in self.acceptFormats.keys()):
+      formatString = ("{:"+varFormat.strip()+"}").format
+      return lambda value: formatString(cast(value))
+    width = cast(varFormat)
+    return lambda value: _reprIfFloat(value).strip().rjust(width)
 
   def modifyInternalDictionary(self,**Kwargs):
     """
@@ -151,33 +187,26 @@ class GenericParser():
           ioVars.append(v)
       else:
         ioVars.append(value)
-    for var in self.varPlaces.keys():
-      for inputFile in self.segments.keys():
-        for place in self.varPlaces[var][inputFile] if inputFile in self.varPlaces[var].keys() else []:
-          if var in modDict.keys():
-            if var in self.formats.keys():
-              if inputFile in self.formats[var].keys():
-                if any(formVal in self.formats[var][inputFile][0] for formVal in self.acceptFormats.keys()):
-                  formatstringc = "{:"+self.formats[var][inputFile][0].strip()+"}"
-                  self.segments[inputFile][place] = formatstringc.format(self.formats[var][inputFile][1](modDict[var]))
-                else:
-                  self.segments[inputFile][place] = _reprIfFloat(modDict[var]).strip().rjust(self.formats[var][inputFile][1](self.formats[var][inputFile][0]))
-            else:
-              self.segments[inputFile][place] = _reprIfFloat(modDict[var])
-          elif var in self.defaults.keys():
-            if var in self.formats.keys():
-              if inputFile in self.formats[var].keys():
-                if any(formVal in self.formats[var][inputFile][0] for formVal in self.acceptFormats.keys()):
-                  formatstringc = "{:"+self.formats[var][inputFile][0].strip()+"}"
-                  self.segments[inputFile][place] = formatstringc.format(self.formats[var][inputFile][1](self.defaults[var][inputFile]))
-                else:
-                  self.segments[inputFile][place] = _reprIfFloat(self.defaults[var][inputFile]).strip().rjust(self.formats[var][inputFile][1](self.formats[var][inputFile][0]))
-            else:
-              self.segments[inputFile][place] = self.defaults[var][inputFile]
-          elif var in ioVars:
-            continue #this gets handled in writeNewInput
-          else:
-            raise IOError('Generic Parser: Variable '+var+' was not sampled and no default given!')
+    # start from the templates, so the parser can be reused for any number of new inputs
+    newSegments = {}
+    for inputFile, slots in self._slots.items():
+      segments = list(self._template[inputFile])
+      for place, var in slots:
+        formatter = self._formatters[(var, inputFile)]
+        if var in modDict:
+          if formatter is not None:
+            segments[place] = formatter(modDict[var])
+        elif var in self.defaults:
+          if var not in self.formats:
+            segments[place] = self.defaults[var][inputFile]
+          elif formatter is not None:
+            segments[place] = formatter(self.defaults[var][inputFile])
+        elif var in ioVars:
+          continue #this gets handled in writeNewInput
+        else:
+          raise IOError('Generic Parser: Variable '+var+' was not sampled and no default given!')
+      newSegments[inputFile] = segments
+    self.segments = newSegments
 
   def writeNewInput(self,inFiles,origFiles):
     """
@@ -205,22 +234,27 @@ class GenericParser():
         raise IOError('No InputFile with extension '+ext+' found!')
       return index,inputFile
 
+    ioValues = {}
     for var in self.varPlaces.keys():
-      for inputFile in self.segments.keys():
-        for place in self.varPlaces[var][inputFile] if inputFile in self.varPlaces[var].keys() else []:
-          for iotype,adlvar in self.adlDict.items():
-            if iotype=='output':
-              if var==self.adlDict[iotype]:
-                self.segments[inputFile][place] = case
-                break
-            elif iotype=='input':
-              if var in self.adlDict[iotype].keys():
-                self.segments[inputFile][place] = getFileWithExtension(inFiles,self.adlDict[iotype][var][0].strip('.'))[1].getAbsFile()
-                break
+      for iotype,adlvar in self.adlDict.items():
+        if iotype=='output':
+          if var==adlvar:
+            ioValues[var] = case
+            break
+        elif iotype=='input':
+          if var in adlvar.keys():
+            ioValues[var] = getFileWithExtension(inFiles,adlvar[var][0].strip('.'))[1].getAbsFile()
+            break
+    if ioValues:
+      for inputFile, slots in self._slots.items():
+        for place, var in slots:
+          if var in ioValues:
+            self.segments[inputFile][place] = ioValues[var]
     #now just write the files.
     for f,inFile in enumerate(origFiles):
       outfile = inFiles[f]
       #if os.path.isfile(outfile.getAbsFile()): os.remove(outfile.getAbsFile())
       outfile.open('w')
-      outfile.writelines(''.join(self.segments[inFile.getFilename()]))
+      # a single write: writelines would write the joined string one character at a time
+      outfile.write(''.join(self.segments[inFile.getFilename()]))
       outfile.close()
@@ -43,6 +43,7 @@ class MAAP5(GenericCode):
       @ Out, None.
     """
     GenericCode._readMoreXML(self,xmlNode)
+    self.reuseParser = False # the input files are modified for each branch before being parsed
     self.include=''
     self.tilastDict={} #{'folder_name':'tilast'} - this dictionary contains the last simulation time of each branch, this is necessary to define the correct restart time
     self.branch = {} #{'folder_name':['variable branch','variable value']} where variable branch is the variable sampled for the current branch e.g. {det_1:[timeloca, 200]}
@@ -70,6 +71,16 @@ class MAAP5(GenericCode):
     if (len(self.boolOutputVariables)==0) and (len(self.contOutputVariables)==0):
       raise IOError('At least one of two nodes <boolMaapOutputVariables> or <contMaapOutputVariables> has to be specified')
 
+  def getModifiedInputFiles(self, oriInputFiles):
+    """
+      This method returns the input files that the code interface modifies (rewrites) in createNewInput.
+      The include files are modified as well for the DET branches, so all the files are returned.
+      @ In, oriInputFiles, list, list of the original input files
+      @ Out, modifiedFiles, list, list of the original input files that get modified
+    """
+    modifiedFiles = list(oriInputFiles)
+    return modifiedFiles
+
   def createNewInput(self,currentInputFiles,oriInputFiles,samplerType,**Kwargs):
     """
       This method is used to generate an input based on the information passed in.
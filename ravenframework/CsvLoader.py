@@ -25,7 +25,8 @@ class CsvLoader(MessageUser):
   """
     Class aimed to load the CSV files
   """
-  acceptableUtils = ['pandas', 'numpy']
+  acceptableUtils = ['pandas', 'numpy', 'pyarrow']
+  _pyarrowWarned = False # True once the unavailability of pyarrow has been reported
 
   def __init__(self):
     """
@@ -39,7 +40,7 @@ class CsvLoader(MessageUser):
     self.allOutParam = False              # all output parameters?
     self.allFieldNames = []               # "header" of the CSV file
 
-  def loadCsvFile(self, myFile, nullOK=None, utility='pandas'):
+  def loadCsvFile(self, myFile, nullOK=None, utility='pandas', columns=None):
     """
       Function to load a csv file into realization format
       It also retrieves the headers
@@ -47,27 +48,31 @@ class CsvLoader(MessageUser):
       @ In, myFile, string, Input file name (absolute path)
       @ In, nullOK, bool, indicates if null values are acceptable
       @ In, utility, str, indicates which utility should be used to load the csv
+      @ In, columns, set, optional, if given only the columns with these names are loaded (the others are skipped)
       @ Out, loadCsvFile, pandas.DataFrame or numpy.ndarray, the loaded data
     """
     if utility == 'pandas':
-      return self._loadCsvPandas(myFile, nullOK=nullOK)
+      return self._loadCsvPandas(myFile, nullOK=nullOK, columns=columns)
     elif utility == 'numpy':
-      return self._loadCsvNumpy(myFile, nullOK=nullOK)
+      return self._loadCsvNumpy(myFile, nullOK=nullOK, columns=columns)
+    elif utility == 'pyarrow':
+      return self._loadCsvPyarrow(myFile, nullOK=nullOK, columns=columns)
     else:
       self.raiseAnError(RuntimeError, f'Unrecognized CSV loading utility: "{utility}"')
 
-  def _loadCsvPandas(self, myFile, nullOK=None):
+  def _loadCsvPandas(self, myFile, nullOK=None, columns=None):
     """
       Function to load a csv file into realization format
       It also retrieves the headers
       The format of the csv must be comma-separated (pandas readable)
       @ In, myFile, string, Input file name (absolute path)
       @ In, nullOK, bool, indicates if null values are acceptable
+      @ In, columns, set, optional, if given only the columns with these names are loaded
       @ Out, df, pandas.DataFrame, the loaded data
     """
     # first try reading the file
     try:
-      df = pd.read_csv(myFile)
+      df = pd.read_csv(myFile, usecols=None if columns is None else lambda column: column in columns)
     except pd.errors.EmptyDataError:
       # no data in file
       self.raiseAWarning(f'Tried to read data from "{myFile}", but the file is empty!')
@@ -81,21 +86,70 @@ class CsvLoader(MessageUser):
     self.allFieldNames = list(df.columns)
     return df
 
-  def _loadCsvNumpy(self, myFile, nullOK=None):
+  def _loadCsvNumpy(self, myFile, nullOK=None, columns=None):
     """
       Function to load a csv file into realization format
       It also retrieves the headers
       The format of the csv must be comma-separated with all floats after header row
       @ In, myFile, string, Input file name (absolute path)
       @ In, nullOK, bool, indicates if null values are acceptable
+      @ In, columns, set, optional, if given only the columns with these names are loaded
       @ Out, data, np.ndarray, the loaded data
     """
     with open(myFile, 'rb') as f:
       head = f.readline().decode()
     self.allFieldNames = list(x.strip() for x in head.split(','))
-    data = np.loadtxt(myFile, dtype=float, delimiter=',', ndmin=2, skiprows=1)
+    useCols = None
+    if columns is not None:
+      useCols = [i for i, name in enumerate(self.allFieldNames) if name in columns]
+      self.allFieldNames = [self.allFieldNames[i] for i in useCols]
+    data = np.loadtxt(myFile, dtype=float, delimiter=',', ndmin=2, skiprows=1, usecols=useCols)
     return data
 
+  def _loadCsvPyarrow(self, myFile, nullOK=None, columns=None):
+    """
+      Function to load a csv file into realization format, using the multithreaded CSV reader of pyarrow
+      (the file is split in blocks that are parsed and converted concurrently).
+      It also retrieves the headers
+      If pyarrow is not available, the file is loaded with pandas.
+      The format of the csv must be comma-separated (pandas readable)
+      @ In, myFile, string, Input file name (absolute path)
+      @ In, nullOK, bool, indicates if null values are acceptable
+      @ In, columns, set, optional, if given only the columns with these names are loaded
+      @ Out, df, pandas.DataFrame, the loaded data
+    """
+    try:
+      import pyarrow
+      from pyarrow import csv as pacsv
+    except ImportError:
+      if not CsvLoader._pyarrowWarned:
+        self.raiseAWarning('The "pyarrow" CSV loading utility was requested but pyarrow cannot be imported; using pandas.')
+        CsvLoader._pyarrowWarned = True
+      return self._loadCsvPandas(myFile, nullOK=nullOK, columns=columns)
+    includeColumns = None
+    if columns is not None:
+      try:
+        header = pd.read_csv(myFile, nrows=0).columns
+      except pd.errors.EmptyDataError:
+        self.raiseAWarning(f'Tried to read data from "{myFile}", but the file is empty!')
+        return
+      includeColumns = [name for name in header if name in columns]
+    try:
+      table = pacsv.read_csv(myFile, read_options=pacsv.ReadOptions(use_threads=True),
+                             convert_options=pacsv.ConvertOptions(include_columns=includeColumns))
+    except pyarrow.ArrowInvalid as error:
+      if 'Empty CSV' not in str(error):
+        raise
+      self.raiseAWarning(f'Tried to read data from "{myFile}", but the file is empty!')
+      return
+    self.raiseADebug(f'Reading data from "{myFile}"')
+    df = table.to_pandas()
+    if (not nullOK) and (pd.isnull(df).values.sum() != 0):
+      bad = pd.isnull(df).any(axis=1).to_numpy().nonzero()[0][0]
+      self.raiseAnError(IOError, f'Invalid data in input file: row "{bad+1}" in "{myFile}"')
+    self.allFieldNames = list(df.columns)
+    return df
+
   def toRealization(self, data):
     """
       Converts data from the "loadCsvFile" format to a realization-style format (dictionary
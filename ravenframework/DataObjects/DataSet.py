@@ -19,7 +19,11 @@
 """
 from __future__ import division, print_function, unicode_literals, absolute_import
 
+import os
 import copy
+import shutil
+import weakref
+import tempfile
 import itertools
 
 import numpy as np
@@ -34,6 +38,7 @@ except ValueError:
 
 from .. import CsvLoader
 from ..utils import utils, cached_ndarray, xmlUtils, mathUtils, InputData, InputTypes
+from ..utils.realizationIndex import RealizationIndex
 
 class DataSet(DataObject):
   """
@@ -59,13 +64,21 @@ class DataSet(DataObject):
     self.type             = 'DataSet'
     self.types            = None             # list of type objects, for each realization entry
     self.printTag         = self.name
-    self.defaultDtype     = object
     self._scaleFactors    = {}               # mean, sigma for data for matching purposes
     self._alignedIndexes  = {}               # dict {index:values} of indexes with aligned coordinates (so they are not in the collector, but here instead)
     self._neededForReload = [self.sampleTag] # metavariables required to reload this data object.
     self._samplerTag      = None
     self.inputKDTree      = None
     self._autogenerate    = set()             # index vars in here are automatically generated
+    self._matchIndex      = None             # RealizationIndex shared by data and collector, for matching realizations by value
+    self.storage          = 'memory'         # storage of the collected data, "memory" or "netCDF" (chunk files on disk)
+    self._storageChunkSize = 1000            # number of realizations per chunk file (on-disk storage)
+    self._storageDir      = None             # directory where the temporary directory of the chunk files is created (None for the system one)
+    self._storagePath     = None             # temporary directory of the chunk files (on-disk storage)
+    self._storageCleanup  = None             # finalizer removing the temporary directory of the chunk files
+    self._chunkData       = []               # lazily opened chunks (xr.Dataset) of the on-disk storage, in sampling order
+    self._storedMoments   = {}               # {var:(count, mean, M2)} of the data stored on disk, for the scaling factors
+    self._unmergedChunks  = False            # True if chunks were stored since the (lazy) concatenation of the chunks was built
 
   ### INPUT SPECIFICATION ###
   @classmethod
@@ -83,6 +96,11 @@ class DataSet(DataObject):
     indexInput.addParam('autogenerate',InputTypes.BoolType,descr="If true, autogenerate this index")
     inputSpecification.addSub(indexInput)
 
+    storageInput = InputData.parameterInputFactory('storage', contentType=InputTypes.makeEnumType('storage', 'storageType', ['memory', 'netCDF']))
+    storageInput.addParam('chunkSize', InputTypes.IntegerType, False)
+    storageInput.addParam('directory', InputTypes.StringType, False)
+    inputSpecification.addSub(storageInput)
+
     return inputSpecification
 
   def _readMoreXML(self,xmlNode):
@@ -95,7 +113,15 @@ class DataSet(DataObject):
     inp.parseNode(xmlNode)
     # let parent read first
     DataObject._readMoreXML(self,inp)
-
+    storage = inp.findFirst('storage')
+    if storage is not None:
+      self.storage = storage.value
+      self._storageChunkSize = storage.parameterValues.get('chunkSize', self._storageChunkSize)
+      self._storageDir = storage.parameterValues.get('directory', None)
+      if self._storageChunkSize < 1:
+        self.raiseAnError(IOError, f'The "chunkSize" of the storage of DataObject "{self.name}" must be a positive integer, got {self._storageChunkSize}!')
+      if self.storage == 'netCDF' and self.hierarchical:
+        self.raiseAnError(IOError, f'The on-disk storage is not available for the hierarchical DataObject "{self.name}"!')
 
   ### EXTERNAL API ###
   # These are the methods that RAVEN entities should call to interact with the data object
@@ -256,31 +282,19 @@ class DataSet(DataObject):
 
     # check alignment of indexes
     self._checkAlignedIndexes(rlz)
-    #  NB If no scalar entry is made, this construction fails.  In that case,
-    #  instead of treating each dataarrray as an object, numpy.asarray calls their asarray methods,
-    #  unfolding them and making a full numpy array with more dimensions, instead of effectively
-    #  a list of realizations, where each realization is effectively a list of xr.DataArray objects.
-    #
-    #  To mitigate this behavior, we forcibly add a [0.0] entry to each realization, then exclude
-    #  it once the realizations are constructed.  This seems like an inefficient option; others
-    #  should be explored.  - talbpaul, 12/2017
-    #  newData is a numpy array of realizations,
-    #  each of which is a numpy array of some combination of scalar values and/or xr.DataArrays.
-    #  This is because the cNDarray collector expects a LIST of realization, not a single realization.
-    #  Maybe the "append" method should be renamed to "extend" or changed to append one at a time.
-    # set realizations as a list of realizations (which are ordered lists)
-    newData = np.array(list(rlz[var] for var in self._orderedVars)+[0.0], dtype=object)
-    newData = newData[:-1]
     # if data storage isn't set up, set it up
     if self._collector is None:
       self._collector = self._newCollector(width=len(self._orderedVars))
-    # append
-    self._collector.append(newData)
+    # append, as an ordered list of the values
+    self._collector.append(list(rlz[var] for var in self._orderedVars))
 
     # if hierarchical, clear the parent as an ending
     self._clearParentEndingStatus(rlz)
     # reset scaling factors, kd tree
     self._resetScaling()
+    # with the on-disk storage, the collected realizations are written to disk by chunks
+    if self.storage == 'netCDF' and len(self._collector) >= self._storageChunkSize:
+      self._collapseCollector()
 
   def addVariable(self, varName, values, classify='meta', indices=None):
     """
@@ -305,6 +319,9 @@ class DataSet(DataObject):
       column = self._collapseNDtoDataArray(values, varName, labels=labels)
       # add to the dataset
       self._data = self._data.assign(**{varName:column})
+      if self.storage == 'netCDF':
+        self._accumulateMoments(self._data[[varName]])
+        self._resplitChunks()
     if classify == 'input' and varName not in self._inputs:
       self._inputs.append(varName)
     elif classify == 'output' and varName not in self._outputs:
@@ -530,6 +547,8 @@ class DataSet(DataObject):
     # if fileToLoad in kwargs, then filename is actualle fileName/fileToLoad
     if 'fileToLoad' in kwargs:
       fname = kwargs['fileToLoad'].getAbsFile()
+    # the loaded data replaces (or is combined with) the existing one, so the match index is obsolete
+    self._matchIndex = None
     # load based on style for loading
     if style == 'netcdf':
       self._fromNetCDF(fname, **kwargs)
@@ -691,8 +710,12 @@ class DataSet(DataObject):
 
     if self._scaleFactors is not None:
       self._scaleFactors.pop(variable,None)
+    self._storedMoments.pop(variable, None)
+    if not noData:
+      self._resplitChunks()
     #either way reset kdtree
     self.inputKDTree = None
+    self._matchIndex = None
 
   def renameVariable(self, old, new):
     """
@@ -726,8 +749,12 @@ class DataSet(DataObject):
     # change scaling factor entry
     if old in self._scaleFactors:
       self._scaleFactors[new] = self._scaleFactors.pop(old)
+    if old in self._storedMoments:
+      self._storedMoments[new] = self._storedMoments.pop(old)
     if self._data is not None:
       self._data = self._data.rename({old:new})
+      self._resplitChunks()
+    self._matchIndex = None
 
   def reset(self):
     """
@@ -741,6 +768,8 @@ class DataSet(DataObject):
     self._meta = {}
     self._alignedIndexes = {}
     self._scaleFactors = {}
+    self._matchIndex = None
+    self._clearStorage()
 
   def setData(self, data, meta):
     """
@@ -752,6 +781,12 @@ class DataSet(DataObject):
     assert isinstance(data, xr.Dataset)
     self._collector = None
     self._data = data
+    self._matchIndex = None
+    if self.storage == 'netCDF':
+      # the data (e.g. lazily loaded from a database) become the first chunk of the storage
+      self._clearStorage()
+      self._chunkData = [data]
+      self._accumulateMoments(data)
     self._meta = meta
     # if we have meta information, we can reconstruct the IO space for this DO
     if 'DataSet' in meta:
@@ -831,6 +866,8 @@ class DataSet(DataObject):
     """
     super().flush()
     self.types = None
+    self._matchIndex = None
+    self._clearStorage()
 
   ### BUILTINS AND PROPERTIES ###
   # These are special commands that RAVEN entities can use to interact with the data object
@@ -842,6 +879,29 @@ class DataSet(DataObject):
     """
     return self.size
 
+  @property
+  def _data(self):
+    """
+      Property to access the underlying data structure.
+      With the on-disk storage, the (lazy) concatenation of the chunks is built only when the data are read,
+      not every time a chunk is stored.
+      @ In, None
+      @ Out, _data, xr.Dataset, the collected data (None if empty)
+    """
+    if self._unmergedChunks:
+      self._mergeChunks()
+    return self._storedData
+
+  @_data.setter
+  def _data(self, data):
+    """
+      Sets the underlying data structure.
+      @ In, data, xr.Dataset, the collected data (None if empty)
+      @ Out, None
+    """
+    self._storedData = data
+    self._unmergedChunks = False
+
   @property
   def isEmpty(self):
     """
@@ -873,6 +933,10 @@ class DataSet(DataObject):
     # from collector
     s += self._collector.size if self._collector is not None else 0
     # from data
+    if self._unmergedChunks:
+      # the chunks stored on disk are not concatenated just to count them
+      s += sum(chunk.sizes[self.sampleTag] for chunk in self._chunkData)
+      return s
     try:
       s += len(self._data[self.sampleTag]) if self._data is not None else 0
     except KeyError: #sampleTag not found, so it _should_ be empty ...
@@ -890,6 +954,32 @@ class DataSet(DataObject):
     return list(self._pivotParams.keys())
 
   ### INTERNAL USE FUNCTIONS ###
+  def _accumulateMoments(self, data):
+    """
+      Merges the moments of new realizations into the moments of the data stored on disk, so that the scaling
+      factors do not need to read the stored data again.
+      @ In, data, xr.Dataset, the new realizations
+      @ Out, None
+    """
+    for var in data.data_vars:
+      values = data[var]
+      if values.dtype.kind not in 'iuf':
+        continue
+      count = int(values.count())
+      if count == 0:
+        continue
+      mean = float(values.mean())
+      m2 = float(values.var()) * count
+      if var in self._storedMoments:
+        # pairwise update (Chan et al.)
+        storedCount, storedMean, storedM2 = self._storedMoments[var]
+        total = storedCount + count
+        delta = mean - storedMean
+        mean = storedMean + delta * count / total
+        m2 = storedM2 + m2 + delta**2 * storedCount * count / total
+        count = total
+      self._storedMoments[var] = (count, mean, m2)
+
   def _addIndexMapToRlz(self, rlz):
     """
       Adds the special key _indexMap along with index mapping
@@ -922,12 +1012,15 @@ class DataSet(DataObject):
     lenData = len(self._data[self.sampleTag]) if self._data is not None else 0
     # if it's in the data ...
     if index < lenData:
+      if self.storage == 'netCDF':
+        self.raiseAnError(NotImplementedError, f'The values of the realizations of DataObject "{self.name}" are stored on disk and cannot be changed!')
       self._data[var].values[index] = value
     # if it's in the collector ...
     elif index < lenColl + lenData:
-      self._collector[index][self._orderedVars.index(var)] = value
+      self._collector[index, self._orderedVars.index(var)] = value
     else:
       self.raiseAnError(IndexError, f'Requested value change for realization "{index}", which is past the end of the data object!')
+    self._matchIndex = None
 
   def _checkAlignedIndexes(self, rlz, tol=1e-15):
     """
@@ -1114,6 +1207,22 @@ class DataSet(DataObject):
       idx, _ = self.realization(matchDict={'prefix': parentID})
       self._changeVariableValue(idx, endVar, False)
 
+  def _clearStorage(self):
+    """
+      Closes and removes the chunk files of the on-disk storage, if any.
+      @ In, None
+      @ Out, None
+    """
+    for chunk in self._chunkData:
+      chunk.close()
+    self._chunkData = []
+    self._storedMoments = {}
+    self._unmergedChunks = False
+    if self._storageCleanup is not None:
+      self._storageCleanup()
+      self._storageCleanup = None
+      self._storagePath = None
+
   def _collapseNDtoDataArray(self, data, var, labels=None, dtype=None):
     """
       Converts a row of numpy samples (float or xr.DataArray) into a single DataArray suitable for a xr.Dataset.
@@ -1185,6 +1294,56 @@ class DataSet(DataObject):
 
     return array
 
+  def _collapseUnalignedHistories(self, v, dims):
+    """
+      Converts the collected samples of a history variable with non-aligned index values into a single DataArray,
+      without creating a DataArray for each realization (as done by _collapseNDtoDataArray).
+      Only applies to numeric variables depending on one numeric index, stored as arrays in the collector.
+      @ In, v, int, column of the variable in the collector
+      @ In, dims, list(str), dimensions of the variable
+      @ Out, array, xr.DataArray or None, data for all the collected realizations, or None if not applicable
+    """
+    if len(dims) != 1 or dims[0] in self._alignedIndexes or dims[0] not in self._orderedVars:
+      return None
+    index = dims[0]
+    values = self._collector.getFlatEntity(v)
+    indexValues = self._collector.getFlatEntity(self._orderedVars.index(index))
+    if values is None or indexValues is None:
+      return None
+    values, offsets, shapes = values
+    indexValues, indexOffsets, indexShapes = indexValues
+    if values.dtype.kind not in 'iuf' or indexValues.dtype.kind not in 'iuf' or not np.array_equal(offsets, indexOffsets):
+      return None
+    lengths = np.diff(offsets)
+    if any(len(shape) != 1 for shape in shapes + indexShapes) or not np.all(lengths) or not np.all(np.isfinite(indexValues)):
+      return None
+    numRlz = len(lengths)
+    rows = np.repeat(np.arange(numRlz), lengths)
+    # as for xr.concat, the index values are the (sorted) union of the values of each realization,
+    # unless they all are the same
+    sameIndex = np.all(lengths == lengths[0])
+    if sameIndex:
+      matrix = indexValues.reshape(numRlz, -1)
+      sameIndex = bool(np.all(matrix == matrix[0]))
+    if sameIndex:
+      coordinate = indexValues[:lengths[0]]
+      positions = np.tile(np.arange(lengths[0]), numRlz)
+    else:
+      coordinate = np.unique(indexValues)
+      positions = np.searchsorted(coordinate, indexValues)
+    # repeated index values in a realization are left to xarray
+    if len(np.unique(coordinate)) != len(coordinate) or len(np.unique(rows * len(coordinate) + positions)) != len(rows):
+      return None
+    if sameIndex:
+      data = values.reshape(numRlz, -1).astype(float if values.dtype.kind == 'f' else int)
+    else:
+      # missing values are filled with NaN
+      data = np.full((numRlz, len(coordinate)), np.nan)
+      data[rows, positions] = values
+    array = xr.DataArray(data, dims=[self.sampleTag, index], coords={self.sampleTag: np.arange(numRlz), index: coordinate})
+
+    return array
+
   @staticmethod
   def _clearDuplicates(toClear):
     """
@@ -1213,12 +1372,15 @@ class DataSet(DataObject):
       self.raiseAnError(RuntimeError,'While trying to create a new Dataset, a variable has itself as an index!'+\
                         '  Error: ' +str(e))
     # if "action" is "extend" but self._data is None, then we really want to "replace".
-    if action == 'extend' and self._data is None:
+    if action == 'extend' and self._storedData is None and not self._unmergedChunks:
       action = 'replace'
     if action == 'return':
       return new
     elif action == 'replace':
-      self._data = new
+      if self.storage == 'netCDF':
+        self._spillToDisk(new)
+      else:
+        self._data = new
       # general metadata included if first time
       # determine dimensions for each variable
       dimsMeta = {}
@@ -1243,12 +1405,16 @@ class DataSet(DataObject):
                                          'pointwise_meta': ','.join(sorted(self._metavars)),
                                          'datasetName': self.name
       }})
-      self._data.attrs = self._meta
+      if self.storage != 'netCDF':
+        self._data.attrs = self._meta
     elif action == 'extend':
       # TODO compatability check!
       # TODO Metadata update?
       # merge can change dtypes b/c no NaN int type: self._data.merge(new,inplace=True)
-      self._data = xr.concat([self._data,new], dim=self.sampleTag)
+      if self.storage == 'netCDF':
+        self._spillToDisk(new)
+      else:
+        self._data = xr.concat([self._data,new], dim=self.sampleTag)
     else:
       self.raiseAnError(RuntimeError, f'action "{action}" was not an expected value for converting array list to dataset!')
     # regardless if "replace" or "return", set up scaling factors
@@ -1336,10 +1502,24 @@ class DataSet(DataObject):
       @ In, None
       @ Out, xarray.Dataset, all the data from this data object.
     """
+    self._collapseCollector()
+
+    return self._data
+
+  def _collapseCollector(self):
+    """
+      Collects the data from self._collector and places it in self._data (or in the chunks of the on-disk storage).
+      @ In, None
+      @ Out, None
+    """
     # if we have collected data, collapse it
     if self._collector is not None and len(self._collector) > 0:
       # keep track of the first sampling index, if we already have some samples (otherwise 0)
-      firstSample = int(self._data[self.sampleTag][-1])+1 if self._data is not None else 0
+      if self._unmergedChunks:
+        # read the last stored chunk only, rather than concatenating all the chunks
+        firstSample = int(self._chunkData[-1][self.sampleTag][-1])+1
+      else:
+        firstSample = int(self._data[self.sampleTag][-1])+1 if self._data is not None else 0
       # storage array for each variable's xr.DataArray with all rlz data from every rlz
       arrays = {}
       # loop over variables IN ORDER of collector storage to collapse data into nice xr.DataArray of realization data
@@ -1356,38 +1536,43 @@ class DataSet(DataObject):
           assert(self.sampleTag not in dims)
           # loop over indexes (just one for now?) and create data
           # SPECIAL CASE: if only histories/scalars, and histories are aligned, we can shortcut this
-          if len(dims) == 1 and dims[0] in self._alignedIndexes:
-            # since aligned, grab the data into one large chunk and make a datarray with all rlzs
-            data = np.vstack(self._collector[:,v]).astype(dtype)
+          data = self._collector.stackEntity(v) if len(dims) == 1 and dims[0] in self._alignedIndexes else None
+          if data is not None:
+            # since aligned, the collector has the data in one large chunk; make a datarray with all rlzs
             coords = {dims[0]: self._alignedIndexes[dims[0]]}
-            arrays[var] = self.constructNDSample(data, dims=[self.sampleTag]+dims, coords=coords)
+            arrays[var] = self.constructNDSample(data.astype(dtype), dims=[self.sampleTag]+dims, coords=coords)
           else:
-            for r in range(len(self._collector)):
-              values = self._collector[r, v]
-              dtype = self._getCompatibleType(values[0])
-              values = np.array(values,dtype=dtype)
-              coords = {}
-              for idx in dims:
-                val = self._alignedIndexes.get(idx, None)
-                if val is None:
-                  val = self._collector[r, self._orderedVars.index(idx)]
-                coords[idx] = val
-              self._collector[r][v] = self.constructNDSample(values, dims, coords, name=str(r))
-            # then collapse these entries into a single datarray
-            arrays[var] = self._collapseNDtoDataArray(self._collector[:,v], var, dtype=dtype)
+            # SPECIAL CASE: histories with their own index values, fill the union of the index values directly
+            arrays[var] = self._collapseUnalignedHistories(v, dims)
+            if arrays[var] is None:
+              samples = np.empty(len(self._collector), dtype=object)
+              for r in range(len(self._collector)):
+                values = self._collector[r, v]
+                dtype = self._getCompatibleType(values[0])
+                values = np.array(values,dtype=dtype)
+                coords = {}
+                for idx in dims:
+                  val = self._alignedIndexes.get(idx, None)
+                  if val is None:
+                    val = self._collector[r, self._orderedVars.index(idx)]
+                  coords[idx] = val
+                samples[r] = self.constructNDSample(values, dims, coords, name=str(r))
+              # then collapse these entries into a single datarray
+              arrays[var] = self._collapseNDtoDataArray(samples, var, dtype=dtype)
         # if it's a dataarray, then that's old-style histories, no-can do right now
         elif isinstance(self._collector[0,v], xr.DataArray):
           self.raiseAnError(NotImplementedError, 'History entries should be numpy arrays, not data arrays!')
         # if not ND, then it's a simple data array construction
         else:
+          column = self._collector.getEntity(v)
           try:
-            varData = np.array(self._collector[:,v], dtype=dtype)
+            varData = np.array(column, dtype=dtype)
           except ValueError as e:
             # infinte/missing data can't be cast to anything but floats or objects, as far as I can tell
-            if dtype != float and pd.isnull(self._collector[:,v]).sum() != 0:
+            if dtype != float and pd.isnull(column).sum() != 0:
               self.raiseAWarning(f'NaN detected, but no safe casting NaN to "{dtype}" so switching to "object" type. ' \
                   + ' This may cause problems with other entities in RAVEN.')
-              varData = self._collector[:,v][:]
+              varData = np.array(column, dtype=object)
               dtype = object
             # otherwise, let error be raised.
             else:
@@ -1411,8 +1596,6 @@ class DataSet(DataObject):
       # clear alignment tracking for indexes
       self._clearAlignment()
 
-    return self._data
-
   def _formatRealization(self, rlz):
     """
       Formats realization without truncating data
@@ -1569,28 +1752,35 @@ class DataSet(DataObject):
                                   self.name.strip(),'":',",".join(missing))
     # set orderedVars to all vars, for now don't be fancy with alignedIndexes
     self._orderedVars = self.vars + self.indexes
-    # make a collector from scratch
+    # make a collector from scratch, filling it one variable at a time
     rows = len(utils.first(source.values()))
-    cols = len(self._orderedVars)
-    # can this for-loop be done in a comprehension?  The dtype seems to be a bit of an issue.
-    data = np.zeros([rows,cols], dtype=object)
-    for v,var in enumerate(self._orderedVars):
-      if len(source[var].shape) > 1:
-        # we can't set all at once, because the user gave us an ND array instead of a np.array(dtype=object) of np.array.
-        #    if we try -> ValueError: "could not broadcast input array from shape (#rlz,#time) into shape (#rlz)
-        for i in range(len(data)):
-          data[i,v] = source[var][i]
-      else:
-        # we can set it at once, the fast way.
-        data[:,v] = source[var]
-    # set up collector as cached nd array of values -> TODO might be some wasteful copying here
-    self._collector = cached_ndarray.cNDarray(values=data, dtype=object)
+    self._collector = self._newCollector(width=0, length=rows)
+    for var in self._orderedVars:
+      # either an array of scalars, an ND array (one entry per realization), or an object array of arrays
+      self._collector.addEntity(source[var])
     # set datatypes for each variable
     rlz = self.realization(index=0)
     self._setDataTypes(rlz)
     # collapse into xr.Dataset
     self.asDataset()
 
+  def _fromNetCDF(self, fileName, **kwargs):
+    """
+      Loads this data object from a netCDF file, with the general metadata as attributes (see _toNetCDF).
+      With the on-disk storage, the file is read lazily, one chunk at a time when needed.
+      @ In, fileName, str, path/name of file to read
+      @ In, kwargs, dict, optional, keywords for options
+      @ Out, None
+    """
+    # NOTE: open_dataset does NOT close the file object, the lazily loaded data read it when needed
+    if self.storage == 'netCDF':
+      data = xr.open_dataset(fileName, engine='netcdf4', chunks={self.sampleTag: self._storageChunkSize})
+    else:
+      data = xr.load_dataset(fileName, engine='netcdf4')
+    # the meta data, convert from string to xml
+    meta = dict((key, xmlUtils.staticFromString(val)) for key, val in data.attrs.items())
+    self.setData(data, meta)
+
   def _fromXarrayDataset(self, dataset):
     """
       Loads data from an xarray dataset
@@ -1627,9 +1817,12 @@ class DataSet(DataObject):
                 'is not consistent with the required dimensions for data object "',
                 self.name.strip(),'":',",".join(requiredDims))
     self._orderedVars = self.vars
-    self._data = datasetSub
-    for key, val in self._data.attrs.items():
+    for key, val in datasetSub.attrs.items():
       self._meta[key] = val
+    if self.storage == 'netCDF':
+      self._spillToDisk(datasetSub)
+    else:
+      self._data = datasetSub
 
   def _getCompatibleType(self, val):
     """
@@ -1692,8 +1885,6 @@ class DataSet(DataObject):
 
     assert(self._collector is not None)
 
-    # TODO KD Tree for faster values -> still want in collector?
-    # TODO slow double loop
     matchVars, matchVals = zip(*toMatch.items()) if toMatch else ([], [])
     avoidVars, avoidVals = zip(*noMatch.items()) if noMatch else ([], [])
     try:
@@ -1706,7 +1897,15 @@ class DataSet(DataObject):
                         "Check <Input>/<Output> sections." )
     if not first:
       rr, rlz = [], []
-    for r, _ in enumerate(self._collector[:]): #TODO: CAN WE MAKE R START FROM LAST MATCHINDEXES ?
+    rows = range(len(self._collector))
+    if first:
+      # only check the realizations that the match index found close enough
+      candidates = self._getMatchCandidates(toMatch, tol)
+      if candidates is not None:
+        numInData = len(self._data[self.sampleTag]) if self._data is not None else 0
+        rows = (candidates[candidates >= numInData] - numInData).tolist()
+    match = False
+    for r in rows:
       match = True
       # find matches first
       if toMatch:
@@ -1755,7 +1954,8 @@ class DataSet(DataObject):
       @ Out, rlz, dict, realization as {var:value} where value is a DataArray with only coordinate dimensions
     """
     assert(self._data is not None)
-    rlz = self._data[{self.sampleTag:index}].drop_vars(self.sampleTag).data_vars
+    # with the on-disk storage, only the chunk of this realization is read
+    rlz = self._data[{self.sampleTag:index}].drop_vars(self.sampleTag).load().data_vars
     rlz = self._convertFinalizedDataRealizationToDict(rlz, unpackXArray)
     return rlz
 
@@ -1789,10 +1989,18 @@ class DataSet(DataObject):
       match = {}
     if noMatch is None:
       noMatch = {}
+    # if possible, only check the realizations that the match index found close enough
+    if first and all(var in self._data and self._data[var].ndim == 1 for var in itertools.chain(match, noMatch)):
+      candidates = self._getMatchCandidates(match, tol)
+      if candidates is not None:
+        for r in candidates[candidates < len(self._data[self.sampleTag])]:
+          if self._dataRealizationMatches(r, match, noMatch, tol):
+            rr = self._data[self.sampleTag].values[r].item()
+            return rr, self._getRealizationFromDataByIndex(rr, unpackXArray)
+        return len(self), None
     matchVars = list(match.keys())
     avoidVars = list(noMatch.keys())
     # TODO what if a variable is in both??
-    # TODO this could be slow, should do KD tree instead
     mask = 1.0
     for var in matchVars: #, val in match.items():
       val = match[var]
@@ -1837,6 +2045,87 @@ class DataSet(DataObject):
 
     return (rr, self._getRealizationFromDataByIndex(rr, unpackXArray)) if first else (rr, rlz)
 
+  def _dataRealizationMatches(self, r, match, noMatch, tol):
+    """
+      Checks if a realization in the data storage matches (and does not antimatch) the provided values,
+      with the same criteria used by _getRealizationFromDataByValue.
+      @ In, r, int, position of the realization in the data storage
+      @ In, match, dict, elements to match
+      @ In, noMatch, dict, elements to AVOID matching (should not match within tolerance)
+      @ In, tol, float, tolerance to which match should be made
+      @ Out, matches, bool, True if the realization matches
+    """
+    for var, val in match.items():
+      value = self._data[var].values[r]
+      # float instances are relative, others are absolute
+      if mathUtils.isAFloatOrInt(val):
+        loc, scale = self._getScalingFactors(var)
+        if not abs((value - loc) / scale - (val - loc) / scale) < tol:
+          return False
+      elif not value == val:
+        return False
+    for var, vals in noMatch.items():
+      vals = np.atleast_1d(vals)
+      value = self._data[var].values[r]
+      if mathUtils.isAFloatOrInt(vals[0]):
+        loc, scale = self._getScalingFactors(var)
+        dataVal = (value - loc) / scale
+        if any(abs(dataVal - (val - loc) / scale) < tol for val in vals):
+          return False
+      elif any(value == val for val in vals):
+        return False
+    return True
+
+  def _getMatchCandidates(self, toMatch, tol):
+    """
+      Uses the match index (shared by data and collector) to find the realizations that may match "toMatch".
+      Only the scalar numeric entries of "toMatch" are used for the search, so the candidates still need to be checked.
+      The index is created (or extended with the realizations added since the last search) as needed.
+      @ In, toMatch, dict, elements to match
+      @ In, tol, float, tolerance to which match should be made
+      @ Out, candidates, np.ndarray or None, sorted positions of the candidates (data realizations first, then
+                         collector realizations), or None if the index can not be used for this search
+    """
+    if not toMatch or not 0 <= tol < 1:
+      return None
+    variables = tuple(var for var, val in toMatch.items() if var in self._orderedVars and mathUtils.isAFloatOrInt(val) and np.isfinite(val))
+    if not variables:
+      return None
+    numInData = len(self._data[self.sampleTag]) if self._data is not None else 0
+    numInCollector = len(self._collector) if self._collector is not None else 0
+    if self._matchIndex is None or self._matchIndex.variables != variables or len(self._matchIndex) > numInData + numInCollector:
+      self._matchIndex = RealizationIndex(variables)
+    start = len(self._matchIndex)
+    if start < numInData + numInCollector:
+      # add the new realizations to the index; realizations in the collector are later moved to the data, in the same order
+      try:
+        columns = []
+        for var in variables:
+          column = []
+          if start < numInData:
+            if self._data[var].ndim != 1:
+              raise ValueError(f'"{var}" is not scalar')
+            column.append(self._data[var].values[start:])
+          if numInCollector:
+            column.append(self._collector[max(start - numInData, 0):, self._orderedVars.index(var)])
+          columns.append(np.concatenate(column).astype(float))
+      except (KeyError, TypeError, ValueError):
+        # not scalar numeric data, the index can not be used
+        self._matchIndex = None
+        return None
+      self._matchIndex.extend(np.column_stack(columns))
+    center = np.array([toMatch[var] for var in variables], dtype=float)
+    radius = np.zeros(len(variables))
+    for v, var in enumerate(variables):
+      loc, scale = self._getScalingFactors(var)
+      # the data storage matches within "tol" of the scaled values, the collector within relative "tol";
+      # the last term accounts for roundoff in the scaling
+      radius[v] = max(tol * abs(scale), tol * abs(center[v]) / (1. - tol)) + 1e-12 * (abs(center[v]) + abs(loc) + abs(scale))
+    if not np.all(np.isfinite(radius)):
+      return None
+    candidates = self._matchIndex.candidates(center, radius)
+    return candidates
+
   def _getRequestedElements(self, options):
     """
       Obtains a list of the elements to be written, based on defaults and options[what]
@@ -1904,6 +2193,19 @@ class DataSet(DataObject):
       provided = list(s.strip() for s in f.readline().split(','))
     return provided
 
+  def _iterChunks(self, data):
+    """
+      Iterates over consecutive realizations of the data: all at once with the in-memory storage,
+      by chunks of loaded realizations with the on-disk storage.
+      @ In, data, xr.Dataset, the data (or a subset of them)
+      @ Out, _iterChunks, iterator, generator of xr.Dataset with consecutive realizations
+    """
+    if self.storage != 'netCDF':
+      yield data
+      return
+    for start in range(0, data.sizes[self.sampleTag], self._storageChunkSize):
+      yield data.isel({self.sampleTag: slice(start, start + self._storageChunkSize)}).load()
+
   def _loadCsvMeta(self, fileName):
     """
       Attempts to load metadata from an associated XML file.
@@ -1944,17 +2246,14 @@ class DataSet(DataObject):
 
     return dims
 
-  def _newCollector(self, width=1, length=100, dtype=None):
+  def _newCollector(self, width=1, length=100):
     """
       Creates a new collector object and returns it.
       @ In, width, int, optional, width of collector
       @ In, length, int, optional, initial length of (allocated) collector
-      @ In, dtype, type, optional, type of entires (float if all float, usually should be object)
+      @ Out, collector, cached_ndarray.cColumnarArray, new collector
     """
-    if dtype is None:
-      dtype = self.defaultDtype # set in subclasses if different
-
-    return cached_ndarray.cNDarray(width=width, length=length, dtype=dtype)
+    return cached_ndarray.cColumnarArray(width=width, length=length)
 
   def _readPandasCSV(self, fname, nullOK=None):
     """
@@ -1983,6 +2282,23 @@ class DataSet(DataObject):
     self._scaleFactors = {}
     self._inputKDTree = None
 
+  def _resplitChunks(self):
+    """
+      Derives the chunks of the on-disk storage from the (lazy) data again, after the data have been modified
+      directly (new, removed or renamed variables), so that the next chunks are concatenated to the modified data.
+      @ In, None
+      @ Out, None
+    """
+    if self.storage != 'netCDF' or self._data is None:
+      return
+    start = 0
+    chunks = []
+    for chunk in self._chunkData:
+      end = start + chunk.sizes[self.sampleTag]
+      chunks.append(self._data.isel({self.sampleTag: slice(start, end)}))
+      start = end
+    self._chunkData = chunks
+
   def _selectiveRealization(self, rlz):
     """
       Used for selecting a subset of the given data.  Not implemented for ND.
@@ -2020,6 +2336,12 @@ class DataSet(DataObject):
         del self._scaleFactors[var]
       except KeyError:
         pass
+    if var is None and self.storage == 'netCDF':
+      # the stored data are not read again, the factors come from the moments merged chunk by chunk
+      for name, (count, mean, m2) in self._storedMoments.items():
+        if name in varList:
+          self._scaleFactors[name] = (mean, np.sqrt(m2 / count))
+      return
     # TODO someday make KDTree too!
     assert(self._data is not None) # TODO check against collector entries?
     ds = self._data[varList] if var is not None else self._data
@@ -2072,6 +2394,47 @@ class DataSet(DataObject):
     if pointwiseMeta:
       self.addExpectedMeta(pointwiseMeta, overwrite=True)
 
+  def _mergeChunks(self):
+    """
+      Builds the lazy concatenation of the chunks of the on-disk storage, once after new chunks have been stored.
+      @ In, None
+      @ Out, None
+    """
+    if len(self._chunkData) == 1:
+      data = self._chunkData[0]
+    else:
+      data = xr.concat(self._chunkData, dim=self.sampleTag)
+    data.attrs = self._meta
+    self._data = data
+
+  def _spillToDisk(self, new):
+    """
+      Writes new realizations to the chunk files of the on-disk storage and opens them lazily (dask arrays,
+      each chunk file is read only when needed); their concatenation is built when the data are read.
+      @ In, new, xr.Dataset, the new realizations
+      @ Out, None
+    """
+    if self._storagePath is None:
+      if self._storageDir is not None:
+        os.makedirs(self._storageDir, exist_ok=True)
+      self._storagePath = tempfile.mkdtemp(prefix=f'{self.name}_', dir=self._storageDir)
+      self._storageCleanup = weakref.finalize(self, shutil.rmtree, self._storagePath, True)
+    self._accumulateMoments(new)
+    # the general metadata are not part of the chunks
+    new = new.copy()
+    new.attrs = {}
+    size = new.sizes[self.sampleTag]
+    for start in range(0, size, self._storageChunkSize):
+      chunk = new.isel({self.sampleTag: slice(start, start + self._storageChunkSize)})
+      path = os.path.join(self._storagePath, f'chunk{len(self._chunkData):06d}.nc')
+      chunk.to_netcdf(path, engine='netcdf4')
+      self._chunkData.append(xr.open_dataset(path, engine='netcdf4', chunks={}))
+    if len(self._chunkData) == 0:
+      self._data = new
+      self._data.attrs = self._meta
+    else:
+      self._unmergedChunks = True
+
   def _toCSV(self, fileName, start=0, **kwargs):
     """
       Writes this data object to CSV file (except the general metadata, see _toCSVXML)
@@ -2108,7 +2471,10 @@ class DataSet(DataObject):
     ordered = list(i for i in self._inputs if i in keep)
     ordered += list(o for o in self._outputs if o in keep)
     ordered += list(m for m in self._metavars if m in keep)
-    self._usePandasWriteCSV(filenameLocal, data, ordered, keepSampleTag=self.sampleTag in keep, mode=mode)
+    # with the on-disk storage, the data are read and written one chunk at a time
+    for chunk in self._iterChunks(data):
+      self._usePandasWriteCSV(filenameLocal, chunk, ordered, keepSampleTag=self.sampleTag in keep, mode=mode)
+      mode = 'a'
 
   def _toCSVCluster(self, fileName, start, clusterLabel, **kwargs):
     """
@@ -2186,6 +2552,24 @@ class DataSet(DataObject):
         ofile.writelines(f'  {xml}\n')
       ofile.writelines('</DataObjectMetadata>\n')
 
+  def _toNetCDF(self, fileName, **kwargs):
+    """
+      Writes this data object to a netCDF file, with the general metadata as attributes.
+      With the on-disk storage, the data are read and written one chunk at a time.
+      @ In, fileName, str, path/name to write file
+      @ In, kwargs, dict, optional, keywords for options
+      @ Out, None
+    """
+    keep = self._getRequestedElements(kwargs)
+    data = self._data.drop_vars(list(var for var in self.getVars() if var not in keep), errors='ignore')
+    # convert metadata into writeable
+    data.attrs = dict((key, xmlUtils.prettify(val.getRoot())) for key, val in self._meta.items())
+    self.raiseADebug(f'Printing data from "{self.name}" to netCDF: "{fileName}"')
+    try:
+      data.to_netcdf(fileName, engine='netcdf4')
+    except PermissionError:
+      self.raiseAnError(PermissionError, f'NetCDF file "{fileName}" denied RAVEN permission to write! Is it open in another program?')
+
   def _usePandasWriteCSV(self, fileName, data, ordered, keepSampleTag=False, keepIndex=False, mode='w'):
     """
       Uses Pandas to write a CSV.
@@ -2349,7 +2733,7 @@ class DataSet(DataObject):
     # get from the collector first
     if self._collector is not None and len(self._collector) > 0:
       # first get rows from collector
-      fromColl = self._collector[np.where(self._collector[:, self._orderedVars.index('RAVEN_isEnding')])]
+      fromColl = self._collector[np.where(self._collector.getEntity(self._orderedVars.index('RAVEN_isEnding')))[0]]
       # then turn them into realization-like
       fromColl = list( dict(zip(self._orderedVars, c)) for c in fromColl )
     else:
@@ -318,10 +318,14 @@ class HistorySet(DataSet):
       else:
         #  if self.hierarchical is True or the DataObject is not hierarchical we write
         # all the histories (full histories if not hierarchical or branch-histories otherwise) independently
-        for i in range(len(data[self.sampleTag].values)):
-          filename = subFiles[i][:-4]
-          rlz = data.isel(**{self.sampleTag:i}).dropna(self.indexes[0])[ordered]
-          self._usePandasWriteCSV(filename,rlz,ordered,keepIndex=True)
+        # with the on-disk storage, the histories are read one chunk at a time
+        i = 0
+        for chunk in self._iterChunks(data):
+          for c in range(len(chunk[self.sampleTag])):
+            filename = subFiles[i][:-4]
+            rlz = chunk.isel(**{self.sampleTag:c}).dropna(self.indexes[0])[ordered]
+            self._usePandasWriteCSV(filename,rlz,ordered,keepIndex=True)
+            i += 1
     else:
       self.raiseAWarning('No output space variables have been requested for DataObject "{}"! No history files will be printed!'.format(self.name))
 
@@ -147,6 +147,13 @@ class DataBase(BaseEntity, InputDataUser):
       if os.path.exists(path):
         os.remove(path)
 
+  def endStepActions(self):
+    """
+      Actions performed at the end of each step the database is an output of (e.g. writing buffered data)
+      @ In, None
+      @ Out, None
+    """
+
   def get_fullpath(self):
     """
       Getter for full file path
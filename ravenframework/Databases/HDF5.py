@@ -27,6 +27,7 @@ import numpy as np
 # Internal Modules----------------------------------------------------------------------------------
 from ..h5py_interface_creator import hdf5Database as h5Data
 from ..DataObjects import PointSet, HistorySet
+from ..utils import InputData, InputTypes
 from .Database import DataBase
 # Internal Modules End------------------------------------------------------------------------------
 
@@ -36,6 +37,21 @@ class HDF5(DataBase):
     Used to add and retrieve attributes and values from said database
   """
 
+  @classmethod
+  def getInputSpecification(cls):
+    """
+      Method to get a reference to a class that specifies the input data for
+      class cls.
+      @ In, cls, the class for which we are retrieving the specification
+      @ Out, spec, InputData.ParameterInput, class to use for
+        specifying input of cls.
+    """
+    spec = super().getInputSpecification()
+    spec.addSub(InputData.parameterInputFactory("layout", contentType=InputTypes.makeEnumType("layout", "layoutType", ["columnar", "groups"])))
+    spec.addSub(InputData.parameterInputFactory("bufferSize", contentType=InputTypes.IntegerType))
+
+    return spec
+
   def __init__(self):
     """
       Constructor
@@ -49,6 +65,8 @@ class HDF5(DataBase):
     self._allvars  = []
     self.printTag = 'DATABASE-HDF5'
     self._extension = '.h5'
+    self.layout = 'columnar' # layout of the independent (MC) realizations in new databases
+    self.bufferSize = 1000   # number of realizations buffered before being written (columnar layout)
 
   def __getstate__(self):
     """
@@ -77,7 +95,8 @@ class HDF5(DataBase):
     """
     self.__dict__.update(newstate)
     self.exist = True
-    self.database = h5Data(self.name, self.databaseDir, self.filename, self.exist)
+    self.database = h5Data(self.name, self.databaseDir, self.filename, self.exist,
+                           layout=self.layout, bufferSize=self.bufferSize)
 
   def _handleInput(self, paramInput):
     """
@@ -85,6 +104,15 @@ class HDF5(DataBase):
       @ In, paramInput, ParameterInput, the already parsed input.
       @ Out, None
     """
+    # the layout is needed by the base class, that initializes the database
+    layoutNode = paramInput.findFirst('layout')
+    if layoutNode is not None:
+      self.layout = layoutNode.value
+    bufferNode = paramInput.findFirst('bufferSize')
+    if bufferNode is not None:
+      if bufferNode.value < 1:
+        self.raiseAnError(IOError, f'<bufferSize> of database "{self.name}" must be a positive integer, got {bufferNode.value}!')
+      self.bufferSize = bufferNode.value
     super()._handleInput(paramInput)
 
   #####################
@@ -108,7 +136,16 @@ class HDF5(DataBase):
     if self.database is not None:
       self.database.closeDatabaseW()
     super().initializeDatabase()
-    self.database = h5Data(self.name, self.databaseDir, self.filename, self.exist, self.variables)
+    self.database = h5Data(self.name, self.databaseDir, self.filename, self.exist, self.variables,
+                           layout=self.layout, bufferSize=self.bufferSize)
+
+  def endStepActions(self):
+    """
+      Writes the buffered realizations at the end of each step
+      @ In, None
+      @ Out, None
+    """
+    self.database.flush()
 
   def saveDataToFile(self, source):
     """
@@ -226,7 +263,10 @@ class HDF5(DataBase):
     allRealizationNames = self.database.retrieveAllHistoryNames()
     # instead to use a OrderedDict in the database, I sort the names here (it is much faster)
     allRealizationNames.sort()
-    allData = [self.realization(name) for name in allRealizationNames]
+    if (not self.exist) and (not self.built):
+      self.raiseAnError(Exception, f'Can not retrieve a realization from Database {self.name} .It has not been built yet!')
+    # the columnar databases read each variable once for all the realizations
+    allData = self.database._getRealizationsByName(allRealizationNames)
 
     return allData
 
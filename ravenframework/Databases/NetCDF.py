@@ -23,8 +23,9 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 import os
 import numpy as np
 import xarray as xr
+import netCDF4
 
-from ..utils import xmlUtils, mathUtils
+from ..utils import xmlUtils, mathUtils, InputData, InputTypes
 from .Database import DataBase
 
 class NetCDF(DataBase):
@@ -44,6 +45,13 @@ class NetCDF(DataBase):
     spec = super(NetCDF, cls).getInputSpecification()
     spec.description = r"""File storage format based on NetCDF4 protocol, which is natively compatible
                        with xarray DataSets used in RAVEN DataObjects."""
+    spec.addSub(InputData.parameterInputFactory("bufferSize", contentType=InputTypes.IntegerType,
+        descr=r"""number of realizations buffered before being appended to the file. The buffer is also
+              written at the end of each step and before the database is read. \default{100}"""))
+    spec.addSub(InputData.parameterInputFactory("chunkSize", contentType=InputTypes.IntegerType,
+        descr=r"""if provided, the database is loaded lazily in the DataObjects, in chunks of this number
+              of realizations, which are read from the file only when needed. Otherwise, the whole database
+              is loaded in memory. \default{None}"""))
 
     return spec
 
@@ -57,6 +65,142 @@ class NetCDF(DataBase):
     self.printTag = 'DATABASE-NetCDF'  # For printing verbosity labels
     self._format = 'netcdf4'  # writing format for disk
     self._extension = '.nc'
+    self._bufferSize = 100     # number of realizations buffered before being appended to the file
+    self._chunkSize = None     # if not None, size of the chunks of the lazy loading
+    self._buffer = []          # realizations (xr.Dataset) not written yet
+    self._nextSampleID = None  # RAVEN_sample_ID of the next realization (None if not known yet)
+    self._lazyData = []        # datasets lazily loaded from the file (still open)
+
+  def _handleInput(self, paramInput):
+    """
+      Function to handle the common parts of the database parameter input.
+      @ In, paramInput, ParameterInput, the already parsed input.
+      @ Out, None
+    """
+    super()._handleInput(paramInput)
+    for sub, attribute in [('bufferSize', '_bufferSize'), ('chunkSize', '_chunkSize')]:
+      node = paramInput.findFirst(sub)
+      if node is not None:
+        if node.value < 1:
+          self.raiseAnError(IOError, f'<{sub}> of database "{self.name}" must be a positive integer, got {node.value}!')
+        setattr(self, attribute, node.value)
+
+  def initializeDatabase(self):
+    """
+      Initialize underlying database object.
+      @ In, None
+      @ Out, None
+    """
+    # the lazily loaded data keep the file open
+    for lazy in self._lazyData:
+      lazy.close()
+    super().initializeDatabase()
+    # the file may have been wiped: start over from its content
+    self._buffer = []
+    self._nextSampleID = None
+    self._lazyData = []
+
+  def endStepActions(self):
+    """
+      Writes the buffered realizations at the end of each step
+      @ In, None
+      @ Out, None
+    """
+    self.flush()
+
+  def flush(self):
+    """
+      Appends the buffered realizations to the file
+      @ In, None
+      @ Out, None
+    """
+    if len(self._buffer) == 0:
+      return
+    # after research, best approach is concatenating xr.DataSet along RAVEN_sample_ID dim
+    new = xr.concat(self._buffer, dim='RAVEN_sample_ID')
+    self._buffer = []
+    self._appendToFile(new)
+
+  def _appendToFile(self, ds):
+    """
+      Appends samples to the file. The samples are written along the unlimited "RAVEN_sample_ID"
+      dimension of the file when possible, the whole file is rewritten otherwise (e.g. new variables
+      or different index values).
+      @ In, ds, xr.Dataset, the samples
+      @ Out, None
+    """
+    path = self.get_fullpath()
+    # the lazily loaded data are read again from the file when needed
+    for lazy in self._lazyData:
+      lazy.close()
+    self._lazyData = []
+    # if this is open somewhere else, we can't write to it
+    # TODO is there a way to check if it's writable? I can't find one ...
+    try:
+      if not os.path.isfile(path):
+        ds.to_netcdf(path, engine=self._format, unlimited_dims=['RAVEN_sample_ID'])
+      elif not self._appendInPlace(path, ds):
+        self.raiseADebug(f'Samples cannot be appended to "{path}", the file is rewritten.')
+        exists = xr.load_dataset(path, engine=self._format)
+        # NOTE order matters! This preserves the sampling order in which data was inserted
+        #      into this database
+        new = xr.concat((exists, ds), 'RAVEN_sample_ID')
+        new.to_netcdf(path, engine=self._format, unlimited_dims=['RAVEN_sample_ID'])
+    except PermissionError:
+      self.raiseAnError(PermissionError, f'NetCDF file "{path}" denied RAVEN permission to write! Is it open in another program?')
+    if 'RAVEN_sample_ID' in ds.coords and len(ds['RAVEN_sample_ID']):
+      self._nextSampleID = int(ds['RAVEN_sample_ID'].values[-1]) + 1
+
+  def _appendInPlace(self, path, ds):
+    """
+      Appends samples at the end of the unlimited "RAVEN_sample_ID" dimension of the file,
+      if the samples have the same variables (types and dimensions) and index values of the file.
+      @ In, path, str, the file path
+      @ In, ds, xr.Dataset, the samples
+      @ Out, appended, bool, True if the samples have been appended
+    """
+    with netCDF4.Dataset(path, 'a') as nc:
+      dim = nc.dimensions.get('RAVEN_sample_ID')
+      if dim is None or not dim.isunlimited() or set(nc.variables) != set(ds.variables):
+        return False
+      for var in ds.variables:
+        stored = nc.variables[var]
+        if stored.dimensions != ds[var].dims:
+          return False
+        if 'RAVEN_sample_ID' not in ds[var].dims:
+          # index values, they must be the same
+          if not np.array_equal(stored[:], ds[var].values):
+            return False
+        elif ds[var].dims[0] != 'RAVEN_sample_ID':
+          return False
+        elif stored.dtype is str:
+          if ds[var].dtype.kind not in 'UO' or not all(isinstance(val, str) for val in ds[var].values.ravel()):
+            return False
+        elif ds[var].dtype.kind not in 'biuf' or not np.can_cast(ds[var].dtype, stored.dtype, 'same_kind'):
+          return False
+      start = len(dim)
+      end = start + len(ds['RAVEN_sample_ID'])
+      for var in ds.variables:
+        if 'RAVEN_sample_ID' in ds[var].dims:
+          nc.variables[var][start:end] = ds[var].values
+    return True
+
+  def _getNextSampleID(self):
+    """
+      Provides the RAVEN_sample_ID of the next realization
+      @ In, None
+      @ Out, counter, int, the sample ID
+    """
+    if self._nextSampleID is None:
+      path = self.get_fullpath()
+      self._nextSampleID = 0
+      if os.path.isfile(path):
+        with xr.open_dataset(path) as ds: # autocloses at end of scope
+          if 'RAVEN_sample_ID' in ds and len(ds.RAVEN_sample_ID):
+            self._nextSampleID = int(ds.RAVEN_sample_ID.values[-1]) + 1
+    counter = self._nextSampleID
+    self._nextSampleID += 1
+    return counter
 
   def saveDataToFile(self, source):
     """
@@ -65,9 +209,10 @@ class NetCDF(DataBase):
       @ Out, None
     """
     ds, meta = source.getData()
+    # the realizations added before are written first
+    self.flush()
     # we actually just tell the DataSet to write out as netCDF
     path = self.get_fullpath()
-    # TODO set up to use dask for on-disk operations
     # convert metadata into writeable
     for key, xml in meta.items():
       ds.attrs[key] = xmlUtils.prettify(xml.getRoot())
@@ -77,23 +222,14 @@ class NetCDF(DataBase):
         # is it a string?
         if mathUtils.isAString(ds[var].values[0]):
           ds[var] = ds[var].astype(str)
-    # is there existing data? Read it in and merge it, if so
+    # is there existing data? The new samples are appended, if so
     # -> we've already wiped the file in initializeDatabase if it's in write mode
     if os.path.isfile(path):
-      exists = xr.load_dataset(path)
-      if 'RAVEN_sample_ID' in exists:
-        floor = int(exists['RAVEN_sample_ID'].values[-1]) + 1
-        new = ds['RAVEN_sample_ID'].values + floor
-        ds = ds.assign_coords(RAVEN_sample_ID=new)
-      # NOTE order matters! This preserves the sampling order in which data was inserted
-      #      into this database
-      ds = xr.concat((exists, ds), 'RAVEN_sample_ID')
-    # if this is open somewhere else, we can't write to it
-    # TODO is there a way to check if it's writable? I can't find one ...
-    try:
-      ds.to_netcdf(path, engine=self._format)
-    except PermissionError:
-      self.raiseAnError(PermissionError, f'NetCDF file "{path}" denied RAVEN permission to write! Is it open in another program?')
+      floor = self._getNextSampleID()
+      self._nextSampleID = floor
+      new = ds['RAVEN_sample_ID'].values + floor
+      ds = ds.assign_coords(RAVEN_sample_ID=new)
+    self._appendToFile(ds)
 
   def loadIntoData(self, target):
     """
@@ -101,11 +237,17 @@ class NetCDF(DataBase):
       @ In, target, DataObjects.DataObjet, object to write data into
       @ Out, None
     """
+    self.flush()
     # the main data
     # NOTE: DO NOT use open_dataset unless you wrap it in a "with xr.open_dataset(f) as ds"!
     # -> open_dataset does NOT close the file object after loading!
     # -> however, load_dataset fully loads the ds into memory and closes the file.
-    ds = xr.load_dataset(self.get_fullpath(), engine=self._format)
+    if self._chunkSize is None:
+      ds = xr.load_dataset(self.get_fullpath(), engine=self._format)
+    else:
+      # lazy loading (using dask), the chunks are read when needed: the file is closed before being written
+      ds = xr.open_dataset(self.get_fullpath(), engine=self._format, chunks={'RAVEN_sample_ID': self._chunkSize})
+      self._lazyData.append(ds)
     # the meta data, convert from string to xml
     meta = dict((key, xmlUtils.staticFromString(val)) for key, val in ds.attrs.items())
     # set D.O. properties
@@ -123,18 +265,8 @@ class NetCDF(DataBase):
       @ Out, None
     """
     # apparently we're storing samples!
-    # -> do we already have data present?
-    path = self.get_fullpath()
-    if os.path.isfile(path):
-      # load data as 100 sample chunks, lazily (not into memory)
-      # -> using the argument "chunks" triggers the lazy loading using dask
-      # existing = xr.open_dataset(path, chunks={'RAVEN_sample_ID': 100}) # TODO user option
-      existing = True
-      with xr.open_dataset(path) as ds: # autocloses at end of scope
-        counter = int(ds.RAVEN_sample_ID.values[-1]) + 1
-    else:
-      existing = None
-      counter = 0
+    # -> the sample ID follows the data already present (in the file or in the buffer)
+    counter = self._getNextSampleID()
     # create DS from realization # TODO make a feature of the Realization object
     indexMap = rlz.get('_indexMap', [{}])[0]
     indices = list(set().union(*(set(x) for x in indexMap.values())))
@@ -152,10 +284,7 @@ class NetCDF(DataBase):
       coords = dict((idx, rlz[idx]) for idx in indexMap.get(var, []))
       xarrs[var] = xr.DataArray(vals, dims=dims, coords=coords).expand_dims(dim={'RAVEN_sample_ID': [counter]})
     rlzDS = xr.Dataset(xarrs)
-    if existing:
-      with xr.open_dataset(path) as ds: # autocloses at end of scope
-        # after research, best approach is concatenating xr.DataSet along RAVEN_sample_ID dim
-        new = xr.concat((ds, rlzDS), dim='RAVEN_sample_ID')
-    else:
-      new = rlzDS
-    new.to_netcdf(path) # TODO would appending instead of writing work for new samples? I doubt it.
+    # the realizations are appended to the file in batches
+    self._buffer.append(rlzDS)
+    if len(self._buffer) >= self._bufferSize:
+      self.flush()
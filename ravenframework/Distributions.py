@@ -138,6 +138,7 @@ class Distribution(BaseEntity, InputDataUser):
     self.dimensionality       = None   # Dimensionality of the distribution (1D or ND)
     self.distType             = None   # Distribution type (continuous or discrete)
     self.memory               = False  # This variable flags if the distribution has history dependence in the sampling process (True) or not (False)
+    self.inverseTransformRvs  = False  # True if rvs() is the inverse cdf of a single uniform random number (i.e. rvs() == ppf(random()))
     self.printTag             = 'DISTRIBUTIONS'
     self.preferredPolynomials = None  # best polynomial for probability-weighted norm of error
     self.preferredQuadrature  = None  # best quadrature for probability-weighted norm of error
@@ -264,6 +265,36 @@ class Distribution(BaseEntity, InputDataUser):
     randResult = self.rvsWithinCDFbounds(CDFlower,CDFupper)
     return randResult
 
+  def ppfArray(self, x):
+    """
+      Function to get the inverse cdf at an array of provided coordinates
+      Default implementation, evaluates one coordinate at a time
+      @ In, x, np.array, values to get the inverse cdf at
+      @ Out, ppfValues, np.array, requested inverse cdfs
+    """
+    ppfValues = np.asarray([self.ppf(val) for val in x])
+    return ppfValues
+
+  def pdfArray(self, x):
+    """
+      Function to get the pdf at an array of provided coordinates
+      Default implementation, evaluates one coordinate at a time
+      @ In, x, np.array, values to get the pdf at
+      @ Out, pdfValues, np.array, requested pdfs
+    """
+    pdfValues = np.asarray([self.pdf(val) for val in x])
+    return pdfValues
+
+  def cdfArray(self, x):
+    """
+      Function to get the cdf at an array of provided coordinates
+      Default implementation, evaluates one coordinate at a time
+      @ In, x, np.array, values to get the cdf at
+      @ Out, cdfValues, np.array, requested cdfs
+    """
+    cdfValues = np.asarray([self.cdf(val) for val in x])
+    return cdfValues
+
   def convertToDistr(self,qtype,pts):
     """
       Converts points from the quadrature "qtype" standard domain to the distribution domain.
@@ -413,6 +444,7 @@ class BoostDistribution(Distribution):
     super().__init__()
     self.dimensionality  = 1
     self.distType        = distType.continuous
+    self.inverseTransformRvs = True
 
   def cdf(self,x):
     """
@@ -441,6 +473,33 @@ class BoostDistribution(Distribution):
     returnPdf = self._distribution.pdf(x)
     return returnPdf
 
+  def ppfArray(self, x):
+    """
+      Function to get the inverse cdf at an array of provided coordinates
+      @ In, x, np.array, values to get the inverse cdf at
+      @ Out, ppfValues, np.array, requested inverse cdfs
+    """
+    ppfValues = np.atleast_1d(self._distribution.inverseCdf(x))
+    return ppfValues
+
+  def pdfArray(self, x):
+    """
+      Function to get the pdf at an array of provided coordinates
+      @ In, x, np.array, values to get the pdf at
+      @ Out, pdfValues, np.array, requested pdfs
+    """
+    pdfValues = np.atleast_1d(self._distribution.pdf(x))
+    return pdfValues
+
+  def cdfArray(self, x):
+    """
+      Function to get the cdf at an array of provided coordinates
+      @ In, x, np.array, values to get the cdf at
+      @ Out, cdfValues, np.array, requested cdfs
+    """
+    cdfValues = np.atleast_1d(self._distribution.cdf(x))
+    return cdfValues
+
   def logPdf(self,x):
     """
       Function to get the log pdf at a provided coordinate
@@ -1773,6 +1832,7 @@ class Categorical(Distribution):
     self.dimensionality = 1
     self.distType       = distType.discrete
     self.isFloat        = True
+    self.inverseTransformRvs = True
     self.rtol = 1e-6
 
   def _handleInput(self, paramInput):
@@ -1941,6 +2001,66 @@ class Categorical(Distribution):
         if cumulative >= x:
           return float(element[0]) if self.isFloat else element[0]
 
+  def pdfArray(self, x):
+    """
+      Function to get the pdf at an array of provided coordinates
+      The states are looked up at once, the coordinates that are not exactly one of the states
+      are evaluated one at a time (tolerance check)
+      @ In, x, np.array, values to get the pdf at
+      @ Out, pdfValues, np.array, requested pdfs
+    """
+    if not self.isFloat:
+      return super().pdfArray(x)
+    x = np.asarray(x, dtype=float)
+    states = np.asarray(sorted(self.mapping.keys()), dtype=float)
+    probabilities = np.asarray([self.mapping[key] for key in sorted(self.mapping.keys())])
+    indexes = np.minimum(np.searchsorted(states, x), states.size - 1)
+    exact = states[indexes] == x
+    pdfValues = np.empty(x.shape)
+    pdfValues[exact] = probabilities[indexes[exact]]
+    for i in np.nonzero(~exact)[0]:
+      pdfValues[i] = self.pdf(x[i])
+    return pdfValues
+
+  def cdfArray(self, x):
+    """
+      Function to get the cdf at an array of provided coordinates
+      @ In, x, np.array, values to get the cdf at
+      @ Out, cdfValues, np.array, requested cdfs
+    """
+    if not self.isFloat:
+      return super().cdfArray(x)
+    x = np.asarray(x, dtype=float)
+    sortedMapping = sorted(self.mapping.items(), key=operator.itemgetter(0))
+    states = np.asarray([element[0] for element in sortedMapping], dtype=float)
+    cumulative = np.cumsum([element[1] for element in sortedMapping])
+    outside = np.logical_or(x < states[0], x > states[-1])
+    if np.any(outside):
+      self.raiseAnError(IOError,f'{self.type} distribution cannot calculate cdf for ' + str(x[outside][0]))
+    # the cdf of a value between two states is the one of the lower state
+    cdfValues = cumulative[np.searchsorted(states, x, side='right') - 1]
+    cdfValues[x == states[-1]] = 1.0
+    return cdfValues
+
+  def ppfArray(self, x):
+    """
+      Function to get the inverse cdf at an array of provided coordinates
+      @ In, x, np.array, values (0 =< x =< 1) to get the inverse cdf at
+      @ Out, ppfValues, np.array, requested inverse cdfs
+    """
+    x = np.asarray(x, dtype=float)
+    if np.any(np.logical_or(x > 1., x < 0.)):
+      self.raiseAnError(IOError,f'{self.type} distribution cannot calculate ppf for', str(x[np.logical_or(x > 1., x < 0.)][0]), '! Valid value should within [0,1]!')
+    sortedMapping = sorted(self.mapping.items(), key=operator.itemgetter(0))
+    states = np.asarray([float(element[0]) if self.isFloat else element[0] for element in sortedMapping],
+                        dtype=float if self.isFloat else object)
+    cumulative = np.cumsum([element[1] for element in sortedMapping])
+    # first state whose cumulative probability reaches x
+    indexes = np.minimum(np.searchsorted(cumulative, x, side='left'), states.size - 1)
+    indexes[x == 1.0] = states.size - 1
+    ppfValues = states[indexes]
+    return ppfValues
+
   def rvs(self):
     """
       Return a random state of the categorical distribution
@@ -2050,10 +2170,10 @@ class UniformDiscrete(Distribution):
       self.xArray   = np.linspace(self.lowerBound,self.upperBound,self.nPoints)
 
     # Here the actual calculation of discrete distribution parameters is performed
-    self.pdfArray = 1.0/self.xArray.size * np.ones(self.xArray.size)
+    self.pdfValues = 1.0/self.xArray.size * np.ones(self.xArray.size)
     paramsDict={}
     paramsDict['outcome'] = self.xArray
-    paramsDict['state'] = self.pdfArray
+    paramsDict['state'] = self.pdfValues
 
     self.categoricalDist = Categorical()
     self.categoricalDist.initializeFromDict(paramsDict)
@@ -2096,6 +2216,30 @@ class UniformDiscrete(Distribution):
     """
     return self.categoricalDist.ppf(x)
 
+  def cdfArray(self, x):
+    """
+      Function to get the cdf at an array of provided coordinates
+      @ In, x, np.array, values to get the cdf at
+      @ Out, cdfValues, np.array, requested cdfs
+    """
+    return self.categoricalDist.cdfArray(x)
+
+  def pdfArray(self, x):
+    """
+      Function to get the pdf at an array of provided coordinates
+      @ In, x, np.array, values to get the pdf at
+      @ Out, pdfValues, np.array, requested pdfs
+    """
+    return self.categoricalDist.pdfArray(x)
+
+  def ppfArray(self, x):
+    """
+      Function to get the inverse cdf at an array of provided coordinates
+      @ In, x, np.array, values (0 =< x =< 1) to get the inverse cdf at
+      @ Out, ppfValues, np.array, requested inverse cdfs
+    """
+    return self.categoricalDist.ppfArray(x)
+
   def rvs(self):
     """
       Return a random state of the distribution
@@ -2126,10 +2270,10 @@ class UniformDiscrete(Distribution):
 
     self.xArray = np.setdiff1d(self.xArray,discardedElems)
 
-    self.pdfArray = 1/self.xArray.size * np.ones(self.xArray.size)
+    self.pdfValues = 1/self.xArray.size * np.ones(self.xArray.size)
     paramsDict={}
     paramsDict['outcome'] = self.xArray
-    paramsDict['state'] = self.pdfArray
+    paramsDict['state'] = self.pdfValues
     paramsDict['strategy'] = self.strategy
 
     self.tempUniformDiscrete = UniformDiscrete()
@@ -2983,6 +3127,7 @@ class Custom1D(Distribution):
     self.variableID      = None
     self.dimensionality  = 1
     self.distType        = distType.continuous
+    self.inverseTransformRvs = True
     # Scipy.interpolate.UnivariateSpline is used
     self.k               = 4 # Degree of the smoothing spline, Must be <=5
     self.s               = 0 # Positive smoothing factor used to choose the number of knots
@@ -3118,6 +3263,38 @@ class Custom1D(Distribution):
     ppfValue = self.invCDF(x)
     return ppfValue
 
+  def pdfArray(self, x):
+    """
+      Function to get the pdf at an array of provided coordinates
+      @ In, x, np.array, values to get the pdf at
+      @ Out, pdfValues, np.array, requested pdfs
+    """
+    pdfValues = np.atleast_1d(self.pdfFunc(x))
+    return pdfValues
+
+  def cdfArray(self, x):
+    """
+      Function to get the cdf at an array of provided coordinates
+      @ In, x, np.array, values to get the cdf at
+      @ Out, cdfValues, np.array, requested cdfs
+    """
+    if self.functionType == 'cdf':
+      cdfValues = np.atleast_1d(self.cdfFunc(x))
+    else:
+      # the integral of the pdf spline is zero outside of the data range
+      antiderivative = self.pdfFunc.antiderivative()
+      cdfValues = np.atleast_1d(antiderivative(np.clip(x, self.data[0][0], self.data[-1][0])) - antiderivative(self.data[0][0]))
+    return cdfValues
+
+  def ppfArray(self, x):
+    """
+      Function to get the inverse cdf at an array of provided coordinates
+      @ In, x, np.array, values to get the inverse cdf at
+      @ Out, ppfValues, np.array, requested inverse cdfs
+    """
+    ppfValues = np.atleast_1d(self.invCDF(x))
+    return ppfValues
+
   def rvs(self):
     """
       Return a random state of the custom1D distribution
@@ -3165,6 +3342,7 @@ class LogUniform(Distribution):
     """
     super().__init__()
     self.base = None
+    self.inverseTransformRvs = True
 
   def initializeDistribution(self):
     """
@@ -3242,6 +3420,37 @@ class LogUniform(Distribution):
       ppfValue = 10.**((self.upperBound-self.lowerBound)*x + self.lowerBound)
     return ppfValue
 
+  def pdfArray(self, x):
+    """
+      Function to get the pdf at an array of provided coordinates
+      @ In, x, np.array, values to get the pdf at
+      @ Out, pdfValues, np.array, requested pdfs
+    """
+    pdfValues = 1./(self.upperBound-self.lowerBound) * 1./np.asarray(x, dtype=float)
+    if self.base != 'natural':
+      pdfValues *= 1./math.log(10.)
+    return pdfValues
+
+  def cdfArray(self, x):
+    """
+      Function to get the cdf at an array of provided coordinates
+      @ In, x, np.array, values to get the cdf at
+      @ Out, cdfValues, np.array, requested cdfs
+    """
+    logX = np.log(x) if self.base == 'natural' else np.log10(x)
+    cdfValues = (logX-self.lowerBound)/(self.upperBound-self.lowerBound)
+    return cdfValues
+
+  def ppfArray(self, x):
+    """
+      Function to get the inverse cdf at an array of provided coordinates
+      @ In, x, np.array, values to get the inverse cdf at
+      @ Out, ppfValues, np.array, requested inverse cdfs
+    """
+    exponent = (self.upperBound-self.lowerBound)*np.asarray(x, dtype=float) + self.lowerBound
+    ppfValues = np.exp(exponent) if self.base == 'natural' else 10.**exponent
+    return ppfValues
+
   def rvs(self):
     """
       Return a random value
@@ -683,37 +683,22 @@ class BasicBinomialDistribution(DiscreteDistribution):
     """
       Inverse cumulative distribution function. The scipy implementation of this function does not match the behavior
       of the boost implementation, so we implement it manually here.
+      Boost solves 1 - I_p(a + 1, n - a) = x for a continuous "a" (I is the regularized incomplete beta function, equal
+      to the CDF at the integers) and rounds the root "out": down if less than 0.5, up otherwise. Since the CDF is
+      increasing, rounding up gives the smallest integer k such that CDF(k) >= x, which is the scipy ppf, and the
+      root is less than 0.5 if the CDF extended at a = 0.5 is greater than x. This allows evaluating arrays at once.
 
-      @ In, x, float, point at which to evaluate the inverse cdf
-      @ Out, inverseCdf, float, inverse cumulative distribution function at x
+      @ In, x, float or np.ndarray, point(s) at which to evaluate the inverse cdf
+      @ Out, iCdf, float or np.ndarray, inverse cumulative distribution function at x
     """
-    # Solve numerically using the complement of the incomplete beta function
-    def func(a, y):
-      """
-        CDF defined with the complement of the incomplete beta function
-
-        @ In, a, float, point at which to evaluate the CDF
-        @ In, y, float, desired quantile value
-        @ Out, diff, float, difference between the desired quantile value and the CDF evaluated at a
-      """
-      if a == self.dist.args[0]:
-        q = 1
-      else:
-        q = 1 - scipy.special.betainc(a + 1, self.dist.args[0] - a, self.dist.args[1])
-      diff = q - y
-      return diff
-
-    # The root finding problem being solved to get the inverse CDF is not vectorized, so we need to loop over the
-    # elements of x if x is an array.
-    if hasattr(x, '__len__'):
-      # Uses the toms748 algorithm for root finding, as stated in the boost documentation at
-      # https://www.boost.org/doc/libs/1_50_0/libs/math/doc/sf_and_dist/html/math_toolkit/dist/dist_ref/dists/binomial_dist.html
-      roots = [scipy.optimize.root_scalar(func, bracket=[0, self.dist.args[0]], args=(xi), method='toms748').root for xi in x]
-      # Round "out": down if less than 0.5, up if greater than 0.5
-      iCdf = np.array([np.floor(root) if root < 0.5 else np.ceil(root) for root in roots])
-    else:
-      root = scipy.optimize.root_scalar(func, bracket=[0, self.dist.args[0]], args=(x), method='toms748').root
-      iCdf = np.floor(root) if root < 0.5 else np.ceil(root)
+    n, p = self.dist.args
+    x = np.asarray(x, dtype=float)
+    iCdf = np.asarray(self.dist.ppf(x), dtype=float)
+    iCdf[1 - scipy.special.betainc(1.5, n - 0.5, p) > x] = 0.
+    # If the input x was a scalar, iCdf will be 0-dim numpy array. If that's the case,
+    # we want to return a scalar instead, so we extract the value from the array.
+    if iCdf.ndim == 0:
+      iCdf = iCdf.item()
     return iCdf
 
 
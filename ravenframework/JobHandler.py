@@ -24,6 +24,10 @@ import sys
 import threading
 import socket
 import re
+import shutil
+import pickle
+import tempfile
+import concurrent.futures
 
 from .utils import importerUtils as im
 from .utils import utils
@@ -39,6 +43,11 @@ if _daskAvail:
   import dask.distributed
 if _rayAvail:
   import ray
+# the objects shipped to the process pool are pickled with cloudpickle, if available (e.g., to
+# support the modules loaded from a path, such as the ExternalModel modules)
+_cloudpickleAvail = im.isLibAvail("cloudpickle")
+if _cloudpickleAvail:
+  import cloudpickle
 
 # end internal parallel module
 # Internal Modules End-----------------------------------------------------------
@@ -128,6 +137,8 @@ class JobHandler(BaseType):
     self._server = None         # Variable containing the info about the RAY or DASK parallel server.
                                   # If None, multi-threading is used
     self.sleepTime = 1e-4         # Sleep time for collecting/inquiring/submitting new jobs
+    self.waitTimeOut = 0.1        # Max time the polling loop (and the clients) block waiting for a job event
+                                  # before checking the queues anyway
     self.completed = False        # Is the execution completed? When True, the JobHandler is shut down
     self.__profileJobs = False    # Determines whether to collect and print job timing summaries at the end of job runs.
     self.maxQueueSize = None      # Prevents the pending queue from growing indefinitely, but also
@@ -161,6 +172,10 @@ class JobHandler(BaseType):
     ############################################################################
 
     self.__queueLock = threading.RLock()
+    # Events used in place of polling: __jobEvent wakes up the polling loop (new job queued,
+    # job done, ...), __updateEvent wakes up the clients waiting for finished jobs or free spots
+    self.__jobEvent = threading.Event()
+    self.__updateEvent = threading.Event()
     # List of submitted job identifiers, includes jobs that have completed as
     # this list is not cleared until a new step is entered
     self.__submittedJobs = []
@@ -173,6 +188,14 @@ class JobHandler(BaseType):
     self.remoteServers = None
     self.daskSchedulerFile = None
     self._daskScheduler = None
+    # objects (models) shipped to the workers in the current step, {id(object): (object, shipment)}
+    # (see __shipToWorkers)
+    self.__shipped = {}
+    self.__shipmentDir = None
+    self.__shipmentGeneration = 0
+    self.__shipmentCounter = 0
+    # statistics of the submissions to the workers in the current step (see reportSubmissionStatistics)
+    self.__submissionStats = self.__newSubmissionStats()
 
   def __getstate__(self):
     """
@@ -182,10 +205,17 @@ class JobHandler(BaseType):
     """
     state = copy.copy(self.__dict__)
     state.pop('_JobHandler__queueLock')
+    state.pop('_JobHandler__jobEvent')
+    state.pop('_JobHandler__updateEvent')
     #XXX we probably need to record how this was init, and store that
     # such as the scheduler file
     if self._parallelLib == ParallelLibEnum.dask and '_server' in state:
       state.pop('_server')
+    if self._parallelLib == ParallelLibEnum.process:
+      # the process pool belongs to this JobHandler: the copies (e.g. clones) use threads
+      state['_server'] = None
+    # the shipments (object references, scattered data) belong to this JobHandler
+    state['_JobHandler__shipped'] = {}
     return state
 
   def __setstate__(self, d):
@@ -196,6 +226,8 @@ class JobHandler(BaseType):
     """
     self.__dict__.update(d)
     self.__queueLock = threading.RLock()
+    self.__jobEvent = threading.Event()
+    self.__updateEvent = threading.Event()
 
   def createCloneJobHandler(self):
     """
@@ -292,7 +324,15 @@ class JobHandler(BaseType):
       @ Out, None
     """
     self.raiseADebug("Initializing parallel InternalParallel: {0} Nodes: {1}".format(self.runInfoDict['internalParallel'],len(self.runInfoDict['Nodes'])))
-    if self._parallelLib != ParallelLibEnum.shared:
+    if self._parallelLib == ParallelLibEnum.process:
+      ## local pool of batchSize processes (the remote nodes, if any, are not used)
+      sys.path.append(self.runInfoDict['WorkingDir'])
+      self._server = concurrent.futures.ProcessPoolExecutor(max_workers=self.runInfoDict['batchSize'],
+                                                            initializer=Runners.ProcessPoolRunner.initializeWorker,
+                                                            initargs=(list(sys.path),))
+      self.__shipmentDir = tempfile.mkdtemp(prefix='raven_process_pool_')
+      self.raiseADebug(f"JobHandler initialized with a pool of {self.runInfoDict['batchSize']} processes")
+    elif self._parallelLib != ParallelLibEnum.shared:
       # dashboard?
       db = self.runInfoDict['includeDashboard']
       # Check if the list of unique nodes is present and, in case, initialize the
@@ -450,6 +490,11 @@ class JobHandler(BaseType):
       self._server.close()
       if self._daskScheduler is not None:
         self._daskScheduler.terminate()
+    elif self._parallelLib == ParallelLibEnum.process and self._server is not None:
+      self._server.shutdown(wait=False, cancel_futures=True)
+      self._server = None
+      self.__shipped = {}
+      shutil.rmtree(self.__shipmentDir, ignore_errors=True)
 
   def __runHeadNode(self, nProcs, port=None):
     """
@@ -661,13 +706,17 @@ class JobHandler(BaseType):
 
   def sendDataToWorkers(self, data):
     """
-      Method to send data to workers (if ray activated) and return a reference
-      If ray is not used, the data is simply returned, otherwise an object reference id is returned
+      Method to send data to workers (if ray or dask activated) and return a reference
+      If neither ray nor dask is used, a copy of the data is returned, otherwise an object reference id
+      (ray) or a future (dask) is returned, that can be used as argument of the jobs
       @ In, data, object, any data to send to workers
-      @ Out, ref, ray.ObjectRef or object, the reference or the object itself
+      @ Out, ref, ray.ObjectRef, dask.distributed.Future or object, the reference or the object itself
     """
     if self._server is not None and self._parallelLib == ParallelLibEnum.ray:
-      ref = ray.put(copy.deepcopy(data))
+      # ray.put serializes (copies) the data
+      ref = ray.put(data)
+    elif self._server is not None and self._parallelLib == ParallelLibEnum.dask:
+      ref = self._server.scatter(data, broadcast=True, hash=False)
     else:
       ref = copy.deepcopy(data)
     return ref
@@ -676,15 +725,38 @@ class JobHandler(BaseType):
     """
     This function begins the polling loop for the JobHandler where it will
     constantly fill up its running queue with jobs in its pending queue and
-    unload finished jobs into its finished queue to be extracted by
+    unload finished jobs into its finished queue to be extracted by the Steps.
+    The loop does not spin: it blocks until a job is queued or a running job
+    notifies its completion (or waitTimeOut elapses).
+    @ In, None
+    @ Out, None
     """
     while not self.completed:
       self.fillJobQueue()
       self.cleanJobQueue()
-      # TODO May want to revisit this:
-      # http://stackoverflow.com/questions/29082268/python-time-sleep-vs-event-wait
-      # probably when we move to Python 3.
-      time.sleep(self.sleepTime)
+      # NOTE: the event is cleared only after waking up, so that a notification that arrives
+      # while the queues are being processed triggers a new pass immediately
+      self.__jobEvent.wait(self.waitTimeOut)
+      self.__jobEvent.clear()
+
+  def _notifyJobEvent(self):
+    """
+      Wakes up the polling loop (e.g. a job has been queued or is done)
+      @ In, None
+      @ Out, None
+    """
+    self.__jobEvent.set()
+
+  def waitForUpdates(self, timeout=None):
+    """
+      Blocks the caller until a job is finished (or spots in the queue are freed), so that
+      clients (e.g. the Steps) do not need to poll the JobHandler.
+      @ In, timeout, float, optional, max time to wait in seconds (if None, waitTimeOut is used)
+      @ Out, updated, bool, True if something changed, False if the wait timed out
+    """
+    updated = self.__updateEvent.wait(self.waitTimeOut if timeout is None else timeout)
+    self.__updateEvent.clear()
+    return updated
 
   def addJob(self, args, functionToRun, identifier, metadata=None, forceUseThreads = False, uniqueHandler="any", clientQueue = False, groupInfo = None):
     """
@@ -716,7 +788,10 @@ class JobHandler(BaseType):
     """
     assert "original_function" in dir(functionToRun), "to parallelize a function, it must be" \
            " decorated with RAVEN Parallel decorator"
-    if self._server is None or forceUseThreads:
+    shipment = None
+    if self._server is not None and not forceUseThreads:
+      shipment = self.__shipToWorkers(args[0] if len(args) > 0 else None)
+    if self._server is None or forceUseThreads or (self._parallelLib == ParallelLibEnum.process and shipment is None):
       internalJob = Runners.factory.returnInstance('SharedMemoryRunner', args,
                                                    functionToRun.original_function,
                                                    identifier=identifier,
@@ -734,15 +809,29 @@ class JobHandler(BaseType):
                                                      identifier=identifier,
                                                      metadata=metadata,
                                                      uniqueHandler=uniqueHandler,
-                                                     profile=self.__profileJobs)
+                                                     profile=self.__profileJobs,
+                                                     shipment=shipment)
 
+      elif self._parallelLib == ParallelLibEnum.process:
+        internalJob = Runners.factory.returnInstance('ProcessPoolRunner', tuple([self._server] + list(args)),
+                                                     functionToRun.original_function,
+                                                     identifier=identifier,
+                                                     metadata=metadata,
+                                                     uniqueHandler=uniqueHandler,
+                                                     profile=self.__profileJobs,
+                                                     shipment=shipment)
       elif self._parallelLib == ParallelLibEnum.ray:
         internalJob = Runners.factory.returnInstance('RayRunner', arguments,
                                                      functionToRun.remote,
                                                      identifier=identifier,
                                                      metadata=metadata,
                                                      uniqueHandler=uniqueHandler,
-                                                     profile=self.__profileJobs)
+                                                     profile=self.__profileJobs,
+                                                     shipment=shipment)
+      # size of what is serialized for each job (the shipped object is only referenced), sampled on the
+      # first job of the step to avoid serializing the arguments of every job once more on the head
+      if self.__submissionStats['argumentBytes'] is None:
+        self.__submissionStats['argumentBytes'] = self.__serializedSize(internalJob._argumentsToSend()[1:] if shipment is not None else args)
     # set the client info
     internalJob.clientRunner = clientQueue
     #  set the groupping id if present
@@ -761,6 +850,103 @@ class JobHandler(BaseType):
     # add the runner in the Queue
     self.reAddJob(internalJob)
 
+  def __shipToWorkers(self, obj):
+    """
+      Ships an object to the workers, once per step, so that the jobs only carry a reference to it
+      instead of serializing it for each job:
+      - ray: the object is put in the object store (ray.put);
+      - dask: the object is scattered to (all) the workers;
+      - process pool: the object is pickled in a file, loaded by each worker the first time it receives a job for it.
+      Only the models are shipped (but the Code, whose evaluations mostly run in external processes).
+      @ In, obj, object, the object whose method is run by the job (e.g. the model)
+      @ Out, shipment, object, the reference to the shipped object, None if it has not been shipped
+        (the jobs of the process pool then run on threads)
+    """
+    if not isinstance(obj, Models.Model) or isinstance(obj, Models.Code):
+      return None
+    with self.__queueLock:
+      if id(obj) not in self.__shipped:
+        shipment = None
+        start = time.time()
+        try:
+          # the size is only known when the object is serialized here (ray and dask serialize it themselves)
+          size = None
+          if self._parallelLib == ParallelLibEnum.process:
+            payload = self.__serialize(obj)
+            size = len(payload)
+            self.__shipmentCounter += 1
+            path = os.path.join(self.__shipmentDir, f'{self.__shipmentCounter}.pk')
+            with open(path, 'wb') as shipmentFile:
+              shipmentFile.write(payload)
+            shipment = (self.__shipmentGeneration, self.__shipmentCounter, path)
+          elif self._parallelLib == ParallelLibEnum.ray:
+            shipment = ray.put(obj)
+          elif self._parallelLib == ParallelLibEnum.dask:
+            shipment = self._server.scatter(obj, broadcast=True, hash=False)
+        except Exception as ae:
+          self.raiseAWarning(f'The {obj.type} "{obj.name}" cannot be shipped to the workers ({ae}): '+
+                             ('its jobs run on threads' if self._parallelLib == ParallelLibEnum.process else 'it is sent with each job'))
+        else:
+          self.__submissionStats['shipments'] += 1
+          self.__submissionStats['shipTime'] += time.time() - start
+          if size is not None:
+            self.__submissionStats['shippedBytes'] += size
+          self.raiseADebug(f'{obj.type} "{obj.name}" shipped to the workers' + (f' ({size/1e6:.3f} MB)' if size is not None else ''))
+        # the object is kept to prevent the reuse of its id
+        self.__shipped[id(obj)] = (obj, shipment)
+      return self.__shipped[id(obj)][1]
+
+  @staticmethod
+  def __serialize(obj):
+    """
+      Serializes an object to be sent to the workers
+      (with cloudpickle, if available, to support e.g. the modules loaded from a path)
+      @ In, obj, object, the object
+      @ Out, payload, bytes, the serialized object
+    """
+    return cloudpickle.dumps(obj) if _cloudpickleAvail else pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+  @staticmethod
+  def __serializedSize(obj):
+    """
+      Estimates the number of bytes sent to the workers for an object
+      @ In, obj, object, the object
+      @ Out, size, int, the size of the serialized object (0 if it cannot be serialized)
+    """
+    try:
+      return len(JobHandler.__serialize(obj))
+    except Exception:
+      return 0
+
+  @staticmethod
+  def __newSubmissionStats():
+    """
+      Creates the (empty) statistics of the submissions to the workers
+      @ In, None
+      @ Out, stats, dict, the statistics
+    """
+    return {'jobs':0, 'argumentBytes':None, 'submitTime':0., 'shipments':0, 'shippedBytes':0, 'shipTime':0.}
+
+  def reportSubmissionStatistics(self, stepName):
+    """
+      Reports (and resets) the statistics of the submissions to the workers (ray, dask or process pool)
+      of the current step: objects shipped once per step (and their size, if serialized by the process pool),
+      bytes serialized for the first job and submission time per job.
+      @ In, stepName, str, the name of the step
+      @ Out, None
+    """
+    with self.__queueLock:
+      stats = self.__submissionStats
+      self.__submissionStats = self.__newSubmissionStats()
+    if stats['jobs'] == 0:
+      return
+    shipped = f'{stats["shippedBytes"]/1e6:.3f} MB in ' if self._parallelLib == ParallelLibEnum.process else ''
+    argumentBytes = stats['argumentBytes'] or 0
+    self.raiseAMessage(f'Step "{stepName}": {stats["jobs"]} jobs submitted to the {self._parallelLib.name} workers, '
+                       f'{stats["shipments"]} objects shipped once ({shipped}{stats["shipTime"]:.3f} s), '
+                       f'{argumentBytes/1e3:.1f} kB serialized per job (first job) and '
+                       f'{stats["submitTime"]/stats["jobs"]*1e3:.2f} ms submission latency per job')
+
   def reAddJob(self, runner):
     """
       Method to add a runner object in the queue
@@ -775,6 +961,7 @@ class JobHandler(BaseType):
       if self.__profileJobs:
         runner.trackTime('queue')
       self.__submittedJobs.append(runner.identifier)
+    self.__jobEvent.set()
 
   def addClientJob(self, args, functionToRun, identifier, metadata=None, uniqueHandler="any", groupInfo = None):
     """
@@ -829,6 +1016,7 @@ class JobHandler(BaseType):
     # place it on the finished queue
     with self.__queueLock:
       self.__finished.append(run)
+    self.__updateEvent.set()
 
   def isFinished(self, uniqueHandler=None):
     """
@@ -1151,11 +1339,18 @@ class JobHandler(BaseType):
               item.args[3].update(kwargs)
 
             self.__running[i] = item
+            self.__running[i].setCompletionCallback(self.__jobEvent.set)
+            start = time.time()
             self.__running[i].start()
+            if not isinstance(item, Runners.SharedMemoryRunner):
+              self.__submissionStats['jobs'] += 1
+              self.__submissionStats['submitTime'] += time.time() - start
             self.__running[i].trackTime('started')
             self.__nextId += 1
           else:
             break
+        # spots in the queue have been freed
+        self.__updateEvent.set()
 
     # Repeat the same process above, only for the clientQueue
     emptySlots = [i for i,run in enumerate(self.__clientRunning) if run is None]
@@ -1164,11 +1359,13 @@ class JobHandler(BaseType):
         for i in emptySlots:
           if len(self.__clientQueue) > 0:
             self.__clientRunning[i] = self.__clientQueue.popleft()
+            self.__clientRunning[i].setCompletionCallback(self.__jobEvent.set)
             self.__clientRunning[i].start()
             self.__clientRunning[i].trackTime('jobHandler_started')
             self.__nextId += 1
           else:
             break
+        self.__updateEvent.set()
 
   def cleanJobQueue(self):
     """
@@ -1180,6 +1377,7 @@ class JobHandler(BaseType):
     # The code handling these two lists was the exact same, I have taken the
     # liberty of condensing these loops into one and removing some of the
     # redundant checks to make this code a bit simpler.
+    newlyFinished = False
     for runList in [self.__running, self.__clientRunning]:
       with self.__queueLock:
         # We need the queueLock, because if terminateJobs runs kill on it,
@@ -1189,6 +1387,11 @@ class JobHandler(BaseType):
             self.__finished.append(run)
             self.__finished[-1].trackTime('jobHandler_finished')
             runList[i] = None
+            newlyFinished = True
+    if newlyFinished:
+      # wake up the clients waiting for finished jobs, and loop again to fill the freed spots
+      self.__updateEvent.set()
+      self.__jobEvent.set()
 
   def setProfileJobs(self,profile=False):
     """
@@ -1206,6 +1409,14 @@ class JobHandler(BaseType):
     """
     with self.__queueLock:
       self.__submittedJobs = []
+      # the objects (e.g. trained ROMs) may have changed since the last step: ship them again
+      if self._parallelLib == ParallelLibEnum.process:
+        for _, shipment in self.__shipped.values():
+          if shipment is not None:
+            os.remove(shipment[2])
+      self.__shipped = {}
+      self.__shipmentGeneration += 1
+      self.__submissionStats = self.__newSubmissionStats()
 
   def shutdown(self):
     """
@@ -1215,6 +1426,7 @@ class JobHandler(BaseType):
     @ Out, None
     """
     self.completed = True
+    self.__jobEvent.set()
     self.__shutdownParallel()
 
   def terminateAll(self):
@@ -1258,5 +1470,7 @@ class JobHandler(BaseType):
           else:
             queue.remove(job)
           self.raiseADebug(f'Terminated job "{job.identifier}" by request.')
+    self.__jobEvent.set()
+    self.__updateEvent.set()
     if len(ids):
       self.raiseADebug('Tried to remove some jobs but not found in any queues:',', '.join(ids))
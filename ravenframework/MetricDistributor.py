@@ -80,6 +80,25 @@ class MetricDistributor(utils.metaclass_insert(abc.ABCMeta,BaseType), MessageUse
     output = self.estimator.evaluate(feat,targ)
     return output
 
+  def evaluateDistanceMatrix(self, histories):
+    """
+      Method to compute the metric between each pair of histories
+      @ In, histories, list(numpy.ndarray), the histories, each with shape (numParameters, numHistorySteps)
+      @ Out, output, numpy.ndarray, 2D array, symmetric, with shape (numHistories, numHistories)
+    """
+    if self.estimator.isInstanceString(['DTW']):
+      # only the upper half, possibly in parallel
+      output = self.estimator.distanceMatrix(histories)
+    else:
+      cardinality = len(histories)
+      output = np.zeros((cardinality, cardinality))
+      for i in range(cardinality):
+        for j in range(i, cardinality):
+          output[i][j] = self.evaluate(((histories[i], None), (histories[j], None)))
+          if i != j:
+            output[j][i] = output[i][j]
+    return output
+
   def evaluate(self,pairedData, weights = None, multiOutput='mean',**kwargs):
     """
       Method to perform the evaluation of given paired data
@@ -118,6 +118,14 @@ class MetricEntity(utils.metaclass_insert(abc.ABCMeta, PluginReadyEntity)):
     #   However, for consistency, we keep it here for future investigation.
     return self._metric.run(x, y, weights=weights, axis=0, **kwargs)
 
+  def distanceMatrix(self, histories):
+    """
+      This method computes the metric between each pair of histories (metrics providing it, e.g. DTW)
+      @ In, histories, list(numpy.ndarray), the histories, each with shape (n_variables, n_time_steps)
+      @ Out, matrix, numpy.ndarray, the distance matrix, shape (n_histories, n_histories)
+    """
+    return self._metric.distanceMatrix(histories)
+
   def getAlgorithmType(self):
     """
       Provide the metric sub-sub-type (used e.g. in SKL metrics)
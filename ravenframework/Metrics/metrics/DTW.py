@@ -17,8 +17,10 @@ Created on August 20 2016
 @author: mandd
 """
 #External Modules------------------------------------------------------------------------------------
-import numpy as np
+import sys
 import copy
+import concurrent.futures
+import numpy as np
 import scipy.spatial.distance as spatialDistance
 #External Modules End--------------------------------------------------------------------------------
 
@@ -27,6 +29,192 @@ from .MetricInterface import MetricInterface
 from ...utils import InputData, InputTypes
 #Internal Modules End--------------------------------------------------------------------------------
 
+# local distances between paired time points (rows of a and b) computed without the full cost matrix
+_pairedDistances = {
+  'euclidean':   lambda a, b: np.sqrt(np.sum((a - b)**2, axis=1)),
+  'sqeuclidean': lambda a, b: np.sum((a - b)**2, axis=1),
+  'cityblock':   lambda a, b: np.sum(np.abs(a - b), axis=1),
+  'chebyshev':   lambda a, b: np.max(np.abs(a - b), axis=1),
+}
+# number of anti-diagonals between two checks of the partial cumulative costs against the cutoff
+_abandonCheckPeriod = 64
+# equivalent names of the local distances
+_distanceAliases = {'manhattan': 'cityblock', 'l1': 'cityblock', 'l2': 'euclidean'}
+# local distance of a point from the box [lower, upper] (from its excess componentwise), for the LB_Keogh lower bound
+_boxDistances = {
+  'euclidean':   lambda excess: np.sqrt(np.sum(excess**2, axis=1)),
+  'sqeuclidean': lambda excess: np.sum(excess**2, axis=1),
+  'cityblock':   lambda excess: np.sum(excess, axis=1),
+  'chebyshev':   lambda excess: np.max(excess, axis=1),
+}
+
+def dtwWindow(r, c, window=None, size=None):
+  """
+    Computes the range of columns of each row of the cost matrix that the warping path can go through
+    @ In, r, int, length of the first sequence (rows)
+    @ In, c, int, length of the second sequence (columns)
+    @ In, window, str, optional, None (no constraint), 'sakoeChiba' (|i-j| <= size, where size is increased
+      to |r-c| if smaller) or 'itakura' (parallelogram whose sides have slopes size and 1/size)
+    @ In, size, float, optional, radius (sakoeChiba) or maximum slope (itakura) of the window
+    @ Out, lower, np.array, first column of each row
+    @ Out, upper, np.array, last column of each row
+  """
+  rows = np.arange(r)
+  if window is None:
+    lower, upper = np.zeros(r, dtype=int), np.full(r, c - 1)
+  elif window == 'sakoeChiba':
+    radius = max(int(size), abs(r - c))
+    lower, upper = np.maximum(rows - radius, 0), np.minimum(rows + radius, c - 1)
+  elif window == 'itakura':
+    if size <= 1:
+      raise ValueError(f'The slope of the Itakura window needs to be greater than 1, got {size}')
+    lower = np.maximum(np.ceil(rows / size), c - 1 - np.floor(size * (r - 1 - rows))).astype(int)
+    upper = np.minimum(np.floor(size * rows), c - 1 - np.ceil((r - 1 - rows) / size)).astype(int)
+    lower, upper = np.maximum(lower, 0), np.minimum(upper, c - 1)
+    if np.any(lower > upper) or np.any(lower[1:] > upper[:-1] + 1):
+      raise ValueError(f'No warping path of sequences of lengths {r} and {c} fits in the Itakura window of slope {size}')
+  else:
+    raise ValueError(f'Unknown DTW window "{window}"')
+  return lower, upper
+
+def lbKeogh(x, y, lower, upper, localDistance):
+  """
+    Computes the LB_Keogh lower bound of the DTW distance between x and y: the distance of each point of x from
+    the envelope of the points of y that it can be matched with (within the window)
+    @ In, x, np.array, first sequence, shape (numTimeSteps, numDimensions)
+    @ In, y, np.array, second sequence, shape (numTimeSteps, numDimensions)
+    @ In, lower, np.array, first column (point of y) of each row (point of x) of the window
+    @ In, upper, np.array, last column (point of y) of each row (point of x) of the window
+    @ In, localDistance, str, the local distance
+    @ Out, bound, float, lower bound of the DTW distance (0 if not available for this local distance)
+  """
+  if localDistance not in _boxDistances:
+    return 0.
+  # reductions over [lower, upper] of each row (the odd ones are discarded)
+  indices = np.ravel(np.column_stack((lower, upper + 1)))
+  padded = np.vstack((y, y[-1:]))
+  envelopeLow = np.minimum.reduceat(padded, indices, axis=0)[::2]
+  envelopeHigh = np.maximum.reduceat(padded, indices, axis=0)[::2]
+  excess = np.maximum(x - envelopeHigh, 0.) + np.maximum(envelopeLow - x, 0.)
+  return np.sum(_boxDistances[localDistance](excess))
+
+def dtwDistance(x, y, localDistance, window=None, size=None, cutoff=np.inf):
+  """
+    Computes the DTW distance between two sequences, one anti-diagonal of the cumulative cost matrix at a time
+    (each of them depends only on the previous two), so that the memory does not depend on the product of the lengths
+    @ In, x, np.array, first sequence, shape (numDimensions, numTimeSteps)
+    @ In, y, np.array, second sequence, shape (numDimensions, numTimeSteps)
+    @ In, localDistance, str, the local distance (scipy.spatial.distance.cdist metric)
+    @ In, window, str, optional, the window constraining the warping path (see dtwWindow)
+    @ In, size, float, optional, the size of the window (see dtwWindow)
+    @ In, cutoff, float, optional, if the distance is larger than it, a lower bound of the distance (also larger than it)
+      is returned as soon as it is found (LB_Keogh or partial cumulative cost)
+    @ Out, value, float, the DTW distance
+  """
+  localDistance = _distanceAliases.get(localDistance, localDistance)
+  x, y = np.ascontiguousarray(np.asarray(x, dtype=float).T), np.ascontiguousarray(np.asarray(y, dtype=float).T)
+  r, c = len(x), len(y)
+  lower, upper = dtwWindow(r, c, window, size)
+  if cutoff < np.inf:
+    bound = lbKeogh(x, y, lower, upper, localDistance)
+    if bound > cutoff:
+      return bound
+  paired = _pairedDistances.get(localDistance)
+  costs = None if paired is not None else spatialDistance.cdist(x, y, metric=localDistance)
+  # rows of the cells of each anti-diagonal k = i + j within the window
+  diagonals = np.arange(r + c - 1)
+  firstRows = np.searchsorted(np.arange(r) + upper, diagonals, side='left')
+  lastRows = np.searchsorted(np.arange(r) + lower, diagonals, side='right') - 1
+  # cumulative costs of the last three anti-diagonals, stored by row (shifted by one, the first entry stays infinite)
+  buffers = [np.full(r + 1, np.inf) for _ in range(3)]
+  filled = [(0, 0)] * 3
+  # the columns of an anti-diagonal decrease along its rows, they are contiguous in the reversed second sequence
+  yReversed = np.ascontiguousarray(y[::-1])
+  for k in diagonals:
+    current, previous, beforePrevious = buffers[k % 3], buffers[(k - 1) % 3], buffers[(k - 2) % 3]
+    start, end = filled[k % 3]
+    current[start:end] = np.inf
+    first, last = firstRows[k], lastRows[k]
+    filled[k % 3] = (first + 1, last + 2)
+    if first > last:
+      # narrow windows skip some anti-diagonals (e.g. the odd ones if the radius is 0)
+      continue
+    if costs is None:
+      cost = paired(x[first:last + 1], yReversed[c - 1 - k + first:c - k + last])
+    else:
+      rows = np.arange(first, last + 1)
+      cost = costs[rows, k - rows]
+    if k == 0:
+      current[1] = cost[0]
+    else:
+      # min of the cells (i, j-1), (i-1, j) and (i-1, j-1)
+      best = np.minimum(previous[first + 1:last + 2], previous[first:last + 1])
+      np.minimum(best, beforePrevious[first:last + 1], out=best)
+      np.add(cost, best, out=current[first + 1:last + 2])
+    if cutoff < np.inf and k % _abandonCheckPeriod == 0 and k > 0:
+      # each warping path goes through one of the last two anti-diagonals
+      bound = min(np.min(current[first + 1:last + 2]), np.min(previous[slice(*filled[(k - 1) % 3])], initial=np.inf))
+      if bound > cutoff:
+        return bound
+  value = buffers[(r + c - 2) % 3][r]
+  return value
+
+_workerHistories = None
+
+def _initializeDistanceWorker(path, histories):
+  """
+    Initializes a worker process computing DTW distances, receiving the histories once
+    @ In, path, list(str), the python path of the main process
+    @ In, histories, list(np.array), the histories, each with shape (numDimensions, numTimeSteps)
+    @ Out, None
+  """
+  global _workerHistories
+  for entry in path:
+    if entry not in sys.path:
+      sys.path.append(entry)
+  _workerHistories = histories
+
+def _distancesInWorker(pairs, settings):
+  """
+    Computes the DTW distances of some pairs of histories in a worker process
+    @ In, pairs, list(tuple), the indices of the pairs of histories
+    @ In, settings, dict, the keyword arguments of dtwDistance
+    @ Out, distances, list(float), the distances
+  """
+  return [dtwDistance(_workerHistories[i], _workerHistories[j], **settings) for i, j in pairs]
+
+def dtwDistanceMatrix(histories, localDistance, window=None, size=None, cutoff=np.inf, workers=1):
+  """
+    Computes the DTW distances between each pair of histories. Only one half of the (symmetric) matrix is
+    computed, on a pool of local processes if requested
+    @ In, histories, list(np.array), the histories, each with shape (numDimensions, numTimeSteps)
+    @ In, localDistance, str, the local distance
+    @ In, window, str, optional, the window constraining the warping path (see dtwWindow)
+    @ In, size, float, optional, the size of the window (see dtwWindow)
+    @ In, cutoff, float, optional, the distances larger than it are replaced by lower bounds larger than it
+    @ In, workers, int, optional, the number of processes
+    @ Out, matrix, np.array, the distance matrix, shape (numHistories, numHistories)
+  """
+  n = len(histories)
+  settings = {'localDistance': localDistance, 'window': window, 'size': size, 'cutoff': cutoff}
+  pairs = [(i, j) for i in range(n) for j in range(i + 1, n)]
+  if workers > 1 and len(pairs) > 1:
+    # a few batches of pairs per process, to balance the load
+    batches = [pairs[b::4 * workers] for b in range(min(4 * workers, len(pairs)))]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_initializeDistanceWorker,
+                                                initargs=(list(sys.path), histories)) as pool:
+      results = list(pool.map(_distancesInWorker, batches, [settings] * len(batches)))
+    distances = np.empty(len(pairs))
+    for b, result in enumerate(results):
+      distances[b::4 * workers] = result
+  else:
+    distances = np.array([dtwDistance(histories[i], histories[j], **settings) for i, j in pairs])
+  matrix = np.zeros((n, n))
+  upperRows, upperColumns = np.triu_indices(n, k=1)
+  matrix[upperRows, upperColumns] = distances
+  matrix[upperColumns, upperRows] = distances
+  return matrix
+
 class DTW(MetricInterface):
   """
     Dynamic Time Warping Metric
@@ -46,6 +234,11 @@ class DTW(MetricInterface):
     orderInputType = InputTypes.makeEnumType("order","orderType",["0","1"])
     inputSpecification.addSub(InputData.parameterInputFactory("order",contentType=orderInputType),quantity=InputData.Quantity.one)
     inputSpecification.addSub(InputData.parameterInputFactory("localDistance",contentType=InputTypes.StringType),quantity=InputData.Quantity.one)
+    windowInput = InputData.parameterInputFactory("window",contentType=InputTypes.FloatType)
+    windowInput.addParam("type", InputTypes.makeEnumType("window","windowType",["sakoeChiba","itakura"]), True)
+    inputSpecification.addSub(windowInput)
+    inputSpecification.addSub(InputData.parameterInputFactory("cutoff",contentType=InputTypes.FloatType))
+    inputSpecification.addSub(InputData.parameterInputFactory("workers",contentType=InputTypes.IntegerType))
     return inputSpecification
 
   def __init__(self):
@@ -60,6 +253,13 @@ class DTW(MetricInterface):
     # the ID of distance function to be employed to determine the local distance evaluation of two time series
     # Available options are provided by scipy pairwise distances, i.e. cityblock, cosine, euclidean, manhattan.
     self.localDistance = None
+    # window constraining the warping path (None, sakoeChiba or itakura) and its size (radius or maximum slope)
+    self.window = None
+    self.windowSize = None
+    # the distances larger than the cutoff are replaced by lower bounds larger than it (not computed in full)
+    self.cutoff = np.inf
+    # number of processes computing the distance matrices
+    self.workers = 1
     # True indicates the metric needs to be able to handle dynamic data
     self._dynamicHandling = True
     # True indicates the metric needs to be able to handle pairwise data
@@ -77,6 +277,17 @@ class DTW(MetricInterface):
         self.order = int(child.value)
       elif child.getName() == "localDistance":
         self.localDistance = child.value
+      elif child.getName() == "window":
+        self.window = child.parameterValues['type']
+        self.windowSize = child.value
+        if (self.window == 'sakoeChiba' and self.windowSize < 0) or (self.window == 'itakura' and self.windowSize <= 1):
+          self.raiseAnError(IOError, "The size of the", self.window, "window of metric", self.name, "is not valid:", self.windowSize)
+      elif child.getName() == "cutoff":
+        self.cutoff = child.value
+      elif child.getName() == "workers":
+        self.workers = child.value
+        if self.workers < 1:
+          self.raiseAnError(IOError, "The number of workers of metric", self.name, "needs to be positive!")
 
   def run(self, x, y, weights=None, axis=0, **kwargs):
     """
@@ -110,22 +321,19 @@ class DTW(MetricInterface):
     else:
       self.raiseAnError(IOError, "Valid axis value should be '0' or '1' for the evaluate method of metric", self.name)
 
-    if len(tempX.shape) == 1:
-      tempX = tempX.reshape(1,-1)
-    if len(tempY.shape) == 1:
-      tempY = tempY.reshape(1,-1)
-    X = np.empty(tempX.shape)
-    Y = np.empty(tempY.shape)
-    for index in range(len(tempX)):
-      if self.order == 1:
-        X[index] = np.gradient(tempX[index])
-        Y[index] = np.gradient(tempY[index])
-      else:
-        X[index] = tempX[index]
-        Y[index] = tempY[index]
-    value = self.dtwDistance(X, Y)
+    value = self.dtwDistance(self._prepare(tempX), self._prepare(tempY))
     return value
 
+  def _prepare(self, x):
+    """
+      Prepares a history for the DTW calculation (derivative if the order is 1)
+      @ In, x, numpy.ndarray, data matrix, shape (n_variables, n_time_steps) or (n_time_steps,)
+      @ Out, prepared, numpy.ndarray, prepared data matrix, shape (n_variables, n_time_steps)
+    """
+    x = np.atleast_2d(x)
+    prepared = np.gradient(x, axis=1) if self.order == 1 else np.asarray(x, dtype=float)
+    return prepared
+
   def dtwDistance(self, x, y):
     """
       This method actually calculates the distance between two histories x and y
@@ -133,23 +341,18 @@ class DTW(MetricInterface):
       @ In, y, numpy.ndarray, data matrix for y
       @ Out, value, float, distance between x and y
     """
-    r, c = len(x[0,:]), len(y[0,:])
-    D0 = np.zeros((r + 1, c + 1))
-    D0[0, 1:] = np.inf
-    D0[1:, 0] = np.inf
-    D1 = D0[1:, 1:]
-    D1 = spatialDistance.cdist(x.T,y.T, metric=self.localDistance)
-    C = D1.copy()
-    for i in range(r):
-      for j in range(c):
-        D1[i, j] += min(D0[i, j], D0[i, j+1], D0[i+1, j])
-    if len(x)==1:
-      path = np.zeros(len(y)), range(len(y))
-    elif len(y) == 1:
-      path = range(len(x)), np.zeros(len(x))
-    else:
-      path = self.tracePath(D0)
-    return D1[-1, -1]
+    value = dtwDistance(x, y, self.localDistance, self.window, self.windowSize, self.cutoff)
+    return value
+
+  def distanceMatrix(self, histories):
+    """
+      Computes the DTW distances between each pair of histories
+      @ In, histories, list(numpy.ndarray), the histories, each with shape (n_variables, n_time_steps)
+      @ Out, matrix, numpy.ndarray, the distance matrix, shape (n_histories, n_histories)
+    """
+    matrix = dtwDistanceMatrix([self._prepare(history) for history in histories], self.localDistance,
+                               self.window, self.windowSize, self.cutoff, self.workers)
+    return matrix
 
   def tracePath(self, D):
     """
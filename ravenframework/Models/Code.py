@@ -18,7 +18,6 @@ Module where the base class and the specialization of different type of Model ar
 import os
 import sys
 import copy
-import shutil
 import platform
 import shlex
 import time
@@ -34,6 +33,7 @@ from ..Decorators.Parallelization import Parallel
 from .. import CsvLoader #note: "from CsvLoader import CsvLoader" currently breaks internalParallel with Files and genericCodeInterface - talbpaul 2017-08-24
 from .. import Files
 from ..DataObjects import Data
+from ..OutStreams import OutStreamEntity
 from ..CodeInterfaceClasses import factory
 #Internal Modules End--------------------------------------------------------------------------------
 
@@ -60,6 +60,15 @@ class Code(Model):
     inputSpecification.addSub(InputData.parameterInputFactory("commandSeparator", contentType=InputTypes.makeEnumType("commandSeparator",
                                                                                                                       "commandSeparatorType",
                                                                                                                       ["&&","||",";"]), default="&&"))
+    inputSpecification.addSub(InputData.parameterInputFactory("inputStaging", contentType=InputTypes.makeEnumType("inputStaging",
+                                                                                                                  "inputStagingType",
+                                                                                                                  ["copy","link","reflink","symlink"]), default="copy"))
+    outputLoaderInput = InputData.parameterInputFactory("outputLoader", contentType=InputTypes.makeEnumType("outputLoader",
+                                                                                                            "outputLoaderType",
+                                                                                                            CsvLoader.CsvLoader.acceptableUtils))
+    outputLoaderInput.addParam("projection", InputTypes.BoolType, False)
+    inputSpecification.addSub(outputLoaderInput)
+    inputSpecification.addSub(cls.getEvaluationCacheSpecification())
     ## Begin command line arguments tag
     ClargsInput = InputData.parameterInputFactory("clargs")
 
@@ -122,6 +131,12 @@ class Code(Model):
     self._ravenWorkingDir = None # RAVEN's working dir
     self.commandSeparator = "&&" # command separator
     self._isThereACode = True    # it is a code
+    self.inputStaging = 'copy'   # how the input files not modified by the code interface are staged for each new input
+    self._modifiedFiles = None   # paths of the original input files modified by the code interface
+    self._stagingStats = {}      # statistics of the input staging in the current step
+    self.outputLoader = None     # utility used to load the CSV outputs of the code (if None, the one of the code interface)
+    self.outputProjection = False # if True, only the columns of the CSV outputs needed by the step outputs are loaded
+    self._outputColumns = None   # names of the CSV columns to load (None to load all of them)
 
   def applyRunInfo(self, runInfo):
     """
@@ -152,6 +167,13 @@ class Code(Model):
         self.preExec = child.value
       elif child.getName() =='commandSeparator':
         self.commandSeparator = child.value
+      elif child.getName() == 'inputStaging':
+        self.inputStaging = child.value
+      elif child.getName() == 'outputLoader':
+        self.outputLoader = child.value
+        self.outputProjection = child.parameterValues.get('projection', False)
+      elif child.getName() == 'evaluationCache':
+        self._readEvaluationCacheInput(child)
       elif child.getName() == 'clargs':
         argtype    = child.parameterValues['type']      if 'type'      in child.parameterValues else None
         arg        = child.parameterValues['arg']       if 'arg'       in child.parameterValues else None
@@ -324,7 +346,7 @@ class Code(Model):
       ##########################################################################
       if not os.path.exists(inputFile.getAbsFile()):
         self.raiseAnError(ValueError, 'The input file '+inputFile.getFilename()+' does not exist in directory: '+inputFile.getPath())
-      shutil.copy(inputFile.getAbsFile(),subSubDirectory)
+      utils.stageFile(inputFile.getAbsFile(), subSubDirectory)
       self.oriInputFiles.append(copy.deepcopy(inputFile))
       self.oriInputFiles[-1].setPath(subSubDirectory)
     self.currentInputFiles = None
@@ -346,6 +368,53 @@ class Code(Model):
       # the deepcopy is needed to avoid the code interface
       # developer to modify the content of the runInfoDict
       self.code.initialize(copy.deepcopy(runInfoDict), self.oriInputFiles)
+    # the files modified by the code interface are always copied, since linked files share the content with the original ones
+    self._modifiedFiles = None
+    if self.inputStaging != 'copy':
+      self._modifiedFiles = set(inputFile.getAbsFile() for inputFile in self.code.getModifiedInputFiles(self.oriInputFiles))
+    self._stagingStats = {'samples':0, 'bytes':0, 'copy':0, 'link':0, 'reflink':0, 'symlink':0}
+    self._outputColumns = self._getOutputColumns(initDict) if self.outputProjection else None
+    self._initializeEvaluationCache(runInfoDict['WorkingDir'])
+
+  def _getEvaluationCacheSignature(self):
+    """
+      Collects what identifies the definition of this model for the persistent evaluation cache:
+      the command line and file arguments, the loaded output columns and the content of the input (template) files.
+      Note that the executable is identified by its path, not by its content.
+      @ In, None
+      @ Out, signature, list, items identifying the model
+    """
+    signature = super()._getEvaluationCacheSignature()
+    signature += [self.executable, self.preExec, repr(self.clargs), repr(self.fargs), self.code.__class__.__name__,
+                  None if self._outputColumns is None else sorted(self._outputColumns)]
+    for inputFile in sorted(self.oriInputFiles, key=lambda inputFile: inputFile.getFilename()):
+      signature.append(inputFile.getFilename())
+      with open(inputFile.getAbsFile(), 'rb') as template:
+        signature.append(template.read())
+    return signature
+
+  def _getOutputColumns(self, initDict):
+    """
+      Collects the names (as in the code output) of the variables needed by the outputs of the step,
+      i.e. the columns of the CSV outputs that need to be loaded
+      @ In, initDict, dict, dictionary of all objects available in the step using this model
+      @ Out, columns, set, names of the columns to load (None if all the columns are needed)
+    """
+    outputs = initDict.get('Output', []) if initDict is not None else []
+    # OutStreams only print DataObjects, the other outputs (e.g. Databases) store all the variables
+    outputs = [output for output in outputs if not isinstance(output, OutStreamEntity)]
+    if not outputs or any(not isinstance(output, Data) for output in outputs):
+      self.raiseAWarning('The projection of the code outputs requires the step outputs to be DataObjects; all the columns are loaded.')
+      return None
+    columns = set()
+    for output in outputs:
+      columns.update(output.vars + output.indexes)
+    # the CSV files use the names of the code, not the aliases
+    for aliasType in ['input', 'output']:
+      for varFramework, varModel in self.alias[aliasType].items():
+        if varFramework in columns:
+          columns.add(varModel)
+    return columns
 
   def createNewInput(self,currentInput,samplerType,**kwargs):
     """
@@ -395,7 +464,12 @@ class Code(Model):
 
       ##########################################################################
       newInputSet[index].setPath(subSubDirectory)
-      shutil.copy(self.oriInputFiles[index].getAbsFile(),subSubDirectory)
+      original = self.oriInputFiles[index].getAbsFile()
+      mode = 'copy' if self._modifiedFiles is None or original in self._modifiedFiles else self.inputStaging
+      staged, bytesWritten = utils.stageFile(original, subSubDirectory, mode)
+      self._stagingStats[staged] = self._stagingStats.get(staged, 0) + 1
+      self._stagingStats['bytes'] = self._stagingStats.get('bytes', 0) + bytesWritten
+    self._stagingStats['samples'] = self._stagingStats.get('samples', 0) + 1
 
     kwargs['subDirectory'] = subDirectory
     kwargs['alias'] = self.alias
@@ -410,6 +484,22 @@ class Code(Model):
 
     return (newInput,kwargs)
 
+  def endStepActions(self):
+    """
+      Reports the summary of the input staging (bytes of input files written per sample) at the end of the step.
+      Note that the inputs created in remote processes (internal parallel) are not accounted for.
+      @ In, None
+      @ Out, None
+    """
+    super().endStepActions()
+    stats = self._stagingStats
+    samples = stats.get('samples', 0)
+    if samples:
+      linked = sum(stats.get(mode, 0) for mode in ('link', 'reflink', 'symlink'))
+      self.raiseAMessage(f'Input staging ({self.inputStaging}): {samples} inputs created, {stats.get("copy", 0)} files copied, '
+                         f'{linked} files linked, {stats.get("bytes", 0)/samples:.0f} bytes written per sample')
+    self._stagingStats = {}
+
   def _expandCommand(self, origCommand):
     """
       Function to expand a command from string to list.
@@ -676,13 +766,13 @@ class Code(Model):
         csvLoader = CsvLoader.CsvLoader()
         # does this CodeInterface have sufficiently intense (or limited) CSV files that
         #   it needs to assume floats and use numpy, or can we use pandas?
-        loadUtility = self.code.getCsvLoadUtil()
-        csvData = csvLoader.loadCsvFile(outFile.getAbsFile(), nullOK=False, utility=loadUtility)
+        loadUtility = self.outputLoader if self.outputLoader is not None else self.code.getCsvLoadUtil()
+        csvData = csvLoader.loadCsvFile(outFile.getAbsFile(), nullOK=False, utility=loadUtility, columns=self._outputColumns)
         returnDict = csvLoader.toRealization(csvData)
 
       if not ravenCase:
-        # check if the csv needs to be printed
-        if self.code.getIfWriteCsv():
+        # check if the csv needs to be printed (it is already there if the data have been loaded from it)
+        if self.code.getIfWriteCsv() and not (outputFile and isStr):
           csvFileName = os.path.join(metaData['subDirectory'],outputFile+'.csv')
           pd.DataFrame.from_dict(returnDict).to_csv(path_or_buf=csvFileName,index=False)
         self._replaceVariablesNamesWithAliasSystem(returnDict, 'inout', True)
@@ -802,6 +892,7 @@ class Code(Model):
       self.raiseAWarning("No pop in evaluation " + repr(evaluation) + " for job " + str(finishedJob.identifier) + ":" + repr(finishedJob) + " with return code "+ repr(finishedJob.getReturnCode()))
 
 
+    self._storeInEvaluationCache(finishedJob, evaluation)
     self._replaceVariablesNamesWithAliasSystem(evaluation, 'input',True)
     # in the event a batch is run, the evaluations will be a dict as {'RAVEN_isBatch':True, 'realizations': [...]}
     if isinstance(evaluation,dict) and evaluation.get('RAVEN_isBatch',False):
@@ -937,6 +1028,10 @@ class Code(Model):
       else:
         kw = kwargs
 
+      # evaluations found in the persistent cache are not run again (not available for batches)
+      if self._evaluationCache is not None and not batchMode and self._findInEvaluationCache(kw, jobHandler):
+        continue
+
       prefix = kw.get("prefix")
       uniqueHandler = kw.get("uniqueHandler",'any')
       # if batch mode is on, lets record the run id within the batch
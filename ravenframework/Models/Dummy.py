@@ -209,9 +209,12 @@ class Dummy(Model):
     # TODO consistency with old HDF5; fix this when HDF5 api is in place
     # TODO expensive deepcopy prevents modification when sent to multiple outputs
     result = finishedJob.getEvaluation()
-    # alias system
-    self._replaceVariablesNamesWithAliasSystem(result,'output',True)
-    output.addRealization(result)
+    # the micro-batched evaluations (e.g. ROM.evaluateMicroBatch) contain several realizations
+    realizations = result['realizations'] if result.get('RAVEN_isBatch', False) else [result]
+    for rlz in realizations:
+      # alias system
+      self._replaceVariablesNamesWithAliasSystem(rlz,'output',True)
+      output.addRealization(rlz)
     # END can be abstracted to base class
 
   def collectOutputFromDict(self,exportDict,output,options=None):
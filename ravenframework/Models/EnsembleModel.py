@@ -24,7 +24,6 @@ import io
 import sys
 import copy
 import numpy as np
-import time
 import itertools
 from collections import OrderedDict
 from ..Decorators.Parallelization import Parallel
@@ -83,9 +82,13 @@ class EnsembleModel(Dummy):
     self.localTargetEvaluations = {}                    # temporary storage of target evaluation data objects
     self.maxIterations          = 30                    # max number of iterations (in case of non-linear system activated)
     self.convergenceTol         = 1.e-3                 # tolerance of the iteration scheme (if activated) => L2 norm
+    self.acceleration           = 'none'                # acceleration of the iteration scheme (none, anderson or aitken)
+    self.accelerationDepth      = 5                     # number of previous iterations used by the Anderson's acceleration
+    self.feedbackVariables      = []                    # variables fed back to the previous models in the iteration scheme [(model index, variable)]
     self.initialConditions      = {}                    # dictionary of initial conditions in case non-linear system is detected
     self.initialStartModels     = []                    # list of models that will execute first.
     self.ensembleModelGraph     = None                  # graph object (graphStructure.graphObject)
+    self.modelPredecessors      = {}                    # models to complete (in the same iteration) before running each model
     self.printTag               = 'EnsembleModel MODEL' # print tag
     self.parallelStrategy = 1                           # parallel strategy [1=MPI like (internalParallel), 2=threads]
     self.runInfoDict = None                             # dictionary containing run info in case of parallelStrategy=2
@@ -158,6 +161,14 @@ class EnsembleModel(Dummy):
         self.maxIterations  = int(child.text)
       elif child.tag == 'tolerance':
         self.convergenceTol = float(child.text)
+      elif child.tag == 'acceleration':
+        self.acceleration = child.text.strip().lower()
+        if self.acceleration not in ['none', 'anderson', 'aitken']:
+          self.raiseAnError(IOError, f'Unknown acceleration "{child.text.strip()}" of the Picard\'s iterations. Available are: none, anderson, aitken')
+      elif child.tag == 'accelerationDepth':
+        self.accelerationDepth = int(child.text)
+        if self.accelerationDepth < 1:
+          self.raiseAnError(IOError, 'The "accelerationDepth" must be at least 1. Got '+child.text.strip())
       elif child.tag == 'initialStartModels':
         self.initialStartModels = list(inp.strip() for inp in child.text.strip().split(','))
       elif child.tag == 'initialConditions':
@@ -352,6 +363,15 @@ class EnsembleModel(Dummy):
         self.raiseAnError(IOError, "The 'initialStartModels' xml node is not needed for non-Picard calculations, "
                           "since the running sequence can be automatically determined by the code! Please delete this node to avoid a mistake.")
       self.raiseAMessage("EnsembleModel connections determined a linear system. Picard's iterations not activated!")
+    # the unknowns of the fixed point problem solved by the Picard's iterations: the outputs fed back to the models preceding
+    # (or equal to) their producer in the execution list. Their values are extrapolated if the iterations are accelerated
+    self.feedbackVariables = []
+    if self.activatePicard:
+      for index, modelOut in enumerate(self.orderList):
+        for var in self.modelsDictionary[modelOut]['Output']:
+          if any(var in self.modelsDictionary[modelIn]['Input'] for modelIn in self.orderList[:index+1]):
+            self.feedbackVariables.append((index, var))
+      self.addMetaKeys(['PicardIterations'])
 
     for modelIn in self.modelsDictionary.keys():
       # in case there are metadataToTransfer, let's check if the source model is executed before the one that requests info
@@ -361,6 +381,14 @@ class EnsembleModel(Dummy):
           if self.orderList.index(source) >= indexModelIn:
             self.raiseAnError(IOError, 'In model "'+modelIn+'" the "metadataToTransfer" named "'+metadataToGet+
                                        '" is linked to the source"'+source+'" that will be executed after this model.')
+    # the models that must be completed before running each model, in the same (Picard's) iteration: the models preceding it
+    # in the execution list that provide its inputs (or metadata). The following ones provide the values of the previous iteration.
+    # The models that do not depend on each other can run concurrently (see _externalRun)
+    self.modelPredecessors = {}
+    for index, modelIn in enumerate(self.orderList):
+      predecessors = set(source for _, source, _ in self.modelsInputDictionary[modelIn]['metadataToTransfer'])
+      predecessors.update(source for source in self.orderList[:index] if modelIn in modelsToOutputModels[source])
+      self.modelPredecessors[modelIn] = predecessors
     self.needToCheckInputs = True
     # write debug statements
     self.raiseADebug("Specs of Graph Network represented by EnsembleModel:")
@@ -657,6 +685,12 @@ class EnsembleModel(Dummy):
           residueContainer[modelIn]['residue'][out] = np.zeros(1)
           residueContainer[modelIn]['iterValues'][0][out] = np.zeros(1)
           residueContainer[modelIn]['iterValues'][1][out] = np.zeros(1)
+      # history of the acceleration: values fed back and produced at the previous iterations, Aitken's relaxation factor and residue
+      residueContainer['acceleration'] = {'fed':[], 'produced':[], 'omega':1., 'residue':None}
+    # values fed back at the current iteration (None if unknown, i.e. not all provided by the initial conditions)
+    fedValues = None
+    if self.activatePicard and all(var in self.initialConditions for _, var in self.feedbackVariables):
+      fedValues = dict((var, np.atleast_1d(self.initialConditions[var])) for _, var in self.feedbackVariables)
 
     maxIterations = self.maxIterations if self.activatePicard else 1
     iterationCount = 0
@@ -667,78 +701,63 @@ class EnsembleModel(Dummy):
       if self.activatePicard:
         self.raiseAMessage("Picard's Iteration "+ str(iterationCount))
 
-      for modelCnt, modelIn in enumerate(self.orderList):
-        # clear the model's Target Evaluation data object
-        # in case there are metadataToTransfer, let's collect them from the source
-        metadataToTransfer = None
-        if self.modelsInputDictionary[modelIn]['metadataToTransfer']:
-          metadataToTransfer = {}
-        for metadataToGet, source, alias in self.modelsInputDictionary[modelIn]['metadataToTransfer']:
-          if metadataToGet in returnDict[source]['general_metadata']:
-            metaDataValue = returnDict[source]['general_metadata'][metadataToGet]
-            metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
-            metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
-          elif metadataToGet in returnDict[source]['response']:
-            metaDataValue = returnDict[source]['response'][metadataToGet]
-            metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
-            metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
-          else:
-            self.raiseAnError(RuntimeError,'metadata "'+metadataToGet+'" is not present among the ones available in source "'+source+'"!')
-        # get dependent outputs
-        dependentOutput = self.__retrieveDependentOutput(modelIn, gotOutputs, typeOutputs)
-        # if nonlinear system, check for initial coditions
-        if iterationCount == 1  and self.activatePicard:
-          sampledVars = inputKwargs[modelIn]['SampledVars'].keys()
-          conditionsToCheck = set(self.modelsDictionary[modelIn]['Input']) - set(itertools.chain(dependentOutput.keys(),sampledVars))
-          for initialConditionToSet in conditionsToCheck:
-            if initialConditionToSet in self.initialConditions.keys():
-              dependentOutput[initialConditionToSet] = self.initialConditions[initialConditionToSet]
-            else:
-              self.raiseAnError(IOError,"No initial conditions provided for variable "+ initialConditionToSet)
-        # set new identifiers
-        suffix = ''
-        if 'batchRun' in  inputKwargs[modelIn]:
-          suffix = f"{utils.returnIdSeparator()}{inputKwargs[modelIn]['batchRun']}"
-        inputKwargs[modelIn]['prefix']        = f"{modelIn}{utils.returnIdSeparator()}{identifier}{suffix}"
-        inputKwargs[modelIn]['uniqueHandler'] = f"{self.name}{identifier}{suffix}"
-        if metadataToTransfer is not None:
-          inputKwargs[modelIn]['metadataToTransfer'] = metadataToTransfer
-
-        for key, value in dependentOutput.items():
-          inputKwargs[modelIn]["SampledVars"  ][key] =  dependentOutput[key]
-          ## FIXME it is a mistake (Andrea). The SampledVarsPb for this variable should be transferred from outside
-          ## Who has this information? -- DPM 4/11/17
-          inputKwargs[modelIn]["SampledVarsPb"][key] =  1.
-        self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVars"  ],'input',False)
-        self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVarsPb"],'input',False)
-        ## FIXME: this will come after we rework the "runInfo" collection in the code
-        ## if run info is present, we need to pass to to kwargs
-        ##if self.runInfoDict and 'Code' == self.modelsDictionary[modelIn]['Instance'].type:
-        ##  inputKwargs[modelIn].update(self.runInfoDict)
-
-        retDict, gotOuts, evaluation = self.__advanceModel(identifier, self.modelsDictionary[modelIn],
-                                                        originalInput[modelIn], inputKwargs[modelIn],
-                                                        inRunTargetEvaluations[modelIn], samplerType,
-                                                        iterationCount, jobHandler)
-
-        returnDict[modelIn] = retDict
-        typeOutputs[modelCnt] = inRunTargetEvaluations[modelIn].type
-        gotOutputs[modelCnt] =  gotOuts
-        tempOutputs[modelIn] = evaluation
-
-        # if nonlinear system, compute the residue
-        ## it looks like this is handling _indexMap, but it's not clear since there's not a way to test it (yet).
-        if self.activatePicard:
-          residueContainer[modelIn]['iterValues'][1] = copy.copy(residueContainer[modelIn]['iterValues'][0])
-          for out in  inRunTargetEvaluations[modelIn].getVars("output"):
-            residueContainer[modelIn]['iterValues'][0][out] = copy.copy(gotOutputs[modelCnt][out])
-            if iterationCount == 1:
-              residueContainer[modelIn]['iterValues'][1][out] = np.zeros(len(residueContainer[modelIn]['iterValues'][0][out]))
-          for out in gotOutputs[modelCnt].keys():
-            residueContainer[modelIn]['residue'][out] = abs(np.asarray(residueContainer[modelIn]['iterValues'][0][out]) -
-                                                            np.asarray(residueContainer[modelIn]['iterValues'][1][out]))
-          residueContainer[modelIn]['Norm'] =  np.linalg.norm(np.asarray(list(residueContainer[modelIn]['iterValues'][1].values()))-
-                                                              np.asarray(list(residueContainer[modelIn]['iterValues'][0].values())))
+      # outputs of the previous iteration, used by the models that precede their producers in the execution list
+      previousOutputs = list(gotOutputs)
+      if iterationCount > 1 and self.acceleration != 'none' and fedValues is not None:
+        # the accelerated values replace the ones produced at the previous iteration
+        for index, var in self.feedbackVariables:
+          if previousOutputs[index] is gotOutputs[index]:
+            previousOutputs[index] = dict(gotOutputs[index])
+          previousOutputs[index][var] = fedValues[var]
+      # the models are run as soon as the models they depend on (in this iteration) are completed: with parallelStrategy 2,
+      # all the ready models are submitted to the jobHandler at once, so that the independent models run concurrently
+      toRun = list(self.orderList)
+      running = []
+      while len(toRun) > 0 or len(running) > 0:
+        if self.parallelStrategy == 1:
+          # the models are evaluated in this thread, following the execution list
+          ready = toRun[:1]
+        else:
+          ready = [modelIn for modelIn in toRun if self.modelPredecessors[modelIn].issubset(returnDict)]
+        for modelIn in ready:
+          toRun.remove(modelIn)
+          self.__prepareModelInput(modelIn, identifier, inputKwargs, returnDict, previousOutputs, gotOutputs, typeOutputs, iterationCount)
+          if self.parallelStrategy == 2:
+            self.__submitModel(self.modelsDictionary[modelIn], originalInput[modelIn], inputKwargs[modelIn], samplerType, jobHandler)
+          running.append(modelIn)
+        # wait until at least one of the running models finishes
+        finished = []
+        while len(finished) == 0:
+          finished = [modelIn for modelIn in running if self.parallelStrategy == 1 or
+                      jobHandler.isThisJobFinished(inputKwargs[modelIn]['prefix'])]
+          if len(finished) == 0:
+            jobHandler.waitForUpdates(1.e-3)
+        for modelIn in finished:
+          running.remove(modelIn)
+          modelCnt = self.orderList.index(modelIn)
+          retDict, gotOuts, evaluation = self.__advanceModel(identifier, self.modelsDictionary[modelIn],
+                                                          originalInput[modelIn], inputKwargs[modelIn],
+                                                          inRunTargetEvaluations[modelIn], samplerType,
+                                                          iterationCount, jobHandler, running=[inputKwargs[m]['prefix'] for m in running])
+
+          returnDict[modelIn] = retDict
+          typeOutputs[modelCnt] = inRunTargetEvaluations[modelIn].type
+          gotOutputs[modelCnt] =  gotOuts
+          tempOutputs[modelIn] = evaluation
+
+          # if nonlinear system, compute the residue
+          ## it looks like this is handling _indexMap, but it's not clear since there's not a way to test it (yet).
+          if self.activatePicard:
+            residueContainer[modelIn]['iterValues'][1] = copy.copy(residueContainer[modelIn]['iterValues'][0])
+            for out in  inRunTargetEvaluations[modelIn].getVars("output"):
+              residueContainer[modelIn]['iterValues'][0][out] = copy.copy(gotOutputs[modelCnt][out])
+              if iterationCount == 1:
+                residueContainer[modelIn]['iterValues'][1][out] = np.zeros(len(residueContainer[modelIn]['iterValues'][0][out]))
+            for out in gotOutputs[modelCnt].keys():
+              residueContainer[modelIn]['residue'][out] = abs(np.asarray(residueContainer[modelIn]['iterValues'][0][out]) -
+                                                              np.asarray(residueContainer[modelIn]['iterValues'][1][out]))
+            residueContainer[modelIn]['Norm'] =  np.linalg.norm(np.asarray(list(residueContainer[modelIn]['iterValues'][1].values()))-
+                                                                np.asarray(list(residueContainer[modelIn]['iterValues'][0].values())))
 
       # if nonlinear system, check the total residue and convergence
       if self.activatePicard:
@@ -756,13 +775,157 @@ class EnsembleModel(Dummy):
         if residualPass:
           self.raiseAMessage("Picard's Iteration converged. Norm: "+ str(residueContainer['TotalResidue']))
           break
+        if self.acceleration != 'none':
+          fedValues = self.__accelerate(residueContainer['acceleration'], fedValues, gotOutputs)
+    if self.activatePicard:
+      # number of iterations (i.e. of executions of each model) needed to converge
+      for modelIn in returnDict:
+        returnDict[modelIn]['response']['PicardIterations'] = np.atleast_1d(iterationCount)
     returnEvaluation = returnDict, inRunTargetEvaluations, tempOutputs
     return returnEvaluation
 
-  def __advanceModel(self, identifier, modelToExecute, origInputList, inputKwargs, inRunTargetEvaluations, samplerType, iterationCount, jobHandler = None):
+  def __accelerate(self, history, fedValues, gotOutputs):
+    """
+      Computes the values to feed back at the next Picard's iteration, accelerating the fixed point iterations
+      with the Anderson's mixing (or with the Aitken's dynamic relaxation, also used as fallback when the
+      Anderson's least-squares problem is rank deficient)
+      @ In, history, dict, the history of the acceleration (see _externalRun), updated in place
+      @ In, fedValues, dict, the values fed back at this iteration {var:np.array} (None if unknown)
+      @ In, gotOutputs, list, the outputs of each model at this iteration
+      @ Out, newValues, dict, the values to feed back at the next iteration {var:np.array} (None if not accelerated)
+    """
+    if history.get('disabled', False):
+      return None
+    produced = dict((var, np.atleast_1d(gotOutputs[index][var])) for index, var in self.feedbackVariables)
+    if fedValues is None:
+      # the first values fed back are the produced ones (plain Picard's iteration)
+      return produced
+    try:
+      x = np.concatenate([np.asarray(fedValues[var], dtype=float).ravel() for _, var in self.feedbackVariables])
+      g = np.concatenate([np.asarray(produced[var], dtype=float).ravel() for _, var in self.feedbackVariables])
+    except ValueError:
+      self.raiseAWarning("The variables fed back in the Picard's iterations are not all numerical: acceleration disabled!")
+      history['disabled'] = True
+      return None
+    if x.shape != g.shape:
+      # the size of the fed back variables changed (e.g. histories of different length): restart the acceleration
+      history.update({'fed':[], 'produced':[], 'omega':1., 'residue':None})
+      return produced
+    residue = g - x
+    # Aitken's dynamic relaxation factor
+    if history['residue'] is not None:
+      deltaResidue = residue - history['residue']
+      denominator = np.dot(deltaResidue, deltaResidue)
+      if denominator > 0.:
+        omega = -history['omega'] * np.dot(history['residue'], deltaResidue) / denominator
+        history['omega'] = omega if np.isfinite(omega) else 1.
+    history['residue'] = residue
+    newValues = x + history['omega'] * residue
+    if self.acceleration == 'anderson':
+      history['fed'].append(x)
+      history['produced'].append(g)
+      # at most as many previous iterations as fed back values (the least-squares problem stays overdetermined)
+      depth = min(self.accelerationDepth, x.size)
+      del history['fed'][:-(depth + 1)]
+      del history['produced'][:-(depth + 1)]
+      if len(history['fed']) > 1:
+        residues = np.asarray(history['produced']) - np.asarray(history['fed'])
+        deltaResidues = np.diff(residues, axis=0).T
+        deltaProduced = np.diff(np.asarray(history['produced']), axis=0).T
+        gamma, _, rank, _ = np.linalg.lstsq(deltaResidues, residue, rcond=None)
+        if rank == deltaResidues.shape[1] and np.all(np.isfinite(gamma)):
+          newValues = g - deltaProduced @ gamma
+        else:
+          # rank deficient: use the Aitken's relaxation and restart the Anderson's history from this iteration
+          self.raiseADebug("Anderson's acceleration rank deficient: Aitken's relaxation used")
+          del history['fed'][:-1]
+          del history['produced'][:-1]
+      else:
+        newValues = g
+    newValues = np.split(newValues, np.cumsum([produced[var].size for _, var in self.feedbackVariables])[:-1])
+    return dict((var, value.reshape(produced[var].shape)) for (_, var), value in zip(self.feedbackVariables, newValues))
+
+  def __prepareModelInput(self, modelIn, identifier, inputKwargs, returnDict, previousOutputs, gotOutputs, typeOutputs, iterationCount):
+    """
+      Sets the inputs (sampled variables, dependent outputs, metadata, identifiers) of a sub-model
+      @ In, modelIn, str, the name of the model
+      @ In, identifier, str, the identifier of the ensemble evaluation
+      @ In, inputKwargs, dict, the kwargs of each model (updated in place)
+      @ In, returnDict, dict, the results of the models completed in this iteration
+      @ In, previousOutputs, list, the outputs of each model at the previous iteration
+      @ In, gotOutputs, list, the outputs of each model at this iteration (for the completed models)
+      @ In, typeOutputs, list, the type of the target evaluation of each model
+      @ In, iterationCount, int, iteration counter (1 if not picard)
+      @ Out, None
+    """
+    # clear the model's Target Evaluation data object
+    # in case there are metadataToTransfer, let's collect them from the source
+    metadataToTransfer = None
+    if self.modelsInputDictionary[modelIn]['metadataToTransfer']:
+      metadataToTransfer = {}
+    for metadataToGet, source, alias in self.modelsInputDictionary[modelIn]['metadataToTransfer']:
+      if metadataToGet in returnDict[source]['general_metadata']:
+        metaDataValue = returnDict[source]['general_metadata'][metadataToGet]
+        metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
+        metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
+      elif metadataToGet in returnDict[source]['response']:
+        metaDataValue = returnDict[source]['response'][metadataToGet]
+        metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
+        metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
+      else:
+        self.raiseAnError(RuntimeError,'metadata "'+metadataToGet+'" is not present among the ones available in source "'+source+'"!')
+    # get dependent outputs
+    modelCnt = self.orderList.index(modelIn)
+    currentOutputs = gotOutputs[:modelCnt] + previousOutputs[modelCnt:]
+    dependentOutput = self.__retrieveDependentOutput(modelIn, currentOutputs, typeOutputs)
+    # if nonlinear system, check for initial coditions
+    if iterationCount == 1  and self.activatePicard:
+      sampledVars = inputKwargs[modelIn]['SampledVars'].keys()
+      conditionsToCheck = set(self.modelsDictionary[modelIn]['Input']) - set(itertools.chain(dependentOutput.keys(),sampledVars))
+      for initialConditionToSet in conditionsToCheck:
+        if initialConditionToSet in self.initialConditions.keys():
+          dependentOutput[initialConditionToSet] = self.initialConditions[initialConditionToSet]
+        else:
+          self.raiseAnError(IOError,"No initial conditions provided for variable "+ initialConditionToSet)
+    # set new identifiers
+    suffix = ''
+    if 'batchRun' in  inputKwargs[modelIn]:
+      suffix = f"{utils.returnIdSeparator()}{inputKwargs[modelIn]['batchRun']}"
+    inputKwargs[modelIn]['prefix']        = f"{modelIn}{utils.returnIdSeparator()}{identifier}{suffix}"
+    inputKwargs[modelIn]['uniqueHandler'] = f"{self.name}{identifier}{suffix}"
+    if metadataToTransfer is not None:
+      inputKwargs[modelIn]['metadataToTransfer'] = metadataToTransfer
+
+    for key, value in dependentOutput.items():
+      inputKwargs[modelIn]["SampledVars"  ][key] =  dependentOutput[key]
+      ## FIXME it is a mistake (Andrea). The SampledVarsPb for this variable should be transferred from outside
+      ## Who has this information? -- DPM 4/11/17
+      inputKwargs[modelIn]["SampledVarsPb"][key] =  1.
+    self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVars"  ],'input',False)
+    self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVarsPb"],'input',False)
+    ## FIXME: this will come after we rework the "runInfo" collection in the code
+    ## if run info is present, we need to pass to to kwargs
+    ##if self.runInfoDict and 'Code' == self.modelsDictionary[modelIn]['Instance'].type:
+    ##  inputKwargs[modelIn].update(self.runInfoDict)
+
+  def __submitModel(self, modelToExecute, origInputList, inputKwargs, samplerType, jobHandler):
+    """
+      This method submits a sub-model to the jobHandler (parallelStrategy == 2), without waiting for it
+      @ In, modelToExecute, super(Model), Model instance than needs to be advanced
+      @ In, origInputList, list, list of model input
+      @ In, inputKwargs, dict, dictionary of kwargs for this model
+      @ In, samplerType, str, sampler Type
+      @ In, jobHandler, jobHandler instance, jobHandler instance
+      @ Out, None
+    """
+    self.raiseADebug('Submitting model',modelToExecute['Instance'].name)
+    inputKwargs.pop("jobHandler", None)
+    modelToExecute['Instance'].submit(origInputList, samplerType, jobHandler, **inputKwargs)
+
+  def __advanceModel(self, identifier, modelToExecute, origInputList, inputKwargs, inRunTargetEvaluations, samplerType, iterationCount, jobHandler = None, running = None):
     """
       This method is aimed to advance the execution of a sub-model and to collect the data using
-      the realization
+      the realization (with parallelStrategy == 2, the sub-model has been submitted and is finished)
       @ In, identifier, str, current job identifier
       @ In, modelToExecute, super(Model), Model instance than needs to be advanced
       @ In, origInputList, list, list of model input
@@ -771,6 +934,7 @@ class EnsembleModel(Dummy):
       @ In, samplerType, str, sampler Type
       @ In, iterationCount, int, iteration counter (1 if not picard)
       @ In, jobHandler, jobHandler instance, optional, jobHandler instance (available only if parallelStrategy == 2)
+      @ In, running, list, optional, identifiers of the other sub-models still running (terminated if this one failed)
       @ Out, returnDict, dict, dictionary containing the data extracted from the target evaluation
       @ Out, gotOutputs, dict, dictionary containing all the data coming out the model
       @ Out, evaluation, dict, the evaluation dictionary with the "unprojected" data
@@ -779,25 +943,16 @@ class EnsembleModel(Dummy):
     suffix = ''
     if 'batchRun' in  inputKwargs:
       suffix = f"{utils.returnIdSeparator()}{inputKwargs['batchRun']}"
-    self.raiseADebug('Submitting model',modelToExecute['Instance'].name)
     localIdentifier = f"{modelToExecute['Instance'].name}{utils.returnIdSeparator()}{identifier}{suffix}"
     if self.parallelStrategy == 1:
       # we evaluate the model directly
+      self.raiseADebug('Evaluating model',modelToExecute['Instance'].name)
       try:
         evaluation = modelToExecute['Instance'].evaluateSample.original_function(modelToExecute['Instance'], origInputList, samplerType, inputKwargs)
       except Exception:
         excType, excValue, excTrace = sys.exc_info()
         evaluation = None
     else:
-      moveOn = False
-      while not moveOn:
-        # run the model
-        inputKwargs.pop("jobHandler", None)
-        modelToExecute['Instance'].submit(origInputList, samplerType, jobHandler, **inputKwargs)
-        ## wait until the model finishes, in order to get ready to run the subsequential one
-        while not jobHandler.isThisJobFinished(localIdentifier):
-          time.sleep(1.e-3)
-        moveOn = True
       # get job that just finished to gather the results
       finishedRun = jobHandler.getFinished(jobIdentifier = localIdentifier, uniqueHandler=f"{self.name}{identifier}{suffix}")
       evaluation = finishedRun[0].getEvaluation()
@@ -808,7 +963,9 @@ class EnsembleModel(Dummy):
           # the failure happened at the input creation stage
           excType, excValue, excTrace = IOError, IOError("Failure happened at the input creation stage. See trace above"), None
         evaluation = None
-        # the model failed
+        # the model failed: stop the other sub-models still running
+        if running:
+          jobHandler.terminateJobs(list(running))
         for modelToRemove in list(set(self.orderList) - set([modelToExecute['Instance'].name])):
           jobHandler.getFinished(jobIdentifier = f"{modelToRemove}{utils.returnIdSeparator()}{identifier}{suffix}",
                                  uniqueHandler = f"{self.name}{identifier}{suffix}")
@@ -19,6 +19,7 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 #End compatibility block for Python 3----------------------------------------------------------------
 
 #External Modules------------------------------------------------------------------------------------
+import os
 import copy
 import numpy as np
 import inspect
@@ -51,6 +52,7 @@ class ExternalModel(Dummy):
     inputSpecification.addSub(InputData.parameterInputFactory("variables", contentType=InputTypes.StringListType))
     inputSpecification.addSub(InputData.parameterInputFactory("inputs", contentType=InputTypes.StringListType))
     inputSpecification.addSub(InputData.parameterInputFactory("outputs", contentType=InputTypes.StringListType))
+    inputSpecification.addSub(cls.getEvaluationCacheSpecification())
     return inputSpecification
 
   @classmethod
@@ -118,6 +120,7 @@ class ExternalModel(Dummy):
     if 'initialize' in dir(self.sim):
       self.sim.initialize(self.initExtSelf,runInfo,inputs)
     Dummy.initialize(self, runInfo, inputs)
+    self._initializeEvaluationCache(runInfo['WorkingDir'])
 
   def createNewInput(self,myInput,samplerType,**kwargs):
     """
@@ -193,6 +196,8 @@ class ExternalModel(Dummy):
           self._setVariableList('input', child.value)
         elif child.getName() == 'outputs':
           self._setVariableList('output', child.value)
+        elif child.getName() == 'evaluationCache':
+          self._readEvaluationCacheInput(child)
 
       if not self.modelVariableType:
         if not self._getVariableList('input') or not self._getVariableList('output'):
@@ -361,8 +366,28 @@ class ExternalModel(Dummy):
         if not mathUtils.sizeMatch(evaluation[key],outputSize):
           self.raiseAnError(Exception,"the time series size needs to be the same for the output space in a HistorySet! Variable:"+key+". Size in the HistorySet="+str(outputSize)+".Size outputed="+str(outputSize))
 
+    self._storeInEvaluationCache(finishedJob, evaluation)
     Dummy.collectOutput(self, finishedJob, output, options)
 
+  def _getEvaluationCacheSignature(self):
+    """
+      Collects what identifies the definition of this model for the persistent evaluation cache:
+      the variables and the source of the external module.
+      @ In, None
+      @ Out, signature, list, items identifying the model
+    """
+    signature = super()._getEvaluationCacheSignature()
+    signature.append(sorted(self.modelVariableType))
+    # the external module, or the module of the plugin class
+    module = self.sim if inspect.ismodule(self.sim) else inspect.getmodule(type(self.sim))
+    sourceFile = getattr(module, '__file__', None)
+    if sourceFile is not None and os.path.isfile(sourceFile):
+      with open(sourceFile, 'rb') as source:
+        signature.append(source.read())
+    else:
+      signature.append(type(self.sim).__name__)
+    return signature
+
   def getSerializationFiles(self):
     """
       Returns a list of any files that this needs if it is serialized
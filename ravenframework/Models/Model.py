@@ -24,12 +24,14 @@ import abc
 import sys
 import importlib
 import pickle
+import os
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
 from ..BaseClasses import BaseEntity, Assembler, InputDataUser
 from ..utils import utils
 from ..utils import InputData, InputTypes
+from ..utils.evaluationCache import EvaluationCache
 #Internal Modules End--------------------------------------------------------------------------------
 
 class Model(utils.metaclass_insert(abc.ABCMeta, BaseEntity, Assembler, InputDataUser)):
@@ -69,6 +71,20 @@ class Model(utils.metaclass_insert(abc.ABCMeta, BaseEntity, Assembler, InputData
 
     return inputSpecification
 
+  @classmethod
+  def getEvaluationCacheSpecification(cls):
+    """
+      Method to get the specification of the (optional) persistent evaluation cache, for the models
+      that support it.
+      @ In, None
+      @ Out, cacheInput, InputData.ParameterInput, class to use for specifying the evaluation cache
+    """
+    cacheInput = InputData.parameterInputFactory("evaluationCache", contentType=InputTypes.StringType)
+    cacheInput.addParam("maxEntries", InputTypes.IntegerType, False)
+    cacheInput.addParam("maxSize", InputTypes.FloatType, False)
+    cacheInput.addParam("tolerance", InputTypes.FloatType, False)
+    return cacheInput
+
   validateDict                  = {}
   validateDict['Input'  ]       = []
   validateDict['Output' ]       = []
@@ -211,6 +227,9 @@ class Model(utils.metaclass_insert(abc.ABCMeta, BaseEntity, Assembler, InputData
     self.printTag = 'MODEL'
     self.createWorkingDir = False
     self._isThereACode = False
+    self._evaluationCacheSettings = None # settings of the persistent evaluation cache (None if not requested)
+    self._evaluationCache = None         # the persistent evaluation cache (EvaluationCache instance)
+    self._evaluationCacheKeys = {}       # {job identifier: cache key} of the submitted jobs not found in the cache
 
   @property
   def containsACode(self):
@@ -444,6 +463,10 @@ class Model(utils.metaclass_insert(abc.ABCMeta, BaseEntity, Assembler, InputData
       else:
         kw = kwargs
 
+      # evaluations found in the persistent cache are not run again (not available for batches)
+      if getattr(self, '_evaluationCache', None) is not None and not batchMode and self._findInEvaluationCache(kw, jobHandler):
+        continue
+
       prefix = kw.get("prefix")
       uniqueHandler = kw.get("uniqueHandler",'any')
       forceThreads = kw.get("forceThreads",False)
@@ -462,6 +485,81 @@ class Model(utils.metaclass_insert(abc.ABCMeta, BaseEntity, Assembler, InputData
                         uniqueHandler=uniqueHandler, forceUseThreads=forceThreads,
                         groupInfo={'id': kwargs['batchInfo']['batchId'], 'size': nRuns} if batchMode else None)
 
+  def _readEvaluationCacheInput(self, cacheNode):
+    """
+      Reads the settings of the persistent evaluation cache.
+      @ In, cacheNode, InputData.ParameterInput, the parsed "evaluationCache" node
+      @ Out, None
+    """
+    maxSize = cacheNode.parameterValues.get('maxSize', None)
+    self._evaluationCacheSettings = {'directory': cacheNode.value.strip(),
+                                     'maxEntries': cacheNode.parameterValues.get('maxEntries', None),
+                                     'maxSize': None if maxSize is None else maxSize * 1e6, # MB -> bytes
+                                     'tolerance': cacheNode.parameterValues.get('tolerance', None)}
+
+  def _getEvaluationCacheSignature(self):
+    """
+      Collects what identifies the definition of this model for the persistent evaluation cache:
+      evaluations stored by models with different signatures are never reused.
+      The specialized models extend it with what their evaluations depend on.
+      @ In, None
+      @ Out, signature, list, items identifying the model
+    """
+    return [self.type, self.subType, sorted(self.alias['input'].items()), sorted(self.alias['output'].items())]
+
+  def _initializeEvaluationCache(self, workingDir):
+    """
+      Opens the persistent evaluation cache (if requested) at the beginning of a step.
+      @ In, workingDir, str, the RAVEN working directory (the cache directory is relative to it)
+      @ Out, None
+    """
+    self._evaluationCache = None
+    self._evaluationCacheKeys = {}
+    if getattr(self, '_evaluationCacheSettings', None) is None:
+      return
+    settings = self._evaluationCacheSettings
+    directory = os.path.join(workingDir, os.path.expanduser(settings['directory']))
+    self._evaluationCache = EvaluationCache(directory, self._getEvaluationCacheSignature(),
+                                            maxEntries=settings['maxEntries'], maxSize=settings['maxSize'],
+                                            tolerance=settings['tolerance'])
+    self.raiseAMessage(f'Evaluation cache "{directory}" opened ({len(self._evaluationCache)} entries)')
+
+  def _findInEvaluationCache(self, kw, jobHandler):
+    """
+      Looks for a sample in the persistent evaluation cache. If found, the stored evaluation is added
+      to the finished jobs (as the restart points are), otherwise the cache key is kept to store the
+      evaluation once collected.
+      @ In, kw, dict, the information coming from the sampler for this sample
+      @ In, jobHandler, JobHandler instance, the global job handler instance
+      @ Out, found, bool, True if the evaluation has been found in the cache
+    """
+    key = self._evaluationCache.key(kw['SampledVars'])
+    cached = self._evaluationCache.get(key)
+    if cached is None:
+      self._evaluationCacheKeys[kw.get('prefix')] = key
+      return False
+    rlz = {'inputs':{}, 'outputs':cached, 'metadata':copy.deepcopy(kw)}
+    jobHandler.addFinishedJob(rlz, metadata=copy.copy(kw), uniqueHandler=kw.get('uniqueHandler', 'any'))
+    self.raiseAMessage(f'job "{kw.get("prefix")}" found in the evaluation cache!')
+    return True
+
+  def _storeInEvaluationCache(self, finishedJob, evaluation):
+    """
+      Stores the evaluation of a job submitted by this model (and not found in the cache) in the
+      persistent evaluation cache. The job metadata are not stored, since the sampler provides
+      them again when the evaluation is reused.
+      @ In, finishedJob, Runner instance, the finished job
+      @ In, evaluation, dict, the evaluation of the job (with the variable names of the model)
+      @ Out, None
+    """
+    if getattr(self, '_evaluationCache', None) is None:
+      return
+    key = self._evaluationCacheKeys.pop(finishedJob.identifier, None)
+    if key is None or not isinstance(evaluation, dict) or evaluation.get('RAVEN_isBatch', False):
+      return
+    metadata = finishedJob.getMetadata() or {}
+    self._evaluationCache.put(key, dict((var, value) for var, value in evaluation.items() if var not in metadata))
+
   def addOutputFromExportDictionary(self,exportDict,output,options,jobIdentifier):
     """
       Method that collects the outputs from them export dictionary
@@ -519,5 +617,9 @@ class Model(utils.metaclass_insert(abc.ABCMeta, BaseEntity, Assembler, InputData
       @ In, None
       @ Out, None
     """
-    pass
+    # NOTE models deserialized from old pickles do not have the cache attributes
+    if getattr(self, '_evaluationCache', None) is not None:
+      stats = self._evaluationCache.stats
+      self.raiseAMessage(f'Evaluation cache: {stats["hits"]} hits, {stats["misses"]} misses, '
+                         f'{stats["stored"]} evaluations stored, {stats["evicted"]} evicted')
 
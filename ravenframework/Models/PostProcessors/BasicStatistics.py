@@ -31,6 +31,7 @@ from .PostProcessorInterface import PostProcessorInterface
 from ...utils import utils
 from ...utils import InputData, InputTypes
 from ...utils import mathUtils
+from ...utils import streamingStatistics
 #Internal Modules End-----------------------------------------------------------
 
 class BasicStatistics(PostProcessorInterface):
@@ -137,6 +138,16 @@ class BasicStatistics(PostProcessorInterface):
     multipleFeaturesInput = InputData.parameterInputFactory("multipleFeatures", contentType=InputTypes.BoolType)
     inputSpecification.addSub(multipleFeaturesInput)
 
+    streamingInput = InputData.parameterInputFactory("streaming", contentType=InputTypes.BoolType,
+                                                     descr="""if True, the statistics are computed by processing the samples
+                                                              in chunks with mergeable accumulators (one-pass moments,
+                                                              co-moment matrices and t-digest sketches for the percentiles).""")
+    streamingInput.addParam("chunkSize", InputTypes.IntegerType, False,
+                            descr="""number of samples processed at once""")
+    streamingInput.addParam("compression", InputTypes.FloatType, False,
+                            descr="""accuracy parameter of the t-digest sketches used for median and percentiles""")
+    inputSpecification.addSub(streamingInput)
+
     return inputSpecification
 
   def __init__(self):
@@ -163,6 +174,9 @@ class BasicStatistics(PostProcessorInterface):
     self.sampleSize     = None # number of sample size
     self.calculations   = {}
     self.validDataType  = ['PointSet', 'HistorySet', 'DataSet'] # The list of accepted types of DataObject
+    self.streaming      = False # True if the statistics are computed in chunks with mergeable accumulators
+    self.chunkSize      = 10000 # number of samples processed at once in streaming mode
+    self.compression    = 200   # accuracy parameter of the t-digest sketches (streaming mode)
 
   def inputToInternal(self, currentInp):
     """
@@ -231,6 +245,11 @@ class BasicStatistics(PostProcessorInterface):
     except KeyError:
       missing = [var for var in self.parameters['targets'] if var not in dataSet]
       self.raiseAnError(KeyError, "Variables: '{}' missing from dataset '{}'!".format(", ".join(missing),currentInput.name))
+    # the data stored on disk are read lazily: unless the statistics are computed in streaming mode (chunk by chunk),
+    # the targets and the weights are read in memory, so that the (exact) statistics are the same as for the data in memory
+    readInput = currentInput.storage == 'netCDF' and not self.streaming
+    if readInput:
+      inputDataset = inputDataset.compute()
     self.sampleTag = currentInput.sampleTag
 
     if currentInput.type == 'HistorySet':
@@ -264,6 +283,9 @@ class BasicStatistics(PostProcessorInterface):
           pbWeights[target] = dataSet[pbName]/dataSet[pbName].sum()
         elif self.pbPresent:
           pbWeights[target] = self.realizationWeight['ProbabilityWeight']
+      if readInput:
+        self.realizationWeight = self.realizationWeight.compute()
+        pbWeights = pbWeights.compute()
     else:
       self.raiseAWarning('BasicStatistics postprocessor did not detect ProbabilityWeights! Assuming unit weights instead...')
 
@@ -428,6 +450,12 @@ class BasicStatistics(PostProcessorInterface):
         self.outputDataset = child.value
       elif tag == "multipleFeatures":
         self.multipleFeatures = child.value
+      elif tag == "streaming":
+        self.streaming = child.value
+        self.chunkSize = child.parameterValues.get('chunkSize', self.chunkSize)
+        self.compression = child.parameterValues.get('compression', self.compression)
+        if self.chunkSize < 1 or self.compression <= 0:
+          self.raiseAnError(IOError, 'The "chunkSize" and "compression" of node <streaming> must be positive!')
       else:
         if tag not in childVals:
           self.raiseAWarning('Unrecognized node in BasicStatistics "',tag,'" has been ignored!')
@@ -647,12 +675,17 @@ class BasicStatistics(PostProcessorInterface):
       @ Out, result, list, the percentile(s)
     """
 
+    arrayIn                = np.asarray(arrayIn, dtype=float).ravel()
+    pbWeight               = np.asarray(pbWeight, dtype=float).ravel()
     # only do the argsort once for all requested percentiles
-    idxs                   = np.argsort(np.asarray(list(zip(pbWeight,arrayIn)))[:,1])
+    idxs                   = np.argsort(arrayIn)
     # Inserting [0.0,arrayIn[idxs[0]]] is needed when few samples are generated and
     # a percentile that is < that the first pb weight is requested. Otherwise the median
     # is returned.
-    sortedWeightsAndPoints = np.insert(np.asarray(list(zip(pbWeight[idxs],arrayIn[idxs]))),0,[0.0,arrayIn[idxs[0]]],axis=0)
+    sortedWeightsAndPoints = np.empty((len(idxs) + 1, 2))
+    sortedWeightsAndPoints[0] = [0.0, arrayIn[idxs[0]]]
+    sortedWeightsAndPoints[1:, 0] = pbWeight[idxs]
+    sortedWeightsAndPoints[1:, 1] = arrayIn[idxs]
     weightsCDF             = np.cumsum(sortedWeightsAndPoints[:,0])
     weightsCDF            /= weightsCDF[-1]
     if interpolation == 'linear':
@@ -685,6 +718,202 @@ class BasicStatistics(PostProcessorInterface):
 
     return result
 
+  def _computeStreamingStatistics(self, inputDataset, pbWeights, needed):
+    """
+      Computes the metrics that can be accumulated in one pass over the samples, processing the samples in chunks
+      of "chunkSize" with mergeable accumulators (weighted moments, co-moment matrices and t-digest sketches).
+      The memory needed by the accumulators does not depend on the number of samples.
+      The percentiles (and the median) are estimated with the t-digest sketches, regardless of the interpolation.
+      @ In, inputDataset, xarray.Dataset, the dataset of inputs
+      @ In, pbWeights, xarray.Dataset, the probability weights of the variables (None if not present)
+      @ In, needed, dict, the metrics needed, with their targets (and features)
+      @ Out, calculations, dict, the computed metrics, in the same format used by _runLocal
+    """
+    pivot = self.pivotParameter if self.pivotParameter in inputDataset.sizes else None
+    pivotDims = (pivot,) if pivot is not None else ()
+    pivotCoords = {pivot: inputDataset[pivot].values} if pivot is not None else {}
+    # variables needed by each kind of accumulator
+    covParams = sorted(set(needed['covariance']['targets']) | set(needed['covariance'].get('features', [])))
+    sensParams = sorted(set(needed['sensitivity']['targets']) | set(needed['sensitivity'].get('features', [])))
+    momentTargets = set(covParams)
+    for metric in ['expectedValue', 'variance', 'sigma', 'skewness', 'kurtosis', 'maximum', 'minimum']:
+      momentTargets.update(needed[metric]['targets'])
+    momentTargets = sorted(momentTargets)
+    quantileTargets = sorted(set(needed['median']['targets']) | set(needed['percentile']['targets']))
+    shape = tuple(inputDataset.sizes[dim] for dim in pivotDims)
+    moments = streamingStatistics.WeightedMoments(shape + (len(momentTargets),)) if momentTargets else None
+    coMoments = streamingStatistics.WeightedCoMoments(len(covParams), shape) if covParams else None
+    # the sensitivities are computed with an unweighted linear regression
+    sensCoMoments = streamingStatistics.WeightedCoMoments(len(sensParams), shape) if sensParams else None
+    digests = dict((target, [streamingStatistics.TDigest(self.compression) for _ in range(int(np.prod(shape)))]) for target in quantileTargets)
+
+    allVariables = sorted(set(momentTargets) | set(sensParams) | set(quantileTargets))
+    def chunkValues(values, variables):
+      """
+        Extracts the values of some variables from the values of a chunk
+        @ In, values, np.ndarray, (samples, *shape, allVariables) values of the chunk
+        @ In, variables, list(str), the variables
+        @ Out, values, np.ndarray, (samples, *shape, variables) values
+      """
+      return values[..., [allVariables.index(var) for var in variables]]
+
+    def chunkWeights(start, end, variables):
+      """
+        Extracts the probability weights of some variables for a chunk of samples
+        @ In, start, int, first sample of the chunk
+        @ In, end, int, end of the chunk
+        @ In, variables, list(str), the variables
+        @ Out, weights, np.ndarray or None, (samples, 1, ..., variables) weights (None for unit weights)
+      """
+      if not self.pbPresent:
+        return None
+      weights = np.stack([np.asarray(pbWeights[var].values).ravel()[start:end] for var in variables], axis=-1)
+      return weights.reshape((weights.shape[0],) + (1,) * len(shape) + (len(variables),))
+
+    numSamples = inputDataset.sizes[self.sampleTag]
+    realizationWeights = np.asarray(self.realizationWeight['ProbabilityWeight'].values).ravel() if self.pbPresent else None
+    for start in range(0, numSamples, self.chunkSize):
+      end = min(start + self.chunkSize, numSamples)
+      chunk = inputDataset[allVariables].isel(**{self.sampleTag: slice(start, end)})
+      chunk = chunk.to_array().transpose(self.sampleTag, *pivotDims, 'variable').values
+      if moments is not None:
+        moments.update(chunkValues(chunk, momentTargets), chunkWeights(start, end, momentTargets))
+      if coMoments is not None:
+        coMoments.update(chunkValues(chunk, covParams), realizationWeights[start:end] if self.pbPresent else None)
+      if sensCoMoments is not None:
+        sensCoMoments.update(chunkValues(chunk, sensParams))
+      if quantileTargets:
+        values = chunkValues(chunk, quantileTargets).reshape(end - start, -1, len(quantileTargets))
+        weights = chunkWeights(start, end, quantileTargets)
+        weights = weights.reshape(end - start, len(quantileTargets)) if weights is not None else None
+        for t, target in enumerate(quantileTargets):
+          for i, digest in enumerate(digests[target]):
+            digest.update(values[:, i, t], weights[:, t] if weights is not None else None)
+
+    def toDataset(array, variables):
+      """
+        Converts an array of per-variable results into a dataset
+        @ In, array, np.ndarray, (*shape, variables) results
+        @ In, variables, list(str), the variables
+        @ Out, dataset, xarray.Dataset, the dataset
+      """
+      return xr.Dataset(dict((var, xr.DataArray(array[..., v], dims=pivotDims, coords=pivotCoords)) for v, var in enumerate(variables)))
+
+    calculations = {}
+    if moments is not None:
+      # sums of the powers of the weights and corrections for unbiased estimates (with unit weights, they reduce
+      #   to the usual corrections for the number of samples)
+      v1, v2, v3, v4 = moments.wSums
+      vp = 1.0 / v1
+      variance = moments.m2 * vp
+      if not self.biased:
+        variance = variance * v1**2 / (v1**2 - v2)
+      if len(needed['expectedValue']['targets']) > 0:
+        calculations['expectedValue'] = toDataset(moments.mean, momentTargets)
+        self.calculations['expectedValue'] = calculations['expectedValue']
+        if self.pbPresent:
+          equivalentSize = (v1**2 / v2)[(0,) * len(shape)]
+          calculations['equivalentSamples'] = xr.Dataset(dict((var, equivalentSize[v]) for v, var in enumerate(momentTargets)))
+      if len(needed['variance']['targets']) > 0:
+        calculations['variance'] = toDataset(variance, momentTargets)
+      with np.errstate(divide='ignore', invalid='ignore'):
+        if len(needed['skewness']['targets']) > 0:
+          corr = v1**3 / (v1**3 - 3.0 * v2 * v1 + 2.0 * v3) if not self.biased else 1.0
+          calculations['skewness'] = toDataset(moments.m3 * vp * corr / variance**1.5, momentTargets)
+        if len(needed['kurtosis']['targets']) > 0:
+          if not self.biased:
+            v1Square = v1**2
+            denom = (v1Square - v2) * (v1Square**2 - 6.0 * v1Square * v2 + 8.0 * v1 * v3 + 3.0 * v2**2 - 6.0 * v4)
+            corr0 = v1Square * (v1Square**2 - 3.0 * v1Square * v2 + 2.0 * v1 * v3 + 3.0 * v2**2 - 3.0 * v4) / denom
+            corr1 = 3.0 * v1Square * (2.0 * v1Square * v2 - 2.0 * v1 * v3 - 3.0 * v2**2 + 3.0 * v4) / denom
+            kurtosis = -3.0 + (moments.m4 * vp * corr0 - (moments.m2 * vp)**2 * corr1) / variance**2
+          else:
+            kurtosis = -3.0 + moments.m4 * vp / variance**2
+          calculations['kurtosis'] = toDataset(kurtosis, momentTargets)
+      if len(needed['maximum']['targets']) > 0:
+        calculations['maximum'] = toDataset(moments.maximum, momentTargets)
+      if len(needed['minimum']['targets']) > 0:
+        calculations['minimum'] = toDataset(moments.minimum, momentTargets)
+    if quantileTargets:
+      if len(needed['median']['targets']) > 0:
+        median = np.stack([np.array([digest.quantile(0.5) for digest in digests[target]]).reshape(shape) for target in quantileTargets], axis=-1)
+        calculations['median'] = toDataset(median, quantileTargets)
+        self.calculations['median'] = calculations['median']
+      if len(needed['percentile']['targets']) > 0:
+        percent = list(needed['percentile']['percent'])
+        percentileSet = xr.Dataset()
+        for target in quantileTargets:
+          quantiles = np.array([digest.quantile(percent) for digest in digests[target]]).reshape(shape + (len(percent),))
+          quantiles = np.moveaxis(quantiles, -1, 0)
+          percentileSet[target] = xr.DataArray(quantiles, dims=('percent',) + pivotDims, coords=dict(percent=percent, **pivotCoords))
+        calculations['percentile'] = percentileSet
+    if coMoments is not None and len(needed['covariance']['targets']) > 0:
+      fact = 1.0 / coMoments.wSum
+      if not self.biased:
+        fact *= coMoments.wSum**2 / (coMoments.wSum**2 - coMoments.w2Sum)
+      cov = coMoments.comoment * fact
+      # the variances use the probability weights of each variable
+      indices = [momentTargets.index(param) for param in covParams]
+      diagonal = np.arange(len(covParams))
+      cov[..., diagonal, diagonal] = variance[..., indices]
+      calculations['covariance'] = xr.DataArray(cov, dims=pivotDims + ('targets', 'features'),
+                                                coords=dict(targets=covParams, features=covParams, **pivotCoords))
+    if sensCoMoments is not None:
+      targets = list(needed['sensitivity']['targets'])
+      features = list(needed['sensitivity']['features'])
+      targIndex = [sensParams.index(var) for var in targets]
+      featIndex = [sensParams.index(var) for var in features]
+      cov = sensCoMoments.comoment.reshape((-1, len(sensParams), len(sensParams)))
+      raw = sensCoMoments.secondMoment().reshape(cov.shape)
+      senMatrix = np.array([self._sensitivityFromCovariance(targets, features, c[np.ix_(targIndex, featIndex)],
+                                                            c[np.ix_(featIndex, featIndex)], r[np.ix_(featIndex, featIndex)])
+                            for c, r in zip(cov, raw)]).reshape(shape + (len(targets), len(features)))
+      calculations['sensitivity'] = xr.DataArray(senMatrix, dims=pivotDims + ('targets', 'features'),
+                                                 coords=dict(targets=targets, features=features, **pivotCoords))
+    return calculations
+
+  def _sensitivityFromCovariance(self, targVars, featVars, covTF, covFF, rawFF):
+    """
+      Computes the sensitivity coefficients (linear regression coefficients) from the covariance matrices, as done by
+      sensitivityCalculation on the samples
+      @ In, targVars, list, list of target variables
+      @ In, featVars, list, list of feature variables
+      @ In, covTF, numpy.ndarray, [#targets, #features] co-moments of targets and features
+      @ In, covFF, numpy.ndarray, [#features, #features] co-moments of the features
+      @ In, rawFF, numpy.ndarray, [#features, #features] second moments (not centered) of the features
+      @ Out, senMatrix, numpy.ndarray, [#targets, #features] sensitivity coefficients
+    """
+    def checkCondition(indices):
+      """
+        Warns about multicollinearity, using the condition number of the features samples
+        (the square root of the condition number of their second moments)
+        @ In, indices, list(int), indices of the features used
+        @ Out, None
+      """
+      condNumber = np.sqrt(np.linalg.cond(rawFF[np.ix_(indices, indices)]))
+      if condNumber > 30.:
+        self.raiseAWarning("Condition Number: {:10.4f} > 30.0. Detected SEVERE multicollinearity problem. Sensitivity might be incorrect!".format(condNumber))
+
+    senMatrix = np.zeros((len(targVars), len(featVars)))
+    if self.multipleFeatures:
+      if not set(targVars) & set(featVars):
+        checkCondition(list(range(len(featVars))))
+        senMatrix = np.dot(covTF, np.linalg.pinv(covFF))
+      else:
+        # a target can not be regressed on itself, so it is removed from the features
+        for p, targ in enumerate(targVars):
+          ind = list(featVars).index(targ) if targ in featVars else None
+          keep = [f for f in range(len(featVars)) if f != ind]
+          regCoeff = np.dot(covTF[p, keep], np.linalg.pinv(covFF[np.ix_(keep, keep)]))
+          checkCondition(keep)
+          if ind is not None:
+            regCoeff = np.insert(regCoeff, ind, 1.0)
+          senMatrix[p,:] = regCoeff
+    else:
+      for p, feat in enumerate(featVars):
+        senMatrix[:,p] = covTF[:,p] / covFF[p,p]
+    return senMatrix
+
   def _runLocal(self, inputData):
     """
       This method executes the postprocessor action. In this case, it computes all the requested statistical FOMs
@@ -773,7 +1002,9 @@ class BasicStatistics(PostProcessorInterface):
     # BEGIN actual calculations
     #
 
-    calculations = {}
+    # in streaming mode, the metrics that can be accumulated are computed in chunks,
+    # the others (and the metrics derived from them) are computed below
+    calculations = self._computeStreamingStatistics(inputDataset, pbWeights, needed) if self.streaming else {}
 
     #################
     # SCALAR VALUES #
@@ -800,7 +1031,7 @@ class BasicStatistics(PostProcessorInterface):
     # expected value
     #
     metric = 'expectedValue'
-    if len(needed[metric]['targets']) > 0:
+    if len(needed[metric]['targets']) > 0 and metric not in calculations:
       self.raiseADebug('Starting "'+metric+'"...')
       dataSet = inputDataset[list(needed[metric]['targets'])]
       if self.pbPresent:
@@ -817,7 +1048,7 @@ class BasicStatistics(PostProcessorInterface):
     # variance
     #
     metric = 'variance'
-    if len(needed[metric]['targets'])>0:
+    if len(needed[metric]['targets'])>0 and metric not in calculations:
       self.raiseADebug('Starting "'+metric+'"...')
       dataSet = inputDataset[list(needed[metric]['targets'])]
       meanSet = calculations['expectedValue'][list(needed[metric]['targets'])]
@@ -844,7 +1075,7 @@ class BasicStatistics(PostProcessorInterface):
     # skewness
     #
     metric = 'skewness'
-    if len(needed[metric]['targets'])>0:
+    if len(needed[metric]['targets'])>0 and metric not in calculations:
       self.raiseADebug('Starting "'+metric+'"...')
       dataSet = inputDataset[list(needed[metric]['targets'])]
       meanSet = calculations['expectedValue'][list(needed[metric]['targets'])]
@@ -855,7 +1086,7 @@ class BasicStatistics(PostProcessorInterface):
     # kurtosis
     #
     metric = 'kurtosis'
-    if len(needed[metric]['targets'])>0:
+    if len(needed[metric]['targets'])>0 and metric not in calculations:
       self.raiseADebug('Starting "'+metric+'"...')
       dataSet = inputDataset[list(needed[metric]['targets'])]
       meanSet = calculations['expectedValue'][list(needed[metric]['targets'])]
@@ -866,7 +1097,7 @@ class BasicStatistics(PostProcessorInterface):
     # median
     #
     metric = 'median'
-    if len(needed[metric]['targets'])>0:
+    if len(needed[metric]['targets'])>0 and metric not in calculations:
       self.raiseADebug('Starting "'+metric+'"...')
       dataSet = inputDataset[list(needed[metric]['targets'])]
       if self.pbPresent:
@@ -1020,7 +1251,7 @@ class BasicStatistics(PostProcessorInterface):
     # maximum
     #
     metric = 'maximum'
-    if len(needed[metric]['targets'])>0:
+    if len(needed[metric]['targets'])>0 and metric not in calculations:
       self.raiseADebug('Starting "'+metric+'"...')
       dataSet = inputDataset[list(needed[metric]['targets'])]
       calculations[metric] = dataSet.max(dim=self.sampleTag)
@@ -1028,7 +1259,7 @@ class BasicStatistics(PostProcessorInterface):
     # minimum
     #
     metric = 'minimum'
-    if len(needed[metric]['targets'])>0:
+    if len(needed[metric]['targets'])>0 and metric not in calculations:
       self.raiseADebug('Starting "'+metric+'"...')
       dataSet = inputDataset[list(needed[metric]['targets'])]
       calculations[metric] = dataSet.min(dim=self.sampleTag)
@@ -1038,52 +1269,53 @@ class BasicStatistics(PostProcessorInterface):
     metric = 'percentile'
     if len(needed[metric]['targets'])>0:
       self.raiseADebug('Starting "'+metric+'"...')
-      dataSet = inputDataset[list(needed[metric]['targets'])]
       percent = list(needed[metric]['percent'])
-      # are there probability weights associated with the data?
-      if self.pbPresent:
-        relWeight = pbWeights[list(needed[metric]['targets'])]
-        # if all weights are the same, calculate percentile with xarray, no need for _computeWeightedPercentile
-        allSameWeight = True
-        for target in needed[metric]['targets']:
-          targWeight = relWeight[target].values
-          if targWeight.min() != targWeight.max():
-            allSameWeight = False
-        if allSameWeight:
-          # all weights are the same, percentile can be calculated with xarray.DataSet
-          percentileSet = dataSet.quantile(percent,dim=self.sampleTag,interpolation=needed[metric]['interpolation'])
-          percentileSet = percentileSet.rename({'quantile': 'percent'})
-        else:
-          # probability weights are not all the same
-          # xarray does not have capability to calculate weighted quantiles at present
-          # implement our own solution
-          percentileSet = xr.Dataset()
+      if metric not in calculations:
+        dataSet = inputDataset[list(needed[metric]['targets'])]
+        # are there probability weights associated with the data?
+        if self.pbPresent:
+          relWeight = pbWeights[list(needed[metric]['targets'])]
+          # if all weights are the same, calculate percentile with xarray, no need for _computeWeightedPercentile
+          allSameWeight = True
           for target in needed[metric]['targets']:
             targWeight = relWeight[target].values
-            targDa = dataSet[target]
-            if self.pivotParameter in targDa.sizes.keys():
-              quantile = []
-              for label, group in targDa.groupby(self.pivotParameter):
-                qtl = self._computeWeightedPercentile(group.values, targWeight, needed[metric]['interpolation'], percent=percent)
-                quantile.append(qtl)
-              da = xr.DataArray(quantile, dims=(self.pivotParameter, 'percent'), coords={'percent': percent, self.pivotParameter: self.pivotValue})
-            else:
-              quantile = self._computeWeightedPercentile(targDa.values, targWeight, needed[metric]['interpolation'], percent=percent)
-              da = xr.DataArray(quantile, dims=('percent'), coords={'percent': percent})
-
-            percentileSet[target] = da
-
-        # TODO: remove when complete
-        # interpolation: {'linear', 'lower', 'higher','midpoint','nearest'}, do not try to use 'linear' or 'midpoint'
-        # The xarray.Dataset.where() will not return the corrrect solution
-        # 'lower' is used for consistent
-        # using xarray.Dataset.sel(**{'quantile':reqPercent}) to retrieve the quantile values
-        #dataSetWeighted = dataSet * relWeight
-        #percentileSet = dataSet.where(dataSetWeighted==dataSetWeighted.quantile(percent,dim=self.sampleTag,interpolation='lower')).mean(self.sampleTag)
-      else:
-        percentileSet = dataSet.quantile(percent,dim=self.sampleTag,interpolation=needed[metric]['interpolation'])
-        percentileSet = percentileSet.rename({'quantile':'percent'})
-      calculations[metric] = percentileSet
+            if targWeight.min() != targWeight.max():
+              allSameWeight = False
+          if allSameWeight:
+            # all weights are the same, percentile can be calculated with xarray.DataSet
+            percentileSet = dataSet.quantile(percent,dim=self.sampleTag,interpolation=needed[metric]['interpolation'])
+            percentileSet = percentileSet.rename({'quantile': 'percent'})
+          else:
+            # probability weights are not all the same
+            # xarray does not have capability to calculate weighted quantiles at present
+            # implement our own solution
+            percentileSet = xr.Dataset()
+            for target in needed[metric]['targets']:
+              targWeight = relWeight[target].values
+              targDa = dataSet[target]
+              if self.pivotParameter in targDa.sizes.keys():
+                quantile = []
+                for label, group in targDa.groupby(self.pivotParameter):
+                  qtl = self._computeWeightedPercentile(group.values, targWeight, needed[metric]['interpolation'], percent=percent)
+                  quantile.append(qtl)
+                da = xr.DataArray(quantile, dims=(self.pivotParameter, 'percent'), coords={'percent': percent, self.pivotParameter: self.pivotValue})
+              else:
+                quantile = self._computeWeightedPercentile(targDa.values, targWeight, needed[metric]['interpolation'], percent=percent)
+                da = xr.DataArray(quantile, dims=('percent'), coords={'percent': percent})
+
+              percentileSet[target] = da
+
+          # TODO: remove when complete
+          # interpolation: {'linear', 'lower', 'higher','midpoint','nearest'}, do not try to use 'linear' or 'midpoint'
+          # The xarray.Dataset.where() will not return the corrrect solution
+          # 'lower' is used for consistent
+          # using xarray.Dataset.sel(**{'quantile':reqPercent}) to retrieve the quantile values
+          #dataSetWeighted = dataSet * relWeight
+          #percentileSet = dataSet.where(dataSetWeighted==dataSetWeighted.quantile(percent,dim=self.sampleTag,interpolation='lower')).mean(self.sampleTag)
+        else:
+          percentileSet = dataSet.quantile(percent,dim=self.sampleTag,interpolation=needed[metric]['interpolation'])
+          percentileSet = percentileSet.rename({'quantile':'percent'})
+        calculations[metric] = percentileSet
 
       # because percentile is different, calculate standard error here
       # standard error calculation uses the standard normal formulation for speed
@@ -1167,7 +1399,7 @@ class BasicStatistics(PostProcessorInterface):
     metric = 'sensitivity'
     targets,features,skip = startVector(metric)
     #NOTE sklearn expects the transpose of what we usually do in RAVEN, so #samples by #features
-    if not skip:
+    if not skip and metric not in calculations:
       #for sensitivity matrix, we don't use numpy/scipy methods to calculate matrix operations,
       #so we loop over targets and features
       params = list(set(targets).union(set(features)))
@@ -1196,7 +1428,7 @@ class BasicStatistics(PostProcessorInterface):
     #
     metric = 'covariance'
     targets,features,skip = startVector(metric)
-    if not skip:
+    if not skip and metric not in calculations:
       # because the C implementation is much faster than picking out individual values,
       #   we do the full covariance matrix with all the targets and features.
       # FIXME adding an alternative for users to choose pick OR do all, defaulting to something smart
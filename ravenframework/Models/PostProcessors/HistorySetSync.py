@@ -19,6 +19,7 @@ Created on October 28, 2015
 import os
 import copy
 import itertools
+import concurrent.futures
 import numpy as np
 #External Modules End--------------------------------------------------------------------------------
 
@@ -46,6 +47,7 @@ class HistorySetSync(PostProcessorReadyInterface):
     inputSpecification.addSub(InputData.parameterInputFactory("syncMethod", contentType=HSSSyncType))
     inputSpecification.addSub(InputData.parameterInputFactory("pivotParameter", contentType=InputTypes.StringType))
     inputSpecification.addSub(InputData.parameterInputFactory("extension", contentType=InputTypes.StringType))
+    inputSpecification.addSub(InputData.parameterInputFactory("workers", contentType=InputTypes.IntegerType))
     return inputSpecification
 
   def __init__(self):
@@ -63,6 +65,7 @@ class HistorySetSync(PostProcessorReadyInterface):
     self.numberOfSamples = None
     self.extension       = None
     self.syncMethod      = None
+    self.workers         = 1      # number of threads re-sampling the variables
 
   def initialize(self, runInfo, inputs, initDict=None):
     """
@@ -78,13 +81,21 @@ class HistorySetSync(PostProcessorReadyInterface):
     if inputs[0].type != 'HistorySet':
       self.raiseAnError(IOError, 'Post-Processor', self.name, 'accepts only HistorySet dataObject, but got "{}"'.format(inputs[0].type))
 
-  def setParams(self, numberOfSamples, pivotParameter, extension, syncMethod):
+  def setParams(self, numberOfSamples, pivotParameter, extension, syncMethod, workers=1):
     """
+      Method to set the parameters of the post-processor (when not read from the input)
+      @ In, numberOfSamples, int, number of samples of the grid
+      @ In, pivotParameter, str, ID of the temporal variable
+      @ In, extension, str, type of extension outside of the histories (zeroed or extended)
+      @ In, syncMethod, str, synchronization method (all, grid, max or min)
+      @ In, workers, int, optional, number of threads re-sampling the variables
+      @ Out, None
     """
     self.numberOfSamples = numberOfSamples
     self.pivotParameter = pivotParameter
     self.extension = extension
     self.syncMethod = syncMethod
+    self.workers = workers
 
   def _handleInput(self, paramInput):
     """
@@ -101,6 +112,8 @@ class HistorySetSync(PostProcessorReadyInterface):
         self.pivotParameter = child.value
       elif child.getName() == 'extension':
         self.extension = child.value
+      elif child.getName() == 'workers':
+        self.workers = child.value
       else:
         self.raiseAnError(IOError, 'HistorySetSync Interfaced Post-Processor ' + str(self.name) + ' : XML node ' + str(child) + ' is not recognized')
 
@@ -110,6 +123,8 @@ class HistorySetSync(PostProcessorReadyInterface):
       self.raiseAnError(IOError, 'HistorySetSync Interfaced Post-Processor ' + str(self.name) + ' : pivotParameter is not specified')
     if self.extension is None or not (self.extension == 'zeroed' or self.extension == 'extended'):
       self.raiseAnError(IOError, 'HistorySetSync Interfaced Post-Processor ' + str(self.name) + ' : extension type is not correctly specified (either not specified or not one of its possible allowed values: zeroed or extended)')
+    if self.workers < 1:
+      self.raiseAnError(IOError, 'HistorySetSync Interfaced Post-Processor ' + str(self.name) + ' : the number of workers needs to be positive')
 
   def run(self,inputIn):
     """
@@ -132,47 +147,39 @@ class HistorySetSync(PostProcessorReadyInterface):
     _, _, inputDic = inputIn['Data'][0]
     outputDic={}
 
+    oldTimes = inputDic['data'][self.pivotParameter]
     newTime = []
     if self.syncMethod == 'grid':
-      maxEndTime = []
-      minInitTime = []
-      for hist in inputDic['data'][self.pivotParameter]:
-        maxEndTime.append(hist[-1])
-        minInitTime.append(hist[0])
-      maxTime = max(maxEndTime)
-      minTime = min(minInitTime)
+      maxTime = max(hist[-1] for hist in oldTimes)
+      minTime = min(hist[0] for hist in oldTimes)
       newTime = np.linspace(minTime,maxTime,self.numberOfSamples)
     elif self.syncMethod == 'all':
-      times = []
-      for hist in inputDic['data'][self.pivotParameter]:
-          times.extend(hist)
-      times = list(set(times))
-      times.sort()
-      newTime = np.array(times)
+      newTime = np.unique(np.concatenate([np.asarray(hist) for hist in oldTimes]))
     elif self.syncMethod in ['min','max']:
-      notableHist   = None   #set on first iteration
-      notableLength = None   #set on first iteration
-
-      for h,elem in np.ndenumerate(inputDic['data'][self.pivotParameter]):
-        l=len(elem)
-        if (h[0] == 0) or (self.syncMethod == 'max' and l > notableLength) or (self.syncMethod == 'min' and l < notableLength):
-          notableHist = inputDic['data'][self.pivotParameter][h[0]]
-          notableLength = l
-      newTime = np.array(notableHist)
+      # first history with the smallest or largest number of time points
+      lengths = [len(hist) for hist in oldTimes]
+      notable = np.argmax(lengths) if self.syncMethod == 'max' else np.argmin(lengths)
+      newTime = np.array(oldTimes[notable])
 
     outputDic['data']={}
-    for var in inputDic['outVars']:
-      outputDic['data'][var] = np.zeros(inputDic['numberRealizations'], dtype=object)
-    outputDic['data'][self.pivotParameter] = np.zeros(inputDic['numberRealizations'], dtype=object)
-
     for var in inputDic['inpVars']:
       outputDic['data'][var] = copy.deepcopy(inputDic['data'][var])
 
+    # interpolation positions of newTime in all the histories, shared by the variables
+    positions = self.resamplingPositions(oldTimes, newTime)
+    outVars = inputDic['outVars']
+    if self.workers > 1 and len(outVars) > 1:
+      with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+        resampled = list(pool.map(lambda var: self.resampleHistories(inputDic['data'][var], positions), outVars))
+    else:
+      resampled = [self.resampleHistories(inputDic['data'][var], positions) for var in outVars]
+    for var, values in zip(outVars, resampled):
+      outputDic['data'][var] = np.zeros(inputDic['numberRealizations'], dtype=object)
+      for rlz, hist in enumerate(values):
+        outputDic['data'][var][rlz] = hist
+    outputDic['data'][self.pivotParameter] = np.zeros(inputDic['numberRealizations'], dtype=object)
     for rlz in range(inputDic['numberRealizations']):
       outputDic['data'][self.pivotParameter][rlz] = newTime
-      for var in inputDic['outVars']:
-        oldTime = inputDic['data'][self.pivotParameter][rlz]
-        outputDic['data'][var][rlz] = self.resampleHist(inputDic['data'][var][rlz], oldTime, newTime)
 
     # add meta variables back
     for key in inputDic['metaKeys']:
@@ -181,6 +188,63 @@ class HistorySetSync(PostProcessorReadyInterface):
 
     return outputDic
 
+  def resamplingPositions(self, oldTimes, newTime):
+    """
+      Method to locate the points of ''newTime'' in each history sampled on ''oldTimes''. The histories are
+      treated as one ragged array (concatenated), so that the positions are indices in the concatenation
+      @ In, oldTimes, list(np.array), the sampled values of the temporal variable of each history
+      @ In, newTime, np.array, array containing the sampled values of the new temporal variable
+      @ Out, positions, dict, the positions: 'previous' and 'next' (indices of the interpolated values,
+        shape (numHistories, numNewTimes)), 'step' and 'offset' (time step of the interval and time elapsed
+        from its beginning), 'before' and 'after' (True for the points outside of each history), 'first'
+        and 'last' (indices of the first and last values of each history)
+    """
+    lengths = np.array([len(hist) for hist in oldTimes])
+    first = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    last = first + lengths - 1
+    flatTimes = np.concatenate([np.asarray(hist) for hist in oldTimes])
+    if all(np.array_equal(hist, oldTimes[0]) for hist in oldTimes[1:]):
+      # aligned histories, only one search
+      index = np.tile(np.searchsorted(oldTimes[0], newTime), (len(oldTimes), 1))
+    else:
+      index = np.array([np.searchsorted(hist, newTime) for hist in oldTimes]).reshape(len(oldTimes), len(newTime))
+    # points after the end are extended, any valid index works for them
+    index = np.minimum(index, lengths[:, np.newaxis] - 1)
+    # a point at the beginning interpolates between the last and the first value (negative index), as before
+    previous = index - 1
+    previous[previous < 0] += np.broadcast_to(lengths[:, np.newaxis], previous.shape)[previous < 0]
+    previous += first[:, np.newaxis]
+    index += first[:, np.newaxis]
+    positions = {'previous': previous,
+                 'next': index,
+                 'step': flatTimes[index] - flatTimes[previous],
+                 'offset': newTime - flatTimes[previous],
+                 'before': newTime < flatTimes[first][:, np.newaxis],
+                 'after': newTime > flatTimes[last][:, np.newaxis],
+                 'first': first,
+                 'last': last}
+    return positions
+
+  def resampleHistories(self, histories, positions):
+    """
+      Method to re-sample the histories of a dependent variable on the new temporal variable
+      @ In, histories, list(np.array), the sampled values of the dependent variable in each history
+      @ In, positions, dict, the positions of the new temporal variable in the histories (see resamplingPositions)
+      @ Out, resampled, np.array, the re-sampled values, shape (numHistories, numNewTimes)
+    """
+    values = np.concatenate([np.asarray(hist) for hist in histories])
+    previous = values[positions['previous']]
+    # same operations as the point-wise linear interpolation, for identical results
+    with np.errstate(divide='ignore', invalid='ignore'):
+      resampled = previous + (values[positions['next']] - previous) / positions['step'] * positions['offset']
+    resampled = resampled.astype(float)
+    if self.extension == 'extended':
+      resampled = np.where(positions['before'], values[positions['first']][:, np.newaxis], resampled)
+      resampled = np.where(positions['after'], values[positions['last']][:, np.newaxis], resampled)
+    elif self.extension == 'zeroed':
+      resampled[positions['before'] | positions['after']] = 0.0
+    return resampled
+
   def resampleHist(self, variable, oldTime, newTime):
     """
       Method the re-sample on ''newTime'' the ''variable'' originally sampled on ''oldTime''
@@ -189,21 +253,4 @@ class HistorySetSync(PostProcessorReadyInterface):
       @ In, newTime,  np.array, array containing the sampled values of the new temporal variable
       @ Out, variable, np.array, array containing the sampled values of the dependent variable re-sampled on oldTime
     """
-    newVar=np.zeros(newTime.size)
-    pos=0
-    for newT in newTime:
-      if newT<oldTime[0]:
-        if self.extension == 'extended':
-          newVar[pos] = variable[0]
-        elif self.extension == 'zeroed':
-          newVar[pos] = 0.0
-      elif newT>oldTime[-1]:
-        if self.extension == 'extended':
-          newVar[pos] = variable[-1]
-        elif self.extension == 'zeroed':
-          newVar[pos] = 0.0
-      else:
-        index = np.searchsorted(oldTime,newT)
-        newVar[pos] = variable[index-1] + (variable[index]-variable[index-1])/(oldTime[index]-oldTime[index-1])*(newT-oldTime[index-1])
-      pos=pos+1
-    return newVar
+    return self.resampleHistories([variable], self.resamplingPositions([oldTime], newTime))[0]
@@ -18,7 +18,6 @@ Created on July 10, 2013
 """
 #External Modules------------------------------------------------------------------------------------
 import numpy as np
-import copy
 from collections import OrderedDict
 #External Modules End--------------------------------------------------------------------------------
 
@@ -55,6 +54,9 @@ class LimitSurface(PostProcessorInterface):
     SideInput = InputData.parameterInputFactory("side", contentType=InputTypes.StringType)
     inputSpecification.addSub(SideInput)
 
+    EvaluationBandInput = InputData.parameterInputFactory("evaluationBand", contentType=InputTypes.IntegerType)
+    inputSpecification.addSub(EvaluationBandInput)
+
     ROMInput = InputData.parameterInputFactory("ROM", contentType=InputTypes.StringType)
     ROMInput.addParam("class", InputTypes.StringType)
     ROMInput.addParam("type", InputTypes.StringType)
@@ -89,6 +91,8 @@ class LimitSurface(PostProcessorInterface):
     self.jobHandler        = None             # job handler pointer
     self.transfMethods     = {}               # transformation methods container
     self.crossedLimitSurf  = False            # Limit surface has been crossed?
+    self.evaluationBand    = None             # number of grid nodes around the previous limit surface where the ROM is re-evaluated (None, everywhere)
+    self.surfaceNodes      = {}               # boolean masks of the grid nodes on the limit surface found by the last run (per sub-grid)
     self.addAssemblerObject('ROM', InputData.Quantity.zero_to_one)
     self.addAssemblerObject('Function', InputData.Quantity.one)
     self.printTag = 'POSTPROCESSOR LIMITSURFACE'
@@ -152,6 +156,7 @@ class LimitSurface(PostProcessorInterface):
     self.nVar                  = len(self.parameters['targets'])                                  # Total number of variables
     self.axisName              = self.gridEntity.returnParameter("dimensionNames",self.name)      # this list is the implicit mapping of the name of the variable with the grid axis ordering self.axisName[i] = name i-th coordinate
     self.testMatrix[self.name] = np.zeros(self.gridEntity.returnParameter("gridShape",self.name)) # grid where the values of the goalfunction are stored
+    self.surfaceNodes          = {}
 
   def _initializeLSppROM(self, inp, raiseErrorIfNotFound = True):
     """
@@ -252,6 +257,10 @@ class LimitSurface(PostProcessorInterface):
       self.lsSide = dictIn["side"]
     if "tolerance" in dictIn.keys():
       self.tolerance = float(dictIn["tolerance"])
+    if dictIn.get("evaluationBand") is not None:
+      self.evaluationBand = int(dictIn["evaluationBand"])
+      if self.evaluationBand < 1:
+        self.raiseAnError(IOError, 'The evaluationBand must be a positive integer (number of grid nodes)! Got '+str(self.evaluationBand))
     if self.lsSide not in ["negative", "positive", "both"]:
       self.raiseAnError(IOError, 'Computation side can be positive, negative, both only !!!!')
 
@@ -334,6 +343,7 @@ class LimitSurface(PostProcessorInterface):
     for nodeName in self.gridEntity.getAllNodesNames(self.name):
       if nodeName != self.name:
         self.testMatrix[nodeName] = np.zeros(self.gridEntity.returnParameter("gridShape",nodeName))
+        self.surfaceNodes.pop(nodeName, None)
 
   def run(self, inputIn = None, returnListSurfCoord = False, exceptionGrid = None, merge = True):
     """
@@ -355,26 +365,35 @@ class LimitSurface(PostProcessorInterface):
     self.surfPoint, evaluations, listSurfPoint = OrderedDict().fromkeys(allGridNames), OrderedDict().fromkeys(allGridNames) ,OrderedDict().fromkeys(allGridNames)
     for nodeName in allGridNames:
       #if skipMainGrid == True and nodeName == self.name: continue
-      self.testMatrix[nodeName] = np.zeros(self.gridEntity.returnParameter("gridShape",nodeName))
+      gridShape = tuple(self.gridEntity.returnParameter("gridShape",nodeName))
       self.gridCoord[nodeName] = self.gridEntity.returnGridAsArrayOfCoordinates(nodeName=nodeName)
+      # nodes where the ROM needs to be (re)evaluated (if None, the whole grid)
+      evaluationMask = self.__evaluationMask__(nodeName, gridShape)
+      if evaluationMask is None:
+        self.testMatrix[nodeName] = np.zeros(gridShape)
+        toBeEvaluated = slice(None)
+      else:
+        # the nodes far from the previous limit surface keep their previous prediction
+        self.testMatrix[nodeName] = self.testMatrix[nodeName].copy()
+        toBeEvaluated = evaluationMask.ravel()
+        self.raiseADebug('LimitSurface: ROM evaluated on '+str(np.count_nonzero(evaluationMask))+' out of '+str(evaluationMask.size)+' grid nodes')
       tempDict ={}
       for  varId, varName in enumerate(self.axisName):
-        tempDict[varName] = self.gridCoord[nodeName][:,varId]
+        tempDict[varName] = self.gridCoord[nodeName][toBeEvaluated,varId]
       self.testMatrix[nodeName].shape     = (self.gridCoord[nodeName].shape[0])                       #rearrange the grid matrix such as is an array of values
-      self.testMatrix[nodeName][:]        = self.ROM.evaluate(tempDict)[self.externalFunction.name]   #get the prediction on the testing grid
-      self.testMatrix[nodeName].shape     = self.gridEntity.returnParameter("gridShape",nodeName)     #bring back the grid structure
+      self.testMatrix[nodeName][toBeEvaluated] = self.ROM.evaluate(tempDict)[self.externalFunction.name] #get the prediction on the testing grid
+      self.testMatrix[nodeName].shape     = gridShape                                                 #bring back the grid structure
       self.gridCoord[nodeName].shape      = self.gridEntity.returnParameter("gridCoorShape",nodeName) #bring back the grid structure
       self.raiseADebug('LimitSurface: Prediction performed')
       # here next the points that are close to any change are detected by a gradient (it is a pre-screener)
       if self.nVar > 1:
-        toBeTested = np.squeeze(np.dstack(np.nonzero(np.sum(np.abs(np.gradient(self.testMatrix[nodeName])), axis = 0))))
+        candidates = np.sum(np.abs(np.gradient(self.testMatrix[nodeName])), axis = 0) != 0
       else:
-        toBeTested = np.squeeze(np.dstack(np.nonzero(np.abs(np.gradient(self.testMatrix[nodeName])))))
-      toBeTested = np.atleast_2d(toBeTested).T if self.nVar == 1 else toBeTested
+        candidates = np.abs(np.gradient(self.testMatrix[nodeName])) != 0
       #printing----------------------
       self.raiseADebug('LimitSurface:  Limit surface candidate points')
       if self.getVerbosity() == 'debug':
-        for coordinate in np.rollaxis(toBeTested, 0):
+        for coordinate in np.argwhere(candidates):
           myStr = ''
           for iVar, varnName in enumerate(self.axisName):
             myStr += varnName + ': ' + str(coordinate[iVar]) + '      '
@@ -383,15 +402,22 @@ class LimitSurface(PostProcessorInterface):
       # check which one of the preselected points is really on the limit surface
       nNegPoints, nPosPoints                       =  0, 0
       listSurfPointNegative, listSurfPointPositive = [], []
+      surfaceNodes = np.zeros(gridShape, dtype=bool)
       if self.lsSide in ["negative", "both"]:
-        # it returns the list of points belonging to the limit state surface and resulting in a negative response by the ROM
-        listSurfPointNegative = self.__localLimitStateSearch__(toBeTested, -1, nodeName)
+        # it returns the points belonging to the limit state surface and resulting in a negative response by the ROM
+        onSurface = self.__localLimitStateSearch__(candidates, -1, nodeName)
+        listSurfPointNegative = list(np.argwhere(onSurface))
         nNegPoints = len(listSurfPointNegative)
+        surfaceNodes |= onSurface
       if self.lsSide in ["positive", "both"]:
-        # it returns the list of points belonging to the limit state surface and resulting in a positive response by the ROM
-        listSurfPointPositive = self.__localLimitStateSearch__(toBeTested, 1, nodeName)
+        # it returns the points belonging to the limit state surface and resulting in a positive response by the ROM
+        onSurface = self.__localLimitStateSearch__(candidates, 1, nodeName)
+        listSurfPointPositive = list(np.argwhere(onSurface))
         nPosPoints = len(listSurfPointPositive)
+        surfaceNodes |= onSurface
       listSurfPoint[nodeName] = listSurfPointNegative + listSurfPointPositive
+      if self.evaluationBand is not None:
+        self.surfaceNodes[nodeName] = surfaceNodes
       #printing----------------------
       if self.getVerbosity() == 'debug':
         if len(listSurfPoint[nodeName]) > 0:
@@ -403,10 +429,8 @@ class LimitSurface(PostProcessorInterface):
           self.raiseADebug('LimitSurface: ' + myStr + '  value: ' + str(self.testMatrix[nodeName][tuple(coordinate)]))
       # if the number of point on the limit surface is > than zero than save it
       if len(listSurfPoint[nodeName]) > 0:
-        self.surfPoint[nodeName] = np.ndarray((len(listSurfPoint[nodeName]), self.nVar))
         evaluations[nodeName] = np.concatenate((-np.ones(nNegPoints), np.ones(nPosPoints)), axis = 0)
-        for pointID, coordinate in enumerate(listSurfPoint[nodeName]):
-          self.surfPoint[nodeName][pointID, :] = self.gridCoord[nodeName][tuple(coordinate)]
+        self.surfPoint[nodeName] = self.gridCoord[nodeName][tuple(np.asarray(listSurfPoint[nodeName]).T)]
     if self.name != exceptionGrid:
       self.listSurfPointNegative, self.listSurfPointPositive = listSurfPoint[self.name][:nNegPoints-1],listSurfPoint[self.name][nNegPoints:]
     if merge == True:
@@ -418,39 +442,57 @@ class LimitSurface(PostProcessorInterface):
       returnSurface = (self.surfPoint, evaluations, listSurfPoint) if returnListSurfCoord else (self.surfPoint, evaluations)
     return returnSurface
 
-  def __localLimitStateSearch__(self, toBeTested, sign, nodeName):
+  def __evaluationMask__(self, nodeName, gridShape):
+    """
+      Returns the grid nodes within self.evaluationBand nodes (along each axis) from the limit
+      surface found by the previous run, i.e. the ones where the ROM needs to be re-evaluated
+      @ In, nodeName, string, the sub-grid name
+      @ In, gridShape, tuple, the shape of the sub-grid
+      @ Out, evaluationMask, np.ndarray or None, boolean mask of the nodes to evaluate (None if the whole grid needs to be)
+    """
+    surfaceNodes = self.surfaceNodes.get(nodeName)
+    if self.evaluationBand is None or surfaceNodes is None or surfaceNodes.shape != gridShape or not surfaceNodes.any():
+      return None
+    evaluationMask = surfaceNodes
+    for axis in range(len(gridShape)):
+      dilated = evaluationMask.copy()
+      for shift in range(1, self.evaluationBand + 1):
+        dilated[axisSlice(axis, len(gridShape), shift, None)] |= evaluationMask[axisSlice(axis, len(gridShape), None, -shift)]
+        dilated[axisSlice(axis, len(gridShape), None, -shift)] |= evaluationMask[axisSlice(axis, len(gridShape), shift, None)]
+      evaluationMask = dilated
+    return evaluationMask
+
+  def __localLimitStateSearch__(self, candidates, sign, nodeName):
     """
-      It returns the list of points belonging to the limit state surface and resulting in
+      It returns the points belonging to the limit state surface and resulting in
       positive or negative responses by the ROM, depending on whether ''sign''
-      equals either -1 or 1, respectively.
-      @ In, toBeTested, np.ndarray, the nodes to be tested
+      equals either -1 or 1, respectively. A candidate node belongs to it if its neighbour
+      along any axis has the opposite response (the neighbour before it is not
+      considered for the last node of an axis).
+      @ In, candidates, np.ndarray, boolean mask of the nodes to be tested
       @ In, sign, int, the sign that should be tested (-1 or +1)
       @ In, nodeName, string, the sub-grid name
-      @ Out, listSurfPoint, list, the list of limit surface coordinates
-    """
-    #TODO: This approach might be extremely slow. It must be replaced with matrix operations
-    listSurfPoint = []
-    gridShape = self.gridEntity.returnParameter("gridShape",nodeName)
-    myIdList = np.zeros(self.nVar,dtype=int)
-    putIt = np.zeros(self.nVar,dtype=bool)
-    for coordinate in np.rollaxis(toBeTested, 0):
-      myIdList[:] = coordinate
-      putIt[:]    = False
-      if self.testMatrix[nodeName][tuple(coordinate)] * sign > 0:
-        for iVar in range(self.nVar):
-          if coordinate[iVar] + 1 < gridShape[iVar]:
-            myIdList[iVar] += 1
-            if self.testMatrix[nodeName][tuple(myIdList)] * sign <= 0:
-              putIt[iVar] = True
-              listSurfPoint.append(copy.copy(coordinate))
-              break
-            myIdList[iVar] -= 1
-            if coordinate[iVar] > 0:
-              myIdList[iVar] -= 1
-              if self.testMatrix[nodeName][tuple(myIdList)] * sign <= 0:
-                putIt[iVar] = True
-                listSurfPoint.append(copy.copy(coordinate))
-                break
-              myIdList[iVar] += 1
-      #if len(set(putIt)) == 1 and  list(set(putIt))[0] == True: listSurfPoint.append(copy.copy(coordinate))
-    return listSurfPoint
+      @ Out, onSurface, np.ndarray, boolean mask of the limit surface nodes
+    """
+    values = self.testMatrix[nodeName] * sign
+    opposite = values <= 0
+    nDim = values.ndim
+    crossed = np.zeros(values.shape, dtype=bool)
+    for axis in range(nDim):
+      # the next node along this axis has the opposite response
+      crossed[axisSlice(axis, nDim, None, -1)] |= opposite[axisSlice(axis, nDim, 1, None)]
+      # the previous node along this axis has the opposite response
+      crossed[axisSlice(axis, nDim, 1, -1)] |= opposite[axisSlice(axis, nDim, None, -2)]
+    onSurface = candidates & (values > 0) & crossed
+    return onSurface
+
+def axisSlice(axis, nDim, start, stop):
+  """
+    Builds the index selecting a range of nodes along one axis of a grid (all of them along the others)
+    @ In, axis, int, the axis
+    @ In, nDim, int, the number of dimensions of the grid
+    @ In, start, int, the first node along the axis (None for the beginning)
+    @ In, stop, int, the end node along the axis, excluded (None for the end)
+    @ Out, index, tuple, the index
+  """
+  return tuple(slice(start, stop) if dim == axis else slice(None) for dim in range(nDim))
@@ -17,8 +17,9 @@ Created on July 10, 2013
 @author: alfoa
 """
 import numpy as np
-import xarray
 import math
+from scipy import stats, spatial
+from scipy.stats import qmc
 
 from .PostProcessorInterface import PostProcessorInterface
 from ...utils import InputData, InputTypes
@@ -72,6 +73,16 @@ class LimitSurfaceIntegral(PostProcessorInterface):
     LSIOutputNameInput = InputData.parameterInputFactory("computeBounds", contentType=InputTypes.BoolType)
     inputSpecification.addSub(LSIOutputNameInput)
 
+    LSISamplingInput = InputData.parameterInputFactory("sampling", contentType=InputTypes.StringType)
+    LSISamplingInput.addParam("width", InputTypes.FloatType)
+    inputSpecification.addSub(LSISamplingInput)
+
+    LSIChunkSizeInput = InputData.parameterInputFactory("chunkSize", contentType=InputTypes.IntegerType)
+    inputSpecification.addSub(LSIChunkSizeInput)
+
+    LSIConfidenceInput = InputData.parameterInputFactory("confidence", contentType=InputTypes.FloatType)
+    inputSpecification.addSub(LSIConfidenceInput)
+
     return inputSpecification
 
   def __init__(self):
@@ -81,7 +92,6 @@ class LimitSurfaceIntegral(PostProcessorInterface):
       @ Out, None
     """
     super().__init__()
-    from ...Models.PostProcessors import factory as ppFactory # delay import to allow definition
     self.variableDist = {}  # dictionary created upon the .xml input file reading. It stores the distributions for each variable.
     self.target = None  # target that defines the f(x1,x2,...,xn)
     self.tolerance = 0.0001  # integration tolerance
@@ -93,8 +103,13 @@ class LimitSurfaceIntegral(PostProcessorInterface):
     self.functionS = None # evaluation classifier for the integration
     self.errorModel = None # classifier used for the error estimation
     self.computationPrefix = None # output prefix for the storage of the probability and, if requested, bounding error
-    self.stat = ppFactory.returnInstance('BasicStatistics')  # instantiation of the 'BasicStatistics' processor, which is used to compute the pb given montecarlo evaluations
-    self.stat.what = ['expectedValue'] # expected value calculation
+    self.sampling = 'montecarlo' # point set used by the montecarlo integration (montecarlo, lhs, sobol or importance)
+    self.importanceWidth = 0.05 # half width (in CDF) of the boxes around the limit surface points sampled by the importance sampling
+    self.importanceCenters = None # limit surface points (in CDF) the importance sampling is centered on
+    self.importanceTree = None # search tree of the importance sampling centers
+    self.chunkSize = 100000 # number of samples evaluated at once (the memory footprint does not depend on the tolerance)
+    self.confidence = None # confidence level of the interval of the integral (if not None, the integration stops when its half width is below the tolerance)
+    self.designsPerChunk = 16 # number of independent LHS or Sobol designs in each chunk (their spread gives the confidence interval)
     self.addAssemblerObject('distribution', InputData.Quantity.zero_to_infinity) # distributions are optional
     self.printTag = 'POSTPROCESSOR INTEGRAL' # print tag
 
@@ -148,6 +163,21 @@ class LimitSurfaceIntegral(PostProcessorInterface):
         self.computationPrefix = child.value
       elif child.getName() == 'computeBounds':
         self.computeErrrorBounds = child.value
+      elif child.getName() == 'sampling':
+        self.sampling = child.value.strip().lower()
+        if self.sampling not in ['montecarlo', 'lhs', 'sobol', 'importance']:
+          self.raiseAnError(IOError, 'sampling can be "montecarlo", "lhs", "sobol" or "importance" only. Got: ' + child.value)
+        self.importanceWidth = child.parameterValues.get('width', self.importanceWidth)
+        if not 0. < self.importanceWidth <= 0.5:
+          self.raiseAnError(IOError, 'the width of the importance sampling needs to be in (0, 0.5]. Got: ' + str(self.importanceWidth))
+      elif child.getName() == 'chunkSize':
+        self.chunkSize = child.value
+        if self.chunkSize < 2:
+          self.raiseAnError(IOError, 'chunkSize needs to be greater than 1. Got: ' + str(self.chunkSize))
+      elif child.getName() == 'confidence':
+        self.confidence = child.value
+        if not 0. < self.confidence < 1.:
+          self.raiseAnError(IOError, 'confidence needs to be in (0, 1). Got: ' + str(self.confidence))
       else:
         self.raiseAnError(NameError, 'invalid or missing labels after the variables call. Only "variable" is accepted.tag: ' + child.getName())
       # if no distribution, we look for the integration domain in the input
@@ -159,7 +189,13 @@ class LimitSurfaceIntegral(PostProcessorInterface):
       self.raiseAnError(IOError,'The required XML node <outputName> has not been inputted!!!')
     if self.target is None:
       self.raiseAWarning('integral target has not been provided. The postprocessor is going to take the last output it finds in the provided limitsurface!!!')
-    True
+    if self.sampling == 'sobol' and (self.chunkSize < 2 * self.designsPerChunk or self.chunkSize & (self.chunkSize - 1)):
+      # the balance properties of the Sobol sequences hold for powers of 2 only
+      self.chunkSize = 2**int(math.ceil(math.log2(max(self.chunkSize, 2 * self.designsPerChunk))))
+      self.raiseAMessage('chunkSize rounded up to ' + str(self.chunkSize) + ' (power of 2) for the Sobol sampling')
+    elif self.sampling == 'lhs' and self.chunkSize % self.designsPerChunk:
+      self.chunkSize += self.designsPerChunk - self.chunkSize % self.designsPerChunk
+      self.raiseAMessage('chunkSize rounded up to ' + str(self.chunkSize) + ' (multiple of ' + str(self.designsPerChunk) + ') for the LHS sampling')
 
   def initialize(self, runInfo, inputs, initDict):
     """
@@ -170,9 +206,6 @@ class LimitSurfaceIntegral(PostProcessorInterface):
       @ Out, None
     """
     self.inputToInternal(inputs)
-    if self.integralType in ['montecarlo']:
-      self.stat.toDo = {'expectedValue':[{'targets':set([self.target]), 'prefix':self.computationPrefix}]}
-      self.stat.initialize(runInfo, inputs, initDict)
     self.functionS = romFactory.returnInstance('KNeighborsClassifier')
     paramDict = {'Features':list(self.variableDist.keys()), 'Target':[self.target]}
     self.functionS.initializeFromDict(paramDict)
@@ -207,6 +240,17 @@ class LimitSurfaceIntegral(PostProcessorInterface):
         self.variableDist[varName] = self.retrieveObjectFromAssemblerDict('distribution', distName)
         self.lowerUpperDict[varName]['lowerBound'] = self.variableDist[varName].lowerBound
         self.lowerUpperDict[varName]['upperBound'] = self.variableDist[varName].upperBound
+    if self.sampling == 'importance':
+      # the points of the limit surface in the CDF space
+      centers = np.zeros((len(self.matrixDict[self.target]), len(self.variableDist)))
+      for index, varName in enumerate(self.variableDist.keys()):
+        if self.variableDist[varName] is None:
+          lowerBound, upperBound = self.lowerUpperDict[varName]['lowerBound'], self.lowerUpperDict[varName]['upperBound']
+          centers[:, index] = (self.matrixDict[varName] - lowerBound) / (upperBound - lowerBound)
+        else:
+          centers[:, index] = self.variableDist[varName].cdfArray(self.matrixDict[varName])
+      self.importanceCenters = centers
+      self.importanceTree = spatial.cKDTree(centers)
 
   def inputToInternal(self, currentInput):
     """
@@ -227,6 +271,9 @@ class LimitSurfaceIntegral(PostProcessorInterface):
         self.target = utils.first(outputKeys)
       elif self.target not in outputKeys:
         self.raiseAnError(IOError, 'The target ' + self.target + 'is not present among the outputs of the PointSet ' + item.name)
+      if len(item) == 0:
+        # e.g. the goal function never changes sign: nothing to train the classifier (nor to center the importance sampling) on
+        self.raiseAnError(IOError, 'The limit surface in the PointSet ' + item.name + ' has no points!')
       # construct matrix
       dataSet = item.asDataset()
       self.matrixDict = {varName: dataSet[varName].values for varName in self.variableDist}
@@ -244,23 +291,102 @@ class LimitSurfaceIntegral(PostProcessorInterface):
       @ In,  input, object, object contained the data to process. (inputToInternal output)
       @ Out, pb, float, integral outcome (probability of the event)
       @ Out, boundError, float, optional, error bound (maximum error of the computed probability)
+      @ Out, halfWidth, float, optional, half width of the confidence interval of the probability
     """
-    pb, boundError = None, None
+    pb, boundError, halfWidth = None, None, None
     if self.integralType == 'montecarlo':
-      tempDict = {}
-      randomMatrix = np.random.rand(int(math.ceil(1.0 / self.tolerance**2)), len(self.variableDist.keys()))
-      for index, varName in enumerate(self.variableDist.keys()):
-        if self.variableDist[varName] == None:
-          randomMatrix[:, index] = randomMatrix[:, index] * (self.lowerUpperDict[varName]['upperBound'] - self.lowerUpperDict[varName]['lowerBound']) + self.lowerUpperDict[varName]['lowerBound']
-        else:
-          randomMatrix[:, index] = self.variableDist[varName].ppf(randomMatrix[:, index])  # previously used np.vectorize in the calculation, but this is faster with scipy distributions
-        tempDict[varName] = randomMatrix[:, index]
-      pb = self.stat.run({'targets':{self.target:xarray.DataArray(self.functionS.evaluate(tempDict)[self.target])}})[self.computationPrefix +"_"+self.target]
-      if self.errorModel:
-        boundError = abs(pb-self.stat.run({'targets':{self.target:xarray.DataArray(self.errorModel.evaluate(tempDict)[self.target])}})[self.computationPrefix +"_"+self.target])
+      pb, boundError, halfWidth = self._integrateMonteCarlo()
     else:
       self.raiseAnError(NotImplemented, "quadrature not yet implemented")
-    return pb, boundError
+    return pb, boundError, halfWidth
+
+  def _integrateMonteCarlo(self):
+    """
+      Computes the integral (and, if requested, the error bound) by Monte Carlo, evaluating the classifiers
+      on chunks of self.chunkSize samples. At most ceil(1/tolerance**2) samples are used; if a confidence level
+      is requested, the integration stops as soon as the half width of the confidence interval is below the tolerance.
+      For the LHS and Sobol point sets, each chunk is made of self.designsPerChunk independent designs and the confidence
+      interval is computed from the spread of their estimates (the last chunk is not truncated).
+      @ In, None
+      @ Out, pb, float, integral outcome (probability of the event)
+      @ Out, boundError, float, error bound (None if not requested)
+      @ Out, halfWidth, float, half width of the confidence interval of the probability (None if not requested)
+    """
+    maxSamples = int(math.ceil(1.0 / self.tolerance**2))
+    quantile = stats.norm.ppf(0.5 + self.confidence / 2.) if self.confidence is not None else None
+    replicated = self.sampling in ['lhs', 'sobol']
+    nSamples = 0
+    # running sums of the estimates (and of their squares) for the goal function and the error model
+    sums, sumSquares, designEstimates = np.zeros(2), 0., []
+    pb, boundError, halfWidth = None, None, None
+    while nSamples < maxSamples:
+      size = self.chunkSize if replicated else min(self.chunkSize, maxSamples - nSamples)
+      tempDict, weights = self._drawChunk(size)
+      values = self.functionS.evaluate(tempDict)[self.target]
+      if weights is not None:
+        values = values * weights
+      sums[0] += np.sum(values)
+      sumSquares += np.sum(values**2)
+      if replicated:
+        designEstimates.extend(np.mean(values.reshape(self.designsPerChunk, -1), axis=1))
+      if self.errorModel:
+        errorValues = self.errorModel.evaluate(tempDict)[self.target]
+        sums[1] += np.sum(errorValues if weights is None else errorValues * weights)
+      nSamples += size
+      pb = sums[0] / nSamples
+      if quantile is not None:
+        if replicated:
+          nDesigns = len(designEstimates)
+          halfWidth = stats.t.ppf(0.5 + self.confidence / 2., nDesigns - 1) * np.std(designEstimates, ddof=1) / math.sqrt(nDesigns)
+        else:
+          halfWidth = quantile * math.sqrt(max(sumSquares - nSamples * pb**2, 0.) / (nSamples - 1) / nSamples)
+        if halfWidth is not None and halfWidth <= self.tolerance:
+          break
+    if self.errorModel:
+      boundError = abs(pb - sums[1] / nSamples)
+    self.raiseAMessage('Integral computed with ' + str(nSamples) + ' samples (' + self.sampling + '): ' + str(pb) +
+                       ('' if halfWidth is None else ' +/- ' + str(halfWidth) + ' (confidence ' + str(self.confidence) + ')'))
+    return pb, boundError, halfWidth
+
+  def _drawChunk(self, size):
+    """
+      Draws a chunk of samples of the integration domain
+      @ In, size, int, number of samples
+      @ Out, tempDict, dict, the samples of each variable
+      @ Out, weights, np.array, the importance sampling weights of the samples (None if not weighted)
+    """
+    nVar = len(self.variableDist)
+    weights = None
+    if self.sampling == 'montecarlo':
+      randomMatrix = np.random.rand(size, nVar)
+    elif self.sampling == 'lhs':
+      designSize = size // self.designsPerChunk
+      randomMatrix = np.vstack([(np.argsort(np.random.rand(designSize, nVar), axis=0) + np.random.rand(designSize, nVar)) / designSize
+                                for _ in range(self.designsPerChunk)])
+    elif self.sampling == 'sobol':
+      designSize = size // self.designsPerChunk
+      randomMatrix = np.vstack([qmc.Sobol(nVar, scramble=True, seed=np.random.randint(2**31 - 1)).random(designSize)
+                                for _ in range(self.designsPerChunk)])
+    else:
+      # defensive mixture: half of the samples are uniform, the other half are uniform in the boxes around the limit surface points
+      randomMatrix = np.random.rand(size, nVar)
+      nearSurface = np.random.rand(size) >= 0.5
+      centers = self.importanceCenters[np.random.randint(len(self.importanceCenters), size=np.count_nonzero(nearSurface))]
+      randomMatrix[nearSurface] = centers + (2. * randomMatrix[nearSurface] - 1.) * self.importanceWidth
+      nBoxes = self.importanceTree.query_ball_point(randomMatrix, self.importanceWidth, p=np.inf, return_length=True)
+      density = 0.5 + 0.5 * nBoxes / (len(self.importanceCenters) * (2. * self.importanceWidth)**nVar)
+      inside = np.all((randomMatrix >= 0.) & (randomMatrix <= 1.), axis=1)
+      # the samples outside of the domain do not contribute (they are moved inside just to be evaluated)
+      weights = inside / density
+      randomMatrix[~inside] = 0.5
+    tempDict = {}
+    for index, varName in enumerate(self.variableDist.keys()):
+      if self.variableDist[varName] == None:
+        randomMatrix[:, index] = randomMatrix[:, index] * (self.lowerUpperDict[varName]['upperBound'] - self.lowerUpperDict[varName]['lowerBound']) + self.lowerUpperDict[varName]['lowerBound']
+      else:
+        randomMatrix[:, index] = self.variableDist[varName].ppf(randomMatrix[:, index])  # previously used np.vectorize in the calculation, but this is faster with scipy distributions
+      tempDict[varName] = randomMatrix[:, index]
+    return tempDict, weights
 
   def collectOutput(self, finishedJob, output):
     """
@@ -270,7 +396,7 @@ class LimitSurfaceIntegral(PostProcessorInterface):
       @ Out, None
     """
     evaluation = finishedJob.getEvaluation()
-    pb, boundError = evaluation[1]
+    pb, boundError, halfWidth = evaluation[1]
     lms = evaluation[0][0]
     if output.type == 'PointSet':
       # we store back the limitsurface
@@ -282,6 +408,8 @@ class LimitSurfaceIntegral(PostProcessorInterface):
           self.raiseAWarning('ERROR Bounds have been computed but the output DataObject does not request the variable: "', self.computationPrefix+"_err", '"!')
         else:
           loadDict[self.computationPrefix+"_err"] = np.full(len(lms), boundError)
+      if self.confidence is not None and self.computationPrefix+"_ci" in output.getVars():
+        loadDict[self.computationPrefix+"_ci"] = np.full(len(lms), np.nan if halfWidth is None else halfWidth)
       output.load(loadDict,'dict')
     # NB I keep this commented part in case we want to keep the possibility to have outputfiles for PP
     #elif isinstance(output,Files.File):
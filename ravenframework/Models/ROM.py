@@ -520,7 +520,16 @@ class ROM(Dummy):
     inRun = self._manipulateInput(Input[0])
     # collect results from model run
     result = self._externalRun(inRun)
-    # build realization
+    return self._createRealization(kwargs, inRun, result)
+
+  def _createRealization(self, kwargs, inRun, result):
+    """
+      Builds the realization of an evaluated sample.
+      @ In, kwargs, dict, the information coming from the sampler for this sample
+      @ In, inRun, dict, the input of the ROM (with the RAVEN variable names)
+      @ In, result, dict, the output of the ROM (with the RAVEN variable names)
+      @ Out, rlz, dict, the realization
+    """
     # assure rlz has all metadata
     self._replaceVariablesNamesWithAliasSystem(kwargs['SampledVars'] ,'input',True)
     rlz = dict((var,np.atleast_1d(kwargs[var])) for var in kwargs.keys())
@@ -528,6 +537,61 @@ class ROM(Dummy):
     rlz.update(dict((var,np.atleast_1d(inRun[var] if var in kwargs['SampledVars'] else result[var])) for var in set(itertools.chain(result.keys(),inRun.keys()))))
     return rlz
 
+  def canEvaluateMicroBatch(self):
+    """
+      Checks if several samples can be evaluated with a single evaluation of this ROM (see evaluateMicroBatch),
+      i.e. if the ROM is static (one value per target and sample).
+      @ In, None
+      @ Out, canEvaluateMicroBatch, bool, True if the micro-batched evaluation is available
+    """
+    if self.pickled or self.segment or self.isADynamicModel or len(self.supervisedContainer) != 1:
+      return False
+    rom = self.supervisedContainer[0]
+    return not rom.isDynamic() and not rom.requireJobHandler
+
+  def submitMicroBatch(self, myInput, samplerType, jobHandler, batch):
+    """
+      Submits several samples to be evaluated by a single job, with a single evaluation of this ROM.
+      @ In, myInput, list, the inputs (list) to start from to generate the new ones
+      @ In, samplerType, string, is the type of sampler that is calling to generate the new inputs
+      @ In, jobHandler, JobHandler instance, the global job handler instance
+      @ In, batch, list(dict), the information coming from the sampler for each sample (see submit)
+      @ Out, None
+    """
+    first, last = batch[0].get('prefix'), batch[-1].get('prefix')
+    identifier = str(first) if len(batch) == 1 else f'{first}-{last}'
+    jobHandler.addJob((self, myInput, samplerType, batch), self.__class__.evaluateMicroBatch, identifier,
+                      metadata=batch[-1], uniqueHandler=batch[-1].get('uniqueHandler', 'any'),
+                      forceUseThreads=batch[-1].get('forceThreads', False))
+
+  @Parallel()
+  def evaluateMicroBatch(self, myInput, samplerType, batch):
+    """
+      Evaluates several samples with a single evaluation of the ROM: the inputs of the samples are stacked in a
+      single request, whose results are split back in one realization per sample. If the ROM does not return one
+      value per sample and target, the samples are evaluated one at a time.
+      @ In, myInput, list, the inputs (list) to start from to generate the new ones
+      @ In, samplerType, string, is the type of sampler that is calling to generate the new inputs
+      @ In, batch, list(dict), the information coming from the sampler for each sample (see evaluateSample)
+      @ Out, evaluation, dict, {'RAVEN_isBatch':True, 'realizations':list(dict)}, the realizations in the batch order
+    """
+    inRuns = [self._manipulateInput(self.createNewInput(myInput, samplerType, **kwargs)[0]) for kwargs in batch]
+    size = len(inRuns)
+    results = None
+    variables = list(inRuns[0].keys())
+    if all(set(inRun.keys()) == set(variables) and all(np.size(inRun[var]) == 1 for var in variables) for inRun in inRuns):
+      request = dict((var, np.concatenate([np.ravel(inRun[var]) for inRun in inRuns])) for var in variables)
+      evaluation = self.evaluate(request)
+      if all(np.ndim(values) == 1 and len(values) == size for values in evaluation.values()):
+        self._replaceVariablesNamesWithAliasSystem(evaluation, 'output', True)
+        results = [dict((var, values[i:i+1]) for var, values in evaluation.items()) for i in range(size)]
+        for inRun in inRuns:
+          self._replaceVariablesNamesWithAliasSystem(inRun, 'input', True)
+    if results is None:
+      results = [self._externalRun(inRun) for inRun in inRuns]
+    realizations = [self._createRealization(kwargs, inRun, result) for kwargs, inRun, result in zip(batch, inRuns, results)]
+    return {'RAVEN_isBatch':True, 'realizations':realizations}
+
   def setAdditionalParams(self, params):
     """
       Used to set parameters at a time other than initialization (such as deserializing).
@@ -18,7 +18,6 @@ Created on Mar 13, 2023
 """
 #External Modules------------------------------------------------------------------------------------
 import sys
-import gc
 import copy
 import threading
 from ..utils import importerUtils as im
@@ -156,10 +155,12 @@ class DaskRunner(InternalRunner):
       @ Out, None
     """
     try:
-      self.__func = self.__client.submit(self.functionToRun, *self.args, retries=0)
+      # the shipped model (scattered dask.distributed.Future) is resolved by dask in the worker
+      self.__func = self.__client.submit(self.functionToRun, *self._argumentsToSend(), retries=0)
+      # wake up the JobHandler as soon as the remote task is done
+      self.__func.add_done_callback(lambda _: self._notifyDone())
       self.trackTime('runner_started')
       self.started = True
-      gc.collect()
       return
 
     except Exception as ae:
@@ -25,13 +25,15 @@ class InternalRunner(Runner):
   """
     Generic base Class for running internal objects
   """
-  def __init__(self, args, functionToRun, **kwargs):
+  def __init__(self, args, functionToRun, shipment=None, **kwargs):
     """
       Init method
       @ In, args, dict, this is a list of arguments that will be passed as
         function parameters into whatever method is stored in functionToRun.
         e.g., functionToRun(*args)
       @ In, functionToRun, method or function, function that needs to be run
+      @ In, shipment, object, optional, reference to the first argument (e.g. the model), already
+        shipped to the workers once for the whole step (see JobHandler), to be sent in place of it
       @ Out, None
     """
     ## First, allow the base class to handle the commonalities
@@ -42,6 +44,7 @@ class InternalRunner(Runner):
     ## Other parameters passed at initialization
     self.args = copy.copy(args)
     self.functionToRun = functionToRun
+    self.shipment = shipment
 
     ## Other parameters manipulated internally
     self.runReturn = None
@@ -50,7 +53,18 @@ class InternalRunner(Runner):
     self.exceptionTrace = None    # sys.exc_info() if an error occurred while running
 
     ## These things cannot be deep copied
-    self.skipOnCopy = ['functionToRun','thread','__queueLock', '_InternalRunner__queueLock']
+    self.skipOnCopy = ['functionToRun','thread','__queueLock', '_InternalRunner__queueLock', 'onDone']
+
+  def _argumentsToSend(self):
+    """
+      Returns the arguments to send to the workers: the first one (e.g. the model) is replaced by its
+      shipment, if any, so that it is not serialized for each job.
+      @ In, None
+      @ Out, args, tuple, the arguments of functionToRun
+    """
+    if self.shipment is None:
+      return tuple(self.args)
+    return (self.shipment,) + tuple(self.args[1:])
 
   def __deepcopy__(self,memo):
     """
@@ -0,0 +1,190 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Created on Oct 18, 2026
+
+Runner of the internal models on a pool of local processes (concurrent.futures),
+available without ray or dask.
+"""
+#External Modules------------------------------------------------------------------------------------
+import sys
+import pickle
+import threading
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from .InternalRunner import InternalRunner
+#Internal Modules End--------------------------------------------------------------------------------
+
+# objects shipped to this (worker) process, {token: object}, see ProcessPoolRunner.evaluateInWorker
+_workerObjects = {}
+_workerGeneration = None
+
+class ProcessPoolRunner(InternalRunner):
+  """
+    Class for running the methods of internal objects (e.g. Models.evaluateSample) on a pool of local
+    processes, to avoid the serialization of CPU-bound Python models by the GIL.
+    The object is shipped to the workers once per step (see JobHandler), not pickled for each job.
+  """
+  def __init__(self, args, functionToRun, **kwargs):
+    """
+      Init method
+      @ In, args, list, the process pool, followed by the arguments that will be passed as function
+        parameters into whatever method is stored in functionToRun (the first one being the shipped object).
+        e.g., functionToRun(*args)
+      @ In, functionToRun, method or function, function that needs to be run
+      @ In, kwargs, dict, additional arguments to base class (the "shipment" of the object is mandatory)
+      @ Out, None
+    """
+    # as for the DaskRunner, the pool is transferred in the arguments
+    self.__pool, args = args[0], args[1:]
+    super().__init__(args, functionToRun, **kwargs)
+    self.__future = None
+    # __futureLock is needed because if isDone and kill are called at the
+    # same time, isDone might end up trying to use __future after it is deleted
+    self.__futureLock = threading.RLock()
+    self.skipOnCopy.extend(['_ProcessPoolRunner__pool', '_ProcessPoolRunner__future', '_ProcessPoolRunner__futureLock'])
+
+  @staticmethod
+  def initializeWorker(path):
+    """
+      Initializes a worker process of the pool
+      @ In, path, list(str), the python path of the main process
+      @ Out, None
+    """
+    for entry in path:
+      if entry not in sys.path:
+        sys.path.append(entry)
+
+  @staticmethod
+  def evaluateInWorker(shipment, functionName, args):
+    """
+      Evaluates a (Parallel-decorated) method of a shipped object in a worker process.
+      The object is loaded (unpickled) only the first time the worker receives a job for it:
+      the following jobs only carry the token of the shipment and the arguments of the method.
+      @ In, shipment, tuple, (generation, token, path of the pickled object) (see JobHandler)
+      @ In, functionName, str, the name of the method of the object to run
+      @ In, args, tuple, the arguments of the method (besides the object itself)
+      @ Out, evaluateInWorker, object, the return of the method
+    """
+    global _workerGeneration
+    generation, token, path = shipment
+    if generation != _workerGeneration:
+      # a new step: the objects shipped for the previous steps are not needed anymore
+      _workerObjects.clear()
+      _workerGeneration = generation
+    if token not in _workerObjects:
+      with open(path, 'rb') as payload:
+        _workerObjects[token] = pickle.load(payload)
+    obj = _workerObjects[token]
+    return getattr(type(obj), functionName).original_function(obj, *args)
+
+  def __getstate__(self):
+    """
+      This function return the state of the ProcessPoolRunner
+      @ In, None
+      @ Out, state, dict, it contains all the information needed by the ProcessPoolRunner to be initialized
+    """
+    state = dict((key, value) for key, value in self.__dict__.items() if key not in self.skipOnCopy)
+    return state
+
+  def __setstate__(self, d):
+    """
+      Initialize the ProcessPoolRunner with the data contained in newstate
+      @ In, d, dict, it contains all the information needed by the ProcessPoolRunner to be initialized
+      @ Out, None
+    """
+    self.__dict__.update(d)
+    self.__pool = None
+    self.__future = None
+    self.__futureLock = threading.RLock()
+
+  def isDone(self):
+    """
+      Method to check if the calculation associated with this Runner is finished
+      @ In, None
+      @ Out, finished, bool, is it finished?
+    """
+    ## If the process has not been started yet, then return False
+    if not self.started:
+      return False
+
+    with self.__futureLock:
+      if self.__future is None or self.hasBeenAdded:
+        return True
+      return self.__future.done()
+
+  def getReturnCode(self):
+    """
+      Returns the return code from running the code.  If return code not yet
+      set, then set it.
+      @ In, None
+      @ Out, returnCode, int,  the return code of this evaluation
+    """
+    if not self.hasBeenAdded:
+      self._collectRunnerResponse()
+    return self.returnCode
+
+  def _collectRunnerResponse(self):
+    """
+      Method to add the process response in the internal variable (pointer)
+      self.runReturn
+      @ In, None
+      @ Out, None
+    """
+    with self.__futureLock:
+      if not self.hasBeenAdded:
+        self.runReturn = None
+        if self.__future is not None:
+          try:
+            self.runReturn = self.__future.result()
+          except Exception as ae:
+            self.exceptionTrace = sys.exc_info()
+            self.returnCode = -1
+            self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
+        self.hasBeenAdded = True
+
+  def start(self):
+    """
+      Method to start the job associated to this Runner
+      @ In, None
+      @ Out, None
+    """
+    try:
+      args = self._argumentsToSend()
+      self.__future = self.__pool.submit(ProcessPoolRunner.evaluateInWorker, args[0], self.functionToRun.__name__, args[1:])
+      self.trackTime('runner_started')
+      self.started = True
+      # wake up the JobHandler as soon as the worker is done
+      self.__future.add_done_callback(lambda _: self._notifyDone())
+    except Exception as ae:
+      self.exceptionTrace = sys.exc_info()
+      self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
+      self.returnCode = -1
+      # collected as a failed run
+      self.started = True
+
+  def kill(self):
+    """
+      Method to kill the job associated to this Runner
+      Note that a job that already started in a worker is not interrupted: its result is discarded.
+      @ In, None
+      @ Out, None
+    """
+    with self.__futureLock:
+      if self.__future is not None:
+        self.__future.cancel()
+      self.__future = None
+    self.returnCode = -1
+    self.trackTime('runner_killed')
@@ -18,7 +18,6 @@ Created on Mar 5, 2013
 """
 #External Modules------------------------------------------------------------------------------------
 import sys
-import gc
 import copy
 import threading
 from ..utils import importerUtils as im
@@ -141,10 +140,12 @@ class RayRunner(InternalRunner):
       @ Out, None
     """
     try:
-      self.__func = self.functionToRun(*self.args)
+      # the shipped model (ray.ObjectRef) is resolved by ray in the worker
+      self.__func = self.functionToRun(*self._argumentsToSend())
+      # wake up the JobHandler as soon as the remote task is done
+      self.__func.future().add_done_callback(lambda _: self._notifyDone())
       self.trackTime('runner_started')
       self.started = True
-      gc.collect()
       return
 
     except Exception as ae:
@@ -56,6 +56,7 @@ class Runner(MessageUser):
     self.uniqueHandler  = uniqueHandler
     self.groupId        = None  # the id of the group this run belong to (batching, if activated)
     self.started        = False
+    self.onDone         = None  # callable (no arguments) used to notify the JobHandler that this run is done
 
     ## First attempt to use a user-specified identifier name
     if identifier is not None:
@@ -130,6 +131,24 @@ class Runner(MessageUser):
     """
     self.timings[event] = time.time()
 
+  def setCompletionCallback(self, callback):
+    """
+      Sets the function to call once this run is done, so that whoever is waiting on it
+      (e.g. the JobHandler polling thread) can be woken up instead of polling.
+      @ In, callback, callable, function taking no arguments (None to remove it)
+      @ Out, None
+    """
+    self.onDone = callback
+
+  def _notifyDone(self):
+    """
+      Calls the completion callback (if any). Runners call this once their evaluation is done.
+      @ In, None
+      @ Out, None
+    """
+    if self.onDone is not None:
+      self.onDone()
+
   def start(self):
     """
       Function to run the driven code
@@ -57,6 +57,7 @@ class SharedMemoryRunner(InternalRunner):
 
     self.skipOnCopy.append('subque')
     self.thread = None
+    self.completed = False # set by the thread itself once the function returned (or raised)
 
   def isDone(self):
     """
@@ -68,7 +69,7 @@ class SharedMemoryRunner(InternalRunner):
     if not self.started:
       return False
 
-    if self.thread is None:
+    if self.thread is None or self.completed:
       return True
     else:
       return not self.thread.is_alive()
@@ -112,7 +113,8 @@ class SharedMemoryRunner(InternalRunner):
       @ Out, None
     """
     try:
-      self.thread = InterruptibleThread(target = lambda q, *arg : q.append(self.functionToRun(*arg)),
+      self.completed = False
+      self.thread = InterruptibleThread(target = self._runAndNotify,
                                      name = self.identifier,
                                      args=(self.subque,) + tuple(self.args))
 
@@ -125,6 +127,20 @@ class SharedMemoryRunner(InternalRunner):
       self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
       self.returnCode = -1
 
+  def _runAndNotify(self, que, *args):
+    """
+      Thread target: runs the function, stores its return in the queue and
+      notifies whoever is waiting on this run (also if the function failed)
+      @ In, que, collections.deque, the queue where to store the function return
+      @ In, args, tuple, the arguments of the function
+      @ Out, None
+    """
+    try:
+      que.append(self.functionToRun(*args))
+    finally:
+      self.completed = True
+      self._notifyDone()
+
   def kill(self):
     """
       Method to kill the job associated to this Runner
@@ -27,6 +27,7 @@ from __future__ import absolute_import
 from .Runner import Runner
 from .InternalRunner import InternalRunner
 from .SharedMemoryRunner import SharedMemoryRunner
+from .ProcessPoolRunner import ProcessPoolRunner
 from .RayRunner import RayRunner
 from .DaskRunner import DaskRunner
 from .PassthroughRunner import PassthroughRunner
@@ -75,6 +75,9 @@ class LimitSurfaceSearch(AdaptiveSampler):
     thresholdInput = InputData.parameterInputFactory("threshold", contentType=InputTypes.FloatType)
     inputSpecification.addSub(thresholdInput)
 
+    evaluationBandInput = InputData.parameterInputFactory("evaluationBand", contentType=InputTypes.IntegerType)
+    inputSpecification.addSub(evaluationBandInput)
+
     romInput = InputData.parameterInputFactory("ROM", contentType=InputTypes.StringType)
     romInput.addParam("type", InputTypes.StringType)
     romInput.addParam("class", InputTypes.StringType)
@@ -163,6 +166,10 @@ class LimitSurfaceSearch(AdaptiveSampler):
                                                 #  (% of range space)
     self.threshold      = 0                     # Post-rank function value
                                                 #  cutoff (%  of range space)
+    self.evaluationBand = None                  # Number of grid nodes around
+                                                #  the previous limit surface
+                                                #  where the ROM is re-evaluated
+                                                #  (None, the whole grid)
     self.sizeGrid       = None                  # size of grid
     self.sizeSubGrid    = None                  # size of subgrid
     self.printTag        = 'ADAPTIVE LIMIT SURFACE'
@@ -310,6 +317,13 @@ class LimitSurfaceSearch(AdaptiveSampler):
         if self.threshold < 0 or self.threshold > 1:
           self.raiseAWarning('Requested an invalid threshold level: ', self.threshold, '. Defaulting to 0.')
           self.threshold = 0
+      if child.tag == 'evaluationBand':
+        try:
+          self.evaluationBand = int(child.text)
+        except:
+          self.raiseAnError(IOError, 'Failed to convert the evaluationBand value: ' + child.text +' into a meaningful integer')
+        if self.evaluationBand < 1:
+          self.raiseAnError(IOError, 'Requested an invalid evaluationBand: ', self.evaluationBand, '. This should be a positive integer value.')
 
   def localGetInitParams(self):
     """
@@ -331,6 +345,7 @@ class LimitSurfaceSearch(AdaptiveSampler):
     paramDict['simplification'  ] = self.simplification
     paramDict['thickness'       ] = self.thickness
     paramDict['threshold'       ] = self.threshold
+    paramDict['evaluationBand'  ] = self.evaluationBand
     return paramDict
 
   def localGetCurrentSetting(self):
@@ -400,7 +415,7 @@ class LimitSurfaceSearch(AdaptiveSampler):
     self.axisName = list(self.distDict.keys())
     self.axisName.sort()
     # initialize LimitSurface PP
-    self.limitSurfacePP._initFromDict({"name":self.name+"LSpp","parameters":[key.replace('<distribution>','') for key in self.axisName],"tolerance":self.tolerance,"side":"both","transformationMethods":transformMethod,"bounds":bounds})
+    self.limitSurfacePP._initFromDict({"name":self.name+"LSpp","parameters":[key.replace('<distribution>','') for key in self.axisName],"tolerance":self.tolerance,"side":"both","transformationMethods":transformMethod,"bounds":bounds,"evaluationBand":self.evaluationBand})
     self.limitSurfacePP.assemblerDict = self.assemblerDict
     self.limitSurfacePP._initializeLSpp({'WorkingDir': None},
                                         [self.lastOutput],
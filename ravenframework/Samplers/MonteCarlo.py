@@ -62,6 +62,8 @@ class MonteCarlo(Sampler):
     samplerInitInput.addSub(samplingTypeInput)
     reseedEachIterationInput = InputData.parameterInputFactory("reseedEachIteration", contentType=InputTypes.StringType)
     samplerInitInput.addSub(reseedEachIterationInput)
+    blockSizeInput = InputData.parameterInputFactory("blockSize", contentType=InputTypes.IntegerType)
+    samplerInitInput.addSub(blockSizeInput)
 
     inputSpecification.addSub(samplerInitInput)
 
@@ -78,6 +80,11 @@ class MonteCarlo(Sampler):
     self.printTag = 'SAMPLER MONTECARLO'
     self.samplingType = None
     self.limit = None
+    self.blockSize = 0         # number of samples drawn at once in block-draw mode (0 => one sample at a time)
+    self._useBlocks = False    # True if the block-draw mode can be used for the current step
+    self._block = None         # block of precomputed samples {var: (values, pdfs)}
+    self._blockIndex = 0       # index of the next sample to be taken from the block
+    self._blockLength = 0      # number of samples in the block
 
   def localInputAndChecks(self, xmlNode, paramInput):
     """
@@ -97,9 +104,60 @@ class MonteCarlo(Sampler):
           self.raiseAnError(IOError, self, f'Monte Carlo sampler {self.name}: specified type of samplingType is not recognized. Allowed type is: uniform')
       else:
         self.samplingType = None
+      if paramInput.findFirst('samplerInit').findFirst('blockSize') is not None:
+        self.blockSize = paramInput.findFirst('samplerInit').findFirst('blockSize').value
+        if self.blockSize < 0:
+          self.raiseAnError(IOError, self, f'Monte Carlo sampler {self.name}: blockSize must be a non-negative integer. Got {self.blockSize}')
     else:
       self.raiseAnError(IOError, self, f'Monte Carlo sampler {self.name} needs the samplerInit block')
 
+  def localInitialize(self):
+    """
+      Will perform all initialization specific to this Sampler.
+      Checks if the block-draw mode can be used: it requires the samples to be obtained by inverse transform of one
+      uniform random number per variable, such that drawing the random numbers in blocks produces the same samples
+      @ In, None
+      @ Out, None
+    """
+    self._block = None
+    self._blockIndex = 0
+    self._blockLength = 0
+    self._useBlocks = False
+    if self.blockSize > 0 and len(self.distDict) > 0:
+      reasons = []
+      if self.samplingType is not None:
+        reasons.append(f'samplingType "{self.samplingType}" is used')
+      if self.reseedAtEachIteration:
+        reasons.append('reseedEachIteration is used')
+      for key in self.distDict:
+        dist = self.distDict[key]
+        if self.variables2distributionsMapping[key]['totDim'] != 1 or not dist.inverseTransformRvs or dist.getMemory():
+          reasons.append(f'distribution "{dist.name}" of variable "{key}" can not be sampled in blocks')
+      if reasons:
+        self.raiseAWarning(f'Monte Carlo sampler {self.name}: block-draw mode disabled since ' + '; '.join(reasons))
+      else:
+        self._useBlocks = True
+
+  def _drawBlock(self):
+    """
+      Draws a block of samples for all the variables at once.
+      The uniform random numbers are drawn in the same order used by the one-sample-at-a-time path
+      (all the variables, sorted by name, for each sample), thus the samples are identical for a given seed.
+      @ In, None
+      @ Out, None
+    """
+    keys = sorted(self.distDict)
+    # do not draw beyond the limit, in order to leave the random number generator in the same state
+    size = max(1, min(self.blockSize, self.limit - self.counter + 1))
+    uniforms = randomUtils.random(len(keys), size, keepMatrix=True)
+    self._block = {}
+    for k, key in enumerate(keys):
+      values = self.distDict[key].ppfArray(uniforms[:, k])
+      pdfs = self.distDict[key].pdfArray(values).tolist()
+      self._block[key] = (values, pdfs)
+    self._blockIndex = 0
+    self._blockLength = size
+
   def localGenerateInput(self, model, myInput):
     """
       Provides the next sample to take.
@@ -109,6 +167,20 @@ class MonteCarlo(Sampler):
       @ In, myInput, list, a list of the original needed inputs for the model (e.g. list of files, etc.)
       @ Out, None
     """
+    if self._useBlocks:
+      if self._blockIndex >= self._blockLength:
+        self._drawBlock()
+      i = self._blockIndex
+      for key, (values, pdfs) in self._block.items():
+        for kkey in key.split(','):
+          self.values[kkey] = values[i]
+        self.inputInfo['SampledVarsPb'][key] = pdfs[i]
+        self.inputInfo['ProbabilityWeight-' + key] = 1.
+      self._blockIndex += 1
+      self.inputInfo['PointProbability'] = reduce(mul, self.inputInfo['SampledVarsPb'].values())
+      self.inputInfo['ProbabilityWeight' ] = 1.0 # MC weight is 1/N => weight is one
+      self.inputInfo['SamplerType'] = 'MonteCarlo'
+      return
     # create values dictionary
     weight = 1.0
     for key in sorted(self.distDict):
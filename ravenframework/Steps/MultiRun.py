@@ -21,6 +21,7 @@
   supercedes Steps.py from alfoa (2/16/2013)
 """
 #External Modules------------------------------------------------------------------------------------
+import sys
 import time
 import copy
 #External Modules End--------------------------------------------------------------------------------
@@ -28,7 +29,9 @@ import copy
 #Internal Modules------------------------------------------------------------------------------------
 from .SingleRun import SingleRun
 from .. import Models
+from ..Samplers import Sampler
 from ..utils import utils
+from ..utils import InputTypes
 from ..OutStreams import OutStreamEntity
 #Internal Modules End--------------------------------------------------------------------------------
 
@@ -37,6 +40,23 @@ class MultiRun(SingleRun):
   """
     This class implements one step of the simulation where several runs are needed
   """
+  @classmethod
+  def getInputSpecification(cls):
+    """
+      Method to get a reference to a class that specifies the input data for
+      class cls.
+      @ In, cls, the class for which we are retrieving the specification
+      @ Out, inputSpecification, InputData.ParameterInput, class to use for
+        specifying input of cls.
+    """
+    inputSpecification = super().getInputSpecification()
+    inputSpecification.addParam("microBatch", InputTypes.IntegerType,
+        descr=r"""maximum number of samples evaluated together, by a single evaluation, when a static ROM
+              is sampled by a Sampler that does not need to collect each run
+              (e.g. MonteCarlo, Grid, Stratified). Ignored in the other cases.
+              \default{1}""")
+    return inputSpecification
+
   def __init__(self):
     """
       Constructor
@@ -47,6 +67,8 @@ class MultiRun(SingleRun):
     self._samplerInitDict = {}          # dictionary that gets sent to the initialization of the sampler
     self.counter = 0                    # counter of the runs already performed
     self._outputCollectionLambda = None # lambda function list to collect the output without checking the type
+    self._microBatch = 1                # maximum number of samples evaluated by a single (ROM) evaluation
+    self._useMicroBatch = False         # True if the samples are evaluated in micro-batches in this step
     self.printTag = 'STEP MULTIRUN'
 
   def _localInputAndCheckParam(self, paramInput):
@@ -59,6 +81,9 @@ class MultiRun(SingleRun):
     SingleRun._localInputAndCheckParam(self,paramInput)
     if self.samplerType not in [item[0] for item in self.parList]:
       self.raiseAnError(IOError, 'Multi-run not possible without a sampler or optimizer!')
+    self._microBatch = paramInput.parameterValues.get('microBatch', 1)
+    if self._microBatch < 1:
+      self.raiseAnError(IOError, f'The "microBatch" of the step "{self.name}" must be a positive integer! Got {self._microBatch}.')
 
   def _initializeSampler(self, inDictionary):
     """
@@ -119,8 +144,13 @@ class MultiRun(SingleRun):
       if not model.amITrained:
         model.raiseAnError(RuntimeError, f'ROM model "{model.name}" has not been trained yet, so it cannot be sampled!'+\
                                         ' Use a RomTrainer step to train it.')
+    self._useMicroBatch = self._microBatch > 1 and self._canMicroBatch(model, inDictionary[self.samplerType])
     for inputIndex in range(inDictionary['jobHandler'].runInfoDict['batchSize']):
-      if inDictionary[self.samplerType].amIreadyToProvideAnInput():
+      if self._useMicroBatch:
+        if not self._submitMicroBatch(inDictionary[self.samplerType], model, inDictionary['Input'], inDictionary['Output'], inDictionary['jobHandler']):
+          break
+        self.raiseAMessage(f'Submitted input batch {inputIndex+1}')
+      elif inDictionary[self.samplerType].amIreadyToProvideAnInput():
         try:
           newInput = self._findANewInputToRun(inDictionary[self.samplerType], inDictionary['Model'], inDictionary['Input'], inDictionary['Output'], inDictionary['jobHandler'])
           if newInput is not None:
@@ -263,7 +293,8 @@ class MultiRun(SingleRun):
         # NOTE for some reason submission outside collection breaks the DET
         # however, it is necessary i.e. batch sampling
         self._addNewRuns(sampler, model, inputs, outputs, jobHandler, inDictionary, verbose=False)
-      time.sleep(self.sleepTime)
+      # block until a job finishes or spots free up in the JobHandler (at most sleepTime)
+      jobHandler.waitForUpdates(self.sleepTime)
     # END while loop that runs the step iterations (collection and submission-for-DET)
     # if any collected runs failed, let the sampler treat them appropriately, and any other closing-out actions
     sampler.finalizeSampler(self.failedRuns)
@@ -294,7 +325,10 @@ class MultiRun(SingleRun):
     if verbose:
       self.raiseADebug('Testing if the sampler is ready to generate a new input')
     for _ in range(min(jobHandler.availability(isEnsemble), sampler.endJobRunnable())):
-      if sampler.amIreadyToProvideAnInput():
+      if self._useMicroBatch:
+        if not self._submitMicroBatch(sampler, model, inputs, outputs, jobHandler):
+          break
+      elif sampler.amIreadyToProvideAnInput():
         try:
           newInput = self._findANewInputToRun(sampler, model, inputs, outputs, jobHandler)
           if newInput is not None:
@@ -310,6 +344,54 @@ class MultiRun(SingleRun):
       if verbose:
         self.raiseADebug(' ... no available JobHandler spots currently (or the Sampler is done.)')
 
+  def _canMicroBatch(self, model, sampler):
+    """
+      Checks if the samples can be evaluated in micro-batches, i.e. if the model is a static ROM and
+      the sampler neither needs to collect the runs one at a time nor to be told the end of each run.
+      @ In, model, Model, the model in charge of evaluating the samples
+      @ In, sampler, Sampler, the sampler in charge of generating the samples
+      @ Out, canMicroBatch, bool, True if the samples can be evaluated in micro-batches
+    """
+    reason = None
+    if not isinstance(model, Models.ROM) or not model.canEvaluateMicroBatch():
+      reason = 'the model is not a static ROM'
+    elif self.samplerType != 'Sampler' or sampler.endJobRunnable() != sys.maxsize:
+      reason = 'the sampler is adaptive'
+    elif type(sampler).finalizeActualSampling is not Sampler.finalizeActualSampling or \
+         type(sampler).localFinalizeActualSampling is not Sampler.localFinalizeActualSampling:
+      reason = 'the sampler needs to collect each run'
+    if reason is not None:
+      self.raiseAWarning(f'The "microBatch" of the step "{self.name}" is ignored, since {reason}!')
+      return False
+    self.raiseADebug(f'The samples are evaluated in micro-batches of up to {self._microBatch} samples')
+    return True
+
+  def _submitMicroBatch(self, sampler, model, inputs, outputs, jobHandler):
+    """
+      Collects up to self._microBatch new inputs from the sampler and submits them to the model as a single job.
+      @ In, sampler, Sampler, the sampler in charge of generating the samples
+      @ In, model, Model, the model in charge of evaluating the samples (see _canMicroBatch)
+      @ In, inputs, object, the raven object used as the input in this step
+      @ In, outputs, object, the raven object used as the output in this step
+      @ In, jobHandler, object, the raven object used to handle jobs
+      @ Out, submitted, bool, False if the sampler did not provide any new input
+    """
+    batch = []
+    newInput = None
+    while len(batch) < self._microBatch and sampler.amIreadyToProvideAnInput():
+      try:
+        found = self._findANewInputToRun(sampler, model, inputs, outputs, jobHandler)
+      except utils.NoMoreSamplesNeeded:
+        self.raiseAMessage(' ... Sampler returned "NoMoreSamplesNeeded".  Continuing...')
+        break
+      # inputs found in restart are already collected
+      if found is not None:
+        newInput = found
+        batch.append(copy.deepcopy(sampler.inputInfo))
+    if batch:
+      model.submitMicroBatch(newInput, sampler.type, jobHandler, batch)
+    return bool(batch)
+
   def _findANewInputToRun(self, sampler, model, inputs, outputs, jobHandler):
     """
       Repeatedly calls Sampler until a new run is found or "NoMoreSamplesNeeded" is raised.
@@ -350,3 +432,4 @@ class MultiRun(SingleRun):
     self._samplerInitDict = {}
     self.counter = 0
     self._outputCollectionLambda = None
+    self._useMicroBatch = False
@@ -21,7 +21,6 @@
 """
 # External Modules----------------------------------------------------------------------------------
 import atexit
-import time
 import os
 import copy
 # External Modules End------------------------------------------------------------------------------
@@ -218,7 +217,7 @@ class SingleRun(Step):
               self.raiseAWarning(f'The job "{finishedJob.identifier}" has been submitted {self.failureHandling["repetitions"]} times, failing every time!!!')
       if jobHandler.isFinished() and len(jobHandler.getFinishedNoPop()) == 0:
         break
-      time.sleep(self.sleepTime)
+      jobHandler.waitForUpdates(self.sleepTime)
     if sampler is not None:
       sampler.handleFailedRuns(self.failedRuns)
     else:
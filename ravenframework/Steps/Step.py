@@ -305,6 +305,13 @@ class Step(utils.metaclass_insert(abc.ABCMeta, BaseEntity, InputDataUser)):
     model = inDictionary.get('Model')
     if model is not None and hasattr(model,'endStepActions'):
       model.endStepActions()
+    # e.g. the databases write the realizations they buffered
+    for out in inDictionary['Output']:
+      if out is not model and hasattr(out, 'endStepActions'):
+        out.endStepActions()
+    jobHandler = inDictionary.get('jobHandler')
+    if jobHandler is not None:
+      jobHandler.reportSubmissionStatistics(self.name)
 
   def takeAstep(self,inDictionary):
     """
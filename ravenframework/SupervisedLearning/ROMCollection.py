@@ -18,8 +18,10 @@
   Container to handle ROMs that are made of many sub-roms
 """
 # standard libraries
+import sys
 import copy
 import warnings
+import concurrent.futures
 from collections import defaultdict, OrderedDict
 import pprint
 
@@ -34,6 +36,55 @@ from ..utils import InputData, InputTypes
 from .SupervisedLearning import SupervisedLearning
 # import pickle as pk # TODO remove me!
 import os
+
+# template ROM of the segments trained in this (worker) process, see Segments._trainSegmentsInParallel
+_workerTemplate = None
+
+def _initializeTrainingWorker(path, templateROM, romGlobalAdjustments):
+  """
+    Initializes a worker process training the segment ROMs, receiving the template ROM once
+    @ In, path, list(str), the python path of the main process
+    @ In, templateROM, SupervisedLearning.supervisedLearning instance, template ROM
+    @ In, romGlobalAdjustments, object, arbitrary container created by ROMs and passed to ROM training
+    @ Out, None
+  """
+  global _workerTemplate
+  for entry in path:
+    if entry not in sys.path:
+      sys.path.append(entry)
+  _workerTemplate = (templateROM, romGlobalAdjustments)
+
+def _trainSegmentROM(templateROM, name, romGlobalAdjustments, picker, data):
+  """
+    Trains the ROM of a subdomain
+    @ In, templateROM, SupervisedLearning.supervisedLearning instance, template ROM
+    @ In, name, str, name of the new ROM
+    @ In, romGlobalAdjustments, object, arbitrary container created by ROMs and passed to ROM training
+    @ In, picker, slice, the slice of the subdomain in the full history
+    @ In, data, dict, data on which the ROM should be trained
+    @ Out, newROM, SupervisedLearning.supervisedLearning instance, trained ROM
+  """
+  newROM = copy.deepcopy(templateROM)
+  newROM.name = name
+  newROM.adjustLocalRomSegment(romGlobalAdjustments, picker)
+  newROM.train(data)
+  return newROM
+
+def _trainSegmentInWorker(name, seed, picker, data):
+  """
+    Trains the ROM of a subdomain in a worker process.
+    The random number generator is seeded with the seed of the subdomain, as in the serial training, so
+    that the ROM does not depend on the number of workers nor on the subdomains previously trained by the worker.
+    @ In, name, str, name of the new ROM
+    @ In, seed, int, the seed of the random number generator for this subdomain
+    @ In, picker, slice, the slice of the subdomain in the full history
+    @ In, data, dict, data on which the ROM should be trained
+    @ Out, newROM, SupervisedLearning.supervisedLearning instance, trained ROM
+  """
+  templateROM, romGlobalAdjustments = _workerTemplate
+  randomUtils.randomSeed(seed)
+  return _trainSegmentROM(templateROM, name, romGlobalAdjustments, picker, data)
+
 #
 #
 #
@@ -218,6 +269,12 @@ class Segments(Collection):
         addition to segmenting if set to \xmlString{cluster}. If set to \xmlString{segment}, then performs
         segmentation without clustering. If clustering, then an additional node needs to be included in the
         \xmlNode{Segment} node.""", default='segment')
+    segment.addParam('trainingWorkers', InputTypes.IntegerType, descr=r"""number of local processes
+        training the segment ROMs concurrently. If greater than 1, the ROMs of the segments are trained
+        on a pool of processes. Serial or not, the global random number generator is seeded before
+        the training of each segment, with a seed drawn once from the global generator (hence depending
+        on the seed of the simulation) plus the index of the segment, so that the trained ROMs do not
+        depend on the number of processes.""", default=1)
     subspace = InputData.parameterInputFactory('subspace', contentType=InputTypes.StringType, descr=r"""designates the subspace to divide. This
         should be the pivot parameter (often ``time'') for the ROM.""")
     subspace.addParam('divisions', InputTypes.IntegerType, False, descr=r"""as an alternative to
@@ -259,6 +316,7 @@ class Segments(Collection):
     self._divisionPivotShift = {}      # whether and how to normalize/shift subspaces
     self._indexValues = {}             # original index values, by index
     self.divisions = None              # trained subdomain division information
+    self._trainingWorkers = 1          # number of processes training the segment ROMs
     # allow some ROM training to happen globally, seperate from individual segment training
     ## see design note for Clusters
     self._romGlobalAdjustments = None  # global ROM settings, provided by the templateROM before clustering
@@ -309,6 +367,9 @@ class Segments(Collection):
           self._divisionPivotShift[subspace] = None
 
     self._divisionInstructions = divisionMode
+    self._trainingWorkers = inputSpecs.parameterValues.get('trainingWorkers', 1)
+    if self._trainingWorkers < 1:
+      self.raiseAnError(IOError, f'"trainingWorkers" must be at least 1; got {self._trainingWorkers}!')
     if len(self._divisionInstructions) > 1:
       self.raiseAnError(NotImplementedError, 'Segmented ROMs do not yet handle multiple subspaces!')
 
@@ -604,8 +665,8 @@ class Segments(Collection):
     # TODO assumes only pivot param
     if pivotID not in self._indexValues:
       self._indexValues[pivotID] = trainingSet[pivotID][0]
-    # loop over clusters and train data
-    roms = []
+    # loop over clusters and collect data
+    segments = []
     for i, subdiv in enumerate(counter):
       # slicer for data selection
       picker = slice(subdiv[0], subdiv[-1] + 1)
@@ -621,17 +682,51 @@ class Segments(Collection):
           # left-shift so that first entry is equal to pivot's first value (maybe not zero)
           delta = data[pivotID][0][0] - trainingSet[pivotID][0][0]
         data[pivotID][0] -= delta
-      # create a new ROM and train it!
-      newROM = copy.deepcopy(templateROM)
-      newROM.name = '{}_seg{}'.format(self._romName, i)
-      newROM.adjustLocalRomSegment(self._romGlobalAdjustments, picker)
-      self.raiseADebug('Training segment', i, picker)
-      newROM.train(data)
-      roms.append(newROM)
+      segments.append(('{}_seg{}'.format(self._romName, i), picker, data))
+    # create new ROMs and train them!
+    # each ROM is trained with its own seed, derived from the global random number generator (hence from the
+    # seed of the user), so that the trained ROMs do not depend on the number of workers
+    baseSeed = randomUtils.randomIntegers(0, 2**31 - 1, self)
+    if self._trainingWorkers > 1 and len(segments) > 1:
+      roms = self._trainSegmentsInParallel(templateROM, segments, baseSeed)
+    else:
+      roms = []
+      for i, (name, picker, data) in enumerate(segments):
+        self.raiseADebug('Training segment', i, picker)
+        randomUtils.randomSeed(baseSeed + i)
+        roms.append(_trainSegmentROM(templateROM, name, self._romGlobalAdjustments, picker, data))
+    # the random numbers drawn after the training do not depend on the number of workers either
+    randomUtils.randomSeed(baseSeed + len(segments))
     # format array for future use
     roms = np.array(roms)
     return roms
 
+  def _trainSegmentsInParallel(self, templateROM, segments, baseSeed):
+    """
+      Trains the ROMs on each subdomain on a pool of local processes.
+      The template ROM is sent once to each process, then only the data of the subdomains.
+      @ In, templateROM, SupervisedLEarning.supervisedLearning instance, template ROM
+      @ In, segments, list(tuple), (name, slice, training data) of each subdomain
+      @ In, baseSeed, int, the seed of the random number generator for the first subdomain (incremented for the next ones)
+      @ Out, roms, list(supervisedLearning), trained ROMs for each subdomain (in order)
+    """
+    workers = min(self._trainingWorkers, len(segments))
+    self.raiseADebug(f'Training {len(segments)} segments on {workers} processes ...')
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                initializer=_initializeTrainingWorker,
+                                                initargs=(list(sys.path), templateROM, self._romGlobalAdjustments)) as pool:
+      futures = [pool.submit(_trainSegmentInWorker, name, baseSeed + i, picker, data) for i, (name, picker, data) in enumerate(segments)]
+      roms = []
+      for i, future in enumerate(futures):
+        try:
+          roms.append(future.result())
+        except Exception as e:
+          for waiting in futures:
+            waiting.cancel()
+          self.raiseAnError(RuntimeError, f'Training of segment {i} failed: {e}')
+        self.raiseADebug('Trained segment', i, segments[i][1])
+    return roms
+
   def _writeSegmentsRealization(self, writeTo):
     """
       Writes pointwise data about segmentation to a realization.
@@ -1417,6 +1512,12 @@ class Interpolated(SupervisedLearning):
         addition to segmenting if set to \xmlString{cluster}. If set to \xmlString{segment}, then performs
         segmentation without clustering. If clustering, then an additional node needs to be included in the
         \xmlNode{Segment} node.""", default='segment')
+    segment.addParam('trainingWorkers', InputTypes.IntegerType, descr=r"""number of local processes
+        training the segment ROMs concurrently. If greater than 1, the ROMs of the segments are trained
+        on a pool of processes. Serial or not, the global random number generator is seeded before
+        the training of each segment, with a seed drawn once from the global generator (hence depending
+        on the seed of the simulation) plus the index of the segment, so that the trained ROMs do not
+        depend on the number of processes.""", default=1)
     subspace = InputData.parameterInputFactory('subspace', contentType=InputTypes.StringType, descr=r"""designates the subspace to divide. This
         should be the pivot parameter (often ``time'') for the ROM.""")
     subspace.addParam('divisions', InputTypes.IntegerType, False, descr=r"""as an alternative to
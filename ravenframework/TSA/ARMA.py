@@ -374,24 +374,79 @@ class ARMA(TimeSeriesGenerator, TimeSeriesCharacterizer, TimeSeriesTransformer):
     synthetic = np.zeros((len(pivot), len(params)))
     for t, (target, data) in enumerate(params.items()):
       armaData = data['arma']
-      P,d,Q = armaData['lags']
-      modelParams = np.r_[armaData.get('const', 0), armaData['ar'], armaData['ma'], armaData.get('var', 1)]
       msrShocks, stateShocks, initialState = self._generateNoise(armaData, synthetic.shape[0])
-      # measurement shocks
-      import statsmodels.api
-      model = statsmodels.tsa.arima.model.ARIMA(synthetic[:,t], order=(P, d, Q), trend='c')
-      # produce sample
-      new = model.simulate(modelParams,
-                           synthetic.shape[0],
-                           measurement_shocks=msrShocks,
-                           state_shocks=stateShocks,
-                           initial_state=initialState)
+      # NOTE the initial state is sampled as a [state, state] matrix of identical columns
+      new = self._simulate(armaData, msrShocks, stateShocks, np.atleast_2d(initialState)[:, 0].reshape(1, -1))[0]
       if settings.get('gaussianize', True):
         # back-transform through CDF
         new = mathUtils.degaussianize(new, params[target]['cdf'])
       synthetic[:, t] = new
     return synthetic
 
+  def generateMany(self, params, pivot, settings, size):
+    """
+      Generates many synthetic histories from fitted parameters at once.
+      The noise of all the histories of a target is drawn at once (measurement shocks, state shocks,
+      then initial states): the RNG stream is consumed in a different order than by "size" calls of
+      "generate", hence the histories are different from the ones of "generate" (but for size = 1).
+      @ In, params, dict, characterization such as otained from self.characterize()
+      @ In, pivot, np.array(float), pivot parameter values
+      @ In, settings, dict, settings for this ROM
+      @ In, size, int, number of histories
+      @ Out, synthetic, np.array(float), synthetic ARMA signals shaped [size, pivotValues, targets]
+    """
+    synthetic = np.zeros((size, len(pivot), len(params)))
+    for t, (target, data) in enumerate(params.items()):
+      armaData = data['arma']
+      msrShocks, stateShocks, initialStates = self._generateNoise(armaData, len(pivot), samples=size)
+      new = self._simulate(armaData, msrShocks, stateShocks, initialStates)
+      if settings.get('gaussianize', True):
+        # back-transform through CDF
+        new = mathUtils.degaussianize(new.ravel(), params[target]['cdf']).reshape(new.shape)
+      synthetic[:, :, t] = new
+    return synthetic
+
+  def _simulate(self, params, msrShocks, stateShocks, initialStates):
+    """
+      Simulates the ARMA state space model (as statsmodels.tsa.arima.model.ARIMA.simulate)
+        y_t = c + x_t[0] + v_t,   x_{t+1} = T x_t + R w_t
+      for many histories at once, by recursive filtering of the shocks rather than by iterating the states.
+      The first state component is the sum of the response to the initial state (that follows the AR
+      recursion once all the initial components have been propagated) and of the ARMA filter of the
+      state shocks.
+      @ In, params, dict, dictionary of trained model parameters
+      @ In, msrShocks, np.array, measurement shocks (v) shaped [histories, pivotValues]
+      @ In, stateShocks, np.array, state shocks (w) shaped [histories, pivotValues]
+      @ In, initialStates, np.array, initial states (x_0) shaped [histories, states]
+      @ Out, signal, np.array, the signals shaped [histories, pivotValues]
+    """
+    transition = self._buildStateSpaceMatrices(params)[0]
+    dim = transition.shape[0]
+    ar = np.atleast_1d(params['ar'])
+    arPoly = np.r_[1., -ar]
+    maPoly = np.r_[1., np.atleast_1d(params['ma'])]
+    nHistories, length = stateShocks.shape
+    # response to the shocks (zero initial state), w_t first affects x_{t+1}
+    forced = np.zeros((nHistories, length))
+    if length > 1:
+      forced[:, 1:] = sp.signal.lfilter(maPoly, arPoly, stateShocks[:, :-1], axis=1)
+    # response to the initial state: iterate the first (few) states ...
+    free = np.zeros((nHistories, length))
+    states = np.array(initialStates, dtype=float)
+    for step in range(min(dim, length)):
+      free[:, step] = states[:, 0]
+      states = states @ transition.T
+    # ... then it is x_t[0] = sum_i ar_i x_{t-i}[0], filtered from the (transposed direct form II) state
+    if length > dim and len(ar) > 0:
+      past = free[:, dim-1::-1]
+      zi = np.zeros((nHistories, len(ar)))
+      for k in range(len(ar)):
+        for m in range(k + 1, len(ar) + 1):
+          zi[:, k] += ar[m - 1] * past[:, m - k - 1]
+      free[:, dim:] = sp.signal.lfilter([1.], arPoly, np.zeros((nHistories, length - dim)), axis=1, zi=zi)[0]
+    signal = params.get('const', 0) + forced + free + msrShocks
+    return signal
+
   def writeXML(self, writeTo, params):
     """
       Allows the engine to put whatever it wants into an XML to print to file.
@@ -576,15 +631,17 @@ class ARMA(TimeSeriesGenerator, TimeSeriesCharacterizer, TimeSeriesTransformer):
     return transition, stateIntercept, stateCov, selection
 
   # utils
-  def _generateNoise(self, params, size):
+  def _generateNoise(self, params, size, samples=None):
     """
       Generates purturbations for ARMA sampling.
       @ In, params, dict, dictionary of trained model parameters
       @ In, size, int, length of time-like variable
-      @ Out, msrShocks, np.array, measurement shocks
-      @ Out, stateShocks, np.array, state shocks
-      @ Out, initialState, np.array, initial random state
+      @ In, samples, int, optional, if given, the number of histories to generate the noise for
+      @ Out, msrShocks, np.array, measurement shocks (shaped [samples, size] if samples is given)
+      @ Out, stateShocks, np.array, state shocks (shaped [samples, size] if samples is given)
+      @ Out, initialState, np.array, initial random state (shaped [samples, states] if samples is given)
     """
+    nSamples = 1 if samples is None else samples
     # measurement shocks -> these are usually near 0 but not exactly
     # note in statsmodels.tsa.statespace.kalman_filter, mean of measure shocks is 0s
     # NOTE (j-bryan, 8/30/2023): The observation covariance matrix (obs_cov) will always be zero for
@@ -595,12 +652,15 @@ class ARMA(TimeSeriesGenerator, TimeSeriesCharacterizer, TimeSeriesTransformer):
     #   is identified and to keep the RNG samples consistent with the existing tests.
     # msrCov = model['obs_cov']
     msrCov = np.zeros((1, 1))
-    msrShocks = randomUtils.randomMultivariateNormal(msrCov, size=size)
+    msrShocks = randomUtils.randomMultivariateNormal(msrCov, size=size * nSamples)
     # state shocks -> these are the significant noise terms
     # note in statsmodels.tsa.statespace.kalman_filter, mean of state shocks is 0s
-    stateShocks = randomUtils.randomMultivariateNormal(np.atleast_2d(params['var']), size=size)
+    stateShocks = randomUtils.randomMultivariateNormal(np.atleast_2d(params['var']), size=size * nSamples)
     # initial state
     initMean = params['initials']['mean']
     initCov = params['initials']['cov']
-    initialState = randomUtils.randomMultivariateNormal(initCov, size=1, mean=initMean)
-    return msrShocks, stateShocks, initialState
+    if samples is None:
+      initialState = randomUtils.randomMultivariateNormal(initCov, size=1, mean=initMean)
+      return msrShocks, stateShocks, initialState
+    initialState = randomUtils.randomMultivariateNormal(initCov, size=samples, mean=np.reshape(initMean, (-1, 1)))
+    return msrShocks.reshape(samples, size), stateShocks.reshape(samples, size), initialState.T
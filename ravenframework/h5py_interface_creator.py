@@ -30,7 +30,11 @@ from .BaseClasses import InputDataUser, MessageUser
 # the database version should be modified
 # everytime a new modification of the internal
 # structure of the data is performed
-_hdf5DatabaseVersion = "v2.1"
+_hdf5DatabaseVersion = "v2.2"
+# versions that can still be read ("v2.1" only has the group-per-realization layout)
+_hdf5CompatibleVersions = ["v2.1", _hdf5DatabaseVersion]
+# group containing the realizations stored with the "columnar" layout
+_columnarGroup = "RAVEN_columnar"
 
 def _dumps(val, void=True):
   """
@@ -86,7 +90,7 @@ class hdf5Database(InputDataUser, MessageUser):
   """
     class to create a h5py (hdf5) database
   """
-  def __init__(self,name, databaseDir, filename, exist, variables=None):
+  def __init__(self,name, databaseDir, filename, exist, variables=None, layout='columnar', bufferSize=1000):
     """
       Constructor
       @ In, name, string, name of this database
@@ -94,6 +98,8 @@ class hdf5Database(InputDataUser, MessageUser):
       @ In, filename, string, the database filename
       @ In, exist, bool, does it exist?
       @ In, variables, list, the user wants to store just some specific variables (default =None => all variables are stored)
+      @ In, layout, string, optional, layout of the new MC databases ("columnar" or "groups")
+      @ In, bufferSize, int, optional, number of realizations buffered before being written (columnar layout)
       @ Out, None
     """
     super().__init__()
@@ -112,6 +118,15 @@ class hdf5Database(InputDataUser, MessageUser):
     # List of boolean variables, true if the corresponding group in self.allGroupPaths
     # is an ending group (no sub-groups appended), false otherwise
     self.allGroupEnds = []
+    # Layout of the realizations (None until the first one is added to a new database):
+    # * groups   = one group per realization (the only one for the DET)
+    # * columnar = one chunked, resizable dataset per variable (MC), the realizations are buffered and appended in batches
+    self.layout = None
+    self.preferredLayout = layout
+    self.bufferSize = max(1, bufferSize)
+    self.columnarNames = []   # names of the realizations (columnar layout), stored and buffered
+    self.__columnarIndex = {} # {name: index} of the realizations (columnar layout)
+    self.__buffer = []        # realizations not written yet (columnar layout)
     # We can create a base empty database or we open an existing one
     if self.fileExist:
       # self.h5FileW is the HDF5 object. Open the database in "update" mode
@@ -122,7 +137,7 @@ class hdf5Database(InputDataUser, MessageUser):
       self.h5FileW = self.openDatabaseW(self.filenameAndPath, 'r+')
       # check version
       version = self.h5FileW.attrs.get("version", "None")
-      if version != _hdf5DatabaseVersion:
+      if version not in _hdf5CompatibleVersions:
         self.raiseAnError(IOError, 'HDF5 RAVEN version (read mode) is outdated. ' +
                           f'Current version is "{_hdf5DatabaseVersion}". ' +
                           f'Version in HDF5 is "{version}".' +
@@ -136,6 +151,14 @@ class hdf5Database(InputDataUser, MessageUser):
       self.__createObjFromFile()
       # "self.firstRootGroup", true if the root group is present (or added), false otherwise
       self.firstRootGroup = True
+      if _columnarGroup in self.h5FileW:
+        self.layout = 'columnar'
+        self.type = 'MC'
+        self.columnarNames = [utils.toString(rlzName) for rlzName in self.h5FileW[_columnarGroup]['names'][:]]
+        self.__columnarIndex = dict((rlzName, index) for index, rlzName in enumerate(self.columnarNames))
+        self.raiseAMessage('TOTAL NUMBER OF REALIZATIONS (COLUMNAR LAYOUT) = ' + str(len(self.columnarNames)))
+      elif any(self.allGroupEnds):
+        self.layout = 'groups'
     else:
       # self.h5FileW is the HDF5 object. Open the database in "write only" mode
       self.h5FileW = self.openDatabaseW(self.filenameAndPath,'w')
@@ -155,7 +178,7 @@ class hdf5Database(InputDataUser, MessageUser):
       @ In, None
       @ Out, __len__, length
     """
-    return len(self.allGroupPaths)
+    return len(self.allGroupPaths) + len(self.columnarNames)
 
   def __createFileLevelInfoDatasets(self):
     """
@@ -169,6 +192,7 @@ class hdf5Database(InputDataUser, MessageUser):
     self.h5FileW["allGroupPaths"].resize((max(len(self.allGroupPaths)*2,2000),))
     self.h5FileW.create_dataset("allGroupEnds", shape=(len(self.allGroupEnds),), dtype=bool, data=self.allGroupEnds, maxshape=(None,))
     self.h5FileW["allGroupEnds"].resize((max(len(self.allGroupPaths)*2,2000),))
+    self.h5FileW.attrs["nGroups"] = len(self.allGroupPaths)
 
   def __updateFileLevelInfoDatasets(self):
     """
@@ -218,6 +242,8 @@ class hdf5Database(InputDataUser, MessageUser):
       @ Out, None
     """
     if isinstance(obj,h5.Group):
+      if name.split('/')[0] == _columnarGroup:
+        return
       self.allGroupPaths.append(utils.toBytes(name))
       try:
         self.allGroupEnds.append(obj.attrs["endGroup"])
@@ -266,6 +292,16 @@ class hdf5Database(InputDataUser, MessageUser):
     prefix    = rlz.get("prefix")
 
     groupName = str(prefix if mathUtils.isSingleValued(prefix) else prefix[0])
+    if not parentID and self.layout != 'groups' and (self.layout == 'columnar' or self.preferredLayout == 'columnar'):
+      # Parallel structure, stored in columns
+      self.layout = 'columnar'
+      self.type = 'MC'
+      self.__addColumnarRealization(groupName, rlz)
+      return
+    if self.layout == 'columnar':
+      self.raiseAnError(IOError, f'The realization "{groupName}" has a parent ("{parentID}"), but the database "{self.name}" '+
+                        'stores independent (MC) realizations!')
+    self.layout = 'groups'
     if parentID:
       #If Hierarchical structure, firstly add the root group
       if not self.firstRootGroup or parentID == "None":
@@ -395,6 +431,141 @@ class hdf5Database(InputDataUser, MessageUser):
     group.attrs[b'nVarsScalar' ] = len(varKeysScalar)
     group.attrs[b'nVarsOther'    ] = len(varKeysOther)
 
+  def __splitRealization(self, rlz):
+    """
+      Splits the data of a realization in floats (or integers) and other types (strings, objects)
+      @ In, rlz, dict, dictionary with the data and metadata to add
+      @ Out, dataScalar, dict, the float data {var:np.array}
+      @ Out, dataOther, dict, the other data {var:np.array}
+    """
+    if self.variables is not None:
+      # check if all variables are contained in the rlz dictionary
+      if not set(self.variables).issubset(rlz.keys()):
+        self.raiseAnError(IOError, "Not all the requested variables have been passed in the realization. Missing are: "+
+                          ",".join(list(set(self.variables).symmetric_difference(set(rlz.keys())))))
+    dataScalar = dict( (key, np.atleast_1d(value)) for (key, value) in rlz.items()
+                       if _checkTypeHDF5(value, False) and (self.variables is None or key in self.variables))
+    dataOther = dict( (key, np.atleast_1d(value)) for (key, value) in rlz.items() if _checkTypeHDF5(value, True) )
+    # the multi-dimensional floats are stored with the other types, to keep their shape
+    for key in [key for key, value in dataScalar.items() if value.ndim > 1]:
+      dataOther[key] = dataScalar.pop(key)
+    return dataScalar, dataOther
+
+  def __addColumnarRealization(self, groupName, rlz):
+    """
+      Function to add a realization to the database, with the columnar layout.
+      The realization is buffered: the buffer is written every "bufferSize" realizations (see flush).
+      @ In, groupName, string, realization name
+      @ In, rlz, dict, dictionary with the data and metadata to add
+      @ Out, None
+    """
+    # (Deleting already present information is not desiderable)
+    while groupName in self.__columnarIndex:
+      groupName = groupName + "_" + groupName
+    self.__buffer.append(self.__splitRealization(rlz))
+    self.__columnarIndex[groupName] = len(self.columnarNames)
+    self.columnarNames.append(groupName)
+    if len(self.__buffer) >= self.bufferSize:
+      self.flush()
+
+  def flush(self):
+    """
+      Writes the buffered realizations (columnar layout) in the database.
+      Each float variable is stored in a chunked, resizable dataset of the concatenated values
+      ("<var>_values") with the cumulative number of values of the realizations ("<var>_ends"),
+      to store both scalars and histories. The other types are stored pickled, one entry per realization.
+      @ In, None
+      @ Out, None
+    """
+    if len(self.__buffer) == 0:
+      return
+    chunks = (max(self.bufferSize, 1024),)
+    columnar = self.h5FileW.require_group(_columnarGroup)
+    self.h5FileW.attrs["version"] = _hdf5DatabaseVersion
+    if 'names' not in columnar:
+      columnar.create_dataset('names', shape=(0,), maxshape=(None,), chunks=chunks, dtype=h5.special_dtype(vlen=str))
+      columnar.attrs['variables'] = _dumps([])
+    nStored = columnar['names'].shape[0]
+    nNew = len(self.__buffer)
+    columnar['names'].resize((nStored + nNew,))
+    columnar['names'][nStored:] = self.columnarNames[nStored:nStored + nNew]
+    # variables already stored, [(variable name, kind, dataset name)]
+    variables = _loads(columnar.attrs['variables'])
+    known = set((var, kind) for var, kind, _ in variables)
+    for kind, position in [('float', 0), ('other', 1)]:
+      for data in self.__buffer:
+        for var in data[position]:
+          if (var, kind) not in known:
+            known.add((var, kind))
+            variables.append((var, kind, f'var{len(variables)}'))
+    for var, kind, dataset in variables:
+      position = 0 if kind == 'float' else 1
+      if kind == 'float':
+        if dataset + '_ends' not in columnar:
+          columnar.create_dataset(dataset + '_values', shape=(0,), maxshape=(None,), chunks=chunks, dtype='float')
+          columnar.create_dataset(dataset + '_ends', shape=(nStored,), maxshape=(None,), chunks=chunks, dtype='int64', fillvalue=0)
+        values, ends = columnar[dataset + '_values'], columnar[dataset + '_ends']
+        newValues = [data[position][var].ravel() for data in self.__buffer if var in data[position]]
+        lengths = [data[position][var].size if var in data[position] else 0 for data in self.__buffer]
+        end = values.shape[0]
+        ends.resize((nStored + nNew,))
+        ends[nStored:] = end + np.cumsum(lengths)
+        if len(newValues) > 0:
+          newValues = np.concatenate(newValues).astype(float)
+          values.resize((end + newValues.size,))
+          values[end:] = newValues
+      else:
+        if dataset not in columnar:
+          columnar.create_dataset(dataset, shape=(nStored,), maxshape=(None,), chunks=chunks, dtype=h5.vlen_dtype(np.dtype('uint8')))
+        pickled = columnar[dataset]
+        pickled.resize((nStored + nNew,))
+        empty = np.zeros(0, dtype='uint8')
+        pickled[nStored:] = [np.frombuffer(pk.dumps(data[position][var]), dtype='uint8') if var in data[position] else empty
+                             for data in self.__buffer]
+    columnar.attrs['variables'] = _dumps(variables)
+    columnar.attrs['nRealizations'] = nStored + nNew
+    self.__buffer = []
+    self.h5FileW.flush()
+
+  def __getColumnarRealizations(self, indices):
+    """
+      Retrieves realizations stored with the columnar layout
+      @ In, indices, list(int), the indices of the realizations
+      @ Out, realizations, list(dict), the realizations {var:np.array}
+    """
+    self.flush()
+    realizations = [{} for _ in indices]
+    if len(indices) == 0:
+      return realizations
+    columnar = self.h5FileW[_columnarGroup]
+    variables = _loads(columnar.attrs['variables'])
+    # a single realization is read by slices, many are read at once
+    single = len(indices) == 1
+    for var, kind, dataset in variables:
+      if kind == 'float':
+        endsSet = columnar[dataset + '_ends']
+        if single:
+          index = indices[0]
+          begin = int(endsSet[index - 1]) if index > 0 else 0
+          end = int(endsSet[index])
+          if end > begin:
+            realizations[0][var] = columnar[dataset + '_values'][begin:end]
+        else:
+          ends = endsSet[:]
+          begins = np.concatenate(([0], ends[:-1]))
+          values = columnar[dataset + '_values'][:]
+          for rlz, index in zip(realizations, indices):
+            if ends[index] > begins[index]:
+              rlz[var] = values[begins[index]:ends[index]]
+      else:
+        pickled = columnar[dataset]
+        entries = [pickled[indices[0]]] if single else pickled[:]
+        for rlz, index in zip(realizations, indices):
+          entry = entries[0] if single else entries[index]
+          if len(entry) > 0:
+            rlz[var] = pk.loads(entry.tobytes())
+    return realizations
+
   def __addGroupRootLevel(self,groupName,rlz):
     """
       Function to add a group into the database (root level)
@@ -495,7 +666,9 @@ class hdf5Database(InputDataUser, MessageUser):
       rname = utils.toString(rootName)
     if not self.fileOpen:
       self.__createObjFromFile() # Create the "self.allGroupPaths" list from the existing database
-    if not rootName:
+    if self.layout == 'columnar':
+      workingList = list(self.columnarNames)
+    elif not rootName:
       workingList = [utils.toString(k).split('/')[-1] for k, v in zip(self.allGroupPaths,self.allGroupEnds) if v ]
     else:
       workingList = [utils.toString(k).split('/')[-1] for k, v in zip(self.allGroupPaths,self.allGroupEnds) if v and utils.toString(k).endswith(rname)]
@@ -565,6 +738,11 @@ class hdf5Database(InputDataUser, MessageUser):
     # and create the "self.allGroupPaths" list from the existing database
     if not self.fileOpen:
       self.__createObjFromFile()
+    if self.layout == 'columnar':
+      if name not in self.__columnarIndex:
+        self.raiseAnError(IOError,'Realization named ' + name + ' not found in database "'+self.name+'"!')
+      newData = self.__getColumnarRealizations([self.__columnarIndex[name]])[0]
+      return newData, {'nVars':len(newData.keys()),'varKeys':newData.keys()}
     # Find the endGroup that coresponds to the given name
     path = self.__returnGroupPath(name)
     found = path != '-$'
@@ -593,12 +771,28 @@ class hdf5Database(InputDataUser, MessageUser):
 
     return(newData,attrs)
 
+  def _getRealizationsByName(self, names):
+    """
+      Function to retrieve many realizations at once (without reconstructing the DET branches).
+      With the columnar layout, each variable is read once for all the realizations.
+      @ In, names, list(str), the realization names
+      @ Out, realizations, list(dict), the realizations
+    """
+    if self.layout != 'columnar':
+      return [self._getRealizationByName(name, {'reconstruct': False})[0] for name in names]
+    missing = [name for name in names if name not in self.__columnarIndex]
+    if len(missing) > 0:
+      self.raiseAnError(IOError,'Realizations named ' + ', '.join(missing) + ' not found in database "'+self.name+'"!')
+    return self.__getColumnarRealizations([self.__columnarIndex[name] for name in names])
+
   def closeDatabaseW(self):
     """
-      Function to close the database
+      Function to close the database (the buffered realizations are written)
       @ In,  None
       @ Out, None
     """
+    if self.fileOpen:
+      self.flush()
     self.h5FileW.close()
     self.fileOpen = False
     return
@@ -233,29 +233,13 @@ class unSupervisedLearning(utils.metaclass_insert(abc.ABCMeta), MessageUser):
             (mu,sigma) = mathUtils.normalizationFactors(tdict[key][var])
             tdictNorm[key][var] = (tdict[key][var]-mu)/sigma
 
-        cardinality = len(tdictNorm.keys())
-        self.normValues = np.zeros((cardinality,cardinality))
+        # process the input data for the metric, numpy.array is required
         keys = list(tdictNorm.keys())
-        for i in range(cardinality):
-          for j in range(i,cardinality):
-            # process the input data for the metric, numpy.array is required
-            assert(list(tdictNorm[keys[i]].keys()) == list(tdictNorm[keys[j]].keys()))
-            numParamsI = len(tdictNorm[keys[i]].keys())
-            numStepsI = len(utils.first(tdictNorm[keys[i]].values()))
-            numStepsJ = len(utils.first(tdictNorm[keys[j]].values()))
-
-            inputI = np.empty((numParamsI, numStepsI))
-            inputJ = np.empty((numParamsI, numStepsJ))
-            for ind, params in enumerate(tdictNorm[keys[i]].keys()):
-              valueI = tdictNorm[keys[i]][params]
-              valueJ = tdictNorm[keys[j]][params]
-              inputI[ind] = valueI
-              inputJ[ind] = valueJ
-            pairedData = ((inputI,None), (inputJ,None))
-            # FIXME: Using loops can be very slow for large number of realizations
-            self.normValues[i][j] = metric.evaluate(pairedData)
-            if i != j:
-              self.normValues[j][i] = self.normValues[i][j]
+        histories = []
+        for key in keys:
+          assert(list(tdictNorm[key].keys()) == list(tdictNorm[keys[0]].keys()))
+          histories.append(np.array([tdictNorm[key][params] for params in tdictNorm[key]], dtype=float))
+        self.normValues = metric.evaluateDistanceMatrix(histories)
       else:
         ## PointSet
         normValues = np.zeros(shape = (realizationCount, featureCount))
@@ -384,3 +384,551 @@ class cNDarray(object):
     assert(abs(index) < self.width)
     self.values = np.delete(self.values,index,axis=1)
     self.width -= 1
+
+#
+#
+#
+#
+class cColumnarArray(object):
+  """
+    Columnar caching of realizations, used by the DataObjects to collect samples.
+    Unlike cNDarray (a single object-dtype matrix), each entity (column) is stored in its own growable buffer:
+      - scalar entities (floats, ints, bools) in a typed np.ndarray, strings and anything else in an object np.ndarray;
+      - array entities (histories, ND samples) as one contiguous flat np.ndarray plus the offset and shape of each sample.
+    This way, collapsing the collected samples requires wrapping one array per entity, instead of looping over
+    the samples. A column falls back to object storage if it receives values incompatible with its buffer,
+    so any value can be collected.
+    The indexing syntax of cNDarray is supported (e.g. [row], [row, column], [:, column]), but columns of array
+    entities are returned as object arrays of (views of the) samples; getEntity and stackEntity are more efficient.
+  """
+  ### CONSTRUCTOR ###
+  def __init__(self, width, length=100):
+    """
+      Constructor.
+      @ In, width, int, number of entities aka columns
+      @ In, length, int, optional, initial capacity (number of samples) to allocate
+      @ Out, None
+    """
+    self.size = 0                 # number of rows (samples) with actual data
+    self.capacity = max(length, 1) # initial number of rows allocated for each new column
+    self._columns = list(_ObjectColumn(self.capacity) for _ in range(width)) # placeholders until the first sample
+
+  ### PROPERTIES ###
+  @property
+  def width(self):
+    """
+      Width property, number of entities.
+      @ In, None
+      @ Out, width, int, number of columns
+    """
+    return len(self._columns)
+
+  @property
+  def shape(self):
+    """
+      Shape property, as used in np.ndarray structures.
+      @ In, None
+      @ Out, (int,int), the (#rows, #columns) of useful data in this cached array
+    """
+    return (self.size, self.width)
+
+  ### BUILTINS ###
+  def __array__(self, dtype=None, copy=None):
+    """
+      so that numpy's array() returns values
+      @ In, dtype, np.type, optional, the requested type of the array
+      @ In, copy, bool, optional, unused (the array is always a new one)
+      @ Out, __array__, numpy.ndarray, the requested array
+    """
+    data = self.getData()
+    if dtype is not None:
+      data = data.astype(dtype)
+    return data
+
+  def __getitem__(self, val):
+    """
+      Get item method, with the same syntax as for a 2D np.ndarray of objects.
+      @ In, val, int or slice or tuple, the slicing object (e.g. 1, [1, 2], [:, 2], [1, (0, 2)], etc.)
+      @ Out, __getitem__, object or np.ndarray, the element(s)
+    """
+    if isinstance(val, tuple) and len(val) == 1:
+      val = val[0]
+    if not isinstance(val, tuple):
+      rows, cols = val, slice(None)
+    else:
+      rows, cols = val
+    # single entity
+    if isinstance(cols, (int, np.integer)):
+      if isinstance(rows, (int, np.integer)):
+        return self._columns[cols].get(self._checkRow(rows))
+      return self.getEntity(cols)[rows]
+    # several entities
+    cols = range(self.width)[cols] if isinstance(cols, slice) else cols
+    if isinstance(rows, (int, np.integer)):
+      row = self._checkRow(rows)
+      return _objectArray(list(self._columns[c].get(row) for c in cols))
+    rows = np.arange(self.size)[rows]
+    data = np.empty((len(rows), len(cols)), dtype=object)
+    for i, c in enumerate(cols):
+      data[:, i] = self.getEntity(c)[rows]
+    return data
+
+  def __setitem__(self, key, value):
+    """
+      Set item method, for single elements only.
+      @ In, key, tuple(int, int), the (row, column) of the element
+      @ In, value, object, the new value
+      @ Out, None
+    """
+    row, col = key
+    row = self._checkRow(row)
+    if not self._columns[col].set(row, value):
+      self._columns[col] = _ObjectColumn.fromColumn(self._columns[col], self.size)
+      self._columns[col].set(row, value)
+
+  def __iter__(self):
+    """
+      Overload of iterator, over the rows
+      @ In, None
+      @ Out, __iter__, iterator, iterator
+    """
+    return (self[r] for r in range(self.size))
+
+  def __len__(self):
+    """
+      Return size, which is the number of samples, independent of entities, containing useful data.
+      Does not include cached entries that have not yet been filled.
+      @ In, None
+      @ Out, __len__, integer, size
+    """
+    return self.size
+
+  def __repr__(self):
+    """
+      overload of __repr__ function
+      @ In, None
+      @ Out, __repr__, string, the representation string
+    """
+    return repr(self.getData())
+
+  ### UTILITY FUNCTIONS ###
+  def append(self, entry):
+    """
+      Append method, adds one sample.
+      @ In, entry, list or np.ndarray, the values of the sample, one for each entity (in order)
+      @ Out, None
+    """
+    if len(entry) != self.width:
+      raise IOError(f'Tried to add new data to cColumnarArray.  Need {self.width} entries, but got {len(entry)}!')
+    # the first sample determines the storage of each column
+    if self.size == 0:
+      self._columns = list(_newColumn(value, self.capacity) for value in entry)
+    for c, column in enumerate(self._columns):
+      if not column.append(entry[c]):
+        # incompatible value, store the column as objects from now on
+        self._columns[c] = _ObjectColumn.fromColumn(column, self.size)
+        self._columns[c].append(entry[c])
+    self.size += 1
+
+  def addEntity(self, vals):
+    """
+      Adds a column to the dataset.
+      @ In, vals, list or np.ndarray, as list(#,#,#) where # is either single-valued or numpy array, one per sample
+      @ Out, None
+    """
+    if self.width == 0:
+      self.size = len(vals)
+    assert len(vals) == self.size
+    capacity = max(self.capacity, self.size)
+    column = _newColumn(vals[0], capacity) if self.size else _ObjectColumn(capacity)
+    if not column.extend(vals):
+      column = _ObjectColumn(capacity)
+      column.extend(vals)
+    self._columns.append(column)
+
+  def removeEntity(self, index):
+    """
+      Removes a column from this dataset
+      @ In, index, int, index of entry to remove
+      @ Out, None
+    """
+    assert(abs(index) < self.width)
+    self._columns.pop(index)
+
+  def getData(self):
+    """
+      Returns the data as a 2D np.ndarray of objects (a new array).
+      @ In, None
+      @ Out, getData, np.ndarray, data with shape (size, width)
+    """
+    return self[:, :]
+
+  def getEntity(self, index):
+    """
+      Returns the values of one column.
+      @ In, index, int, index of the column
+      @ Out, getEntity, np.ndarray, (size,) typed array for scalar entities (a view, no copy),
+                        object array of the samples for array entities
+    """
+    return self._columns[index].values(self.size)
+
+  def stackEntity(self, index):
+    """
+      Returns the values of one column stacked as a single array, if all the samples have the same shape.
+      @ In, index, int, index of the column
+      @ Out, stackEntity, np.ndarray or None, (size, *shape) array (a view for array entities), or None if the
+                          samples have different shapes
+    """
+    return self._columns[index].stack(self.size)
+
+  def getFlatEntity(self, index):
+    """
+      Returns the flat storage of a column of array entities.
+      @ In, index, int, index of the column
+      @ Out, getFlatEntity, tuple or None, (values, offsets, shapes) where values[offsets[r]:offsets[r+1]] are the
+                            (flattened) values of sample r and shapes[r] its shape; None if not stored as arrays
+    """
+    column = self._columns[index]
+    if not isinstance(column, _RaggedColumn):
+      return None
+    return column.flat(self.size)
+
+  def _checkRow(self, row):
+    """
+      Checks a row index and converts it to nonnegative.
+      @ In, row, int, row index (negative counts from the end)
+      @ Out, row, int, nonnegative row index
+    """
+    if row < 0:
+      row += self.size
+    if not 0 <= row < self.size:
+      raise IndexError(f'index {row} is out of bounds for cColumnarArray with size {self.size}')
+    return row
+
+def _objectArray(values):
+  """
+    Creates a 1D object array from a list, without numpy unpacking arrays in the list.
+    @ In, values, list, the entries
+    @ Out, array, np.ndarray, object array with len(values) entries
+  """
+  array = np.empty(len(values), dtype=object)
+  for i, val in enumerate(values):
+    array[i] = val
+  return array
+
+def _newColumn(value, capacity):
+  """
+    Creates the column storage appropriate for "value".
+    @ In, value, object, first value to store in the column
+    @ In, capacity, int, initial capacity (number of samples)
+    @ Out, column, object, the new (empty) column
+  """
+  if isinstance(value, np.ndarray):
+    if value.dtype.kind in 'biufcU':
+      return _RaggedColumn(value.dtype, capacity)
+  elif isinstance(value, (bool, int, float, np.bool_, np.number)):
+    return _ScalarColumn(type(value), np.asarray(value).dtype, capacity)
+  return _ObjectColumn(capacity)
+
+def _grow(values, needed):
+  """
+    Grows a buffer (quadrupling its size) to hold at least "needed" entries.
+    @ In, values, np.ndarray, the buffer
+    @ In, needed, int, minimum number of entries
+    @ Out, values, np.ndarray, the same buffer if large enough, otherwise a larger copy
+  """
+  if needed <= len(values):
+    return values
+  new = np.empty(max(4 * len(values), needed), dtype=values.dtype)
+  new[:len(values)] = values
+  return new
+
+class _ObjectColumn(object):
+  """
+    Column of arbitrary objects.
+  """
+  def __init__(self, capacity):
+    """
+      Constructor.
+      @ In, capacity, int, initial capacity
+      @ Out, None
+    """
+    self.size = 0
+    self._values = np.empty(capacity, dtype=object)
+
+  @classmethod
+  def fromColumn(cls, column, size):
+    """
+      Converts another column into an object column.
+      @ In, column, object, the original column
+      @ In, size, int, number of samples stored in the column
+      @ Out, new, _ObjectColumn, the object column
+    """
+    new = cls(max(size, 1) * 4)
+    for r in range(size):
+      new._values[r] = column.get(r)
+    new.size = size
+    return new
+
+  def append(self, value):
+    """
+      Appends a value.
+      @ In, value, object, the value
+      @ Out, append, bool, True (always accepted)
+    """
+    if self.size == len(self._values):
+      self._values = _grow(self._values, self.size + 1)
+    self._values[self.size] = value
+    self.size += 1
+    return True
+
+  def extend(self, values):
+    """
+      Appends several values.
+      @ In, values, list or np.ndarray, the values
+      @ Out, extend, bool, True (always accepted)
+    """
+    for value in values:
+      _ObjectColumn.append(self, value)
+    return True
+
+  def get(self, row):
+    """
+      Gets a value.
+      @ In, row, int, the row
+      @ Out, get, object, the value
+    """
+    return self._values[row]
+
+  def set(self, row, value):
+    """
+      Sets a value.
+      @ In, row, int, the row
+      @ In, value, object, the value
+      @ Out, set, bool, True (always accepted)
+    """
+    self._values[row] = value
+    return True
+
+  def values(self, size):
+    """
+      Gets the values.
+      @ In, size, int, number of rows
+      @ Out, values, np.ndarray, view of the values
+    """
+    return self._values[:size]
+
+  def stack(self, size):
+    """
+      Gets the values stacked into a single array.
+      @ In, size, int, number of rows
+      @ Out, stack, np.ndarray or None, stacked values, None if they have different shapes
+    """
+    shapes = set(np.shape(val) for val in self._values[:size])
+    if len(shapes) != 1:
+      return None
+    return np.stack(list(self._values[:size])) if shapes != {()} else np.array(list(self._values[:size]))
+
+class _ScalarColumn(_ObjectColumn):
+  """
+    Column of scalars of a single numpy-compatible type, stored in a typed buffer.
+  """
+  def __init__(self, pyType, dtype, capacity):
+    """
+      Constructor.
+      @ In, pyType, type, type of the values that are accepted without further checks
+      @ In, dtype, np.dtype, type of the buffer
+      @ In, capacity, int, initial capacity
+      @ Out, None
+    """
+    self.size = 0
+    self._type = pyType
+    self._values = np.empty(capacity, dtype=dtype)
+
+  def _accepts(self, value):
+    """
+      Checks if a value can be stored in the buffer without changing its type.
+      @ In, value, object, the value
+      @ Out, _accepts, bool, True if storable
+    """
+    return type(value) is self._type or isinstance(value, (bool, int, float, np.bool_, np.number)) and np.asarray(value).dtype == self._values.dtype
+
+  def append(self, value):
+    """
+      Appends a value.
+      @ In, value, object, the value
+      @ Out, append, bool, True if accepted, False if it does not fit the column type
+    """
+    if type(value) is not self._type and not self._accepts(value):
+      return False
+    if self.size == len(self._values):
+      self._values = _grow(self._values, self.size + 1)
+    self._values[self.size] = value
+    self.size += 1
+    return True
+
+  def extend(self, values):
+    """
+      Appends several values, if they all fit the column type.
+      @ In, values, list or np.ndarray, the values
+      @ Out, extend, bool, True if accepted, False if any does not fit the column type (nothing is added)
+    """
+    if isinstance(values, np.ndarray) and values.ndim == 1 and values.dtype == self._values.dtype:
+      self._values = _grow(self._values, self.size + len(values))
+      self._values[self.size:self.size + len(values)] = values
+      self.size += len(values)
+      return True
+    if not all(self._accepts(value) for value in values):
+      return False
+    return _ObjectColumn.extend(self, values)
+
+  def set(self, row, value):
+    """
+      Sets a value.
+      @ In, row, int, the row
+      @ In, value, object, the value
+      @ Out, set, bool, True if accepted, False if it does not fit the column type
+    """
+    if not self._accepts(value):
+      return False
+    return _ObjectColumn.set(self, row, value)
+
+  def stack(self, size):
+    """
+      Gets the values stacked into a single array.
+      @ In, size, int, number of rows
+      @ Out, stack, np.ndarray, view of the values
+    """
+    return self._values[:size]
+
+class _RaggedColumn(object):
+  """
+    Column of np.ndarray samples (possibly of different shapes), stored in a contiguous flat buffer.
+  """
+  def __init__(self, dtype, capacity):
+    """
+      Constructor.
+      @ In, dtype, np.dtype, type of the buffer
+      @ In, capacity, int, initial capacity (number of samples)
+      @ Out, None
+    """
+    self.size = 0
+    self._values = np.empty(capacity * 8, dtype=dtype)  # flattened samples, one after the other
+    self._offsets = np.zeros(capacity + 1, dtype=int)     # sample r is in _values[_offsets[r]:_offsets[r+1]]
+    self._shapes = []                                     # shape of each sample
+    self._shape = None                                    # shape of all the samples, if the same (False otherwise)
+
+  def _accepts(self, value):
+    """
+      Checks if a value can be stored in the buffer, changing the buffer type if needed.
+      @ In, value, object, the value
+      @ Out, _accepts, bool, True if storable
+    """
+    if not isinstance(value, np.ndarray):
+      return False
+    if value.dtype != self._values.dtype:
+      if value.dtype.kind not in 'biufcU' or (value.dtype.kind == 'U') != (self._values.dtype.kind == 'U'):
+        return False
+      dtype = np.result_type(self._values.dtype, value.dtype)
+      if dtype != self._values.dtype:
+        self._values = self._values.astype(dtype)
+    return True
+
+  def append(self, value):
+    """
+      Appends a value.
+      @ In, value, object, the value
+      @ Out, append, bool, True if accepted, False if it is not an array compatible with the column
+    """
+    if not self._accepts(value):
+      return False
+    start = self._offsets[self.size]
+    end = start + value.size
+    self._values = _grow(self._values, end)
+    self._values[start:end] = value.ravel()
+    self._offsets = _grow(self._offsets, self.size + 2)
+    self._offsets[self.size + 1] = end
+    self._shapes.append(value.shape)
+    if self._shape is None:
+      self._shape = value.shape
+    elif self._shape is not False and self._shape != value.shape:
+      self._shape = False
+    self.size += 1
+    return True
+
+  def extend(self, values):
+    """
+      Appends several values, if they all fit the column.
+      @ In, values, list or np.ndarray, the values (np.ndarray with one sample per entry of the first dimension,
+                    or sequence of np.ndarray)
+      @ Out, extend, bool, True if accepted, False if any does not fit the column (nothing is added)
+    """
+    if isinstance(values, np.ndarray) and values.ndim > 1 and self._accepts(values):
+      # all the samples have the same shape, copy them at once
+      if not self.size or self._shape == values.shape[1:]:
+        start = self._offsets[self.size]
+        sampleSize = int(np.prod(values.shape[1:]))
+        end = start + sampleSize * len(values)
+        self._values = _grow(self._values, end)
+        self._values[start:end] = values.ravel()
+        self._offsets = _grow(self._offsets, self.size + len(values) + 1)
+        self._offsets[self.size + 1:self.size + len(values) + 1] = start + sampleSize * np.arange(1, len(values) + 1)
+        self._shapes.extend([values.shape[1:]] * len(values))
+        self._shape = values.shape[1:]
+        self.size += len(values)
+        return True
+    if not all(self._accepts(value) for value in values):
+      return False
+    for value in values:
+      self.append(value)
+    return True
+
+  def get(self, row):
+    """
+      Gets a value.
+      @ In, row, int, the row
+      @ Out, get, np.ndarray, the value (a view of the buffer)
+    """
+    return self._values[self._offsets[row]:self._offsets[row + 1]].reshape(self._shapes[row])
+
+  def set(self, row, value):
+    """
+      Sets a value, if it has the same shape as the existing one.
+      @ In, row, int, the row
+      @ In, value, object, the value
+      @ Out, set, bool, True if accepted, False if it can not be stored in place
+    """
+    if not self._accepts(value) or value.shape != self._shapes[row]:
+      return False
+    self._values[self._offsets[row]:self._offsets[row + 1]] = value.ravel()
+    return True
+
+  def values(self, size):
+    """
+      Gets the values.
+      @ In, size, int, number of rows
+      @ Out, values, np.ndarray, object array of the samples
+    """
+    values = np.empty(size, dtype=object)
+    for r in range(size):
+      values[r] = self.get(r)
+    return values
+
+  def stack(self, size):
+    """
+      Gets the values stacked into a single array.
+      @ In, size, int, number of rows
+      @ Out, stack, np.ndarray or None, (size, *shape) view of the values, None if they have different shapes
+    """
+    if self._shape is False:
+      return None
+    shape = self._shape if self._shape is not None else (0,)
+    return self._values[:self._offsets[size]].reshape((size,) + shape)
+
+  def flat(self, size):
+    """
+      Gets the flat storage.
+      @ In, size, int, number of rows
+      @ Out, flat, tuple, (values, offsets, shapes), see cColumnarArray.getFlatEntity
+    """
+    return self._values[:self._offsets[size]], self._offsets[:size + 1], self._shapes[:size]
@@ -0,0 +1,176 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Persistent (on-disk) cache of model evaluations, keyed on the sampled variables
+  and on a signature of the model definition.
+"""
+#External Modules------------------------------------------------------------------------------------
+import os
+import pickle
+import hashlib
+import time
+import tempfile
+from collections import OrderedDict
+import numpy as np
+#External Modules End--------------------------------------------------------------------------------
+
+class EvaluationCache:
+  """
+    Directory of pickled evaluations, one file per entry, named after the hash of
+    the model signature and of the sampled values. Floating point values are rounded to
+    the number of significant digits corresponding to the (relative) tolerance before being hashed.
+    The least recently used entries are evicted when the maximum number of entries or the maximum
+    size of the cache is exceeded.
+  """
+  extension = '.evaluation.pk'
+
+  def __init__(self, directory, signature, maxEntries=None, maxSize=None, tolerance=None):
+    """
+      Constructor.
+      @ In, directory, str, path of the directory of the cache (created if missing)
+      @ In, signature, list, objects (str, bytes or anything with a stable repr) identifying the model definition
+      @ In, maxEntries, int, optional, maximum number of entries (None for no limit)
+      @ In, maxSize, float, optional, maximum size of the cache in bytes (None for no limit)
+      @ In, tolerance, float, optional, relative tolerance of the matching of the float values (None for exact)
+      @ Out, None
+    """
+    self.directory = directory
+    self.maxEntries = maxEntries
+    self.maxSize = maxSize
+    self.tolerance = tolerance
+    self.digits = None if not tolerance else max(1, int(np.ceil(-np.log10(tolerance))))
+    hasher = hashlib.sha256()
+    for item in signature:
+      hasher.update(item if isinstance(item, bytes) else repr(item).encode())
+      hasher.update(b'\0')
+    self.signature = hasher.hexdigest()
+    self.stats = {'hits':0, 'misses':0, 'stored':0, 'evicted':0}
+    os.makedirs(self.directory, exist_ok=True)
+    # entries ordered from the least to the most recently used: {fileName: size}
+    self._entries = OrderedDict()
+    found = []
+    with os.scandir(self.directory) as dirEntries:
+      for entry in dirEntries:
+        if entry.name.endswith(self.extension) and entry.is_file():
+          stat = entry.stat()
+          found.append((stat.st_mtime_ns, entry.name, stat.st_size))
+    for _, name, size in sorted(found):
+      self._entries[name] = size
+    self._size = sum(self._entries.values())
+
+  def __len__(self):
+    """
+      Number of entries in the cache (for all the model signatures).
+      @ In, None
+      @ Out, __len__, int, number of entries
+    """
+    return len(self._entries)
+
+  def _encode(self, value):
+    """
+      Converts a sampled value into its (tolerance-aware) hashable representation.
+      @ In, value, object, the sampled value
+      @ Out, encoded, bytes, the representation
+    """
+    array = np.atleast_1d(np.asarray(value))
+    if array.dtype.kind == 'f':
+      if self.digits is None:
+        return array.astype(float).tobytes()
+      return ','.join(f'{item:.{self.digits - 1}e}' for item in array.astype(float).ravel() + 0.).encode()
+    if array.dtype.kind in 'iub':
+      return array.astype(np.int64).tobytes()
+    return repr(array.tolist()).encode()
+
+  def key(self, sampledVars):
+    """
+      Computes the name of the entry corresponding to the sampled values.
+      @ In, sampledVars, dict, {variable: sampled value}
+      @ Out, key, str, the key (name of the file of the entry)
+    """
+    hasher = hashlib.sha256(self.signature.encode())
+    for var in sorted(sampledVars):
+      hasher.update(var.encode() + b'\0')
+      hasher.update(self._encode(sampledVars[var]) + b'\0')
+    return hasher.hexdigest() + self.extension
+
+  def get(self, key):
+    """
+      Retrieves an evaluation.
+      @ In, key, str, the key (from self.key)
+      @ Out, evaluation, dict, the stored evaluation (None if not found)
+    """
+    evaluation = None
+    if key in self._entries:
+      path = os.path.join(self.directory, key)
+      try:
+        with open(path, 'rb') as cached:
+          evaluation = pickle.load(cached)
+        self._touch(path)
+        self._entries.move_to_end(key)
+      except (OSError, EOFError, pickle.UnpicklingError):
+        # removed or corrupted by somebody else: treat it as a miss
+        self._size -= self._entries.pop(key)
+        evaluation = None
+    if evaluation is None:
+      self.stats['misses'] += 1
+    else:
+      self.stats['hits'] += 1
+    return evaluation
+
+  def put(self, key, evaluation):
+    """
+      Stores an evaluation (atomically, so concurrent readers never see partial entries), then
+      evicts the least recently used entries if the cache is too large.
+      @ In, key, str, the key (from self.key)
+      @ In, evaluation, dict, the evaluation to store
+      @ Out, None
+    """
+    if key in self._entries:
+      return
+    handle, tmpPath = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+    with os.fdopen(handle, 'wb') as tmpFile:
+      pickle.dump(evaluation, tmpFile, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmpPath, os.path.join(self.directory, key))
+    self._touch(os.path.join(self.directory, key))
+    self._entries[key] = os.path.getsize(os.path.join(self.directory, key))
+    self._size += self._entries[key]
+    self.stats['stored'] += 1
+    self._evict()
+
+  def _touch(self, path):
+    """
+      Marks an entry as used now; the modification times order the entries when the cache is reopened.
+      The time is set explicitly, since the file system clock may be too coarse to order consecutive uses.
+      @ In, path, str, the path of the entry
+      @ Out, None
+    """
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
+
+  def _evict(self):
+    """
+      Removes the least recently used entries until the cache respects its limits.
+      The most recent entry is always kept.
+      @ In, None
+      @ Out, None
+    """
+    while len(self._entries) > 1 and ((self.maxEntries is not None and len(self._entries) > self.maxEntries) or
+                                      (self.maxSize is not None and self._size > self.maxSize)):
+      name, size = self._entries.popitem(last=False)
+      self._size -= size
+      try:
+        os.remove(os.path.join(self.directory, name))
+      except FileNotFoundError:
+        pass
+      self.stats['evicted'] += 1
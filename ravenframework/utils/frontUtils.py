@@ -69,30 +69,57 @@ def nonDominatedFrontier(data, returnMask, minMask=None):
   else:
     return isEfficient
 
-def rankNonDominatedFrontiers(data):
+def rankNonDominatedFrontiers(data, blockSize=128):
   """
-    This method ranks the non dominated fronts by omitting thr first front from the data
-    and searching the remaining data for a new one recursively.
+    This method ranks the non dominated fronts, as if omitting the first front from the data
+    and searching the remaining data for a new one recursively (as by nonDominatedFrontier,
+    a point equal to a point with a lower index is ranked after it).
+    The points are sorted lexicographically (ties by index), so that the points dominating a point
+    precede it: the rank of a point is one more than the highest rank of the preceding points dominating it.
+    The dominance is checked for blocks of points at once.
     @ In, data, np.array, data matrix (nPoints, nObjectives) containing the multi-objective
                           evaluations of each point/individual, element (i,j)
                           means jth objective function at the ith point/individual
+    @ In, blockSize, int, optional, number of points whose dominance is checked at once
     @ out, nonDominatedRank, list, a list of length nPoints that has the ranking
                                   of the front passing through each point
   """
-  nonDominatedRank = np.zeros(data.shape[0],dtype=int)
-  rank = 0
-  indicesDominated = list(np.arange(data.shape[0]))
-  indicesNonDominated = []
-  rawData = data
-  while np.shape(data)[0] > 0:
-    rank += 1
-    indicesNonDominated = list(nonDominatedFrontier(data, False))
-    if rank > 1:
-      for i in range(len(indicesNonDominated)):
-        indicesNonDominated[i] = indicesDominated[indicesNonDominated[i]]
-    indicesDominated = list(set(indicesDominated)-set(indicesNonDominated))
-    data = rawData[indicesDominated]
-    nonDominatedRank[indicesNonDominated] = rank
+  data = np.asarray(data)
+  nPoints, nObjectives = data.shape
+  # np.lexsort is stable and sorts by the last key first
+  order = np.lexsort(data.T[::-1])
+  sortedData = data[order]
+  sortedRank = np.zeros(nPoints, dtype=int)
+  for start in range(0, nPoints, blockSize):
+    end = min(start + blockSize, nPoints)
+    block = sortedData[start:end]
+    # highest rank of the dominating points of the previous blocks, grouped by rank
+    baseRank = np.zeros(end - start, dtype=int)
+    if start > 0:
+      byRank = np.argsort(sortedRank[:start], kind='stable')
+      previousRanks = sortedRank[byRank]
+      previous = sortedData[byRank]
+      dominated = np.ones((end - start, start), dtype=bool)
+      for obj in range(nObjectives):
+        dominated &= previous[:, obj] <= block[:, obj, np.newaxis]
+      groupStarts = np.flatnonzero(np.r_[True, previousRanks[1:] != previousRanks[:-1]])
+      dominatedByRank = np.logical_or.reduceat(dominated, groupStarts, axis=1)
+      highest = dominatedByRank.shape[1] - 1 - np.argmax(dominatedByRank[:, ::-1], axis=1)
+      baseRank = np.where(dominatedByRank.any(axis=1), previousRanks[groupStarts][highest], 0)
+    # dominating points in the block (the preceding ones), iterating the ranks up to the longest chain
+    inner = np.ones((end - start, end - start), dtype=bool)
+    for obj in range(nObjectives):
+      inner &= block[:, obj] <= block[:, obj, np.newaxis]
+    inner = np.tril(inner, -1)
+    blockRank = baseRank + 1
+    while True:
+      newRank = np.maximum(baseRank, np.max(np.where(inner, blockRank, 0), axis=1)) + 1
+      if np.array_equal(newRank, blockRank):
+        break
+      blockRank = newRank
+    sortedRank[start:end] = blockRank
+  nonDominatedRank = np.zeros(nPoints, dtype=int)
+  nonDominatedRank[order] = sortedRank
   nonDominatedRank = list(nonDominatedRank)
   return nonDominatedRank
 
@@ -105,16 +132,19 @@ def crowdingDistance(rank, popSize, objectives):
     @ Out, crowdDist, np.array, array of crowding distances
   """
   crowdDist = np.zeros(popSize)
+  rank = np.asarray(rank)
   fronts = np.unique(rank)
   fronts = fronts[fronts!=np.inf]
 
   for f in range(len(fronts)):
-    front = np.where(np.asarray(rank)==f+1)[0]
-    fMax = np.max(objectives[front, :], axis=0)
-    fMin = np.min(objectives[front, :], axis=0)
+    front = np.where(rank==f+1)[0]
+    frontObjectives = objectives[front, :]
+    fMax = np.max(frontObjectives, axis=0)
+    fMin = np.min(frontObjectives, axis=0)
     for obj in range(np.shape(objectives)[1]):
-      sortedRank = np.argsort(objectives[front, obj])
+      sortedRank = np.argsort(frontObjectives[:, obj])
+      sortedValues = frontObjectives[sortedRank, obj]
+      # the extremes have an infinite distance, the others the (normalized) distance between their neighbors
       crowdDist[front[sortedRank[0]]] = crowdDist[front[sortedRank[-1]]] = np.inf
-      for i in range(1, len(front)-1):
-        crowdDist[front[sortedRank[i]]] = crowdDist[front[sortedRank[i]]] + (objectives[front[sortedRank[i+1]], obj] - objectives[front[sortedRank[i-1]], obj]) / (fMax[obj]-fMin[obj])
+      crowdDist[front[sortedRank[1:-1]]] += (sortedValues[2:] - sortedValues[:-2]) / (fMax[obj]-fMin[obj])
   return crowdDist
@@ -55,18 +55,25 @@ class BoxMullerGenerator:
       @ In, engine, instance, optional, random number generator
       @ Out, values, np.ndarray, random value
     """
-    values = np.zeros(size)
     with self.__queueLock:
-      queueLength = len(self.queue[engine])
-      if queueLength < size:
-        #calculate new values
-        # We want to add only as many new values as we need to the queue, but Box Muller does them in pairs.
-        # Asking for ceil((size - len(queue)) / 2) evaluations of Box Muller will give us enough values to
-        # satisfy the request.
-        genSize = np.ceil((size - queueLength) / 2).astype(int)
-        # Using extendleft instead of extend so that the values are added behind the existing values in the deque.
-        self.queue[engine].extendleft(self.createSamples(size=genSize, engine=engine))
-    values = np.array([self.queue[engine].pop() for _ in range(size)])
+      queue = self.queue[engine]
+      queueLength = len(queue)
+      if queueLength >= size:
+        return np.array([queue.pop() for _ in range(size)])
+      # the queued values come first
+      values = np.empty(size)
+      values[:queueLength] = [queue.pop() for _ in range(queueLength)]
+      #calculate new values
+      # We want to generate only as many new values as we need, but Box Muller does them in pairs.
+      # Asking for ceil((size - len(queue)) / 2) evaluations of Box Muller will give us enough values to
+      # satisfy the request.
+      genSize = np.ceil((size - queueLength) / 2).astype(int)
+      # The new values are used directly rather than popped one by one from the queue (in the same order),
+      # only the one left over (if any) is queued.
+      samples = np.atleast_1d(self.createSamples(size=genSize, engine=engine))
+      values[queueLength:] = samples[:size - queueLength]
+      # Using extendleft so that the left over values are popped in order.
+      queue.extendleft(samples[size - queueLength:])
     return values
 
   def createSamples(self, size, engine=None):
@@ -0,0 +1,115 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Spatial index used to find realizations by value (e.g. restart matching) without
+  scanning all the stored realizations.
+"""
+#External Modules------------------------------------------------------------------------------------
+import numpy as np
+from scipy.spatial import cKDTree
+#External Modules End--------------------------------------------------------------------------------
+
+class RealizationIndex:
+  """
+    Incrementally maintained index over the (scalar, numeric) values of a set of variables.
+    Rows are identified by their position (0, 1, 2, ...) in the order they are added.
+    The bulk of the rows is stored in a KD-tree, while recently added rows are kept in a "tail" that is
+    searched by brute force until it is large enough to justify rebuilding the tree (lazily, on query).
+    The index only provides candidates: a superset of the rows within the requested distance, that
+    the caller is expected to verify with its own (exact) matching criterion.
+  """
+  def __init__(self, variables, rebuildFraction=0.1, minTail=256):
+    """
+      Constructor.
+      @ In, variables, tuple(str), names of the indexed variables
+      @ In, rebuildFraction, float, optional, the tree is rebuilt when the tail is larger than this fraction of the tree
+      @ In, minTail, int, optional, the tree is never rebuilt for tails smaller than this
+      @ Out, None
+    """
+    self.variables = tuple(variables)
+    self.rebuildFraction = rebuildFraction
+    self.minTail = minTail
+    self._points = np.zeros((0, len(self.variables))) # values of the rows covered by the tree, one row per realization
+    self._tail = []                                  # chunks of values of the rows added after the tree was built
+    self._tailSize = 0                               # number of rows in the tail
+    self._tree = None                                # KD-tree over the (finite) rows in self._points
+    self._treeRows = np.zeros(0, dtype=int)          # position of the rows in the tree
+    self._nonFinite = np.zeros(0, dtype=int)         # rows covered by the tree range, but with NaN/inf (always candidates)
+    self._factors = np.ones(len(self.variables))     # per-variable scaling used in the tree
+
+  def __len__(self):
+    """
+      Number of indexed rows.
+      @ In, None
+      @ Out, __len__, int, number of rows
+    """
+    return len(self._points) + self._tailSize
+
+  def extend(self, values):
+    """
+      Adds rows to the index.
+      @ In, values, np.ndarray, (rows, len(self.variables)) float array of new values
+      @ Out, None
+    """
+    values = np.asarray(values, dtype=float).reshape(-1, len(self.variables))
+    self._tail.append(values)
+    self._tailSize += len(values)
+
+  def candidates(self, center, radius):
+    """
+      Finds the rows that may be within "radius" of "center" (component-wise, i.e. Chebyshev distance).
+      @ In, center, np.ndarray, (len(self.variables),) values to search around
+      @ In, radius, np.ndarray, (len(self.variables),) maximum distance for each variable
+      @ Out, rows, np.ndarray, sorted positions of the candidate rows
+    """
+    center = np.asarray(center, dtype=float)
+    radius = np.asarray(radius, dtype=float)
+    if self._tailSize > max(self.minTail, self.rebuildFraction * len(self._points)):
+      self._rebuild()
+    found = [self._nonFinite]
+    if self._tree is not None:
+      # the tree is isotropic, so use the largest scaled radius and let the caller filter
+      scaledRadius = np.max(radius / self._factors)
+      inTree = self._tree.query_ball_point(center / self._factors, scaledRadius, p=np.inf)
+      found.append(self._treeRows[np.asarray(inTree, dtype=int)])
+    if self._tailSize:
+      if len(self._tail) > 1:
+        self._tail = [np.concatenate(self._tail, axis=0)]
+      tail = self._tail[0]
+      # NaN/inf in the tail are kept as candidates as well
+      near = np.all(np.abs(tail - center) <= radius, axis=1) | np.logical_not(np.all(np.isfinite(tail), axis=1))
+      found.append(np.nonzero(near)[0] + len(self._points))
+    rows = np.unique(np.concatenate(found))
+    return rows
+
+  def _rebuild(self):
+    """
+      Moves the tail into the tree and rebuilds the KD-tree over all the rows.
+      @ In, None
+      @ Out, None
+    """
+    self._points = np.concatenate([self._points] + self._tail, axis=0)
+    self._tail = []
+    self._tailSize = 0
+    finite = np.all(np.isfinite(self._points), axis=1)
+    self._treeRows = np.nonzero(finite)[0]
+    self._nonFinite = np.nonzero(np.logical_not(finite))[0]
+    points = self._points[self._treeRows]
+    if len(points):
+      # scale each variable to its spread, such that the tree is balanced across variables
+      spread = np.max(points, axis=0) - np.min(points, axis=0)
+      self._factors = np.where(spread > 0, spread, 1.0)
+      self._tree = cKDTree(points / self._factors)
+    else:
+      self._tree = None
@@ -0,0 +1,298 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Mergeable accumulators used to compute statistics on data that arrive in chunks (streaming).
+  Each accumulator can be updated with a chunk of samples and merged with another accumulator
+  of the same kind (e.g. computed on another chunk, batch or worker), so that the statistics of
+  the whole data are obtained without storing the samples.
+  References:
+    P. Pebay, "Formulas for Robust, One-Pass Parallel Computation of Covariances and Arbitrary-Order
+    Statistical Moments", Sandia Report SAND2008-6212 (2008)
+    T. Dunning, O. Ertl, "Computing Extremely Accurate Quantiles Using t-Digests", arXiv:1902.04023 (2019)
+"""
+#External Modules------------------------------------------------------------------------------------
+import numpy as np
+#External Modules End--------------------------------------------------------------------------------
+
+def _chunkWeights(weights, values):
+  """
+    Provides the weights of a chunk of samples, broadcastable against the values.
+    @ In, weights, np.ndarray or None, the weights (None for unit weights)
+    @ In, values, np.ndarray, (samples, ...) values of the chunk
+    @ Out, weights, np.ndarray, the weights, with as many dimensions as the values
+  """
+  if weights is None:
+    return np.ones((values.shape[0],) + (1,) * (values.ndim - 1))
+  weights = np.asarray(weights, dtype=float)
+  if weights.ndim == 1:
+    weights = weights.reshape((-1,) + (1,) * (values.ndim - 1))
+  return weights
+
+class WeightedMoments:
+  """
+    Weighted central moments (up to the fourth order), extrema and sums of the powers of the weights,
+    computed independently for each entry of arrays of values with a given shape.
+    The moments are stored as sums of weighted powers of the deviations from the mean (not normalized),
+    such that the accumulators can be merged exactly (Pebay formulas).
+  """
+  def __init__(self, shape=()):
+    """
+      Constructor.
+      @ In, shape, tuple, optional, shape of the values of a single sample
+      @ Out, None
+    """
+    self.shape = tuple(shape)
+    self.count = 0                          # number of samples
+    self.wSums = np.zeros((4,) + self.shape) # sums of the 1st to 4th power of the weights
+    self.mean = np.zeros(self.shape)        # weighted mean
+    self.m2 = np.zeros(self.shape)          # sum of w * (x - mean)^2
+    self.m3 = np.zeros(self.shape)          # sum of w * (x - mean)^3
+    self.m4 = np.zeros(self.shape)          # sum of w * (x - mean)^4
+    self.minimum = np.full(self.shape, np.inf)
+    self.maximum = np.full(self.shape, -np.inf)
+
+  def update(self, values, weights=None):
+    """
+      Adds a chunk of samples.
+      @ In, values, np.ndarray, (samples, *shape) values
+      @ In, weights, np.ndarray, optional, (samples,) or (samples, *shape) weights, unit weights if not given
+      @ Out, None
+    """
+    values = np.asarray(values, dtype=float)
+    if values.shape[0] == 0:
+      return
+    chunk = WeightedMoments(self.shape)
+    weights = _chunkWeights(weights, values)
+    wSum = np.broadcast_to(weights.sum(axis=0), self.shape)
+    chunk.count = values.shape[0]
+    chunk.wSums = np.array([np.broadcast_to((weights**p).sum(axis=0), self.shape) for p in range(1, 5)])
+    chunk.mean = (weights * values).sum(axis=0) / wSum
+    deviation = values - chunk.mean
+    squared = weights * deviation**2
+    chunk.m2 = squared.sum(axis=0)
+    chunk.m3 = (squared * deviation).sum(axis=0)
+    chunk.m4 = (squared * deviation**2).sum(axis=0)
+    chunk.minimum = values.min(axis=0)
+    chunk.maximum = values.max(axis=0)
+    self.merge(chunk)
+
+  def merge(self, other):
+    """
+      Merges the samples accumulated by another accumulator into this one.
+      @ In, other, WeightedMoments, the other accumulator
+      @ Out, None
+    """
+    if other.count == 0:
+      return
+    if self.count == 0:
+      self.count = other.count
+      self.wSums = np.array(other.wSums)
+      self.mean, self.m2, self.m3, self.m4 = np.array(other.mean), np.array(other.m2), np.array(other.m3), np.array(other.m4)
+      self.minimum, self.maximum = np.array(other.minimum), np.array(other.maximum)
+      return
+    wA, wB = self.wSums[0], other.wSums[0]
+    w = wA + wB
+    delta = other.mean - self.mean
+    m2 = self.m2 + other.m2 + delta**2 * wA * wB / w
+    m3 = self.m3 + other.m3 + delta**3 * wA * wB * (wA - wB) / w**2 \
+         + 3.0 * delta * (wA * other.m2 - wB * self.m2) / w
+    m4 = self.m4 + other.m4 + delta**4 * wA * wB * (wA**2 - wA * wB + wB**2) / w**3 \
+         + 6.0 * delta**2 * (wA**2 * other.m2 + wB**2 * self.m2) / w**2 \
+         + 4.0 * delta * (wA * other.m3 - wB * self.m3) / w
+    self.mean = self.mean + delta * wB / w
+    self.m2, self.m3, self.m4 = m2, m3, m4
+    self.wSums = self.wSums + other.wSums
+    self.count += other.count
+    self.minimum = np.minimum(self.minimum, other.minimum)
+    self.maximum = np.maximum(self.maximum, other.maximum)
+
+class WeightedCoMoments:
+  """
+    Weighted co-moment matrix (sum of w * (x - mean)(y - mean)) of vectors of variables, with an optional
+    leading shape (e.g. one matrix for each time step). The weights are the same for all the variables.
+  """
+  def __init__(self, size, shape=()):
+    """
+      Constructor.
+      @ In, size, int, number of variables
+      @ In, shape, tuple, optional, leading shape of the values of a single sample
+      @ Out, None
+    """
+    self.size = size
+    self.shape = tuple(shape)
+    self.count = 0                                       # number of samples
+    self.wSum = 0.0                                      # sum of the weights
+    self.w2Sum = 0.0                                     # sum of the squared weights
+    self.mean = np.zeros(self.shape + (size,))           # weighted mean
+    self.comoment = np.zeros(self.shape + (size, size))  # sum of w * (x - mean)(y - mean)
+
+  def update(self, values, weights=None):
+    """
+      Adds a chunk of samples.
+      @ In, values, np.ndarray, (samples, *shape, size) values
+      @ In, weights, np.ndarray, optional, (samples,) weights, unit weights if not given
+      @ Out, None
+    """
+    values = np.asarray(values, dtype=float)
+    if values.shape[0] == 0:
+      return
+    chunk = WeightedCoMoments(self.size, self.shape)
+    weights = np.ones(values.shape[0]) if weights is None else np.asarray(weights, dtype=float).ravel()
+    chunk.count = values.shape[0]
+    chunk.wSum = weights.sum()
+    chunk.w2Sum = (weights**2).sum()
+    chunk.mean = np.tensordot(weights, values, axes=(0, 0)) / chunk.wSum
+    deviation = values - chunk.mean
+    weighted = deviation * weights.reshape((-1,) + (1,) * (values.ndim - 1))
+    chunk.comoment = np.einsum('n...i,n...j->...ij', weighted, deviation)
+    self.merge(chunk)
+
+  def merge(self, other):
+    """
+      Merges the samples accumulated by another accumulator into this one.
+      @ In, other, WeightedCoMoments, the other accumulator
+      @ Out, None
+    """
+    if other.count == 0:
+      return
+    if self.count == 0:
+      self.count, self.wSum, self.w2Sum = other.count, other.wSum, other.w2Sum
+      self.mean, self.comoment = np.array(other.mean), np.array(other.comoment)
+      return
+    w = self.wSum + other.wSum
+    delta = other.mean - self.mean
+    self.comoment = self.comoment + other.comoment + (self.wSum * other.wSum / w) * delta[..., :, None] * delta[..., None, :]
+    self.mean = self.mean + delta * other.wSum / w
+    self.wSum = w
+    self.w2Sum += other.w2Sum
+    self.count += other.count
+
+  def secondMoment(self):
+    """
+      Provides the (not centered) weighted second moment matrix, sum of w * x * y.
+      @ In, None
+      @ Out, secondMoment, np.ndarray, (*shape, size, size) matrix
+    """
+    secondMoment = self.comoment + self.wSum * self.mean[..., :, None] * self.mean[..., None, :]
+    return secondMoment
+
+class TDigest:
+  """
+    Merging t-digest sketch of a weighted distribution of values, used to estimate its quantiles.
+    The samples are clustered in centroids whose size is limited by the scale function
+    k(q) = compression / (2 pi) * asin(2q - 1), such that the centroids are small (and the estimates accurate)
+    in the tails of the distribution. The memory is O(compression), whatever the number of samples.
+  """
+  def __init__(self, compression=200):
+    """
+      Constructor.
+      @ In, compression, float, optional, accuracy parameter (number of centroids is about compression/2 to compression)
+      @ Out, None
+    """
+    self.compression = compression
+    self.means = np.zeros(0)     # means of the centroids (sorted)
+    self.weights = np.zeros(0)   # weights of the centroids
+    self.minimum = np.inf
+    self.maximum = -np.inf
+    self._bufferValues = []      # chunks of samples not yet merged in the centroids
+    self._bufferWeights = []
+    self._bufferSize = 0
+
+  def update(self, values, weights=None):
+    """
+      Adds a chunk of samples.
+      @ In, values, np.ndarray, (samples,) values
+      @ In, weights, np.ndarray, optional, (samples,) weights, unit weights if not given
+      @ Out, None
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    if len(values) == 0:
+      return
+    weights = np.ones(len(values)) if weights is None else np.asarray(weights, dtype=float).ravel()
+    # samples with no weight do not contribute to the distribution
+    positive = weights > 0
+    if not positive.all():
+      values, weights = values[positive], weights[positive]
+      if len(values) == 0:
+        return
+    self._bufferValues.append(values)
+    self._bufferWeights.append(weights)
+    self._bufferSize += len(values)
+    self.minimum = min(self.minimum, values.min())
+    self.maximum = max(self.maximum, values.max())
+    if self._bufferSize > 5 * self.compression:
+      self._compress()
+
+  def merge(self, other):
+    """
+      Merges the samples accumulated by another sketch into this one.
+      @ In, other, TDigest, the other sketch
+      @ Out, None
+    """
+    other._compress()
+    if len(other.means):
+      self._bufferValues.append(other.means)
+      self._bufferWeights.append(other.weights)
+      self._bufferSize += len(other.means)
+      self.minimum = min(self.minimum, other.minimum)
+      self.maximum = max(self.maximum, other.maximum)
+      self._compress()
+
+  def totalWeight(self):
+    """
+      Provides the total weight of the accumulated samples.
+      @ In, None
+      @ Out, totalWeight, float, the sum of the weights
+    """
+    self._compress()
+    totalWeight = self.weights.sum()
+    return totalWeight
+
+  def quantile(self, q):
+    """
+      Estimates the quantiles of the distribution.
+      @ In, q, float or np.ndarray, the quantile(s), in [0, 1]
+      @ Out, quantile, float or np.ndarray, the estimated quantile(s)
+    """
+    self._compress()
+    if len(self.means) == 0:
+      return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+    total = self.weights.sum()
+    # the centroids are placed at the center of their weight, the extrema at the ends
+    centers = (np.cumsum(self.weights) - 0.5 * self.weights) / total
+    positions = np.concatenate(([0.0], centers, [1.0]))
+    values = np.concatenate(([self.minimum], self.means, [self.maximum]))
+    quantile = np.interp(q, positions, values)
+    return quantile
+
+  def _compress(self):
+    """
+      Merges the buffered samples in the centroids.
+      @ In, None
+      @ Out, None
+    """
+    if not self._bufferSize:
+      return
+    means = np.concatenate([self.means] + self._bufferValues)
+    weights = np.concatenate([self.weights] + self._bufferWeights)
+    self._bufferValues, self._bufferWeights, self._bufferSize = [], [], 0
+    order = np.argsort(means)
+    means, weights = means[order], weights[order]
+    total = weights.sum()
+    # scale function at the center of each point: points with the same integer part are merged
+    q = np.clip((np.cumsum(weights) - 0.5 * weights) / total, 0.0, 1.0)
+    k = np.floor(self.compression / (2.0 * np.pi) * np.arcsin(2.0 * q - 1.0))
+    starts = np.concatenate(([0], np.nonzero(np.diff(k))[0] + 1))
+    self.weights = np.add.reduceat(weights, starts)
+    self.means = np.add.reduceat(weights * means, starts) / self.weights
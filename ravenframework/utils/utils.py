@@ -47,8 +47,8 @@ try:
   import enum
   #Enum of the parallel libraries we support
   #Note that shared is use no parallel lib, and distributed is choose one
-  # and use it.
-  ParallelLibEnum = enum.Enum('ParallelLibEnum', ['dask','ray','shared','distributed'])
+  # and use it. process is a pool of local processes (no library needed).
+  ParallelLibEnum = enum.Enum('ParallelLibEnum', ['dask','ray','shared','distributed','process'])
 except ImportError:
   ParallelLibEnum = "ParallelLibEnum is not available without enum"
 
@@ -186,6 +186,45 @@ def removeFile(pathAndFileName):
   if os.path.isfile(pathAndFileName):
     os.remove(pathAndFileName)
 
+def stageFile(source, destinationDir, mode='copy'):
+  """
+    Method to stage a file into a directory, by copying it or by linking it to the source.
+    Linked files share the content with the source, so they must not be modified in place.
+    If the file cannot be linked (e.g. different file systems, no reflink support), it is copied.
+    An existing file in the destination is removed first, such that a file previously linked there
+    is not written through.
+    @ In, source, string, path of the file to stage
+    @ In, destinationDir, string, directory where the file is staged
+    @ In, mode, string, optional, one of 'copy', 'link' (hard link), 'reflink' (copy-on-write clone), 'symlink'
+    @ Out, staged, string, the way the file got staged ('copy', 'link', 'reflink' or 'symlink')
+    @ Out, bytesWritten, int, number of bytes of file content written
+  """
+  destination = os.path.join(destinationDir, os.path.basename(source))
+  if os.path.abspath(destination) == os.path.abspath(source):
+    return 'copy', 0
+  if os.path.lexists(destination) and not os.path.isdir(destination):
+    os.remove(destination)
+  try:
+    if mode == 'link':
+      os.link(source, destination)
+      return mode, 0
+    if mode == 'symlink':
+      os.symlink(os.path.abspath(source), destination)
+      return mode, 0
+    if mode == 'reflink':
+      import fcntl
+      ficlone = 0x40049409 # FICLONE ioctl request (Linux)
+      with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        fcntl.ioctl(dst.fileno(), ficlone, src.fileno())
+      shutil.copymode(source, destination)
+      return mode, 0
+  except (OSError, ImportError):
+    # fall back to a copy
+    if os.path.lexists(destination):
+      os.remove(destination)
+  shutil.copy(source, destination)
+  return 'copy', os.path.getsize(destination)
+
 def removeDir(strPath):
   """
     Method to remove a directory.
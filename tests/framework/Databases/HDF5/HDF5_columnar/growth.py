@@ -0,0 +1,29 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Histories of different lengths, to test the storage of ragged data in the databases
+"""
+import numpy as np
+
+def run(self, Input):
+  """
+    Computes the histories
+    @ In, self, object, the external model container
+    @ In, Input, dict, the sampled variables
+    @ Out, None
+  """
+  length = 2 + int(10 * self.x)
+  self.time = np.linspace(0., 1., length)
+  self.y = self.x * np.exp(self.rate * self.time)
+  self.yMax = float(self.y[-1])
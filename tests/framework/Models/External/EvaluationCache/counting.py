@@ -0,0 +1,33 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#*******************************************
+#* ExternalModule counting its evaluations *
+#*******************************************
+#
+# Returns the sum of the inputs and the number of times the model has been actually evaluated,
+#     which reveals the evaluations taken from the evaluation cache.
+#
+calls = 0
+
+def run(self, Input):
+  """
+    Evaluates the model
+    @ In, self, object, the external model object
+    @ In, Input, dict, the sampled variables
+    @ Out, None
+  """
+  global calls
+  calls += 1
+  self.ans = self.x + self.y
+  self.evaluation = calls
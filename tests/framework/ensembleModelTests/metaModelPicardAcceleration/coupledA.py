@@ -0,0 +1,27 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  First model of a slowly converging coupled (non-linear) system, used to test the
+  acceleration of the Picard's iterations of the EnsembleModel
+"""
+import numpy as np
+
+def run(self, Input):
+  """
+    Computes the "y" responses from the sampled "p" and the "x" fed back by coupledB
+    @ In, Input, dict, the inputs
+    @ Out, None
+  """
+  self.y1 = self.p + 0.9 * np.tanh(self.x1) - 0.2 * self.x2
+  self.y2 = 0.5 * np.cos(self.x1) + 0.7 * self.x2
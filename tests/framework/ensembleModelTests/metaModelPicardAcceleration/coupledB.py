@@ -0,0 +1,26 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Second model of a slowly converging coupled (non-linear) system, used to test the
+  acceleration of the Picard's iterations of the EnsembleModel
+"""
+
+def run(self, Input):
+  """
+    Computes the "x" responses (fed back to coupledA) from the "y" computed by coupledA
+    @ In, Input, dict, the inputs
+    @ Out, None
+  """
+  self.x1 = 0.95 * self.y1
+  self.x2 = 0.9 * self.y2
@@ -821,6 +821,103 @@ os.remove(csvname+'_0.csv')
 os.remove(csvname+'_1.csv')
 os.remove(csvname+'.xml')
 
+######################################
+#          ON-DISK STORAGE           #
+######################################
+# the same histories, kept in memory and stored on disk by chunks of two realizations
+def makeStorageHistorySet(storage):
+  """
+    Creates a HistorySet with the given storage node
+    @ In, storage, xml.etree.ElementTree.Element, the storage node (None for the default)
+    @ Out, data, HistorySet, the data object
+  """
+  xml = createElement('HistorySet',attrib={'name':'storage'})
+  xml.append(createElement('Input',text='a,b'))
+  xml.append(createElement('Output',text='x,y'))
+  options = createElement('options')
+  options.append(createElement('pivotParameter',text='time'))
+  xml.append(options)
+  if storage is not None:
+    xml.append(storage)
+  data = DataObjects.HistorySet()
+  data.messageHandler = mh
+  data._readMoreXML(xml)
+  data.addExpectedMeta(['prefix'])
+  return data
+
+inMemory = makeStorageHistorySet(None)
+onDisk = makeStorageHistorySet(createElement('storage',attrib={'chunkSize':'2','directory':'HSStorageUnitTest'},text='netCDF'))
+checkSame('Storage type',onDisk.storage,'netCDF')
+# count the concatenations of the chunks, which are built only when the data are read
+xrConcat = xr.concat
+concatCalls = []
+def countConcat(*args, **kwargs):
+  """
+    Counts the calls to xr.concat
+    @ In, args, list, the positional arguments of xr.concat
+    @ In, kwargs, dict, the keyword arguments of xr.concat
+    @ Out, concat, xr.Dataset, the concatenated data
+  """
+  concatCalls.append(len(args[0]))
+  return xrConcat(*args, **kwargs)
+xr.concat = countConcat
+rng = np.random.default_rng(42)
+storageRlzs = []
+for r in range(7):
+  steps = 5 if r % 3 == 0 else 4
+  rlz = {'a':np.array([float(r)]),
+         'b':np.array([2.*r]),
+         'x':rng.random(steps),
+         'y':rng.random(steps),
+         'time':np.arange(steps, dtype=float),
+         'prefix':np.array(['p{}'.format(r)])}
+  storageRlzs.append(rlz)
+  inMemory.addRealization(dict(rlz))
+  onDisk.addRealization(dict(rlz))
+# every second realization is written to disk, the last one is still collected
+checkSame('Storage chunks',len(onDisk._chunkData),3)
+checkSame('Storage collector',len(onDisk._collector),1)
+checkSame('Storage size',len(onDisk),7)
+checkSame('Storage concat when collecting',concatCalls,[])
+checkSame('Storage files',len(os.listdir(os.path.join('HSStorageUnitTest',os.listdir('HSStorageUnitTest')[0]))),3)
+checkRlz('Storage rlz on disk',onDisk.realization(index=3),storageRlzs[3],skip=['_indexMap'])
+# the three chunks are concatenated once, the collected realization is not written to disk
+checkSame('Storage concat on read',concatCalls,[3])
+checkRlz('Storage rlz collected',onDisk.realization(index=6),storageRlzs[6],skip=['_indexMap'])
+checkRlz('Storage rlz match',onDisk.realization(matchDict={'a':4.0})[1],storageRlzs[4],skip=['_indexMap'])
+diskData = onDisk.asDataset()
+# the last realization is written to disk, then the four chunks are concatenated once
+onDisk.asDataset()
+checkSame('Storage concat on next reads',concatCalls,[3,4])
+xr.concat = xrConcat
+checkTrue('Storage lazy',diskData['x'].chunks is not None)
+checkTrue('Storage dataset',inMemory.asDataset().equals(diskData.compute()))
+for var in ['a','b','x','y']:
+  checkFloat('Storage scaling mean {}'.format(var),onDisk._scaleFactors[var][0],inMemory._scaleFactors[var][0],tol=1e-12)
+  checkFloat('Storage scaling std {}'.format(var),onDisk._scaleFactors[var][1],inMemory._scaleFactors[var][1],tol=1e-12)
+# CSV written chunk by chunk
+inMemory.write('HSStorageMemory',style='CSV')
+onDisk.write('HSStorageDisk',style='CSV')
+for suffix in ['_{}.csv'.format(r) for r in range(7)] + ['.xml']:
+  checkSame('Storage CSV{}'.format(suffix),open('HSStorageDisk'+suffix,'r').read(),open('HSStorageMemory'+suffix,'r').read())
+  os.remove('HSStorageDisk'+suffix)
+  os.remove('HSStorageMemory'+suffix)
+os.remove('HSStorageDisk.csv')
+os.remove('HSStorageMemory.csv')
+# NetCDF, loaded lazily
+onDisk.write('HSStorageUnitTest.nc',style='netCDF')
+loaded = makeStorageHistorySet(createElement('storage',attrib={'chunkSize':'3','directory':'HSStorageUnitTest'},text='netCDF'))
+loaded.load('HSStorageUnitTest.nc',style='netCDF')
+checkSame('Storage NetCDF chunks',loaded.asDataset()['x'].chunks[0],(3,3,1))
+checkTrue('Storage NetCDF dataset',inMemory.asDataset().equals(loaded.asDataset().compute()))
+checkRlz('Storage NetCDF rlz',loaded.realization(index=5),storageRlzs[5],skip=['_indexMap'])
+loaded.reset()
+os.remove('HSStorageUnitTest.nc')
+# the chunk files are removed with the data
+onDisk.reset()
+checkSame('Storage reset',os.listdir('HSStorageUnitTest'),[])
+os.rmdir('HSStorageUnitTest')
+
 print(results)
 
 sys.exit(results["fail"])
@@ -608,6 +608,65 @@ data.setSelectiveOutput('operator','mean')
 data.addRealization(rlz0)
 checkRlz('PointSet selective default',data.realization(index=3),{'a':0.5,'x':1.34})
 
+######################################
+#   MATCHING WITH MANY REALIZATIONS  #
+######################################
+# realizations are found through the match index, both in the data and in the collector
+data = DataObjects.PointSet()
+xml = createElement('PointSet',attrib={'name':'test'})
+xml.append(createElement('Input',text='a,b'))
+xml.append(createElement('Output',text='x'))
+data._readMoreXML(xml)
+data.messageHandler = mh
+values = np.random.default_rng(42).random((600, 3))
+for i in range(400):
+  rlz = {'a': values[i, 0], 'b': values[i, 1], 'x': values[i, 2]}
+  formatRealization(rlz)
+  data.addRealization(rlz)
+data.asDataset()
+for i in range(400, 600):
+  rlz = {'a': values[i, 0], 'b': values[i, 1], 'x': values[i, 2]}
+  formatRealization(rlz)
+  data.addRealization(rlz)
+# in the data, the index is the sample ID
+for i in [0, 123, 399]:
+  idx, rlz = data.realization(matchDict={'a': values[i, 0], 'b': values[i, 1]})
+  checkSame(f'PointSet many match data index {i}', idx, i)
+  checkFloat(f'PointSet many match data value {i}', rlz['x'], values[i, 2])
+# in the collector, the index is relative to the collector
+for i in [400, 555, 599]:
+  idx, rlz = data.realization(matchDict={'a': values[i, 0], 'b': values[i, 1]})
+  checkSame(f'PointSet many match collector index {i}', idx, i - 400)
+  checkFloat(f'PointSet many match collector value {i}', rlz['x'], values[i, 2])
+# no match outside of the tolerance
+idx, rlz = data.realization(matchDict={'a': values[10, 0] + 1e-3, 'b': values[10, 1]})
+checkSame('PointSet many no match index', idx, 600)
+checkNone('PointSet many no match', rlz)
+# match within a larger tolerance
+idx, rlz = data.realization(matchDict={'a': values[10, 0] * (1 + 1e-8), 'b': values[10, 1]}, tol=1e-6)
+checkSame('PointSet many tolerance match index', idx, 10)
+idx, rlz = data.realization(matchDict={'a': values[410, 0] * (1 + 1e-8), 'b': values[410, 1]}, tol=1e-6)
+checkSame('PointSet many tolerance match collector index', idx, 10)
+# antimatch
+idx, rlz = data.realization(matchDict={'a': values[123, 0], 'b': values[123, 1]}, noMatchDict={'x': values[123, 2]})
+checkSame('PointSet many antimatch index', idx, 600)
+# realizations added after the index has been created are found as well
+rlz = {'a': 2.0, 'b': 3.0, 'x': 4.0}
+formatRealization(rlz)
+data.addRealization(rlz)
+idx, rlz = data.realization(matchDict={'a': 2.0, 'b': 3.0})
+checkSame('PointSet many match new index', idx, 200)
+checkFloat('PointSet many match new value', rlz['x'], 4.0)
+# still found after collapsing the collector into the data
+data.asDataset()
+idx, rlz = data.realization(matchDict={'a': 2.0, 'b': 3.0})
+checkSame('PointSet many match collapsed index', idx, 600)
+idx, rlz = data.realization(matchDict={'a': values[555, 0], 'b': values[555, 1]})
+checkSame('PointSet many match collapsed index 555', idx, 555)
+# matching on a subset of the variables
+idx, rlz = data.realization(matchDict={'b': values[321, 1]})
+checkSame('PointSet many match subset index', idx, 321)
+
 
 # TODO more exhaustive tests are needed, but this is sufficient for initial work.
 
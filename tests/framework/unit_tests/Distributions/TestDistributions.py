@@ -126,6 +126,24 @@ def checkIntegralDiscrete(name, dist, low, high, tol=1e-3):
   tot = sum(dist.pdf(x) for x in xs)
   checkAnswer(name+' unity integration', tot, 1, tol)
 
+def checkArrayMethods(name, dist, methods=('ppf', 'cdf', 'pdf'), tol=1e-12):
+  """
+    Checks that the evaluations of the ppf, cdf and pdf at arrays of coordinates match
+    the ones at one coordinate at a time
+    @ In, name, string, the name printed out if it fails
+    @ In, dist, instance, the distribution to inquire
+    @ In, methods, tuple, optional, the methods to check
+    @ In, tol, float, optional, the relative tolerance
+    @ Out, None
+  """
+  cdfs = np.linspace(0.01, 0.99, 25)
+  xs = [dist.ppf(cdf) for cdf in cdfs]
+  for method in methods:
+    points = cdfs if method == 'ppf' else xs
+    values = getattr(dist, method + 'Array')(np.asarray(points))
+    for point, value in zip(points, values):
+      checkAnswer(f'{name} {method}Array({point})', value, getattr(dist, method)(point), tol, relative=True)
+
 def getDistribution(xmlElement):
   """
     Parses the xmlElement and returns the distribution
@@ -1143,6 +1161,9 @@ checkAnswer("Categorical  ppf(0.5)" , Categorical.ppf(0.5),50)
 checkAnswer("Categorical  ppf(0.9)" , Categorical.ppf(0.9),60)
 checkAnswer("Categorical  ppf(1.0)" , Categorical.ppf(1.0),60)
 
+checkArrayMethods("Categorical", Categorical)
+checkAnswer("Categorical  cdfArray(40)" , Categorical.cdfArray(np.array([40.]))[0], 0.45)
+
 #Test Categorical (string)
 
 CategoricalElement = ET.Element("Categorical",{"name":"test"})
@@ -1256,6 +1277,20 @@ checkAnswer("UniformDiscrete2 rvs4",UniformDiscrete2.rvs(),0.25)
 checkAnswer("UniformDiscrete2 rvs5",UniformDiscrete2.rvs(),0.875)
 checkAnswer("UniformDiscrete2 rvs6",UniformDiscrete2.rvs(),0.25)
 
+#Test the array evaluations of the 1D distributions
+for name, dist in [('uniform', uniform), ('log10Uniform', log10Uniform), ('normal', normal), ('truncNormal', truncNormal),
+                   ('lowtruncNormal', lowtruncNormal), ('uptruncNormal', uptruncNormal), ('gamma', gamma),
+                   ('nobeta_gamma', nobeta_gamma), ('beta', beta), ('betan', betan), ('triangular', triangular),
+                   ('poisson', poisson), ('binomial', binomial), ('bernoulli', bernoulli), ('geometric', geometric),
+                   ('logistic', logistic), ('lowLogistic', lowLogistic), ('upLogistic', upLogistic), ('laplace', laplace),
+                   ('exponential', exponential), ('lowExponential', lowExponential), ('upExponential', upExponential),
+                   ('truncExponential', truncExponential), ('logNormal', logNormal), ('lowlogNormal', lowlogNormal),
+                   ('uplogNormal', uplogNormal), ('logNormalLowMean', logNormalLowMean), ('weibull', weibull),
+                   ('lowWeibull', lowWeibull), ('upWeibull', upWeibull), ('Custom1D', Custom1D)]:
+  checkArrayMethods(name, dist)
+checkArrayMethods('Categorical (string)', Categorical, methods=('ppf',))
+checkArrayMethods('UniformDiscrete2', UniformDiscrete2)
+
 print(results)
 
 sys.exit(results["fail"])
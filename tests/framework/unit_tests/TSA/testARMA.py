@@ -328,6 +328,30 @@ checkFloat('Simple denorm 250', 2.051286365253135, new[250], tol=1e-6)
 checkFloat('Simple denorm 500', -0.5047179383332892, new[500], tol=1e-6)
 checkFloat('Simple denorm 999', 1.3200315405820204, new[999], tol=1e-6)
 
+##########
+# Native simulator, compared with the statsmodels state space simulation with the same noise
+#
+import statsmodels.tsa.arima.model
+armaData = params['A']['arma']
+randomUtils.randomSeed(42)
+msrShocks, stateShocks, initialState = arma._generateNoise(armaData, len(pivot))
+model = statsmodels.tsa.arima.model.ARIMA(np.zeros(len(pivot)), order=armaData['lags'], trend='c')
+expected = model.simulate(np.r_[armaData['const'], armaData['ar'], armaData['ma'], armaData['var']], len(pivot),
+                          measurement_shocks=msrShocks, state_shocks=stateShocks, initial_state=initialState)
+native = arma._simulate(armaData, msrShocks, stateShocks, np.atleast_2d(initialState)[:, 0].reshape(1, -1))[0]
+checkArray('Native simulation', expected, native, float, tol=1e-10)
+
+# many histories at once: the same stream as "generate" for a single history
+randomUtils.randomSeed(42)
+new = arma.generate(params, pivot, settings)[:, 0]
+randomUtils.randomSeed(42)
+many = arma.generateMany(params, pivot, settings, 1)
+checkSame('Generate many shape', many.shape, (1, len(pivot), 1))
+checkArray('Generate many single', new, many[0, :, 0], float, tol=1e-10)
+many = arma.generateMany(params, pivot, settings, 3)
+checkSame('Generate many histories shape', many.shape, (3, len(pivot), 1))
+checkTrue('Generate many histories differ', not np.allclose(many[0], many[1]))
+
 print(results)
 
 sys.exit(results["fail"])
@@ -105,6 +105,70 @@ else:
   print('checking string representation does not match:\n'+msg,'\n!=\n'+right)
   results['fail']+=1
 
+
+#test columnar collector
+def checkSame(comment, value, expected):
+  """
+    This method is aimed to compare two objects (or arrays) for equality
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ Out, None
+  """
+  if np.array_equal(np.asarray(value, dtype=object), np.asarray(expected, dtype=object)):
+    results['pass'] += 1
+  else:
+    print('checking', comment, value, '!=', expected)
+    results['fail'] += 1
+
+collector = cached_ndarray.cColumnarArray(width=4, length=2)
+checkAnswer('columnar empty length', len(collector), 0)
+hist = [np.array([1.0, 2.0, 3.0]), np.array([4.0, 5.0]), np.array([6.0, 7.0, 8.0])]
+for i in range(3):
+  collector.append([float(i), i, 'sample{}'.format(i), hist[i]])
+checkAnswer('columnar length', len(collector), 3)
+checkSame('columnar shape', collector.shape, (3, 4))
+checkSame('columnar float column', collector[:, 0], [0.0, 1.0, 2.0])
+checkSame('columnar float dtype', collector.getEntity(0).dtype, float)
+checkSame('columnar int dtype', collector.getEntity(1).dtype, int)
+checkSame('columnar str column', collector[:, 2], ['sample0', 'sample1', 'sample2'])
+checkSame('columnar element', collector[1, 2], 'sample1')
+checkSame('columnar negative row', collector[-1, 1], 2)
+checkSame('columnar history', collector[1, 3], hist[1])
+checkSame('columnar history column', [len(h) for h in collector[:, 3]], [3, 2, 3])
+checkSame('columnar row', collector[2][:3], [2.0, 2, 'sample2'])
+checkSame('columnar row subset', collector[0, (2, 0)], ['sample0', 0.0])
+checkSame('columnar rows', collector[np.array([0, 2]), 1], [0, 2])
+checkSame('columnar 2D', collector[1:, :2].shape, (2, 2))
+values, offsets, shapes = collector.getFlatEntity(3)
+checkSame('columnar flat values', values, np.concatenate(hist))
+checkSame('columnar flat offsets', offsets, [0, 3, 5, 8])
+checkSame('columnar unstackable', collector.stackEntity(3), None)
+checkSame('columnar stack scalars', collector.stackEntity(1), [0, 1, 2])
+# values that do not fit the column type are stored as objects
+collector[1, 1] = np.nan
+checkSame('columnar set other type', [collector[0, 1], np.isnan(collector[1, 1]), collector[2, 1]], [0, True, 2])
+checkSame('columnar set other type dtype', collector.getEntity(1).dtype, object)
+collector.append([3.0, 'four', 'sample3', 5.0])
+checkSame('columnar append other type', collector[3, 1], 'four')
+checkSame('columnar history other type', collector[3, 3], 5.0)
+checkSame('columnar history kept', collector[0, 3], hist[0])
+# adding, removing columns
+collector.addEntity([10, 11, 12, 13])
+checkSame('columnar add entity', collector[:, 4], [10, 11, 12, 13])
+collector.removeEntity(2)
+checkSame('columnar remove entity', collector[3], [3.0, 'four', 5.0, 13])
+# aligned histories are stacked without copies
+collector = cached_ndarray.cColumnarArray(width=0)
+collector.addEntity(np.array([1.5, 2.5]))
+collector.addEntity(np.arange(6.0).reshape(2, 3))
+checkAnswer('columnar add entity length', len(collector), 2)
+checkSame('columnar stack histories', collector.stackEntity(1), np.arange(6.0).reshape(2, 3))
+collector.append([3.5, np.array([6.0, 7.0, 8.0])])
+checkSame('columnar stack appended histories', collector.stackEntity(1), np.arange(9.0).reshape(3, 3))
+collector[2, 1] = np.array([0.0, 0.0, 0.0])
+checkSame('columnar set history', collector[2, 1], [0.0, 0.0, 0.0])
+
 print(results)
 
 sys.exit(results["fail"])
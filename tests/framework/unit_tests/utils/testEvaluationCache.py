@@ -0,0 +1,107 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the persistent evaluation cache
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+import os,sys
+import shutil
+import tempfile
+import numpy as np
+ravenDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir))
+sys.path.append(ravenDir)
+
+from ravenframework.utils.evaluationCache import EvaluationCache
+
+results = {"pass":0,"fail":0}
+
+def checkAnswer(comment,value,expected):
+  """
+    This method is aimed to compare two values
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ Out, None
+  """
+  if value != expected:
+    print("checking answer",comment,':',value,"!=",expected)
+    results["fail"] += 1
+  else:
+    results["pass"] += 1
+
+cacheDir = tempfile.mkdtemp()
+try:
+  # store and retrieve
+  cache = EvaluationCache(cacheDir, ['model', b'template'])
+  key = cache.key({'x':0.1, 'y':np.array([1., 2.]), 'n':3, 's':'a'})
+  checkAnswer('miss', cache.get(key), None)
+  cache.put(key, {'ans':np.array([4.])})
+  checkAnswer('hit', cache.get(key)['ans'][0], 4.)
+  checkAnswer('key independent of the order', cache.key({'s':'a', 'n':3, 'y':np.array([1., 2.]), 'x':0.1}), key)
+  checkAnswer('exact keys by default', cache.key({'x':0.1 + 1e-16, 'y':np.array([1., 2.]), 'n':3, 's':'a'}) == key, False)
+  checkAnswer('statistics', (cache.stats['hits'], cache.stats['misses'], cache.stats['stored']), (1, 1, 1))
+
+  # persistence and signature
+  reopened = EvaluationCache(cacheDir, ['model', b'template'])
+  checkAnswer('persistent entries', len(reopened), 1)
+  checkAnswer('persistent hit', reopened.get(key)['ans'][0], 4.)
+  other = EvaluationCache(cacheDir, ['model', b'modified template'])
+  checkAnswer('other signature', other.get(other.key({'x':0.1, 'y':np.array([1., 2.]), 'n':3, 's':'a'})), None)
+
+  # tolerance
+  tolerant = EvaluationCache(cacheDir, ['model'], tolerance=1e-8)
+  checkAnswer('within tolerance', tolerant.key({'x':1.2345678901}), tolerant.key({'x':1.2345678902}))
+  checkAnswer('beyond tolerance', tolerant.key({'x':1.2345678901}) == tolerant.key({'x':1.2345679901}), False)
+  checkAnswer('signed zero', tolerant.key({'x':0.}), tolerant.key({'x':-0.}))
+  shutil.rmtree(cacheDir)
+
+  # least recently used eviction
+  lru = EvaluationCache(cacheDir, ['model'], maxEntries=3)
+  keys = [lru.key({'x':float(i)}) for i in range(4)]
+  for i in range(3):
+    lru.put(keys[i], {'ans':i})
+  lru.get(keys[0])
+  lru.put(keys[3], {'ans':3})
+  checkAnswer('entries after eviction', len(lru), 3)
+  checkAnswer('least recently used evicted', lru.get(keys[1]), None)
+  checkAnswer('recently used kept', lru.get(keys[0]), {'ans':0})
+  checkAnswer('files after eviction', len(os.listdir(cacheDir)), 3)
+  checkAnswer('eviction order persistent', list(EvaluationCache(cacheDir, ['model'])._entries)[-1], keys[0])
+  shutil.rmtree(cacheDir)
+
+  # size eviction
+  sized = EvaluationCache(cacheDir, ['model'], maxSize=30000)
+  for i in range(10):
+    sized.put(sized.key({'x':float(i)}), {'ans':np.zeros(1000)})
+  checkAnswer('entries after size eviction', len(sized), 3)
+  checkAnswer('evicted', sized.stats['evicted'], 7)
+finally:
+  shutil.rmtree(cacheDir, ignore_errors=True)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.evaluationCache</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>utils.evaluationCache</classesTested>
+    <description>
+       This test performs Unit Tests for the persistent evaluation cache (keys, tolerance,
+       persistence, model signatures and least recently used eviction).
+    </description>
+  </TestInfo>
+"""
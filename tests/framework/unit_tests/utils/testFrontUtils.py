@@ -152,6 +152,30 @@ indexes2D = frontUtils.nonDominatedFrontier(test2D, returnMask=False, minMask=np
 answerIndexes = np.array([0, 16, 34, 47, 49])
 checkArray('2D nonDominatedFrontier MinMask with indexes', indexes2D.tolist(), answerIndexes.tolist())
 
+## Testing ranking of the non dominated frontiers
+rank3D = frontUtils.rankNonDominatedFrontiers(test3D)
+answerRank3D = [1, 1, 1, 2, 2, 1, 2, 1, 1, 1]
+checkArray('3D rankNonDominatedFrontiers', rank3D, answerRank3D)
+
+# equal points are ranked in successive frontiers, by index
+testDuplicates = np.array([[1., 1.], [0., 2.], [1., 1.], [2., 2.], [0., 2.], [1., 1.]])
+rankDuplicates = frontUtils.rankNonDominatedFrontiers(testDuplicates)
+answerRankDuplicates = [1, 1, 2, 4, 2, 3]
+checkArray('rankNonDominatedFrontiers with duplicates', rankDuplicates, answerRankDuplicates)
+
+# many points (several blocks), compared with omitting the frontiers one by one
+testMany = np.random.RandomState(42).randint(0, 20, size=(500, 3)).astype(float)
+rankMany = frontUtils.rankNonDominatedFrontiers(testMany)
+answerRankMany = np.zeros(len(testMany), dtype=int)
+remaining = np.arange(len(testMany))
+rank = 0
+while len(remaining):
+  rank += 1
+  front = frontUtils.nonDominatedFrontier(testMany[remaining], returnMask=True)
+  answerRankMany[remaining[front]] = rank
+  remaining = remaining[~front]
+checkArray('rankNonDominatedFrontiers many points', rankMany, answerRankMany.tolist())
+
 ## Testing crowding distances
 # test1: 2 objective functions
 testCDarray = np.array([[12, 0],
@@ -0,0 +1,154 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the streamingStatistics accumulators
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+import os,sys
+import numpy as np
+ravenDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir))
+sys.path.append(ravenDir)
+
+from ravenframework.utils import streamingStatistics
+
+results = {"pass":0,"fail":0}
+
+def checkArray(comment,value,expected,tol=1e-10):
+  """
+    This method is aimed to compare two arrays of floats given a relative tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, np.ndarray, the values to compare
+    @ In, expected, np.ndarray, the expected values
+    @ In, tol, float, optional, the relative tolerance
+    @ Out, None
+  """
+  value = np.asarray(value)
+  expected = np.asarray(expected)
+  if value.shape != expected.shape or not np.allclose(value, expected, rtol=tol, atol=tol):
+    print("checking answer",comment,':',value,"!=",expected)
+    results["fail"] += 1
+  else:
+    results["pass"] += 1
+
+rng = np.random.default_rng(7)
+values = rng.lognormal(size=(5000, 3))
+weights = rng.random(5000)
+
+#
+# WeightedMoments
+#
+def moments(x, w):
+  """
+    Direct computation of the weighted central moments
+    @ In, x, np.ndarray, (samples, variables) values
+    @ In, w, np.ndarray, (samples,) weights
+    @ Out, moments, tuple, mean and sums of w * (x - mean)^k for k = 2, 3, 4
+  """
+  mean = np.average(x, axis=0, weights=w)
+  dev = x - mean
+  return mean, (w[:, None] * dev**2).sum(0), (w[:, None] * dev**3).sum(0), (w[:, None] * dev**4).sum(0)
+
+mean, m2, m3, m4 = moments(values, weights)
+acc = streamingStatistics.WeightedMoments((3,))
+for start in range(0, 5000, 700):
+  acc.update(values[start:start+700], weights[start:start+700])
+checkArray('chunked mean', acc.mean, mean)
+checkArray('chunked m2', acc.m2, m2)
+checkArray('chunked m3', acc.m3, m3)
+checkArray('chunked m4', acc.m4, m4)
+checkArray('chunked weight sums', acc.wSums, [[np.sum(weights**k)]*3 for k in range(1, 5)])
+checkArray('chunked minimum', acc.minimum, values.min(0))
+checkArray('chunked maximum', acc.maximum, values.max(0))
+checkArray('count', acc.count, 5000)
+
+first = streamingStatistics.WeightedMoments((3,))
+first.update(values[:1234], weights[:1234])
+second = streamingStatistics.WeightedMoments((3,))
+second.update(values[1234:], weights[1234:])
+first.merge(second)
+checkArray('merged mean', first.mean, mean)
+checkArray('merged m2', first.m2, m2)
+checkArray('merged m3', first.m3, m3)
+checkArray('merged m4', first.m4, m4)
+
+unit = streamingStatistics.WeightedMoments((3,))
+unit.update(values)
+mean, m2, _, _ = moments(values, np.ones(5000))
+checkArray('unit weights mean', unit.mean, mean)
+checkArray('unit weights m2', unit.m2, m2)
+
+#
+# WeightedCoMoments
+#
+mean = np.average(values, axis=0, weights=weights)
+dev = values - mean
+comoment = (weights[:, None] * dev).T @ dev
+acc = streamingStatistics.WeightedCoMoments(3)
+for start in range(0, 5000, 999):
+  acc.update(values[start:start+999], weights[start:start+999])
+checkArray('chunked comoment mean', acc.mean, mean)
+checkArray('chunked comoment', acc.comoment, comoment)
+checkArray('second moment', acc.secondMoment(), (weights[:, None] * values).T @ values)
+
+first = streamingStatistics.WeightedCoMoments(3)
+first.update(values[:10], weights[:10])
+second = streamingStatistics.WeightedCoMoments(3)
+second.update(values[10:], weights[10:])
+first.merge(second)
+checkArray('merged comoment', first.comoment, comoment)
+checkArray('merged weight sums', [first.wSum, first.w2Sum], [weights.sum(), np.sum(weights**2)])
+
+#
+# TDigest
+#
+samples = rng.normal(size=200000)
+digest = streamingStatistics.TDigest(200)
+for start in range(0, 200000, 10000):
+  digest.update(samples[start:start+10000])
+quantiles = [0.001, 0.05, 0.25, 0.5, 0.75, 0.95, 0.999]
+ranks = np.searchsorted(np.sort(samples), [digest.quantile(q) for q in quantiles]) / samples.size
+checkArray('digest ranks', ranks, quantiles, tol=2e-3)
+checkArray('digest total weight', digest.totalWeight(), 200000)
+checkArray('digest extrema', [digest.quantile(0.), digest.quantile(1.)], [samples.min(), samples.max()])
+checkArray('digest size', len(digest.means) <= 200, True)
+
+first = streamingStatistics.TDigest(200)
+first.update(samples[:50000])
+second = streamingStatistics.TDigest(200)
+second.update(samples[50000:])
+first.merge(second)
+ranks = np.searchsorted(np.sort(samples), [first.quantile(q) for q in quantiles]) / samples.size
+checkArray('merged digest ranks', ranks, quantiles, tol=2e-3)
+
+# weighted samples: the quantiles of the weighted distribution
+digest = streamingStatistics.TDigest(200)
+digest.update(np.array([0., 1.]), np.array([3., 1.]))
+checkArray('weighted digest median', digest.quantile(0.5) < 0.5, True)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.streamingStatistics</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>utils.streamingStatistics</classesTested>
+    <description>
+       This test performs Unit Tests for the streamingStatistics accumulators (weighted moments,
+       co-moments and t-digest), comparing chunked and merged accumulations with direct computations.
+    </description>
+  </TestInfo>
+"""